@@ -10,7 +10,7 @@
 # actual implementation. Here's the finished base classes for M5 and hopefully the final project.
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List
 
 # ===== INHERITANCE DEMONSTRATED HERE =====
 # DataEntity is an abstract base class that will be inherited by concrete classes like Person
@@ -81,6 +81,31 @@ class ReportGenerator(ABC):
         """Each report calculates it's own stats"""
         pass
     
+    def get_structured_data(self) -> Dict[str, Any]:
+        """
+        Machine readable version of the report (plain dict, JSON friendly).
+        Report types override this with their real fields - the default just wraps the text.
+        """
+        return {'content': self.generate_content(), 'statistics': self.get_statistics()}
+    
+    def iter_content_chunks(self) -> Iterator[str]:
+        """
+        Content in pieces. By default it's just generate_content() as one chunk,
+        report types with templates override this so they never build one big string.
+        """
+        yield self.generate_content()
+    
+    def iter_chunks(self, title: str = None, include_stats: bool = True) -> Iterator[str]:
+        """
+        The whole formatted report as a stream of chunks - joining them gives format_report()
+        ===== POLYMORPHISM DEMONSTRATED HERE =====
+        iter_content_chunks and get_statistics are whatever the subclass implements
+        """
+        if title:
+            yield f"=== {title} ===\n\n"
+        yield from self.iter_content_chunks()
+        yield from self._format_summary(include_stats)
+    
     def format_report(self, title: str = None, include_stats: bool = True) -> str:
         """
         Formats the report nicely for all report types
@@ -89,27 +114,29 @@ class ReportGenerator(ABC):
         The actual behavior depends on which subclass implements these methods
         This is runtime polymorphism in action!
         """
-        report_parts = []
-        
-        if title:
-            report_parts.append(f"=== {title} ===")
-            report_parts.append("")  # blank line
+        report_parts = [f"=== {title} ===\n\n"] if title else []
         
         # get the main report content - POLYMORPHIC CALL
         # The actual implementation depends on the specific subclass
-        content = self.generate_content()
-        report_parts.append(content)
+        report_parts.append(self.generate_content())
+        report_parts.extend(self._format_summary(include_stats))
         
-        if include_stats:
-            # Another POLYMORPHIC CALL - behavior varies by subclass
-            stats = self.get_statistics()
-            if stats:
-                report_parts.append("")
-                report_parts.append("SUMMARY STATISTICS:")
-                for key, value in stats.items():
-                    report_parts.append(f"  {key}: {value}")
+        return ''.join(report_parts)
+    
+    def _format_summary(self, include_stats: bool) -> List[str]:
+        """The SUMMARY STATISTICS block that goes after the content (empty if there's nothing)"""
+        if not include_stats:
+            return []
         
-        return '\n'.join(report_parts)
+        # Another POLYMORPHIC CALL - behavior varies by subclass
+        stats = self.get_statistics()
+        if not stats:
+            return []
+        
+        summary_parts = ["\n\nSUMMARY STATISTICS:"]
+        for key, value in stats.items():
+            summary_parts.append(f"\n  {key}: {value}")
+        return summary_parts
 
 # ===== INHERITANCE DEMONSTRATED HERE =====
 # DialogHandler is an abstract base class for different dialog types
@@ -165,4 +192,12 @@ class DialogHandler(ABC):
         """Gets the result from the dialog"""
         # ===== ENCAPSULATION DEMONSTRATED HERE =====
         # Provides controlled access to the internal result state
-        return self._result
\ No newline at end of file
+        return self._result
+    
+    def refresh_widgets(self) -> bool:
+        """
+        Called after every event the dialog sees. Dialogs whose widgets depend on what's
+        been typed (autocomplete) update them here and return True so they get redrawn.
+        Most dialogs never change, so the default does nothing.
+        """
+        return False
\ No newline at end of file
@@ -0,0 +1,194 @@
+# cohort.py
+# Vax Project - saved patient cohorts
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# A cohort is just a named set of patient IDs ("symptomatic this week" etc).
+# The set is stored as a bitmap split into 65536-ID chunks (kind of like a roaring
+# bitmap) - each chunk is a Python int where bit N means ID chunk_base + N is in it.
+# Union/intersection/difference are then |, & and &~ on the chunk ints which run in C,
+# and empty chunks just aren't stored so big sparse IDs don't waste memory.
+# For saving, each chunk's bytes get zlib compressed.
+
+import os
+import pickle
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+COHORT_FILE_NAME = "cohorts.dat"
+CHUNK_BITS = 16  # 65536 IDs per chunk
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+
+class Cohort:
+    """
+    Immutable named set of person IDs stored as a chunked bitmap.
+    Set operations return new Cohort objects, they never change this one.
+    """
+
+    def __init__(self, name: str, chunks: Dict[int, int] = None):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private bitmap chunks (chunk number -> bits) - only readable through the methods below
+        self.__name = name
+        self.__chunks = {key: bits for key, bits in (chunks or {}).items() if bits}
+        self.__fingerprint = None  # worked out on first use - the chunks never change after this
+
+    @staticmethod
+    def from_ids(name: str, person_ids: Iterable[int]) -> 'Cohort':
+        """Builds a cohort from a bunch of IDs (IDs can't be negative)"""
+        chunks = {}
+        for person_id in person_ids:
+            if person_id < 0:
+                raise ValueError(f"Cohort IDs can't be negative, got {person_id}")
+            key = person_id >> CHUNK_BITS
+            chunks[key] = chunks.get(key, 0) | (1 << (person_id & CHUNK_MASK))
+        return Cohort(name, chunks)
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def get_chunks(self) -> Dict[int, int]:
+        """returns a copy of the raw bitmap chunks"""
+        return dict(self.__chunks)
+
+    def get_fingerprint(self) -> tuple:
+        """
+        Hashable snapshot of the membership - two cohorts with the same members match.
+        Query and report caches ask for it on every lookup, so it's only built once.
+        """
+        if self.__fingerprint is None:
+            self.__fingerprint = tuple(sorted(self.__chunks.items()))
+        return self.__fingerprint
+
+    def get_size(self) -> int:
+        """returns how many patients are in the cohort"""
+        return sum(bits.bit_count() for bits in self.__chunks.values())
+
+    def contains(self, person_id: int) -> bool:
+        if person_id < 0:
+            return False
+        bits = self.__chunks.get(person_id >> CHUNK_BITS, 0)
+        return (bits >> (person_id & CHUNK_MASK)) & 1 == 1
+
+    def iter_ids(self) -> Iterator[int]:
+        """Yields member IDs in ascending order, skipping empty bytes of the bitmap quickly"""
+        for key in sorted(self.__chunks):
+            bits = self.__chunks[key]
+            chunk_base = key << CHUNK_BITS
+            data = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+            for byte_index, byte in enumerate(data):
+                if not byte:
+                    continue
+                base = chunk_base + byte_index * 8
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield base + bit
+
+    def get_ids(self) -> List[int]:
+        return list(self.iter_ids())
+
+    # set algebra - the whole point of using a bitmap
+    def union(self, other: 'Cohort', name: str = None) -> 'Cohort':
+        chunks = dict(self.__chunks)
+        for key, bits in other.get_chunks().items():
+            chunks[key] = chunks.get(key, 0) | bits
+        return Cohort(name or f"({self.__name} | {other.get_name()})", chunks)
+
+    def intersection(self, other: 'Cohort', name: str = None) -> 'Cohort':
+        other_chunks = other.get_chunks()
+        chunks = {key: bits & other_chunks[key] for key, bits in self.__chunks.items()
+                  if key in other_chunks}
+        return Cohort(name or f"({self.__name} & {other.get_name()})", chunks)
+
+    def difference(self, other: 'Cohort', name: str = None) -> 'Cohort':
+        other_chunks = other.get_chunks()
+        chunks = {key: bits & ~other_chunks.get(key, 0) for key, bits in self.__chunks.items()}
+        return Cohort(name or f"({self.__name} - {other.get_name()})", chunks)
+
+    def without_id(self, person_id: int) -> 'Cohort':
+        """Same cohort minus one ID (used when a patient gets deleted)"""
+        return self.difference(Cohort.from_ids(self.__name, [person_id]), self.__name)
+
+    def to_compressed(self) -> Dict[int, bytes]:
+        """zlib compressed bytes for each chunk, for saving"""
+        return {key: zlib.compress(bits.to_bytes((bits.bit_length() + 7) // 8, 'little'))
+                for key, bits in self.__chunks.items()}
+
+    @staticmethod
+    def from_compressed(name: str, data: Dict[int, bytes]) -> 'Cohort':
+        return Cohort(name, {key: int.from_bytes(zlib.decompress(chunk), 'little')
+                             for key, chunk in data.items()})
+
+
+class CohortRegistry:
+    """
+    Keeps the saved cohorts by name and does set algebra between them.
+    Operations take either a cohort name or a Cohort object.
+    """
+
+    def __init__(self):
+        self.__cohorts = {}  # name -> Cohort
+
+    def save_cohort(self, cohort: Cohort) -> Cohort:
+        """Stores (or replaces) a cohort under its name"""
+        self.__cohorts[cohort.get_name()] = cohort
+        return cohort
+
+    def get_cohort(self, name: str) -> Optional[Cohort]:
+        return self.__cohorts.get(name)
+
+    def delete_cohort(self, name: str) -> bool:
+        return self.__cohorts.pop(name, None) is not None
+
+    def get_cohort_names(self) -> List[str]:
+        return sorted(self.__cohorts.keys())
+
+    def resolve(self, cohort: Union[str, Cohort]) -> Cohort:
+        """Turns a name into the saved Cohort, raises ValueError for unknown names"""
+        if isinstance(cohort, Cohort):
+            return cohort
+        found = self.__cohorts.get(cohort)
+        if found is None:
+            raise ValueError(f"Unknown cohort: {cohort}")
+        return found
+
+    def union(self, first, second, save_as: str = None) -> Cohort:
+        result = self.resolve(first).union(self.resolve(second), save_as)
+        return self.save_cohort(result) if save_as else result
+
+    def intersection(self, first, second, save_as: str = None) -> Cohort:
+        result = self.resolve(first).intersection(self.resolve(second), save_as)
+        return self.save_cohort(result) if save_as else result
+
+    def difference(self, first, second, save_as: str = None) -> Cohort:
+        result = self.resolve(first).difference(self.resolve(second), save_as)
+        return self.save_cohort(result) if save_as else result
+
+    def discard_id(self, person_id: int):
+        """Takes a deleted patient out of every cohort"""
+        for name, cohort in list(self.__cohorts.items()):
+            if cohort.contains(person_id):
+                self.__cohorts[name] = cohort.without_id(person_id)
+
+    def clear_members(self):
+        """Empties every cohort but keeps the names (used when all patients get deleted)"""
+        for name in list(self.__cohorts):
+            self.__cohorts[name] = Cohort(name)
+
+    def save_to(self, storage_dir: str):
+        """Writes all cohorts to the cohort file (temp file + rename so it's never half written)"""
+        payload = {name: cohort.to_compressed() for name, cohort in self.__cohorts.items()}
+        path = os.path.join(storage_dir, COHORT_FILE_NAME)
+        with open(path + ".tmp", 'wb') as cohort_file:
+            pickle.dump(payload, cohort_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + ".tmp", path)
+
+    def load_from(self, storage_dir: str):
+        """Loads the cohort file if there is one"""
+        path = os.path.join(storage_dir, COHORT_FILE_NAME)
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as cohort_file:
+            payload: Dict[str, Dict[int, bytes]] = pickle.load(cohort_file)
+        self.__cohorts = {name: Cohort.from_compressed(name, data) for name, data in payload.items()}
@@ -0,0 +1,112 @@
+# patient_query.py
+# Vax Project - filter/sort description for patient lists
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The list view needs "everyone cleared for entry, sorted by ID" style questions, and
+# it needs them a screenful at a time. A PatientQuery just describes which people and
+# in what order; VaccineManager.run_query() does the work against the packed flags
+# (nothing gets loaded) and iter_window() hands back one page of it. A query can also
+# be narrowed to the results of the search box (a SearchResult).
+
+from typing import Iterable, Optional, Union
+from .person import ALL_VACCINES_MASK, ALL_SYMPTOMS_MASK
+from .cohort import Cohort
+from .patient_search import SearchResult
+
+FLAG_CODE_COUNT = 64  # six flag bits
+
+SORT_KEYS = ("added", "id", "vaccines", "symptoms")
+
+# handy filters for the list view - name: the flag codes that match (None = everyone)
+STATUS_FILTERS = {
+    "all": None,
+    "cleared": frozenset([ALL_VACCINES_MASK]),
+    "not_cleared": frozenset(code for code in range(FLAG_CODE_COUNT) if code != ALL_VACCINES_MASK),
+    "symptomatic": frozenset(code for code in range(FLAG_CODE_COUNT) if code & ALL_SYMPTOMS_MASK),
+}
+
+
+class PatientQuery:
+    """
+    Immutable description of a filtered, sorted patient list.
+    required_bits / excluded_bits - flag bits that must / can't be set
+    codes - if given, only these exact flag codes match (see STATUS_FILTERS)
+    cohort - only members of this cohort
+    name_prefix - first or last name starts with this (uses the name index)
+    search - only people in this search box result
+    sort_by - one of SORT_KEYS ('added' is the order people were added in)
+    """
+
+    def __init__(self, required_bits: int = 0, excluded_bits: int = 0,
+                 codes: Optional[Iterable[int]] = None, cohort: Union[str, Cohort] = None,
+                 name_prefix: str = None, sort_by: str = "added", descending: bool = False,
+                 search: SearchResult = None):
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {sort_by} (expected one of {', '.join(SORT_KEYS)})")
+        if required_bits & excluded_bits:
+            raise ValueError("A flag can't be both required and excluded")
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private fields with getters only - queries get used as cache keys so they can't change
+        self.__required_bits = required_bits
+        self.__excluded_bits = excluded_bits
+        self.__codes = frozenset(codes) if codes is not None else None
+        self.__cohort = cohort
+        self.__name_prefix = name_prefix.strip().lower() if name_prefix else None
+        self.__sort_by = sort_by
+        self.__descending = descending
+        self.__search = search
+
+    @staticmethod
+    def for_status(status: str = "all", **kwargs) -> 'PatientQuery':
+        """Query using one of the STATUS_FILTERS names"""
+        if status not in STATUS_FILTERS:
+            raise ValueError(f"Unknown status filter: {status}")
+        return PatientQuery(codes=STATUS_FILTERS[status], **kwargs)
+
+    def with_sort(self, sort_by: str, descending: bool = False) -> 'PatientQuery':
+        """Same filter, different order"""
+        return PatientQuery(self.__required_bits, self.__excluded_bits, self.__codes, self.__cohort,
+                            self.__name_prefix, sort_by, descending, self.__search)
+
+    def get_cohort(self) -> Union[str, Cohort, None]:
+        return self.__cohort
+
+    def get_name_prefix(self) -> Optional[str]:
+        return self.__name_prefix
+
+    def get_search(self) -> Optional[SearchResult]:
+        return self.__search
+
+    def get_sort_by(self) -> str:
+        return self.__sort_by
+
+    def is_descending(self) -> bool:
+        return self.__descending
+
+    def code_table(self) -> bytes:
+        """
+        256 byte table, 1 where a flag code matches the flag part of the query (codes stop at 63).
+        bytearray.translate() with this turns the packed flags into a match mask in C.
+        """
+        return bytes(1 if self.matches_code(code) else 0 for code in range(FLAG_CODE_COUNT)) + bytes(192)
+
+    def matches_code(self, code: int) -> bool:
+        if code & self.__required_bits != self.__required_bits:
+            return False
+        if code & self.__excluded_bits:
+            return False
+        return self.__codes is None or code in self.__codes
+
+    def has_flag_filter(self) -> bool:
+        return bool(self.__required_bits or self.__excluded_bits or self.__codes is not None)
+
+    def get_key(self) -> tuple:
+        """Hashable key for caching results (the manager adds the cohort fingerprint)"""
+        cohort_name = self.__cohort.get_name() if isinstance(self.__cohort, Cohort) else self.__cohort
+        codes = tuple(sorted(self.__codes)) if self.__codes is not None else None
+        search_key = self.__search.get_key() if self.__search is not None else None
+        return (self.__required_bits, self.__excluded_bits, codes, cohort_name,
+                self.__name_prefix, self.__sort_by, self.__descending, search_key)
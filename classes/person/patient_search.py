@@ -0,0 +1,171 @@
+# patient_search.py
+# Vax Project - search-as-you-type results
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The search box matches the start of a patient's ID, first or last name, or phone
+# number. The first search walks the indexes (SortedIdIndex for IDs, PrefixIndex for
+# names and phones). Every match remembers the key it matched on, so when the user
+# keeps typing ("an" -> "ann") the new result is just the old matches filtered by the
+# longer text - that's the common case and it never touches the indexes again.
+# Searches take an is_cancelled callback so the GUI can drop one that went stale.
+
+from typing import Callable, Dict, List, Optional
+from .person_index import PrefixIndex, SortedIdIndex
+
+SEARCH_FIELDS = ("id", "name", "phone")
+
+# characters people type in phone numbers that aren't digits
+PHONE_PUNCTUATION = set(" ()-+.")
+
+# how many items get looked at between is_cancelled() checks
+CANCEL_CHECK_INTERVAL = 4096
+
+
+def search_terms(text: str) -> Dict[str, Optional[str]]:
+    """
+    What each field gets matched against for this text (None = that field can't match).
+    IDs need all digits, names are case insensitive, phones ignore ( ) - + . and spaces.
+    """
+    text = text.strip()
+    digits = ''.join(c for c in text if c.isdigit())
+    phone_like = digits and all(c.isdigit() or c in PHONE_PUNCTUATION for c in text)
+    return {
+        "id": text if text.isdigit() else None,
+        "name": text.lower() or None,
+        "phone": digits if phone_like else None,
+    }
+
+
+class SearchResult:
+    """
+    Everyone matching one search text, plus what each of them matched on.
+    ID matches come first (in numeric order), then name matches, then phone matches.
+    """
+
+    def __init__(self, text: str, terms: Dict[str, Optional[str]],
+                 matches: Dict[str, list], data_version: int):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private match lists - 'id' holds IDs, 'name' and 'phone' hold (key, id) pairs
+        self.__text = text.strip()
+        self.__terms = terms
+        self.__matches = matches
+        self.__data_version = data_version
+        self.__ids = None  # deduplicated IDs, built the first time somebody asks
+        self.__id_set = None
+
+    @staticmethod
+    def from_indexes(text: str, id_index: SortedIdIndex, name_index: PrefixIndex,
+                     phone_index: PrefixIndex, data_version: int,
+                     is_cancelled: Callable[[], bool] = None) -> Optional['SearchResult']:
+        """Fresh search against the manager's indexes. None if it got cancelled."""
+        terms = search_terms(text)
+        matches = {field: [] for field in SEARCH_FIELDS}
+        next_check = CANCEL_CHECK_INTERVAL
+
+        if terms["id"] is not None:
+            id_matches = matches["id"]
+            for person_id in id_index.iter_prefix(terms["id"]):
+                id_matches.append(person_id)
+                if is_cancelled is not None and len(id_matches) >= next_check:
+                    next_check += CANCEL_CHECK_INTERVAL
+                    if is_cancelled():
+                        return None
+
+        for field, index in (("name", name_index), ("phone", phone_index)):
+            if terms[field] is None:
+                continue
+            pairs = matches[field]
+            for key, ids in index.iter_prefix(terms[field]):
+                pairs.extend((key, person_id) for person_id in ids)
+                if is_cancelled is not None and len(pairs) >= next_check:
+                    next_check = len(pairs) + CANCEL_CHECK_INTERVAL
+                    if is_cancelled():
+                        return None
+            next_check = CANCEL_CHECK_INTERVAL
+
+        return SearchResult(text, terms, matches, data_version)
+
+    def can_refine(self, text: str, data_version: int) -> bool:
+        """
+        True if the result for text is guaranteed to be a subset of this one - the data
+        hasn't changed, and every field that can match the new text matched a shorter
+        version of it here.
+        """
+        if data_version != self.__data_version or not self.__text:
+            return False
+        if not text.strip().startswith(self.__text):
+            return False
+        for field, term in search_terms(text).items():
+            old_term = self.__terms[field]
+            if term is not None and (old_term is None or not term.startswith(old_term)):
+                return False
+        return True
+
+    def refine(self, text: str, is_cancelled: Callable[[], bool] = None) -> Optional['SearchResult']:
+        """Result for a longer text, filtered out of this one (check can_refine first). None if cancelled."""
+        terms = search_terms(text)
+        matches = {}
+        for field in SEARCH_FIELDS:
+            term = terms[field]
+            if term is None:
+                matches[field] = []
+                continue
+            if field == "id":
+                kept = self.__filter(self.__matches[field], lambda person_id: str(person_id).startswith(term),
+                                     is_cancelled)
+            else:
+                kept = self.__filter(self.__matches[field], lambda pair: pair[0].startswith(term), is_cancelled)
+            if kept is None:
+                return None
+            matches[field] = kept
+        return SearchResult(text, terms, matches, self.__data_version)
+
+    def get_text(self) -> str:
+        return self.__text
+
+    def get_data_version(self) -> int:
+        """manager data version this was computed at"""
+        return self.__data_version
+
+    def get_match_count(self) -> int:
+        """matches before removing duplicates - how much work refining this would be"""
+        return sum(len(items) for items in self.__matches.values())
+
+    def get_ids(self) -> List[int]:
+        """Matching IDs without duplicates (someone can match on first and last name)"""
+        if self.__ids is None:
+            ordered = dict.fromkeys(self.__matches["id"])
+            for field in ("name", "phone"):
+                ordered.update((person_id, None) for _, person_id in self.__matches[field])
+            self.__ids = list(ordered)
+        return self.__ids
+
+    def get_count(self) -> int:
+        return len(self.get_ids())
+
+    def get_id_set(self) -> frozenset:
+        """Matching IDs as a set, for membership checks"""
+        if self.__id_set is None:
+            self.__id_set = frozenset(self.get_ids())
+        return self.__id_set
+
+    def contains(self, person_id: int) -> bool:
+        return person_id in self.get_id_set()
+
+    def get_key(self) -> tuple:
+        """Hashable key for query caching - same text at the same data version gives the same result"""
+        return (self.__text, self.__data_version)
+
+    @staticmethod
+    def __filter(items: list, predicate: Callable, is_cancelled: Callable[[], bool] = None) -> Optional[list]:
+        """Private helper - filters in chunks so a cancel doesn't have to wait for the whole list"""
+        if is_cancelled is None:
+            return [item for item in items if predicate(item)]
+        kept = []
+        for start in range(0, len(items), CANCEL_CHECK_INTERVAL):
+            if is_cancelled():
+                return None
+            kept.extend(item for item in items[start:start + CANCEL_CHECK_INTERVAL] if predicate(item))
+        return kept
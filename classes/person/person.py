@@ -4,9 +4,20 @@
 # 06/21/2025
 # Hamza Kurdi
 
-from typing import Dict
+from typing import Dict, Callable
 from classes.base_classes import DataEntity
 
+# bit positions for the packed six-bit medical flag code
+# low three bits are the vaccines, high three bits are the symptoms
+COVID19_BIT = 0x01
+INFLUENZA_BIT = 0x02
+EBOLA_BIT = 0x04
+FEVER_BIT = 0x08
+FATIGUE_BIT = 0x10
+HEADACHE_BIT = 0x20
+ALL_VACCINES_MASK = COVID19_BIT | INFLUENZA_BIT | EBOLA_BIT
+ALL_SYMPTOMS_MASK = FEVER_BIT | FATIGUE_BIT | HEADACHE_BIT
+
 # ===== INHERITANCE DEMONSTRATED HERE =====
 # Person class inherits from DataEntity abstract base class
 # This demonstrates inheritance - Person gets all the structure and behavior from DataEntity
@@ -43,6 +54,24 @@ class Person(DataEntity):
         self.__fever = False
         self.__fatigue = False
         self.__headache = False
+        
+        # whoever owns this person (the VaccineManager) gets told when medical data changes
+        self.__change_listener = None
+    
+    def set_change_listener(self, listener: Callable = None):
+        """Sets the callback that gets called with this person whenever medical data changes"""
+        self.__change_listener = listener
+    
+    def __notify_change(self):
+        """Private helper to tell the owner something changed"""
+        if self.__change_listener:
+            self.__change_listener(self)
+    
+    def __getstate__(self):
+        """Pickle support - the listener points back at the manager so we leave it out"""
+        state = self.__dict__.copy()
+        state['_Person__change_listener'] = None
+        return state
     
     # ===== ENCAPSULATION DEMONSTRATED HERE =====
     # Getter methods provide controlled read-only access to private data
@@ -69,18 +98,21 @@ class Person(DataEntity):
     
     def set_covid19_vaccine(self, value: bool):
         self.__covid19_vaccine = value
+        self.__notify_change()
     
     def get_influenza_vaccine(self) -> bool:
         return self.__influenza_vaccine
     
     def set_influenza_vaccine(self, value: bool):
         self.__influenza_vaccine = value
+        self.__notify_change()
     
     def get_ebola_vaccine(self) -> bool:
         return self.__ebola_vaccine
     
     def set_ebola_vaccine(self, value: bool):
         self.__ebola_vaccine = value
+        self.__notify_change()
     
     # ===== ENCAPSULATION DEMONSTRATED HERE =====
     # More getter/setter pairs for symptom data encapsulation
@@ -90,18 +122,21 @@ class Person(DataEntity):
     
     def set_fever(self, value: bool):
         self.__fever = value
+        self.__notify_change()
     
     def get_fatigue(self) -> bool:
         return self.__fatigue
     
     def set_fatigue(self, value: bool):
         self.__fatigue = value
+        self.__notify_change()
     
     def get_headache(self) -> bool:
         return self.__headache
     
     def set_headache(self, value: bool):
         self.__headache = value
+        self.__notify_change()
     
     # ===== ENCAPSULATION DEMONSTRATED HERE =====
     # Public methods that operate on private data provide a clean interface
@@ -115,6 +150,15 @@ class Person(DataEntity):
         """Count of current symptoms - usefull for triage"""
         return sum([self.__fever, self.__fatigue, self.__headache])
     
+    def get_flag_code(self) -> int:
+        """Packs all six medical flags into one small int (see the *_BIT constants up top)"""
+        return ((COVID19_BIT if self.__covid19_vaccine else 0) |
+                (INFLUENZA_BIT if self.__influenza_vaccine else 0) |
+                (EBOLA_BIT if self.__ebola_vaccine else 0) |
+                (FEVER_BIT if self.__fever else 0) |
+                (FATIGUE_BIT if self.__fatigue else 0) |
+                (HEADACHE_BIT if self.__headache else 0))
+    
     # ===== INHERITANCE & POLYMORPHISM DEMONSTRATED HERE =====
     # Implementation of abstract method from DataEntity base class
     # This is polymorphism - different classes implement validate_data differently
@@ -161,6 +205,7 @@ class Person(DataEntity):
         # Internal method that modifies private data in a controlled way
         self.__covid19_vaccine = self.__influenza_vaccine = self.__ebola_vaccine = False
         self.__fever = self.__fatigue = self.__headache = False
+        self.__notify_change()
     
     def update_medical_data(self, vaccines: Dict[str, bool] = None, symptoms: Dict[str, bool] = None):
         """Bulk update medical data from dictionaries - convienent for batch operations"""
@@ -175,4 +220,7 @@ class Person(DataEntity):
         if symptoms:
             self.__fever = symptoms.get('fever', self.__fever)
             self.__fatigue = symptoms.get('fatigue', self.__fatigue)
-            self.__headache = symptoms.get('headache', self.__headache)
\ No newline at end of file
+            self.__headache = symptoms.get('headache', self.__headache)
+        
+        if vaccines or symptoms:
+            self.__notify_change()
\ No newline at end of file
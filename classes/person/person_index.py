@@ -0,0 +1,244 @@
+# person_index.py
+# Vax Project - secondary indexes and the index file
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The manager can find people by ID with its dictionary, but for names and phone
+# numbers it would have to look at every record. PrefixIndex keeps sorted keys so we
+# can do exact and prefix lookups with bisect. SortedIdIndex does the same for typing
+# the start of an ID. IndexFile saves all the index data next to the records file so
+# startup doesn't have to rebuild everything from scratch.
+
+import os
+import pickle
+import struct
+import zlib
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Iterator
+
+INDEX_FILE_NAME = "indexes.idx"
+INDEX_MAGIC = b"VAXIDX"
+INDEX_FORMAT_VERSION = 1
+
+# magic, format version, data version, segment file size, payload length, crc32 of payload
+INDEX_HEADER = struct.Struct('<6sHQQQI')
+
+
+class PrefixIndex:
+    """
+    Maps string keys to the person IDs that have them.
+    Keys are kept sorted so prefix searches are a bisect plus a short walk.
+    """
+
+    def __init__(self):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private structures - the sorted key list has to stay in sync with the dict
+        self.__postings = {}  # key -> dict of person ids (a dict so it's an ordered set)
+        self.__sorted_keys = []
+
+    def add(self, key: str, person_id: int):
+        """Adds person_id under key (empty keys are ignored)"""
+        if not key:
+            return
+        ids = self.__postings.get(key)
+        if ids is None:
+            self.__postings[key] = {person_id: None}
+            insort(self.__sorted_keys, key)
+        else:
+            ids[person_id] = None
+
+    def remove(self, key: str, person_id: int):
+        """Removes person_id from key, drops the key once nobody has it"""
+        ids = self.__postings.get(key)
+        if not ids or person_id not in ids:
+            return
+        del ids[person_id]
+        if not ids:
+            del self.__postings[key]
+            del self.__sorted_keys[bisect_left(self.__sorted_keys, key)]
+
+    def clear(self):
+        self.__postings.clear()
+        self.__sorted_keys.clear()
+
+    def get_key_count(self) -> int:
+        """returns how many distinct keys are in the index"""
+        return len(self.__sorted_keys)
+
+    def find_exact(self, key: str) -> List[int]:
+        """IDs stored under exactly this key"""
+        return list(self.__postings.get(key, []))
+
+    def iter_prefix(self, prefix: str) -> Iterator[tuple]:
+        """Yields (key, ids) for every key starting with prefix, in sorted key order"""
+        position = bisect_left(self.__sorted_keys, prefix)
+        while position < len(self.__sorted_keys):
+            key = self.__sorted_keys[position]
+            if not key.startswith(prefix):
+                break
+            yield key, self.__postings[key]
+            position += 1
+
+    def find_prefix(self, prefix: str, limit: Optional[int] = None) -> List[int]:
+        """IDs for every key starting with prefix, stops early once we hit the limit"""
+        results = []
+        seen = set()
+        for _, ids in self.iter_prefix(prefix):
+            for person_id in ids:
+                if person_id not in seen:
+                    seen.add(person_id)
+                    results.append(person_id)
+                    if limit is not None and len(results) >= limit:
+                        return results
+        return results
+
+    def to_payload(self) -> Dict[str, List[int]]:
+        """Plain dict version for saving (keys come out sorted)"""
+        return {key: list(self.__postings[key]) for key in self.__sorted_keys}
+
+    @staticmethod
+    def from_payload(payload: Dict[str, List[int]]) -> 'PrefixIndex':
+        """Builds an index back from to_payload() output without re-sorting"""
+        index = PrefixIndex()
+        index.__postings = {key: dict.fromkeys(ids) for key, ids in payload.items()}
+        index.__sorted_keys = list(payload.keys())
+        return index
+
+
+class SortedIdIndex:
+    """
+    Every person ID in numeric order, packed 8 bytes each.
+    A digit prefix is a handful of numeric ranges - "12" means 12, 120-129, 1200-1299
+    and so on up to the biggest ID - so a prefix search is two bisects per range and
+    the matches come out in numeric order without looking at anything else.
+    """
+
+    def __init__(self, person_ids: Iterable[int] = ()):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private sorted array - only add/remove touch it so it stays sorted
+        self.__ids = array('q', sorted(person_ids))
+
+    def add(self, person_id: int):
+        ids = self.__ids
+        if not ids or person_id > ids[-1]:
+            ids.append(person_id)  # IDs usually go up, so this is the common case
+            return
+        position = bisect_left(ids, person_id)
+        if position == len(ids) or ids[position] != person_id:
+            ids.insert(position, person_id)
+
+    def remove(self, person_id: int):
+        position = bisect_left(self.__ids, person_id)
+        if position < len(self.__ids) and self.__ids[position] == person_id:
+            del self.__ids[position]
+
+    def clear(self):
+        self.__ids = array('q')
+
+    def get_count(self) -> int:
+        return len(self.__ids)
+
+    def iter_prefix(self, prefix: str) -> Iterator[int]:
+        """IDs whose decimal form starts with prefix (digits only), smallest first"""
+        for start, end in self.__prefix_spans(prefix):
+            for position in range(start, end):
+                yield self.__ids[position]
+
+    def count_prefix(self, prefix: str) -> int:
+        """How many IDs start with prefix - just the bisects, nothing gets built"""
+        return sum(end - start for start, end in self.__prefix_spans(prefix))
+
+    def find_prefix(self, prefix: str, limit: Optional[int] = None) -> List[int]:
+        """IDs starting with prefix, stops early once we hit the limit"""
+        results = []
+        for start, end in self.__prefix_spans(prefix):
+            if limit is not None:
+                end = min(end, start + limit - len(results))
+            results.extend(self.__ids[start:end])
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def __prefix_spans(self, prefix: str) -> List[tuple]:
+        """Private helper - (start, end) positions in the array for each numeric range"""
+        ids = self.__ids
+        if not ids:
+            return []
+        if not prefix:
+            return [(0, len(ids))]
+        if not prefix.isdigit():
+            return []
+        if prefix[0] == '0':
+            # only 0 itself starts with a zero
+            start = bisect_left(ids, 0)
+            return [(start, start + 1)] if prefix == '0' and start < len(ids) and ids[start] == 0 else []
+
+        spans = []
+        low, high = int(prefix), int(prefix) + 1
+        biggest = ids[-1]
+        while low <= biggest:
+            start = bisect_left(ids, low)
+            end = bisect_left(ids, high, start)
+            if end > start:
+                spans.append((start, end))
+            low, high = low * 10, high * 10
+        return spans
+
+
+class IndexFile:
+    """
+    Reads and writes the index file that sits next to the records file.
+    The header has a checksum and a data-version stamp (manager data version plus
+    records file size) so a stale or damaged index just gets ignored and rebuilt.
+    """
+
+    def __init__(self, storage_dir: str):
+        self.__path = os.path.join(storage_dir, INDEX_FILE_NAME)
+
+    def get_path(self) -> str:
+        """returns where the index file lives"""
+        return self.__path
+
+    def save(self, payload: Dict, data_version: int, segment_size: int):
+        """Writes the payload to a temp file then swaps it in so we never leave half a file"""
+        body = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        header = INDEX_HEADER.pack(INDEX_MAGIC, INDEX_FORMAT_VERSION, data_version,
+                                   segment_size, len(body), zlib.crc32(body))
+        temp_path = self.__path + ".tmp"
+        with open(temp_path, 'wb') as index_file:
+            index_file.write(header)
+            index_file.write(body)
+            index_file.flush()
+            os.fsync(index_file.fileno())
+        os.replace(temp_path, self.__path)
+
+    def load(self, segment_size: int) -> Optional[tuple]:
+        """
+        Returns (data_version, payload) if the index is intact and matches the records file.
+        Returns None if it's missing, corrupted, from an older format or stale.
+        """
+        try:
+            with open(self.__path, 'rb') as index_file:
+                header = index_file.read(INDEX_HEADER.size)
+                if len(header) != INDEX_HEADER.size:
+                    return None
+                magic, version, data_version, stored_size, length, crc = INDEX_HEADER.unpack(header)
+                if magic != INDEX_MAGIC or version != INDEX_FORMAT_VERSION:
+                    return None
+                # records file changed since the index was written - index is stale
+                if stored_size != segment_size:
+                    return None
+                body = index_file.read(length)
+        except OSError:
+            return None
+
+        if len(body) != length or zlib.crc32(body) != crc:
+            return None
+        return data_version, pickle.loads(body)
+
+    def remove(self):
+        """Deletes the index file so the next startup rebuilds"""
+        if os.path.exists(self.__path):
+            os.remove(self.__path)
@@ -0,0 +1,132 @@
+# person_proxy.py
+# Vax Project - lightweight Person handles
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Reports and stats mostly only care about the six medical flags, and the manager
+# already keeps those packed. A PersonProxy is just an ID plus a slot number - the
+# flag getters read the packed byte straight from the manager and the full Person
+# record (names, phone, address) is only loaded the first time one of those is needed.
+
+from typing import Optional
+from classes.base_classes import DataEntity
+from .person import (Person, COVID19_BIT, INFLUENZA_BIT, EBOLA_BIT, FEVER_BIT,
+                     FATIGUE_BIT, HEADACHE_BIT, ALL_VACCINES_MASK, ALL_SYMPTOMS_MASK)
+
+
+# ===== INHERITANCE DEMONSTRATED HERE =====
+# PersonProxy inherits from DataEntity just like Person does, so anything written
+# against the DataEntity interface (validate_data, get_display_info) works with both
+class PersonProxy(DataEntity):
+    """
+    Stand-in for a Person that loads the real record on demand.
+    Has the same getters/setters as Person so code can use either one.
+    """
+
+    def __init__(self, manager, person_id: int, slot: int):
+        super().__init__(person_id)
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private handle state - the slot is only a hint, the manager double checks it
+        self.__manager = manager
+        self.__slot = slot
+        self.__person: Optional[Person] = None  # filled in the first time we need it
+
+    def get_slot(self) -> int:
+        """returns the position this proxy points at in the manager"""
+        return self.__slot
+
+    def is_materialized(self) -> bool:
+        """True once the full Person record has been loaded"""
+        return self.__person is not None
+
+    def get_person(self) -> Person:
+        """Loads (if needed) and returns the real Person record"""
+        if self.__person is None:
+            self.__person = self.__manager.get_person_by_id(self._id)
+            if self.__person is None:
+                raise LookupError(f"Patient {self._id} is no longer in the system")
+        return self.__person
+
+    def __flags(self) -> int:
+        """Private helper - reads the packed flag byte from the manager"""
+        return self.__manager.get_flag_code(self._id, self.__slot)
+
+    # personal info - these need the full record
+    def get_first_name(self) -> str:
+        return self.get_person().get_first_name()
+
+    def get_last_name(self) -> str:
+        return self.get_person().get_last_name()
+
+    def get_phone(self) -> str:
+        return self.get_person().get_phone()
+
+    def get_address(self) -> str:
+        return self.get_person().get_address()
+
+    # medical flags - straight from the packed storage, no record load
+    def get_covid19_vaccine(self) -> bool:
+        return bool(self.__flags() & COVID19_BIT)
+
+    def get_influenza_vaccine(self) -> bool:
+        return bool(self.__flags() & INFLUENZA_BIT)
+
+    def get_ebola_vaccine(self) -> bool:
+        return bool(self.__flags() & EBOLA_BIT)
+
+    def get_fever(self) -> bool:
+        return bool(self.__flags() & FEVER_BIT)
+
+    def get_fatigue(self) -> bool:
+        return bool(self.__flags() & FATIGUE_BIT)
+
+    def get_headache(self) -> bool:
+        return bool(self.__flags() & HEADACHE_BIT)
+
+    def get_flag_code(self) -> int:
+        return self.__flags()
+
+    def get_vaccine_count(self) -> int:
+        return bin(self.__flags() & ALL_VACCINES_MASK).count('1')
+
+    def get_symptom_count(self) -> int:
+        return bin(self.__flags() & ALL_SYMPTOMS_MASK).count('1')
+
+    def is_cleared_for_entry(self) -> bool:
+        # all three vaccines and no symptoms
+        return self.__flags() == ALL_VACCINES_MASK
+
+    # setters go through the real record so the manager hears about the change
+    def set_covid19_vaccine(self, value: bool):
+        self.get_person().set_covid19_vaccine(value)
+
+    def set_influenza_vaccine(self, value: bool):
+        self.get_person().set_influenza_vaccine(value)
+
+    def set_ebola_vaccine(self, value: bool):
+        self.get_person().set_ebola_vaccine(value)
+
+    def set_fever(self, value: bool):
+        self.get_person().set_fever(value)
+
+    def set_fatigue(self, value: bool):
+        self.get_person().set_fatigue(value)
+
+    def set_headache(self, value: bool):
+        self.get_person().set_headache(value)
+
+    def reset_data(self):
+        self.get_person().reset_data()
+
+    def update_medical_data(self, vaccines=None, symptoms=None):
+        self.get_person().update_medical_data(vaccines, symptoms)
+
+    # ===== INHERITANCE & POLYMORPHISM DEMONSTRATED HERE =====
+    # Same DataEntity methods as Person - these just forward to the real record
+    def validate_data(self) -> bool:
+        return self.get_person().validate_data()
+
+    def get_display_info(self) -> str:
+        return self.get_person().get_display_info()
@@ -0,0 +1,412 @@
+# person_store.py
+# Vax Project - Person storage backends
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The VaccineManager used to just keep every Person in a list. That's fine for the
+# class demo but not for a real registry, so the actual record storage lives here now.
+# MemoryPersonStore keeps everything in a dict (same as before), TieredPersonStore
+# keeps only the recently used people in memory and spills the rest to a file.
+
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Dict, Iterator, List, Tuple
+from .person import Person
+
+# every record in the segment file starts with this header:
+# person id, insertion sequence, payload length, crc32 of the payload (length 0 = deleted record)
+RECORD_HEADER = struct.Struct('<qQII')
+SEGMENT_FILE_NAME = "records.dat"
+
+# flush() rewrites the segment file once dead copies take up more than this share of it
+# (and there's at least COMPACT_MIN_DEAD_BYTES of them, no point rewriting a tiny file)
+COMPACT_DEAD_RATIO = 0.5
+COMPACT_MIN_DEAD_BYTES = 1 << 20
+
+
+def read_record(segment, offset: int, length: int) -> Person:
+    """Reads one framed record from an open segment file and checks it wasn't corrupted"""
+    segment.seek(offset)
+    header = segment.read(RECORD_HEADER.size)
+    person_id, _, stored_length, crc = RECORD_HEADER.unpack(header)
+    payload = segment.read(stored_length)
+    if stored_length != length or zlib.crc32(payload) != crc:
+        raise IOError(f"Corrupted record for person {person_id} in segment file")
+    return pickle.loads(payload)
+
+
+# ===== INHERITANCE DEMONSTRATED HERE =====
+# PersonStore is an abstract base class - the manager only talks to this interface
+# so it doesn't care if the people live in memory or on disk
+class PersonStore(ABC):
+    """
+    Base class for where Person records actually get kept.
+    Keyed by person ID, the manager handles ordering and indexes itself.
+    """
+
+    @abstractmethod
+    def get(self, person_id: int) -> Optional[Person]:
+        """Returns the person with this ID or None"""
+        pass
+
+    @abstractmethod
+    def put(self, person: Person):
+        """Adds or replaces a person record"""
+        pass
+
+    @abstractmethod
+    def remove(self, person_id: int):
+        """Removes a person record if it's there"""
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """Removes every record"""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, int]:
+        """Returns counters about the store (hot/cold sizes, hits etc)"""
+        pass
+
+    def flush(self):
+        """Writes out anything only held in memory - nothing to do by default"""
+        pass
+
+    def get_record_locations(self, person_ids: List[int]) -> Optional[Tuple[str, List[tuple]]]:
+        """
+        (segment file path, [(id, offset, length), ...]) so another process can read
+        these records from the file itself. None when they don't live in a file
+        with a name (the default - everything's in memory).
+        """
+        return None
+
+    def close(self):
+        """Releases any files the store has open - nothing to do by default"""
+        pass
+
+
+# ===== INHERITANCE DEMONSTRATED HERE =====
+# Simplest store - everything stays in memory, same behaviour the manager always had
+class MemoryPersonStore(PersonStore):
+    """Keeps every Person in a dictionary. Default store for small registries."""
+
+    def __init__(self):
+        self.__records = {}  # person id -> Person
+
+    def get(self, person_id: int) -> Optional[Person]:
+        return self.__records.get(person_id)
+
+    def put(self, person: Person):
+        self.__records[person.id] = person
+
+    def remove(self, person_id: int):
+        self.__records.pop(person_id, None)
+
+    def clear(self):
+        self.__records.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {'hot': len(self.__records), 'cold': 0, 'hits': 0, 'faults': 0,
+                'evictions': 0, 'spills': 0, 'compactions': 0}
+
+
+# ===== INHERITANCE DEMONSTRATED HERE =====
+# Tiered store - hot records in an LRU cache, cold ones pickled into a segment file
+class TieredPersonStore(PersonStore):
+    """
+    Keeps at most hot_capacity Person objects in memory (least recently used goes first).
+    Evicted records get appended to a segment file and are loaded back on demand.
+    The file is append-only so a rewritten record just leaves the old copy as dead space,
+    flush() compacts it (copies only the live records to a fresh file) once more than
+    compact_ratio of the file is dead. With a storage_dir the segment file is kept between runs, so after flush() it holds
+    every record and the manager can open it again on the next startup.
+    Background report threads load records too, and a lookup moves things around
+    (LRU order, file position), so every public method holds the store's lock.
+    scan() is the exception - it only runs while the manager is starting up.
+    """
+
+    def __init__(self, hot_capacity: int, storage_dir: str = None,
+                 compact_ratio: float = COMPACT_DEAD_RATIO, compact_min_bytes: int = COMPACT_MIN_DEAD_BYTES):
+        if hot_capacity < 1:
+            raise ValueError("hot_capacity must be at least 1")
+        if not 0 < compact_ratio < 1:
+            raise ValueError("compact_ratio must be between 0 and 1")
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private cache state - nobody outside should touch the LRU order or file offsets
+        self.__hot_capacity = hot_capacity
+        self.__hot = OrderedDict()  # person id -> Person, most recently used at the end
+        self.__dirty = set()  # ids whose in-memory copy is newer than the file copy
+        self.__offsets = {}  # person id -> (offset, length, sequence) of the newest copy on disk
+        self.__new_sequences = {}  # person id -> sequence for records not written yet
+        self.__next_sequence = 1  # insertion order, so a rescan can put people back in order
+        self.__compact_ratio = compact_ratio
+        self.__compact_min_bytes = compact_min_bytes
+        self.__lock = threading.RLock()  # flush calls compact, so it has to be reentrant
+
+        # counters so we can see how well the cache is doing
+        self.__hits = 0
+        self.__faults = 0
+        self.__evictions = 0
+        self.__spills = 0
+        self.__compactions = 0
+
+        # no directory means a throwaway temp file that goes away on close
+        self.__segment_path = None
+        if storage_dir:
+            os.makedirs(storage_dir, exist_ok=True)
+            self.__segment_path = os.path.join(storage_dir, SEGMENT_FILE_NAME)
+            mode = 'r+b' if os.path.exists(self.__segment_path) else 'w+b'
+            self.__segment = open(self.__segment_path, mode)
+        else:
+            self.__segment = tempfile.TemporaryFile()
+
+    def get_hot_capacity(self) -> int:
+        """returns how many records we keep in memory"""
+        return self.__hot_capacity
+
+    def get(self, person_id: int) -> Optional[Person]:
+        """Cache hit just bumps the LRU order, a miss reads the record back from disk"""
+        with self.__lock:
+            person = self.__hot.get(person_id)
+            if person is not None:
+                self.__hot.move_to_end(person_id)
+                self.__hits += 1
+                return person
+
+            # not in memory - an ID we never stored isn't in the offsets either, no disk read
+            location = self.__offsets.get(person_id)
+            if location is None:
+                return None
+
+            person = self.__read_record(location[0], location[1])
+            self.__faults += 1
+            self.__hot[person_id] = person
+            self.__evict_if_needed()
+            return person
+
+    def put(self, person: Person):
+        """New or changed records go in the hot cache marked dirty"""
+        with self.__lock:
+            if person.id not in self.__offsets and person.id not in self.__new_sequences:
+                self.__new_sequences[person.id] = self.__next_sequence
+                self.__next_sequence += 1
+            self.__hot[person.id] = person
+            self.__hot.move_to_end(person.id)
+            self.__dirty.add(person.id)
+            self.__evict_if_needed()
+
+    def remove(self, person_id: int):
+        with self.__lock:
+            self.__hot.pop(person_id, None)
+            self.__dirty.discard(person_id)
+            self.__new_sequences.pop(person_id, None)
+            if self.__offsets.pop(person_id, None) is not None:
+                # tombstone so a scan of the file knows this one is gone
+                self.__append_record(person_id, 0, b"")
+
+    def clear(self):
+        with self.__lock:
+            self.__hot.clear()
+            self.__dirty.clear()
+            self.__offsets.clear()
+            self.__new_sequences.clear()
+            self.__next_sequence = 1
+            self.__segment.seek(0)
+            self.__segment.truncate()
+
+    def is_hot(self, person_id: int) -> bool:
+        """True if the record is currently in memory"""
+        return person_id in self.__hot
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.__lock:
+            cold = sum(1 for person_id in self.__offsets if person_id not in self.__hot)
+            return {
+                'hot': len(self.__hot),
+                'cold': cold,
+                'hits': self.__hits,
+                'faults': self.__faults,
+                'evictions': self.__evictions,
+                'spills': self.__spills,
+                'compactions': self.__compactions
+            }
+
+    def flush(self):
+        """
+        Writes every dirty hot record to the file so the file has the full registry,
+        then compacts the file if it's mostly dead copies by now
+        """
+        with self.__lock:
+            for person_id in list(self.__dirty):
+                self.__write_person(self.__hot[person_id])
+            self.__dirty.clear()
+
+            dead = self.get_dead_bytes()
+            if dead >= self.__compact_min_bytes and dead > self.get_segment_size() * self.__compact_ratio:
+                self.compact()
+            else:
+                self.__segment.flush()
+                os.fsync(self.__segment.fileno())
+
+    def compact(self):
+        """
+        Rewrites the segment file with only the newest copy of each record that's on disk,
+        in insertion order, and drops the old copies and tombstones.
+        Records only held in memory (dirty ones) aren't affected - flush() writes those first.
+        """
+        with self.__lock:
+            if self.__segment_path:
+                temp_path = self.__segment_path + ".compact"
+                target = open(temp_path, 'w+b')
+            else:
+                temp_path = None
+                target = tempfile.TemporaryFile()
+
+            try:
+                offsets = {}
+                position = 0
+                self.__segment.flush()
+                for person_id, location in sorted(self.__offsets.items(), key=lambda item: item[1][2]):
+                    offset, length, sequence = location
+                    self.__segment.seek(offset)
+                    target.write(self.__segment.read(RECORD_HEADER.size + length))
+                    offsets[person_id] = (position, length, sequence)
+                    position += RECORD_HEADER.size + length
+                target.flush()
+                os.fsync(target.fileno())
+            except BaseException:
+                target.close()
+                if temp_path:
+                    os.remove(temp_path)
+                raise
+
+            self.__segment.close()
+            if temp_path:
+                # swap the files over, the old one stays complete until the rename happens
+                target.close()
+                os.replace(temp_path, self.__segment_path)
+                self.__segment = open(self.__segment_path, 'r+b')
+            else:
+                self.__segment = target
+            self.__offsets = offsets
+            self.__compactions += 1
+
+    def get_segment_size(self) -> int:
+        """returns the current size of the segment file in bytes"""
+        with self.__lock:
+            self.__segment.flush()
+            return os.fstat(self.__segment.fileno()).st_size
+
+    def get_dead_bytes(self) -> int:
+        """returns how much of the segment file is old copies and tombstones"""
+        with self.__lock:
+            live = sum(RECORD_HEADER.size + location[1] for location in self.__offsets.values())
+            return self.get_segment_size() - live
+
+    def get_record_locations(self, person_ids: List[int]) -> Optional[Tuple[str, List[tuple]]]:
+        """
+        Writes out the dirty ones first so the file copy is current. None without a
+        storage_dir - the temp file has no name another process could open.
+        IDs that aren't stored are left out.
+        """
+        if not self.__segment_path:
+            return None
+        with self.__lock:
+            for person_id in person_ids:
+                if person_id in self.__dirty:
+                    self.__write_person(self.__hot[person_id])
+                    self.__dirty.discard(person_id)
+            self.__segment.flush()
+            return self.__segment_path, [(person_id,) + self.__offsets[person_id][:2]
+                                         for person_id in person_ids if person_id in self.__offsets]
+
+    def get_offsets(self) -> Dict[int, tuple]:
+        """returns a copy of where each record's newest copy lives in the file (and its sequence)"""
+        with self.__lock:
+            return dict(self.__offsets)
+
+    def set_offsets(self, offsets: Dict[int, tuple]):
+        """Points the store at records already in the file (from a saved index)"""
+        with self.__lock:
+            self.__hot.clear()
+            self.__dirty.clear()
+            self.__new_sequences.clear()
+            self.__offsets = dict(offsets)
+            self.__next_sequence = max((location[2] for location in self.__offsets.values()), default=0) + 1
+
+    def scan(self) -> Iterator[Person]:
+        """
+        Reads the whole segment file and yields the newest live copy of every record,
+        in the order they were originally added. Also rebuilds the offsets as it goes.
+        This is the slow path, only used when the saved index can't be trusted.
+        """
+        self.__segment.flush()
+        self.__segment.seek(0)
+        offsets = {}
+        position = 0
+        while True:
+            header = self.__segment.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                break
+            person_id, sequence, length, crc = RECORD_HEADER.unpack(header)
+            payload = self.__segment.read(length)
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break  # torn write at the end of the file - ignore the rest
+            if length == 0:
+                offsets.pop(person_id, None)
+            else:
+                offsets[person_id] = (position, length, sequence)
+            position += RECORD_HEADER.size + length
+
+        # anything after a torn write is garbage, cut it off so new records land in the right place
+        self.__segment.truncate(position)
+        self.set_offsets(offsets)
+        for person_id, location in sorted(offsets.items(), key=lambda item: item[1][2]):
+            yield self.__read_record(location[0], location[1])
+
+    def close(self):
+        with self.__lock:
+            self.__segment.close()
+
+    def __evict_if_needed(self):
+        """Private helper - pushes least recently used records out until we're under budget"""
+        while len(self.__hot) > self.__hot_capacity:
+            person_id, person = self.__hot.popitem(last=False)
+            self.__evictions += 1
+
+            # only write it out if the disk copy is missing or stale
+            if person_id in self.__dirty or person_id not in self.__offsets:
+                self.__write_person(person)
+                self.__dirty.discard(person_id)
+
+    def __write_person(self, person: Person):
+        """Private helper - appends a person's current state and points the offsets at it"""
+        if person.id in self.__offsets:
+            sequence = self.__offsets[person.id][2]
+        else:
+            sequence = self.__new_sequences.pop(person.id)
+        offset, length = self.__append_record(person.id, sequence, pickle.dumps(person))
+        self.__offsets[person.id] = (offset, length, sequence)
+        self.__spills += 1
+
+    def __append_record(self, person_id: int, sequence: int, payload: bytes) -> tuple:
+        """Private helper - writes one framed record at the end of the file"""
+        self.__segment.seek(0, os.SEEK_END)
+        offset = self.__segment.tell()
+        self.__segment.write(RECORD_HEADER.pack(person_id, sequence, len(payload), zlib.crc32(payload)))
+        self.__segment.write(payload)
+        return (offset, len(payload))
+
+    def __read_record(self, offset: int, length: int) -> Person:
+        """Private helper - reads one record back and checks it wasn't corrupted"""
+        self.__segment.flush()
+        return read_record(self.__segment, offset, length)
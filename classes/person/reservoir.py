@@ -0,0 +1,112 @@
+# reservoir.py
+# Vax Project - uniform sample of patient IDs
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Quick-look numbers for a huge registry don't need every record, a fair random sample
+# of a couple thousand people is plenty. Keeping the sample up to date as people get
+# added (reservoir sampling) is easy. Removals are the tricky part - if you just drop
+# the removed person from the sample it stops being uniform. This uses "random
+# pairing": every removal is remembered and paired with a later insert, which gets
+# the removed person's spot back with the right probability.
+
+import random
+from typing import Dict, Iterable, List
+
+
+class ReservoirSample:
+    """
+    Uniform random sample of up to capacity IDs out of everyone added and not removed.
+    add/remove are O(1). The sample can dip below capacity after removals until enough
+    inserts come in to refill it (call rebuild() to refill it straight from the ID list).
+    """
+
+    def __init__(self, capacity: int, seed: int = None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private sample state - the list and the position dict have to stay in sync
+        self.__capacity = capacity
+        self.__random = random.Random(seed)
+        self.__members: List[int] = []
+        self.__positions: Dict[int, int] = {}  # id -> index in __members
+        self.__population = 0
+
+        # removals not paired with an insert yet (from inside / outside the sample)
+        self.__removed_inside = 0
+        self.__removed_outside = 0
+
+    def add(self, item: int):
+        """Called for every new ID"""
+        self.__population += 1
+        pending = self.__removed_inside + self.__removed_outside
+        if pending:
+            # pair this insert with an earlier removal
+            if self.__random.random() * pending < self.__removed_inside:
+                self.__removed_inside -= 1
+                self.__insert(item)
+            else:
+                self.__removed_outside -= 1
+            return
+
+        # plain reservoir sampling (Algorithm R)
+        if len(self.__members) < self.__capacity:
+            self.__insert(item)
+        elif self.__random.random() * self.__population < self.__capacity:
+            self.__replace(self.__random.randrange(len(self.__members)), item)
+
+    def remove(self, item: int):
+        """Called for every removed ID (only IDs that were added)"""
+        self.__population = max(0, self.__population - 1)
+        position = self.__positions.pop(item, None)
+        if position is None:
+            self.__removed_outside += 1
+            return
+        last = self.__members.pop()
+        if last != item:
+            self.__members[position] = last
+            self.__positions[last] = position
+        self.__removed_inside += 1
+
+    def clear(self):
+        self.__members.clear()
+        self.__positions.clear()
+        self.__population = 0
+        self.__removed_inside = 0
+        self.__removed_outside = 0
+
+    def rebuild(self, items: Iterable[int]):
+        """Throws the sample away and draws a fresh one from the full ID list"""
+        items = list(items)
+        self.clear()
+        self.__population = len(items)
+        chosen = items if len(items) <= self.__capacity else self.__random.sample(items, self.__capacity)
+        for item in chosen:
+            self.__insert(item)
+
+    def contains(self, item: int) -> bool:
+        return item in self.__positions
+
+    def get_ids(self) -> List[int]:
+        """returns a copy of the sampled IDs (no particular order)"""
+        return list(self.__members)
+
+    def get_size(self) -> int:
+        return len(self.__members)
+
+    def get_capacity(self) -> int:
+        return self.__capacity
+
+    def get_population(self) -> int:
+        return self.__population
+
+    def __insert(self, item: int):
+        self.__positions[item] = len(self.__members)
+        self.__members.append(item)
+
+    def __replace(self, position: int, item: int):
+        del self.__positions[self.__members[position]]
+        self.__members[position] = item
+        self.__positions[item] = position
@@ -4,8 +4,31 @@
 # 06/21/2025
 # Hamza Kurdi
 
-from typing import Optional, Dict, List
-from .person import Person
+import threading
+import time
+from array import array
+from collections import Counter, OrderedDict
+from itertools import compress
+from typing import Callable, Optional, Dict, List, Iterator, Iterable, Union
+from .person import (Person, COVID19_BIT, INFLUENZA_BIT, EBOLA_BIT, FEVER_BIT,
+                     FATIGUE_BIT, HEADACHE_BIT, ALL_VACCINES_MASK, ALL_SYMPTOMS_MASK)
+from .person_store import PersonStore, MemoryPersonStore, TieredPersonStore
+from .person_index import PrefixIndex, SortedIdIndex, IndexFile
+from .cohort import Cohort, CohortRegistry
+from .person_proxy import PersonProxy
+from .reservoir import ReservoirSample
+from .patient_query import PatientQuery
+from .patient_search import SearchResult
+
+# how many people the random sample for approximate stats keeps
+DEFAULT_SAMPLE_SIZE = 2048
+
+# how many query results (sorted/filtered ID lists) to keep around for the list view
+QUERY_CACHE_SIZE = 8
+
+# vaccine / symptom count for each packed flag code, for sorting without loading records
+VACCINE_COUNTS = bytes(bin(code & ALL_VACCINES_MASK).count('1') for code in range(256))
+SYMPTOM_COUNTS = bytes(bin(code & ALL_SYMPTOMS_MASK).count('1') for code in range(256))
 
 class VaccineManager:
     """
@@ -13,43 +36,117 @@ class VaccineManager:
     Basically stores people and lets you do stuff with them like add/remove etc.
     Made it more efficient by using a dictionary to find people faster.
     
+    If you give it max_hot_records (how many Person records to keep in memory - it's a
+    record count, not bytes) it switches to tiered storage - recently used people stay in memory and the rest
+    get spilled to a file in storage_dir (or a temp file) and loaded back when needed.
+    The stats never need the full records since the medical flags are kept packed.
+    
+    With a storage_dir the registry persists: save() writes the records and an index
+    file (ID order, packed flags, name/phone indexes) and the next manager opened on the
+    same directory loads the index directly, only rescanning the records if it's stale.
+    
+    search_patients() matches the start of an ID, name or phone number for the
+    search box, using the indexes (and the previous result when the text just got longer).
+    The search box runs big searches on a worker thread, so changes to the indexes
+    happen under an index lock (see search_patients).
+    
+    Named cohorts (saved sets of patient IDs) live here too so the stats can be
+    scoped to a cohort instead of the whole population.
+    
+    The get_proxy_* / iter_proxies methods hand out PersonProxy handles instead of
+    full Person objects - flags come from the packed storage and the rest of the
+    record only gets loaded if somebody asks for a name, phone or address.
+    
+    Checking whether an ID is taken is just the lookup dictionary - it's in memory
+    even when the records aren't, so a new ID never costs a trip to the store.
+    
     ===== ENCAPSULATION DEMONSTRATED THROUGHOUT THIS CLASS =====
     This class encapsulates the management of Person objects and provides
     a clean interface for vaccine management operations.
     """
     
-    def __init__(self, max_capacity: int = 15):
+    def __init__(self, max_capacity: int = 15, max_hot_records: Optional[int] = None,
+                 storage_dir: Optional[str] = None, sample_size: int = DEFAULT_SAMPLE_SIZE):
         # ===== ENCAPSULATION DEMONSTRATED HERE =====
         # Private attributes hide the internal data structures from external access
         # External code cannot directly manipulate the people list or lookup dictionary
-        self.__people = []  # Private list of Person objects
+        self.__ids = []  # Private list of person IDs in the order they were added
+        self.__flags = bytearray()  # packed six-bit medical flag code, one byte per person
         self.__max_capacity = max_capacity  # Private capacity limit
-        self.__id_lookup = {}  # Private dictionary to make finding people faster hopefully
+        self.__id_lookup = {}  # Private dictionary from ID to position in the list
+        self.__data_version = 0  # goes up on every change so caches know when they're stale
+        
+        # secondary indexes so name/phone lookups don't need a full scan
+        self.__name_index = PrefixIndex()  # lowercase first and last names
+        self.__phone_index = PrefixIndex()  # phone digits only
+        self.__id_index = SortedIdIndex()  # IDs in numeric order for ID prefix search
+        self.__index_lock = threading.RLock()  # held while the three indexes above change or get walked
+        self.__index_version = 0  # goes up whenever they change
+        self.__cohorts = CohortRegistry()  # saved named cohorts
+        self.__sample = ReservoirSample(sample_size)  # uniform sample of IDs for approximate stats
+        self.__query_cache = OrderedDict()  # (query key, cohort, data version) -> ID tuple
+        
+        # the actual Person records live in a store - all in memory unless we got a
+        # hot record limit or a directory to keep them in
+        self.__storage_dir = storage_dir
+        self.__index_file = None
+        if max_hot_records is None and storage_dir is None:
+            self.__store: PersonStore = MemoryPersonStore()
+        else:
+            hot_capacity = max_hot_records if max_hot_records is not None else max(max_capacity, 1)
+            self.__store: PersonStore = TieredPersonStore(hot_capacity, storage_dir)
+        
+        if storage_dir:
+            self.__index_file = IndexFile(storage_dir)
+            self.__open_storage()
     
     # ===== ENCAPSULATION DEMONSTRATED HERE =====
     # Public getter methods provide controlled read-only access to private data
     # External code can query the state but cannot directly modify private attributes
     def get_person_count(self) -> int:
         """returns how many people we currently have"""
-        return len(self.__people)
+        return len(self.__ids)
     
     def get_max_capacity(self) -> int:
         """returns the max number of people allowed"""
         return self.__max_capacity
     
+    def get_data_version(self) -> int:
+        """returns a number that changes every time the registry changes"""
+        return self.__data_version
+    
+    def has_person(self, person_id: int) -> bool:
+        """checks if an ID is taken without loading the record"""
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # The lookup dictionary is internal - callers just get a yes or no
+        return person_id in self.__id_lookup
+    
+    def get_storage_stats(self) -> Dict[str, int]:
+        """returns the store counters (hot/cold record counts, cache hits, faults, spills)"""
+        return self.__store.get_stats()
+    
     def add_person(self, person: Person) -> bool:
         """tries to add a person to the system, returns True if it worked"""
         # ===== ENCAPSULATION DEMONSTRATED HERE =====
         # This method encapsulates complex validation logic and data management
         # External code just calls add_person() - all the internal complexity is hidden
-        if (len(self.__people) >= self.__max_capacity or 
-            person.id in self.__id_lookup or 
+        if (len(self.__ids) >= self.__max_capacity or 
+            self.has_person(person.id) or 
             not person.validate_data()):
             return False
         
         # Private data structures are modified through controlled internal logic
-        self.__people.append(person)
-        self.__id_lookup[person.id] = person
+        self.__id_lookup[person.id] = len(self.__ids)
+        self.__ids.append(person.id)
+        self.__flags.append(person.get_flag_code())
+        with self.__index_lock:
+            self.__index_person(person)
+            self.__id_index.add(person.id)
+            self.__index_version += 1
+        self.__sample.add(person.id)
+        person.set_change_listener(self.__on_person_changed)
+        self.__store.put(person)
+        self.__data_version += 1
         return True
     
     def get_person_by_id(self, person_id: int) -> Optional[Person]:
@@ -57,85 +154,456 @@ class VaccineManager:
         # ===== ENCAPSULATION DEMONSTRATED HERE =====
         # The internal lookup dictionary is hidden from external code
         # This method provides the interface to access private data safely
-        return self.__id_lookup.get(person_id)
+        if not self.has_person(person_id):
+            return None
+        return self.__load_person(person_id)
     
     def get_person_by_index(self, index: int) -> Optional[Person]:
         """get person by their position in the list, checks bounds so we dont crash"""
         # ===== ENCAPSULATION DEMONSTRATED HERE =====
         # Encapsulates bounds checking and safe access to private list
         # External code doesn't need to worry about array bounds - it's handled internally
-        return self.__people[index] if 0 <= index < len(self.__people) else None
+        if not 0 <= index < len(self.__ids):
+            return None
+        return self.__load_person(self.__ids[index])
+    
+    def get_proxy_by_id(self, person_id: int) -> Optional[PersonProxy]:
+        """lightweight handle for someone by ID - doesn't load the record"""
+        slot = self.__id_lookup.get(person_id)
+        return PersonProxy(self, person_id, slot) if slot is not None else None
+    
+    def get_proxy_by_index(self, index: int) -> Optional[PersonProxy]:
+        """lightweight handle for someone by position - doesn't load the record"""
+        if not 0 <= index < len(self.__ids):
+            return None
+        return PersonProxy(self, self.__ids[index], index)
+    
+    def iter_proxies(self, cohort: Union[str, Cohort] = None) -> Iterator[PersonProxy]:
+        """like iter_people() but hands out proxies, so nothing gets loaded unless it's needed"""
+        lookup = self.__id_lookup
+        for person_id in self.__member_ids(cohort):
+            slot = lookup.get(person_id)
+            if slot is not None:
+                yield PersonProxy(self, person_id, slot)
+    
+    def get_flag_code(self, person_id: int, slot: int = None) -> int:
+        """
+        returns someone's packed six-bit medical flag code.
+        slot is just a hint (proxies pass it) - if it's out of date we look the ID up again.
+        """
+        if slot is None or slot >= len(self.__ids) or self.__ids[slot] != person_id:
+            slot = self.__id_lookup.get(person_id)
+            if slot is None:
+                raise LookupError(f"Patient {person_id} is no longer in the system")
+        return self.__flags[slot]
+    
+    def find_ids_by_name(self, name: str) -> List[int]:
+        """IDs of everyone whose first or last name matches (not case sensitive)"""
+        return self.__name_index.find_exact(name.strip().lower())
+    
+    def find_ids_by_phone(self, phone: str) -> List[int]:
+        """IDs of everyone with this phone number (formatting characters are ignored)"""
+        return self.__phone_index.find_exact(self.__phone_key(phone))
+    
+    def find_ids_by_prefix(self, prefix: str, limit: Optional[int] = None) -> List[int]:
+        """IDs that start with these digits, smallest first (bisects on the sorted ID index)"""
+        return self.__id_index.find_prefix(prefix.strip(), limit)
+    
+    def count_ids_with_prefix(self, prefix: str) -> int:
+        """how many IDs start with these digits, without listing them"""
+        return self.__id_index.count_prefix(prefix.strip())
+    
+    def search_patients(self, text: str, previous: Optional[SearchResult] = None,
+                        is_cancelled: Callable[[], bool] = None) -> Optional[SearchResult]:
+        """
+        Everyone whose ID, first/last name or phone starts with text.
+        Pass the last result as previous - if text just got longer it gets filtered
+        down instead of searching again. Returns None if is_cancelled() said to stop.
+        Safe to call from a worker thread: a fresh search walks the indexes holding the
+        index lock, lets go of it briefly at each is_cancelled() check so adding people
+        isn't held up, and returns None (go again) if the indexes changed in between.
+        Refining only reads the previous result, so it doesn't need the lock.
+        """
+        if previous is not None and previous.can_refine(text, self.__data_version):
+            return previous.refine(text, is_cancelled)
+        with self.__index_lock:
+            checkpoint = self.__index_checkpoint(is_cancelled) if is_cancelled is not None else None
+            return SearchResult.from_indexes(text, self.__id_index, self.__name_index, self.__phone_index,
+                                             self.__data_version, checkpoint)
+    
+    # ===== ENCAPSULATION DEMONSTRATED HERE =====
+    # Cohort methods - callers work with names and IDs, the bitmaps stay internal details
+    def get_cohorts(self) -> CohortRegistry:
+        """returns the cohort registry (for set algebra between saved cohorts)"""
+        return self.__cohorts
+    
+    def save_cohort(self, name: str, person_ids: Iterable[int]) -> Cohort:
+        """saves a named cohort from a list of IDs - IDs not in the system get skipped"""
+        members = (person_id for person_id in person_ids if person_id in self.__id_lookup)
+        return self.__cohorts.save_cohort(Cohort.from_ids(name, members))
+    
+    def save_cohort_by_flags(self, name: str, required_bits: int = 0, excluded_bits: int = 0) -> Cohort:
+        """
+        saves a cohort of everyone whose packed flags have all of required_bits set
+        and none of excluded_bits (e.g. required_bits=FEVER_BIT for 'has a fever').
+        One pass over the packed flags, no records get loaded.
+        """
+        members = (self.__ids[slot] for slot, code in enumerate(self.__flags)
+                   if code & required_bits == required_bits and not code & excluded_bits)
+        return self.__cohorts.save_cohort(Cohort.from_ids(name, members))
     
     def get_people(self) -> List[Person]:
         """returns a copy of all the people so you cant mess with the original list"""
         # ===== ENCAPSULATION DEMONSTRATED HERE =====
         # Returns a copy instead of direct access to private data
         # This prevents external code from accidentally modifying the internal list
-        return self.__people.copy()
+        # NOTE: in tiered mode this loads every record - use iter_people() for big registries
+        return list(self.iter_people())
+    
+    def iter_ids(self, cohort: Union[str, Cohort] = None) -> Iterator[int]:
+        """goes through the IDs of everyone (or just a cohort) without loading any records"""
+        return iter(self.__member_ids(cohort))
+    
+    def get_record_locations(self, person_ids: List[int]) -> Optional[tuple]:
+        """
+        where these people's records sit in the storage file, (path, [(id, offset, length)]),
+        so a worker process can read them itself - None if they aren't in a file it can open
+        """
+        return self.__store.get_record_locations(person_ids)
+    
+    def iter_people(self, cohort: Union[str, Cohort] = None) -> Iterator[Person]:
+        """goes through everyone (or just a cohort) one at a time without building a big list"""
+        for person_id in self.__member_ids(cohort):
+            yield self.__load_person(person_id)
+    
+    def run_query(self, query: PatientQuery) -> tuple:
+        """
+        IDs matching a PatientQuery, in its sort order. Works on the packed flags and
+        the name index only, so no records get loaded. Results are cached until the
+        data changes, so paging through the same list doesn't redo the work.
+        """
+        cohort = query.get_cohort()
+        cohort_key = self.__cohorts.resolve(cohort).get_fingerprint() if cohort is not None else None
+        key = (query.get_key(), cohort_key, self.__data_version)
+        result = self.__query_cache.get(key)
+        if result is not None:
+            self.__query_cache.move_to_end(key)
+            return result
+        
+        search = query.get_search()
+        if search is not None:
+            lookup = self.__id_lookup
+            found = search.get_id_set()
+            if len(found) * 8 < len(self.__ids):
+                # small result - start from it and put it back in added order
+                ids = sorted((person_id for person_id in found if person_id in lookup), key=lookup.__getitem__)
+            else:
+                ids = [person_id for person_id in self.__ids if person_id in found]
+            if query.has_flag_filter():
+                table = query.code_table()
+                flags = self.__flags
+                ids = [person_id for person_id in ids if table[flags[lookup[person_id]]]]
+        elif query.has_flag_filter():
+            # flag filter - translate() turns the packed flags into a 0/1 mask in one C call
+            ids = list(compress(self.__ids, self.__flags.translate(query.code_table())))
+        else:
+            ids = list(self.__ids)
+        if cohort is not None:
+            members = self.__cohorts.resolve(cohort)
+            ids = [person_id for person_id in ids if members.contains(person_id)]
+        if query.get_name_prefix():
+            named = set(self.__name_index.find_prefix(query.get_name_prefix()))
+            ids = [person_id for person_id in ids if person_id in named]
+        
+        sort_by = query.get_sort_by()
+        descending = query.is_descending()
+        if sort_by == 'id':
+            ids.sort(reverse=descending)
+        elif sort_by in ('vaccines', 'symptoms'):
+            counts = VACCINE_COUNTS if sort_by == 'vaccines' else SYMPTOM_COUNTS
+            flags = self.__flags
+            lookup = self.__id_lookup
+            ids.sort(key=lambda person_id: counts[flags[lookup[person_id]]], reverse=descending)
+        elif descending:
+            ids.reverse()
+        
+        result = tuple(ids)
+        self.__query_cache[key] = result
+        if len(self.__query_cache) > QUERY_CACHE_SIZE:
+            self.__query_cache.popitem(last=False)
+        return result
+    
+    def count_query(self, query: PatientQuery) -> int:
+        """how many people match a query"""
+        return len(self.run_query(query))
+    
+    def iter_window(self, query: PatientQuery, offset: int, limit: int) -> Iterator[PersonProxy]:
+        """
+        Proxies for one page of a query's results (rows offset .. offset + limit - 1).
+        This is what the list view pages through - only the visible rows ever get loaded.
+        """
+        lookup = self.__id_lookup
+        for person_id in self.run_query(query)[max(offset, 0):max(offset, 0) + limit]:
+            yield PersonProxy(self, person_id, lookup[person_id])
+    
+    def get_index_of(self, person_id: int) -> int:
+        """position of someone in the list (-1 if they're not here)"""
+        return self.__id_lookup.get(person_id, -1)
+    
+    def remove_person(self, person_id: int) -> bool:
+        """
+        removes one person, returns False if they weren't in the system.
+        The last person in the list moves into the removed slot so nobody else has to shift.
+        """
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Every internal structure has to be updated together - callers just pass an ID
+        slot = self.__id_lookup.pop(person_id, None)
+        if slot is None:
+            return False
+        
+        person = self.__load_person(person_id)
+        person.set_change_listener(None)
+        with self.__index_lock:
+            self.__name_index.remove(person.get_first_name().lower(), person_id)
+            self.__name_index.remove(person.get_last_name().lower(), person_id)
+            self.__phone_index.remove(self.__phone_key(person.get_phone()), person_id)
+            self.__id_index.remove(person_id)
+            self.__index_version += 1
+        
+        # swap with the last slot and pop, so it's O(1) instead of shifting everyone down
+        last_id = self.__ids.pop()
+        last_flags = self.__flags.pop()
+        if last_id != person_id:
+            self.__ids[slot] = last_id
+            self.__flags[slot] = last_flags
+            self.__id_lookup[last_id] = slot
+        
+        self.__sample.remove(person_id)
+        self.__cohorts.discard_id(person_id)
+        self.__store.remove(person_id)
+        self.__data_version += 1
+        return True
     
     def clear_all_people(self) -> int:
         """removes everyone from the system and tells you how many got removed"""
         # ===== ENCAPSULATION DEMONSTRATED HERE =====
         # Encapsulates the complex operation of clearing both data structures
         # External code gets a simple interface, internal consistency is maintained
-        count = len(self.__people)
-        self.__people.clear()
+        count = len(self.__ids)
+        self.__ids.clear()
+        self.__flags.clear()
         self.__id_lookup.clear()
+        with self.__index_lock:
+            self.__name_index.clear()
+            self.__phone_index.clear()
+            self.__id_index.clear()
+            self.__index_version += 1
+        self.__cohorts.clear_members()
+        self.__sample.clear()
+        self.__store.clear()
+        self.__data_version += 1
         return count
     
     def reset_all_medical_data(self) -> int:
         """clears all the medical info for everyone, keeps the people tho"""
         # ===== ENCAPSULATION DEMONSTRATED HERE =====
         # Encapsulates iteration over private data and coordination with Person objects
-        for person in self.__people:
+        for person in self.iter_people():
             person.reset_data()  # Uses Person's encapsulated reset method
-        return len(self.__people)
+        return len(self.__ids)
     
-    def get_vaccination_stats(self) -> Dict[str, int]:
-        """calculates vaccination stats for reporting - counts each vaccine type"""
+    def get_vaccination_stats(self, cohort: Union[str, Cohort] = None) -> Dict[str, int]:
+        """calculates vaccination stats for reporting - counts each vaccine type (optionally for one cohort)"""
         # ===== ENCAPSULATION DEMONSTRATED HERE =====
         # Complex statistical calculation is encapsulated in a clean method interface
         # Internal iteration over private data is hidden from external code
-        if not self.__people:
+        code_counts = self.__count_flag_codes(cohort)
+        total = sum(code_counts.values())
+        if not total:
             return {'covid19': 0, 'influenza': 0, 'ebola': 0, 'fully_vaccinated': 0, 'total_people': 0}
         
-        stats = {'total_people': len(self.__people), 'covid19': 0, 'influenza': 0, 'ebola': 0, 'fully_vaccinated': 0}
+        stats = {'total_people': total, 'covid19': 0, 'influenza': 0, 'ebola': 0, 'fully_vaccinated': 0}
         
-        # Private data access is encapsulated within this method
-        for person in self.__people:
-            if person.get_covid19_vaccine():  # Using Person's encapsulated getter methods
-                stats['covid19'] += 1
-            if person.get_influenza_vaccine():
-                stats['influenza'] += 1
-            if person.get_ebola_vaccine():
-                stats['ebola'] += 1
-            if person.is_cleared_for_entry():  # Using Person's encapsulated business logic
-                stats['fully_vaccinated'] += 1
+        # counting the packed flag codes means we never have to load the Person records
+        for code, count in code_counts.items():
+            if code & COVID19_BIT:
+                stats['covid19'] += count
+            if code & INFLUENZA_BIT:
+                stats['influenza'] += count
+            if code & EBOLA_BIT:
+                stats['ebola'] += count
+            if code == ALL_VACCINES_MASK:  # all vaccines, no symptoms = cleared for entry
+                stats['fully_vaccinated'] += count
         
         return stats
     
-    def get_symptom_stats(self) -> Dict[str, int]:
-        """counts up all the different symptoms people have - for the health reports"""
+    def get_symptom_stats(self, cohort: Union[str, Cohort] = None) -> Dict[str, int]:
+        """counts up all the different symptoms people have - for the health reports (optionally for one cohort)"""
         # ===== ENCAPSULATION DEMONSTRATED HERE =====
         # Another example of encapsulating complex data processing
         # External code gets clean statistics without knowing internal implementation
-        if not self.__people:
+        code_counts = self.__count_flag_codes(cohort)
+        if not code_counts:
             return {'fever': 0, 'fatigue': 0, 'headache': 0, 'any_symptoms': 0, 'cleared_for_entry': 0}
         
         stats = {'fever': 0, 'fatigue': 0, 'headache': 0, 'any_symptoms': 0, 'cleared_for_entry': 0}
         
-        # Iteration over private data is encapsulated within this method
-        for person in self.__people:
-            # Uses Person's encapsulated getter methods instead of direct attribute access
-            if person.get_fever():
-                stats['fever'] += 1
-            if person.get_fatigue():
-                stats['fatigue'] += 1
-            if person.get_headache():
-                stats['headache'] += 1
-            if person.get_symptom_count() > 0:  # Uses Person's encapsulated calculation
-                stats['any_symptoms'] += 1
-            if person.is_cleared_for_entry():  # Uses Person's encapsulated business logic
-                stats['cleared_for_entry'] += 1
-        
-        return stats
\ No newline at end of file
+        # same trick as above - one pass over the packed codes
+        for code, count in code_counts.items():
+            if code & FEVER_BIT:
+                stats['fever'] += count
+            if code & FATIGUE_BIT:
+                stats['fatigue'] += count
+            if code & HEADACHE_BIT:
+                stats['headache'] += count
+            if code & ALL_SYMPTOMS_MASK:
+                stats['any_symptoms'] += count
+            if code == ALL_VACCINES_MASK:
+                stats['cleared_for_entry'] += count
+        
+        return stats
+    
+    def get_flag_code_counts(self, cohort: Union[str, Cohort] = None) -> Dict[int, int]:
+        """returns how many people have each packed six-bit flag code (everyone or one cohort)"""
+        return dict(self.__count_flag_codes(cohort))
+    
+    def get_sample_flag_code_counts(self, cohort: Union[str, Cohort] = None) -> Dict[int, int]:
+        """
+        Same as get_flag_code_counts but only over the random sample - a couple thousand
+        lookups no matter how big the registry is. With a cohort only sampled members count.
+        """
+        lookup = self.__id_lookup
+        flags = self.__flags
+        sampled = self.__sample.get_ids()
+        if cohort is not None:
+            members = self.__cohorts.resolve(cohort)
+            sampled = [person_id for person_id in sampled if members.contains(person_id)]
+        return dict(Counter(flags[lookup[person_id]] for person_id in sampled))
+    
+    def get_population_size(self, cohort: Union[str, Cohort] = None) -> int:
+        """how many people are in the system (or in a cohort) without counting flags"""
+        if cohort is None:
+            return len(self.__ids)
+        return len(self.__member_ids(cohort))
+    
+    def get_sample_size(self) -> int:
+        """returns how many people the approximate-stats sample holds right now"""
+        return self.__sample.get_size()
+    
+    def __count_flag_codes(self, cohort: Union[str, Cohort] = None) -> Counter:
+        """Private helper - histogram of the packed flag codes in one pass"""
+        if cohort is None:
+            return Counter(self.__flags)
+        flags = self.__flags
+        lookup = self.__id_lookup
+        return Counter(flags[lookup[person_id]] for person_id in self.__member_ids(cohort))
+    
+    def __member_ids(self, cohort: Union[str, Cohort] = None) -> Iterable[int]:
+        """Private helper - IDs of everyone, or of the cohort members still in the system"""
+        if cohort is None:
+            return self.__ids.copy()
+        lookup = self.__id_lookup
+        return [person_id for person_id in self.__cohorts.resolve(cohort).iter_ids()
+                if person_id in lookup]
+    
+    def save(self):
+        """
+        Writes every record plus the index file to storage_dir.
+        Only works when the manager was created with a storage_dir.
+        """
+        if not self.__index_file:
+            raise ValueError("save() needs a VaccineManager created with a storage_dir")
+        
+        self.__store.flush()
+        payload = {
+            'ids': array('q', self.__ids).tobytes(),
+            'flags': bytes(self.__flags),
+            'offsets': self.__store.get_offsets(),
+            'name_index': self.__name_index.to_payload(),
+            'phone_index': self.__phone_index.to_payload()
+        }
+        self.__index_file.save(payload, self.__data_version, self.__store.get_segment_size())
+        self.__cohorts.save_to(self.__storage_dir)
+    
+    def close(self):
+        """Saves (if we have a storage_dir) and releases the storage files"""
+        if self.__index_file:
+            self.save()
+        self.__store.close()
+    
+    def __open_storage(self):
+        """Private helper - loads the saved index, or rebuilds it if it's missing or stale"""
+        # cohorts aren't derived from the records so they have their own file
+        self.__cohorts.load_from(self.__storage_dir)
+        
+        segment_size = self.__store.get_segment_size()
+        loaded = self.__index_file.load(segment_size)
+        
+        if loaded is not None:
+            # fast path - no records get touched at all
+            self.__data_version, payload = loaded
+            ids = array('q')
+            ids.frombytes(payload['ids'])
+            self.__ids = ids.tolist()
+            self.__flags = bytearray(payload['flags'])
+            self.__id_lookup = {person_id: slot for slot, person_id in enumerate(self.__ids)}
+            self.__name_index = PrefixIndex.from_payload(payload['name_index'])
+            self.__phone_index = PrefixIndex.from_payload(payload['phone_index'])
+            self.__store.set_offsets(payload['offsets'])
+            self.__id_index = SortedIdIndex(self.__ids)  # just a sort, not worth saving
+            self.__sample.rebuild(self.__ids)
+            return
+        
+        if segment_size == 0:
+            return  # brand new directory, nothing to load
+        
+        # slow path - read every record back and rebuild the indexes from scratch
+        for person in self.__store.scan():
+            self.__id_lookup[person.id] = len(self.__ids)
+            self.__ids.append(person.id)
+            self.__flags.append(person.get_flag_code())
+            self.__index_person(person)
+        self.__id_index = SortedIdIndex(self.__ids)
+        self.__sample.rebuild(self.__ids)
+    
+    def __index_checkpoint(self, is_cancelled: Callable[[], bool]) -> Callable[[], bool]:
+        """
+        Private helper - wraps is_cancelled for a search holding the index lock. Each check
+        drops the lock for a moment so a waiting add/remove can get in, and says stop
+        if one did (the walk's place in the indexes isn't valid anymore).
+        """
+        version = self.__index_version
+        
+        def checkpoint() -> bool:
+            self.__index_lock.release()
+            time.sleep(0)  # actually give the waiting thread a turn
+            self.__index_lock.acquire()
+            return self.__index_version != version or is_cancelled()
+        return checkpoint
+    
+    def __index_person(self, person: Person):
+        """Private helper - adds a person to the name and phone indexes"""
+        self.__name_index.add(person.get_first_name().lower(), person.id)
+        self.__name_index.add(person.get_last_name().lower(), person.id)
+        self.__phone_index.add(self.__phone_key(person.get_phone()), person.id)
+    
+    @staticmethod
+    def __phone_key(phone: str) -> str:
+        """Private helper - phone numbers are indexed by their digits only"""
+        return ''.join(c for c in phone if c.isdigit())
+    
+    def __load_person(self, person_id: int) -> Person:
+        """Private helper - gets the record from the store and makes sure we hear about changes"""
+        person = self.__store.get(person_id)
+        # records coming back from disk don't have the listener anymore
+        person.set_change_listener(self.__on_person_changed)
+        return person
+    
+    def __on_person_changed(self, person: Person):
+        """Private callback - keeps the packed flags and the stored record in sync"""
+        slot = self.__id_lookup.get(person.id)
+        if slot is None:
+            return
+        self.__flags[slot] = person.get_flag_code()
+        self.__store.put(person)  # marks it dirty so the tiered store writes it out again
+        self.__data_version += 1
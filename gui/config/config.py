@@ -17,6 +17,7 @@ class GUIConfiguration:
         self.__window_width = 800
         self.__window_height = 750
         self.__window_title = "Vaccine Tracker"
+        self.__version = 0  # bumped on any change that affects how things look
         
         # color scheme - keeping these private w/ getters
         self.__colors = {
@@ -37,6 +38,12 @@ class GUIConfiguration:
         self.__card_margin = 20
         self.__form_columns = 2
         self.__button_spacing = 10
+        
+        # recurring background reports - name: (report type, seconds between runs)
+        self.__report_schedule = {
+            'hourly_vaccination_stats': ('vaccination', 60 * 60),
+            'daily_symptom_analysis': ('symptom', 24 * 60 * 60)
+        }
     
     # getter methods for the config values
     def get_window_size(self) -> tuple:
@@ -55,11 +62,26 @@ class GUIConfiguration:
         """Returns the card margin value"""
         return self.__card_margin
     
+    def get_version(self) -> int:
+        """Changes whenever colors or the window size change - cached drawings check this"""
+        return self.__version
+    
+    def get_report_schedule(self) -> Dict[str, tuple]:
+        """Returns the recurring report jobs as name -> (report type, interval in seconds)"""
+        return self.__report_schedule.copy()
+    
     def set_window_title(self, title: str):
         """Changes the window title"""
         self.__window_title = title
     
+    def set_window_size(self, width: int, height: int):
+        """Changes the window size (the window itself has to be recreated by the caller)"""
+        self.__window_width = width
+        self.__window_height = height
+        self.__version += 1
+    
     def update_color(self, color_name: str, color_value: tuple):
         """Updates a specific color if it exists"""
         if color_name in self.__colors:
-            self.__colors[color_name] = color_value
\ No newline at end of file
+            self.__colors[color_name] = color_value
+            self.__version += 1
\ No newline at end of file
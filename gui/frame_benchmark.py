@@ -0,0 +1,311 @@
+# frame_benchmark.py
+# Vax Project Frame Benchmark
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Runs the real GUI headless (SDL dummy drivers, nothing on screen) and plays a script
+# of mouse and keyboard events through it - idle, hovering, filling in the form, the
+# list view, search, reports and navigation - timing every frame with FrameProfiler.
+# It does this for several registry sizes so we see if a frame gets slower as the
+# number of patients grows. Meant for CI machines with no display:
+#
+#   python -m gui.frame_benchmark --populations 0 1000 100000 1000000 --budget-ms 16
+#
+# Exits with 1 if any phase's p95 is over --budget-ms.
+
+import os
+
+# has to be set before pygame starts up anything
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import random
+import sys
+import time
+import pygame
+from typing import Dict, List
+
+from classes.person.person import Person
+from classes.person.vaccine_manager import VaccineManager
+from systems.render.frame_profiler import FrameProfiler, SurfaceCounter
+from .main_gui import VaccineTrackerGUI
+
+DEFAULT_POPULATIONS = [0, 1000, 100000, 1000000]
+
+FIRST_NAMES = ["Ann", "Ben", "Carla", "David", "Elena", "Frank", "Grace", "Hassan",
+               "Ivy", "Jamal", "Kim", "Luis", "Maya", "Noah", "Omar", "Priya"]
+LAST_NAMES = ["Lee", "Smith", "Garcia", "Nguyen", "Patel", "Brown", "Kurdi", "Lopez",
+              "Chen", "Johnson", "Rossi", "Khan", "Silva", "Martin", "Walker", "Young"]
+
+# the patient the script adds - the form only takes IDs up to 999 and the made-up
+# population has 7 digit IDs, so they never clash
+SCRIPT_PATIENT_ID = "999"
+
+# where things are on the 800x750 window (see main_gui/handlers for the layout)
+ID_FIELD = (160, 168)
+FIRST_NAME_FIELD = (160, 213)
+LAST_NAME_FIELD = (160, 258)
+COVID_CHECKBOX = (95, 323)
+ADD_BUTTON = (395, 415)
+DIALOG_OK = (600, 485)  # OK on the centered 500x280 dialog
+REPORT_OK = (670, 605)  # OK on the 640x520 report dialog
+REPORT_TEXT = (400, 300)
+FIRST_SUGGESTION = (215, 398)  # first ID button in the report dialog
+PREVIOUS_BUTTON = (330, 625)
+NEXT_BUTTON = (430, 625)
+LIST_BUTTON = (530, 625)
+FILTER_BUTTON = (640, 625)
+SEARCH_FIELD = (177, 621)
+LIST_ROWS = (300, 520)
+LIST_HEADERS = [(40, 450), (120, 450), (340, 450)]  # ID, Name, Vaccines
+INDIVIDUAL_REPORT_BUTTON = (70, 665)
+VACCINE_STATS_BUTTON = (202, 665)
+
+# longest we wait on a search or report running in the background
+SETTLE_TIMEOUT_S = 10.0
+
+
+def build_population(count: int, seed: int = 5230) -> VaccineManager:
+    """Manager with count made-up patients - same seed, same people, so runs compare"""
+    rng = random.Random(seed)
+    manager = VaccineManager(max_capacity=count + 10)
+    ids = rng.sample(range(1000000, 10000000), count)
+    for person_id in ids:
+        person = Person(person_id, rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES),
+                        f"{rng.randrange(200, 1000)}-555-{rng.randrange(10000):04d}")
+        bits = rng.getrandbits(6)
+        person.update_medical_data(
+            vaccines={'covid19': bool(bits & 1), 'influenza': bool(bits & 2), 'ebola': bool(bits & 4)},
+            symptoms={'fever': bool(bits & 8), 'fatigue': bool(bits & 16), 'headache': bool(bits & 32)}
+        )
+        manager.add_person(person)
+    return manager
+
+
+# scripted input - the same events pygame would put in the queue
+def click_events(pos: tuple) -> list:
+    return [
+        pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)),
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1),
+        pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1),
+    ]
+
+
+def key_events(char: str) -> list:
+    key = pygame.K_RETURN if char == "\r" else ord(char)
+    return [
+        pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char, mod=0, scancode=0),
+        pygame.event.Event(pygame.KEYUP, key=key, unicode=char, mod=0, scancode=0),
+    ]
+
+
+def wheel_events(rows: int) -> list:
+    return [pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=rows, flipped=False)]
+
+
+def move_events(pos: tuple) -> list:
+    return [pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(1, 1), buttons=(0, 0, 0))]
+
+
+class FrameBenchmark:
+    """
+    Plays the script against one GUI and records every frame in a FrameProfiler.
+    Each phase is a named group of frames so the report says where time went.
+    """
+
+    def __init__(self, manager: VaccineManager, profiler: FrameProfiler):
+        self.__manager = manager
+        self.__profiler = profiler
+        self.__app = None
+
+    def run(self) -> Dict[str, dict]:
+        """Runs the whole script once, returns the profiler report"""
+        self.__app = VaccineTrackerGUI(self.__manager, headless=True, auto_run=False)
+        self.__profiler.start()
+        try:
+            self.__app.run_frame([])  # first frame paints everything, it isn't part of any phase
+            for name, phase in self.__phases():
+                self.__profiler.begin_phase(name)
+                phase()
+        finally:
+            self.__profiler.stop()
+            self.__app.close(quit_pygame=False)  # the next pass reuses pygame (and pygwidgets' fonts)
+            self.__manager.remove_person(int(SCRIPT_PATIENT_ID))  # back how we found it for the next pass
+        return self.__profiler.get_report()
+
+    def __phases(self) -> list:
+        return [
+            ("idle", self.__idle),
+            ("hover", self.__hover),
+            ("form_typing", self.__form_typing),
+            ("add_patient", self.__add_patient),
+            ("list_scroll", self.__list_scroll),
+            ("list_sort_filter", self.__list_sort_filter),
+            ("search", self.__search),
+            ("individual_report", self.__individual_report),
+            ("background_report", self.__background_report),
+            ("navigate", self.__navigate),
+        ]
+
+    def __frame(self, events: list = ()) -> bool:
+        return self.__profiler.measure(lambda: self.__app.run_frame(list(events)))
+
+    def __click(self, pos: tuple):
+        self.__frame(click_events(pos))
+
+    def __type(self, text: str):
+        for char in text:
+            self.__frame(key_events(char))
+
+    def __settle(self):
+        """Keeps running frames until the search/report running elsewhere is done"""
+        deadline = time.perf_counter() + SETTLE_TIMEOUT_S
+        while self.__app.has_background_work() and time.perf_counter() < deadline:
+            time.sleep(0.005)
+            self.__frame()
+        self.__frame()  # the frame that shows the result
+
+    # ===== the script =====
+    def __idle(self):
+        for _ in range(60):
+            self.__frame()
+
+    def __hover(self):
+        # sweep across the form and over the buttons along the bottom
+        for step in range(60):
+            self.__frame(move_events((40 + step * 12, 150 + (step * 9) % 520)))
+
+    def __form_typing(self):
+        self.__click(ID_FIELD)
+        self.__type(SCRIPT_PATIENT_ID)
+        self.__click(FIRST_NAME_FIELD)
+        self.__type("Benchmark")
+        self.__click(LAST_NAME_FIELD)
+        self.__type("Patient")
+        self.__click(COVID_CHECKBOX)
+
+    def __add_patient(self):
+        self.__click(ADD_BUTTON)
+        for _ in range(10):
+            self.__frame()
+        self.__click(DIALOG_OK)
+
+    def __list_scroll(self):
+        self.__click(LIST_BUTTON)
+        self.__frame(move_events(LIST_ROWS))
+        for _ in range(30):
+            self.__frame(wheel_events(-1))
+        for _ in range(10):
+            self.__frame(wheel_events(1))
+        self.__click((LIST_ROWS[0], LIST_ROWS[1] + 20))
+
+    def __list_sort_filter(self):
+        for header in LIST_HEADERS:
+            self.__click(header)
+            self.__click(header)  # again flips the order
+        for _ in range(4):  # all the way round the filters, back to everyone
+            self.__click(FILTER_BUTTON)
+
+    def __search(self):
+        self.__click(SEARCH_FIELD)
+        self.__type("ma")
+        self.__settle()
+        self.__type("r")  # refines the last result
+        self.__settle()
+        for _ in range(3):
+            self.__type("\b")
+        self.__settle()
+        self.__click(LIST_BUTTON)  # back to the patient card
+
+    def __individual_report(self):
+        self.__click(INDIVIDUAL_REPORT_BUTTON)
+        self.__type(SCRIPT_PATIENT_ID[:2])
+        self.__click(FIRST_SUGGESTION)
+        self.__frame(move_events(REPORT_TEXT))
+        for _ in range(5):
+            self.__frame(wheel_events(-1))
+        for _ in range(5):
+            self.__frame(wheel_events(1))
+        self.__click(REPORT_OK)
+
+    def __background_report(self):
+        self.__click(VACCINE_STATS_BUTTON)
+        self.__settle()
+        self.__click(REPORT_OK)
+
+    def __navigate(self):
+        for _ in range(10):
+            self.__click(PREVIOUS_BUTTON)
+        for _ in range(10):
+            self.__click(NEXT_BUTTON)
+
+
+def run_population(count: int, track_allocations: bool, counter: SurfaceCounter) -> Dict[str, dict]:
+    """
+    Builds the population, times the script, then (optionally) runs it again with
+    tracemalloc on for the memory numbers - tracemalloc would skew the timings.
+    """
+    manager = build_population(count)
+    report = FrameBenchmark(manager, FrameProfiler(surface_counter=counter)).run()
+    if track_allocations:
+        memory = FrameBenchmark(manager, FrameProfiler(track_allocations=True)).run()
+        for name, summary in memory.items():
+            report[name]['peak_kb'] = summary.get('peak_kb', 0.0)
+            report[name]['retained_blocks'] = summary.get('retained_blocks', 0)
+    return report
+
+
+def print_report(count: int, report: Dict[str, dict]):
+    print(f"\n{count:,} patients")
+    print(f"{'phase':<20}{'frames':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+          f"{'surfaces':>10}{'peak KB':>9}{'retained':>10}")
+    for name, summary in report.items():
+        print(f"{name:<20}{summary['frames']:>7}{summary['p50_ms']:>9.2f}{summary['p95_ms']:>9.2f}"
+              f"{summary['p99_ms']:>9.2f}{summary['max_ms']:>9.2f}{summary['surfaces']:>10}"
+              f"{summary.get('peak_kb', ''):>9}{summary.get('retained_blocks', ''):>10}")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Headless frame-time benchmark for the Vaccine Tracker GUI")
+    parser.add_argument("--populations", type=int, nargs="+", default=DEFAULT_POPULATIONS,
+                        help="registry sizes to run the script against")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="fail if any phase's p95 frame time is over this")
+    parser.add_argument("--json", dest="json_path", default=None, help="also write the results here")
+    parser.add_argument("--no-allocations", action="store_true",
+                        help="skip the second (tracemalloc) pass")
+    args = parser.parse_args(argv)
+
+    # fonts have to be created after this to have their renders counted
+    counter = SurfaceCounter()
+    counter.install()
+    results = {}
+    try:
+        for count in args.populations:
+            started = time.perf_counter()
+            results[count] = run_population(count, not args.no_allocations, counter)
+            print_report(count, results[count])
+            print(f"({time.perf_counter() - started:.1f}s including building the population)")
+    finally:
+        counter.uninstall()
+        pygame.quit()
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({str(count): report for count, report in results.items()}, f, indent=2)
+
+    if args.budget_ms is not None:
+        over = [(count, name, summary['p95_ms']) for count, report in results.items()
+                for name, summary in report.items() if summary['p95_ms'] > args.budget_ms]
+        for count, name, p95 in over:
+            print(f"OVER BUDGET: {name} at {count:,} patients, p95 {p95:.2f} ms > {args.budget_ms} ms")
+        if over:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# background_handler.py
+# Static Background Layer Module
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+import pygame
+import pygwidgets
+from ..config.config import GUIConfiguration
+
+
+class BackgroundLayerHandler:
+    """
+    Draws the parts of the window that never change - the background color, the
+    cards with their shadows, and the title/subtitle - onto one surface, once.
+    Every frame after that is a single blit instead of a dozen rounded rectangles
+    and two text widgets. The surface gets rebuilt if the config colors change
+    (GUIConfiguration.get_version) or the window changes size.
+    """
+
+    # (x, y, width, height, color name) for each card - x None means the card margin
+    CARD_LAYOUT = [
+        (None, 10, 760, 85, 'card'),  # header
+        (None, 105, 760, 320, 'form_bg'),  # form
+        (None, 435, 680, 170, 'card'),  # display
+        (710, 490, 70, 70, 'card'),  # status indicator
+    ]
+    # positions in CARD_LAYOUT, for code that needs to know where a card is
+    HEADER_CARD = 0
+    FORM_CARD = 1
+    DISPLAY_CARD = 2
+
+    def __init__(self, window, config: GUIConfiguration):
+        self.__window = window
+        self.__config = config
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private cached layer plus what it was built from, so we know when it's stale
+        self.__layer = None
+        self.__built_version = None
+        self.__built_size = None
+        self.__rebuild_count = 0
+
+    def get_card_rect(self, card: int) -> pygame.Rect:
+        """Where one of the CARD_LAYOUT cards sits on screen (without its shadow)"""
+        x, y, width, height, _ = self.CARD_LAYOUT[card]
+        return pygame.Rect(self.__config.get_card_margin() if x is None else x, y, width, height)
+
+    def get_layer(self) -> pygame.Surface:
+        """The pre-drawn background, rebuilt first if the colors or window size changed"""
+        window_size = self.__window.get_size()
+        if (self.__layer is None or self.__built_version != self.__config.get_version()
+                or self.__built_size != window_size):
+            self.__layer = self.__build_layer(window_size)
+            self.__built_version = self.__config.get_version()
+            self.__built_size = window_size
+            self.__rebuild_count += 1
+        return self.__layer
+
+    def draw(self):
+        """One blit for the whole static background (respects the window's clip area)"""
+        self.__window.blit(self.get_layer(), (0, 0))
+
+    def invalidate(self):
+        """Forces a rebuild on the next draw"""
+        self.__layer = None
+
+    def get_rebuild_count(self) -> int:
+        """How many times the layer has been drawn from scratch"""
+        return self.__rebuild_count
+
+    def __build_layer(self, window_size: tuple) -> pygame.Surface:
+        """Private helper - draws the background, cards and header text onto a new surface"""
+        colors = self.__config.get_colors()
+        layer = pygame.Surface(window_size)
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()  # same pixel format as the window = fastest blit
+        layer.fill(colors['bg'])
+
+        margin = self.__config.get_card_margin()
+        for x, y, width, height, color_name in self.CARD_LAYOUT:
+            self.__draw_modern_card(layer, margin if x is None else x, y, width, height,
+                                    colors[color_name], colors['border'])
+
+        # title and subtitle never change, so they're part of the layer too
+        pygwidgets.DisplayText(
+            layer, (margin, 25), "Vaccine Tracker",
+            fontSize=28, textColor=colors['primary'], justified='center', width=760
+        ).draw()
+        pygwidgets.DisplayText(
+            layer, (margin, 55), "COP5230 Hamza Kurdi - M5 Assignment",
+            fontSize=14, textColor=colors['text_light'], justified='center', width=760
+        ).draw()
+        return layer
+
+    @staticmethod
+    def __draw_modern_card(surface, x: int, y: int, width: int, height: int,
+                           color: tuple, border_color: tuple):
+        """Card with a shadow and a border (moved here from the main GUI)"""
+        # shadow first
+        shadow_rect = pygame.Rect(x + 3, y + 3, width, height)
+        pygame.draw.rect(surface, (0, 0, 0, 30), shadow_rect, border_radius=12)
+
+        # main card
+        card_rect = pygame.Rect(x, y, width, height)
+        pygame.draw.rect(surface, color, card_rect, border_radius=12)
+        pygame.draw.rect(surface, border_color, card_rect, 2, border_radius=12)
@@ -9,6 +9,7 @@ import pygwidgets
 from typing import Optional, Dict, Any
 from ..config.config import GUIConfiguration
 from classes.person.person import Person
+from systems.render.resource_cache import DEFAULT_RESOURCE_CACHE
 
 
 class PatientDisplayHandler:
@@ -24,6 +25,7 @@ class PatientDisplayHandler:
         
         # display widgets - need to keep track of these
         self.__display_widgets = []
+        self.__overview_label = None
         self.__patient_text = None
         self.__counter_label = None
         self.__nav_buttons = {}
@@ -40,11 +42,11 @@ class PatientDisplayHandler:
         self.__nav_buttons.clear()
         
         # patient overview section label
-        overview_label = pygwidgets.DisplayText(
+        self.__overview_label = pygwidgets.DisplayText(
             self.__window, (50, 440), "Patient Overview",
             fontSize=16, textColor=self.__colors['text_dark']
         )
-        self.__display_widgets.append(overview_label)
+        self.__display_widgets.append(self.__overview_label)
         
         # main patient text display area
         self.__patient_text = pygwidgets.DisplayText(
@@ -69,6 +71,16 @@ class PatientDisplayHandler:
             self.__window, (380, 605), "Next"
         )
         
+        # switches the card between one patient and the list (PatientListHandler)
+        self.__nav_buttons['list'] = pygwidgets.TextButton(
+            self.__window, (480, 605), "List View"
+        )
+        # cycles the list's status filter - only shows up in list mode
+        self.__nav_buttons['filter'] = pygwidgets.TextButton(
+            self.__window, (590, 605), "Filter"
+        )
+        self.__nav_buttons['filter'].hide()
+        
         self.__display_widgets.extend(self.__nav_buttons.values())
     
     def get_display_widgets(self) -> list:
@@ -79,6 +91,18 @@ class PatientDisplayHandler:
         """Returns the navigation button dictionary"""
         return self.__nav_buttons
     
+    def set_list_mode(self, list_mode: bool):
+        """The list takes over the patient text area, so hide the detail text while it's up"""
+        for widget in (self.__overview_label, self.__patient_text):
+            if list_mode:
+                widget.hide()
+            else:
+                widget.show()
+        if list_mode:
+            self.__nav_buttons['filter'].show()
+        else:
+            self.__nav_buttons['filter'].hide()
+    
     def __truncate_text(self, text: str, max_length: int = 40) -> str:
         """Cuts off long text so it fits better on screen"""
         if len(text) <= max_length:
@@ -162,7 +186,6 @@ class PatientDisplayHandler:
         pygame.draw.circle(self.__window, self.__colors['card'], self.__indicator_pos, 20, 3)
         
         # add the status symbol inside the circle
-        status_font = pygame.font.Font(None, 24)
         if self.__indicator_color == self.__colors['success']:
             status_text = "+"
         elif self.__indicator_color == self.__colors['danger']:
@@ -170,6 +193,6 @@ class PatientDisplayHandler:
         else:
             status_text = "?"
         
-        text_surface = status_font.render(status_text, True, self.__colors['card'])
+        text_surface = DEFAULT_RESOURCE_CACHE.render_text(status_text, self.__colors['card'], 24)
         text_rect = text_surface.get_rect(center=self.__indicator_pos)
         self.__window.blit(text_surface, text_rect)
\ No newline at end of file
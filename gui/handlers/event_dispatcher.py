@@ -0,0 +1,161 @@
+# event_dispatcher.py
+# Event Dispatch Module
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+import pygame
+from typing import Callable, Dict, List, Optional, Tuple
+
+MOUSE_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL)
+KEY_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT)
+
+
+class DispatchEntry:
+    """One registered widget - where it is, which layer it's in and what to call when it fires"""
+
+    def __init__(self, widget, layer: int, order: int, callback: Optional[Callable]):
+        self.widget = widget
+        self.rect = widget.getRect()
+        self.layer = layer
+        self.order = order
+        self.callback = callback
+        self.focusable = hasattr(widget, 'focus')  # text fields take keyboard input
+
+    def sort_key(self) -> Tuple[int, int]:
+        return (self.layer, self.order)
+
+
+class EventDispatcher:
+    """
+    Sends each event only to the widgets that can care about it, instead of every
+    widget on screen. Widgets are put in a grid of cells by their rect, so a mouse
+    event only looks at the cell under the pointer.
+    - mouse events go to widgets under the pointer, plus the ones that were under it
+      last time (so buttons see the pointer leave) and any button still held down
+    - clicks also go to focused text fields so they can lose focus
+    - keyboard events only go to the focused text field
+    Lower layer numbers get the event first, and the first widget whose handleEvent
+    returns True gets its callback run and stops the event, same as the old loop.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private grid - (column, row) -> entries whose rect touches that cell
+        self.__cell_size = cell_size
+        self.__grid: Dict[Tuple[int, int], List[DispatchEntry]] = {}
+        self.__entries: Dict[int, DispatchEntry] = {}  # id(widget) -> entry
+        self.__focusable: List[DispatchEntry] = []
+        self.__order = 0
+
+        self.__hover_targets: List[DispatchEntry] = []  # under the pointer last mouse event
+        self.__pressed_targets: List[DispatchEntry] = []  # got the mouse down, waiting for the up
+        self.__pointer = None  # last pointer position an event told us about
+
+        self.__events = 0
+        self.__deliveries = 0
+
+    def register(self, widget, callback: Callable = None, layer: int = 0):
+        """
+        Adds an interactive widget. callback(widget) runs when its handleEvent returns True.
+        Widgets without handleEvent (labels) are ignored.
+        """
+        if not hasattr(widget, 'handleEvent'):
+            return
+        self.unregister(widget)
+        entry = DispatchEntry(widget, layer, self.__order, callback)
+        self.__order += 1
+        self.__entries[id(widget)] = entry
+        for cell in self.__cells_for(entry.rect):
+            self.__grid.setdefault(cell, []).append(entry)
+        if entry.focusable:
+            self.__focusable.append(entry)
+
+    def unregister(self, widget):
+        entry = self.__entries.pop(id(widget), None)
+        if entry is None:
+            return
+        for cell in self.__cells_for(entry.rect):
+            cell_entries = self.__grid.get(cell)
+            if cell_entries is not None:
+                cell_entries.remove(entry)
+                if not cell_entries:
+                    del self.__grid[cell]
+        if entry.focusable:
+            self.__focusable.remove(entry)
+        self.__hover_targets = [target for target in self.__hover_targets if target is not entry]
+        self.__pressed_targets = [target for target in self.__pressed_targets if target is not entry]
+
+    def move(self, widget):
+        """Call after a registered widget changes position (re-files it in the grid)"""
+        entry = self.__entries.get(id(widget))
+        if entry is not None:
+            self.register(widget, entry.callback, entry.layer)
+
+    def get_widgets_at(self, pos: tuple) -> list:
+        """Registered widgets whose rect contains pos"""
+        return [entry.widget for entry in self.__entries_at(pos)]
+
+    def dispatch(self, event) -> bool:
+        """Delivers one event, returns True if a widget handled it"""
+        self.__events += 1
+        if event.type in MOUSE_EVENTS:
+            targets = self.__mouse_targets(event)
+        elif event.type in KEY_EVENTS:
+            if event.type == pygame.KEYUP:
+                targets = list(self.__focusable)  # key repeat has to stop even if focus moved
+            else:
+                targets = [entry for entry in self.__focusable if entry.widget.focus]
+        else:
+            return False
+
+        for entry in sorted(targets, key=DispatchEntry.sort_key):
+            self.__deliveries += 1
+            if entry.widget.handleEvent(event):
+                if entry.callback is not None:
+                    entry.callback(entry.widget)
+                return True
+        return False
+
+    def get_stats(self) -> dict:
+        """Events seen and handleEvent calls made - deliveries/events is the average fan-out"""
+        return {
+            'widgets': len(self.__entries),
+            'events': self.__events,
+            'deliveries': self.__deliveries
+        }
+
+    def __mouse_targets(self, event) -> List[DispatchEntry]:
+        """Private helper - who gets a mouse event"""
+        # wheel events have no pos - use where the last mouse event was, so scripted
+        # events (and headless runs, where get_pos() is always 0,0) land in the right place
+        if hasattr(event, 'pos'):
+            self.__pointer = event.pos
+        pos = self.__pointer if self.__pointer is not None else pygame.mouse.get_pos()
+        under = self.__entries_at(pos)
+
+        targets = {id(entry): entry for entry in under}
+        for entry in self.__hover_targets + self.__pressed_targets:
+            targets[id(entry)] = entry
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            for entry in self.__focusable:
+                if entry.widget.focus:
+                    targets[id(entry)] = entry
+            self.__pressed_targets = list(under)
+        elif event.type == pygame.MOUSEBUTTONUP:
+            self.__pressed_targets = []
+
+        self.__hover_targets = under
+        return list(targets.values())
+
+    def __entries_at(self, pos: tuple) -> List[DispatchEntry]:
+        """Private helper - grid lookup, then an exact rect check"""
+        cell = (int(pos[0]) // self.__cell_size, int(pos[1]) // self.__cell_size)
+        return [entry for entry in self.__grid.get(cell, ()) if entry.rect.collidepoint(pos)]
+
+    def __cells_for(self, rect) -> List[Tuple[int, int]]:
+        """Private helper - every grid cell a rect touches"""
+        size = self.__cell_size
+        return [(column, row)
+                for column in range(rect.left // size, (rect.right - 1) // size + 1)
+                for row in range(rect.top // size, (rect.bottom - 1) // size + 1)]
@@ -0,0 +1,283 @@
+# patient_list_handler.py
+# Patient List View Module
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+import pygame
+import pygwidgets
+from typing import List, Optional
+from ..config.config import GUIConfiguration
+from classes.person.vaccine_manager import VaccineManager
+from classes.person.patient_query import PatientQuery, STATUS_FILTERS
+from classes.person.patient_search import SearchResult
+
+
+class PatientListHandler:
+    """
+    Scrollable table of patients for the display card.
+    Only the rows that fit on screen have widgets - scrolling just puts different
+    patients into the same row widgets, and the patients for the visible rows are
+    paged in with VaccineManager.iter_window(), so the registry size doesn't matter.
+    Clicking a column header sorts by it (again flips the order), the mouse wheel
+    scrolls, clicking the scrollbar jumps, clicking a row selects that patient.
+    set_search() narrows the list to the search box results.
+    """
+
+    ROW_HEIGHT = 18
+    HEADER_HEIGHT = 20
+    SCROLLBAR_WIDTH = 10
+
+    # (header label, x offset, sort key or None) - Name goes back to the order they were added
+    COLUMNS = [
+        ("ID", 0, "id"),
+        ("Name", 80, "added"),
+        ("Vaccines", 300, "vaccines"),
+        ("Symptoms", 410, "symptoms"),
+        ("Status", 490, None),
+    ]
+    COUNT_OFFSET = 555  # x offset of the right-justified patient count in the header
+
+    def __init__(self, window, config: GUIConfiguration, manager: VaccineManager,
+                 rect: tuple = (30, 440, 660, 162)):
+        self.__window = window
+        self.__colors = config.get_colors()
+        self.__manager = manager
+        self.__rect = pygame.Rect(rect)
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private paging state - what's showing and what it was loaded from
+        self.__row_count = (self.__rect.height - self.HEADER_HEIGHT) // self.ROW_HEIGHT
+        self.__query = PatientQuery()
+        self.__status_filter = "all"
+        self.__search: Optional[SearchResult] = None
+        self.__offset = 0
+        self.__selected_id: Optional[int] = None
+        self.__visible = False
+        self.__loaded_key = None  # (query key, offset, data version) the rows were filled from
+        self.__row_ids: List[Optional[int]] = [None] * self.__row_count
+        self.__total = 0
+        self.__changed = True
+
+        self.__header_widgets = []
+        self.__count_label = None
+        self.__row_widgets: List[List[pygwidgets.DisplayText]] = []  # recycled while scrolling
+        self.__setup_widgets()
+
+    def __setup_widgets(self):
+        """Makes the header and one set of column widgets per visible row (never more)"""
+        for label, x_offset, _ in self.COLUMNS:
+            self.__header_widgets.append(pygwidgets.DisplayText(
+                self.__window, (self.__rect.x + 6 + x_offset, self.__rect.y + 3), label,
+                fontSize=12, textColor=self.__colors['text_dark']
+            ))
+        self.__count_label = pygwidgets.DisplayText(
+            self.__window, (self.__rect.x + self.COUNT_OFFSET, self.__rect.y + 4), "",
+            fontSize=11, textColor=self.__colors['text_light'], justified='right', width=95
+        )
+        self.__header_widgets.append(self.__count_label)
+        for row in range(self.__row_count):
+            y = self.__rect.y + self.HEADER_HEIGHT + row * self.ROW_HEIGHT + 2
+            self.__row_widgets.append([
+                pygwidgets.DisplayText(self.__window, (self.__rect.x + 6 + x_offset, y), "",
+                                       fontSize=11, textColor=self.__colors['text_dark'])
+                for _, x_offset, _ in self.COLUMNS
+            ])
+
+    # the dispatcher treats the whole list as one widget
+    def getRect(self) -> pygame.Rect:
+        return self.__rect
+
+    def handleEvent(self, event) -> bool:
+        """Returns True when a row got clicked - get_selected_id() says who"""
+        if not self.__visible:
+            return False
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll_by(-event.y * 3)
+            return False
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return False
+        if not self.__rect.collidepoint(event.pos):
+            return False
+
+        x, y = event.pos[0] - self.__rect.x, event.pos[1] - self.__rect.y
+        if x >= self.__rect.width - self.SCROLLBAR_WIDTH:
+            # jump so the clicked spot on the track is the middle of the page
+            fraction = max(0, y - self.HEADER_HEIGHT) / max(1, self.__rect.height - self.HEADER_HEIGHT)
+            self.scroll_to(int(fraction * self.__total) - self.__row_count // 2)
+            return False
+        if y < self.HEADER_HEIGHT:
+            self.__sort_by_column(x)
+            return False
+
+        row = (y - self.HEADER_HEIGHT) // self.ROW_HEIGHT
+        if row < self.__row_count and self.__row_ids[row] is not None:
+            self.__selected_id = self.__row_ids[row]
+            self.__changed = True
+            return True
+        return False
+
+    def set_visible(self, visible: bool):
+        self.__visible = visible
+        self.__changed = True
+
+    def is_visible(self) -> bool:
+        return self.__visible
+
+    def set_query(self, query: PatientQuery):
+        """Shows a different filter/sort, back at the top"""
+        self.__query = query
+        self.__offset = 0
+        self.__changed = True
+
+    def get_query(self) -> PatientQuery:
+        return self.__query
+
+    def cycle_status_filter(self) -> str:
+        """Moves to the next STATUS_FILTERS entry (keeps the sort), returns its name"""
+        names = list(STATUS_FILTERS)
+        self.__status_filter = names[(names.index(self.__status_filter) + 1) % len(names)]
+        self.set_query(self.__build_query())
+        return self.__status_filter
+
+    def set_search(self, search: Optional[SearchResult]):
+        """Only show people in this search result (None shows everyone again)"""
+        self.__search = search
+        self.set_query(self.__build_query())
+
+    def get_search(self) -> Optional[SearchResult]:
+        return self.__search
+
+    def get_status_filter(self) -> str:
+        return self.__status_filter
+
+    def scroll_by(self, rows: int):
+        self.scroll_to(self.__offset + rows)
+
+    def scroll_to(self, offset: int):
+        total = self.__manager.count_query(self.__query)
+        offset = max(0, min(offset, total - self.__row_count))
+        if offset != self.__offset:
+            self.__offset = offset
+            self.__changed = True
+
+    def get_selected_id(self) -> Optional[int]:
+        return self.__selected_id
+
+    def set_selected_id(self, person_id: Optional[int], reveal: bool = True):
+        """Highlights a patient, scrolling them into view if they're in the list but off screen"""
+        if person_id != self.__selected_id:
+            self.__selected_id = person_id
+            self.__changed = True
+        if reveal and person_id is not None and self.__visible:
+            results = self.__manager.run_query(self.__query)
+            if person_id not in results[self.__offset:self.__offset + self.__row_count]:
+                try:
+                    self.scroll_to(results.index(person_id) - self.__row_count // 2)
+                except ValueError:
+                    pass  # filtered out
+
+    def consume_changed(self) -> bool:
+        """True (once) if the list needs redrawing - scrolled, sorted, selected or the data changed"""
+        if self.__visible and self.__loaded_key is not None and \
+                self.__loaded_key[2] != self.__manager.get_data_version():
+            self.__changed = True
+        changed = self.__changed
+        self.__changed = False
+        return changed
+
+    def draw(self):
+        if not self.__visible:
+            return
+        self.__refresh_rows()
+
+        # header strip and selected row highlight
+        header_rect = pygame.Rect(self.__rect.x, self.__rect.y, self.__rect.width, self.HEADER_HEIGHT)
+        pygame.draw.rect(self.__window, self.__colors['hover'], header_rect)
+        for row, person_id in enumerate(self.__row_ids):
+            if person_id is not None and person_id == self.__selected_id:
+                pygame.draw.rect(self.__window, self.__colors['border'], self.__row_rect(row))
+
+        for widget in self.__header_widgets:
+            widget.draw()
+        for row, widgets in enumerate(self.__row_widgets):
+            if self.__row_ids[row] is None:
+                continue
+            for widget in widgets:
+                widget.draw()
+
+        self.__draw_scrollbar()
+
+    def __refresh_rows(self):
+        """Private helper - reloads the visible page if the query, offset or data changed"""
+        key = (self.__query.get_key(), self.__offset, self.__manager.get_data_version())
+        if key == self.__loaded_key:
+            return
+        self.__loaded_key = key
+        self.__total = self.__manager.count_query(self.__query)
+        if self.__offset > max(0, self.__total - self.__row_count):
+            self.__offset = max(0, self.__total - self.__row_count)
+            self.__loaded_key = (key[0], self.__offset, key[2])
+
+        noun = "matches" if self.__search is not None else "patients"
+        self.__count_label.setValue(f"{self.__total:,} {noun}")
+
+        page = list(self.__manager.iter_window(self.__query, self.__offset, self.__row_count))
+        for row in range(self.__row_count):
+            if row < len(page):
+                proxy = page[row]
+                self.__row_ids[row] = proxy.id
+                self.__fill_row(self.__row_widgets[row], proxy)
+            else:
+                self.__row_ids[row] = None
+
+    @staticmethod
+    def __fill_row(widgets: list, proxy):
+        """Private helper - puts one patient into a recycled row (setValue only re-renders on change)"""
+        vaccines = [name for name, has in (("COVID", proxy.get_covid19_vaccine()),
+                                           ("Flu", proxy.get_influenza_vaccine()),
+                                           ("Ebola", proxy.get_ebola_vaccine())) if has]
+        symptoms = [name for name, has in (("Fever", proxy.get_fever()),
+                                           ("Fatigue", proxy.get_fatigue()),
+                                           ("Headache", proxy.get_headache())) if has]
+        values = [
+            str(proxy.id),
+            f"{proxy.get_first_name()} {proxy.get_last_name()}"[:32],
+            " ".join(vaccines) or "-",
+            " ".join(symptoms) or "-",
+            "Cleared" if proxy.is_cleared_for_entry() else "Not cleared",
+        ]
+        for widget, value in zip(widgets, values):
+            if widget.getValue() != value:
+                widget.setValue(value)
+
+    def __build_query(self) -> PatientQuery:
+        """Private helper - current status filter and search, keeping the current sort"""
+        return PatientQuery.for_status(self.__status_filter, sort_by=self.__query.get_sort_by(),
+                                       descending=self.__query.is_descending(), search=self.__search)
+
+    def __sort_by_column(self, x: int):
+        """Private helper - header click sorts by that column, clicking again flips the order"""
+        for label, x_offset, sort_key in reversed(self.COLUMNS):
+            if x >= x_offset:
+                if sort_key is None:
+                    return
+                descending = (self.__query.get_sort_by() == sort_key and not self.__query.is_descending())
+                self.set_query(self.__query.with_sort(sort_key, descending))
+                return
+
+    def __row_rect(self, row: int) -> pygame.Rect:
+        return pygame.Rect(self.__rect.x, self.__rect.y + self.HEADER_HEIGHT + row * self.ROW_HEIGHT,
+                           self.__rect.width - self.SCROLLBAR_WIDTH, self.ROW_HEIGHT)
+
+    def __draw_scrollbar(self):
+        """Private helper - track plus a thumb sized to how much of the list is showing"""
+        track = pygame.Rect(self.__rect.right - self.SCROLLBAR_WIDTH, self.__rect.y + self.HEADER_HEIGHT,
+                            self.SCROLLBAR_WIDTH, self.__rect.height - self.HEADER_HEIGHT)
+        pygame.draw.rect(self.__window, self.__colors['hover'], track)
+        if self.__total <= self.__row_count:
+            return
+        thumb_height = max(12, track.height * self.__row_count // self.__total)
+        thumb_y = track.y + (track.height - thumb_height) * self.__offset // (self.__total - self.__row_count)
+        pygame.draw.rect(self.__window, self.__colors['text_light'],
+                         (track.x + 2, thumb_y, track.width - 4, thumb_height), border_radius=3)
@@ -0,0 +1,196 @@
+# search_handler.py
+# Patient Search Box Module
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+import pygame
+import pygwidgets
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+from ..config.config import GUIConfiguration
+from classes.person.vaccine_manager import VaccineManager
+from classes.person.patient_search import SearchResult
+
+# how long typing has to pause before we search
+DEBOUNCE_MS = 250
+
+# searches that look at fewer matches/people than this just run on the UI thread
+INLINE_SEARCH_LIMIT = 20000
+
+# how often the main loop checks on a search running in the background
+POLL_MS = 50
+
+
+class PatientSearchHandler:
+    """
+    The search box under the patient card - finds patients by the start of their ID,
+    name or phone number while you type.
+    - keystrokes are debounced, the search only starts once typing pauses (Enter skips the wait)
+    - if the text just got longer, the last result gets filtered down instead of searching again
+    - big searches run on a worker thread so the frame loop never waits on them, and
+      typing again cancels the one that's running (it checks a generation number)
+    Call update() once a frame; it returns True when there's a new result to show.
+    """
+
+    def __init__(self, window, config: GUIConfiguration, manager: VaccineManager,
+                 debounce_ms: int = DEBOUNCE_MS, inline_limit: int = INLINE_SEARCH_LIMIT):
+        self.__manager = manager
+        self.__debounce_ms = debounce_ms
+        self.__inline_limit = inline_limit
+        colors = config.get_colors()
+
+        self.__label = pygwidgets.DisplayText(
+            window, (28, 619), "Search", fontSize=14, textColor=colors['text_dark']
+        )
+        self.__input = pygwidgets.InputText(window, (85, 615), width=185, fontSize=18)
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private search state - the GUI only sees update() and get_result()
+        self.__seen_text = ""
+        self.__due_at: Optional[int] = None  # ticks when the debounced search should start
+        self.__generation = 0  # goes up on every edit, a running search with an old number is stale
+        self.__pool: Optional[ThreadPoolExecutor] = None  # created the first time a search is big
+        self.__running: Optional[Future] = None
+        self.__running_generation = 0
+        self.__result: Optional[SearchResult] = None  # what's showing (None = no search)
+        self.__has_update = False
+
+        self.__searches = 0
+        self.__refinements = 0
+        self.__background = 0
+        self.__cancelled = 0
+        self.__errors = 0
+
+    def get_widgets(self) -> list:
+        return [self.__label, self.__input]
+
+    def get_input(self) -> pygwidgets.InputText:
+        return self.__input
+
+    def get_result(self) -> Optional[SearchResult]:
+        """Latest search result, None when the box is empty"""
+        return self.__result
+
+    def search_now(self):
+        """Skips the debounce wait (Enter in the box)"""
+        self.__seen_text = self.__input.getValue()
+        self.__generation += 1
+        self.__due_at = None
+        self.__start_search()
+
+    def update(self) -> bool:
+        """Once a frame - notices edits, starts due searches and collects finished ones"""
+        now = pygame.time.get_ticks()
+        text = self.__input.getValue()
+        if text != self.__seen_text:
+            self.__seen_text = text
+            self.__generation += 1  # whatever is running is stale now
+            self.__due_at = now + self.__debounce_ms
+
+        if self.__due_at is not None and now >= self.__due_at:
+            self.__due_at = None
+            self.__start_search()
+
+        if self.__running is not None and self.__running.done():
+            self.__collect()
+
+        # people got added/changed since the result was made - search again so it's current
+        if (self.__result is not None and self.__due_at is None and self.__running is None
+                and self.__result.get_data_version() != self.__manager.get_data_version()):
+            self.__start_search()
+
+        has_update = self.__has_update
+        self.__has_update = False
+        return has_update
+
+    def is_searching(self) -> bool:
+        return self.__due_at is not None or self.__running is not None
+
+    def get_ms_until_due(self) -> Optional[int]:
+        """How soon update() has something to do (for the frame pacer), None if nothing's pending"""
+        if self.__running is not None:
+            return POLL_MS
+        if self.__due_at is not None:
+            return max(0, self.__due_at - pygame.time.get_ticks())
+        return None
+
+    def shutdown(self):
+        self.__generation += 1  # tells a running search to stop
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=False)
+            self.__pool = None
+
+    def get_stats(self) -> dict:
+        return {
+            'searches': self.__searches,
+            'refinements': self.__refinements,
+            'background': self.__background,
+            'cancelled': self.__cancelled,
+            'errors': self.__errors
+        }
+
+    def __start_search(self):
+        """Private helper - runs the search for the current text, inline or on the worker"""
+        text = self.__seen_text
+        if not text.strip():
+            if self.__result is not None:
+                self.__result = None
+                self.__has_update = True
+            return
+
+        self.__searches += 1
+        previous = self.__result
+        version = self.__manager.get_data_version()
+        if previous is not None and previous.can_refine(text, version):
+            self.__refinements += 1
+            work = previous.get_match_count()
+        else:
+            previous = None
+            work = self.__manager.get_person_count()
+
+        if work <= self.__inline_limit:
+            self.__apply(self.__manager.search_patients(text, previous))
+            return
+
+        # a search already running is for older text - its generation check stops it
+        if self.__pool is None:
+            self.__pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="patient-search")
+        self.__background += 1
+        generation = self.__generation
+        self.__running_generation = generation
+        self.__running = self.__pool.submit(self.__search_worker, text, previous, generation)
+
+    def __search_worker(self, text: str, previous: Optional[SearchResult], generation: int):
+        """
+        Private helper - runs on the worker thread. The manager locks its indexes while
+        the search walks them, and returns None if they changed part way through.
+        """
+        result = self.__manager.search_patients(text, previous, lambda: generation != self.__generation)
+        if result is not None:
+            result.get_id_set()  # built here so the list doesn't do it on the UI thread
+        return result
+
+    def __collect(self):
+        """Private helper - takes a finished background search, unless it went stale"""
+        future, self.__running = self.__running, None
+        try:
+            result = future.result()
+        except Exception:
+            # a search that blew up shouldn't take the frame loop down with it - keep
+            # showing the last result, the next edit searches again
+            self.__errors += 1
+            return
+        if self.__running_generation != self.__generation:
+            self.__cancelled += 1  # typed again while it ran - the debounce starts the newer one
+            return
+        if result is None:
+            self.__start_search()  # the indexes changed under it, go again
+            return
+        self.__apply(result)
+
+    def __apply(self, result: Optional[SearchResult]):
+        """Private helper - new result to show"""
+        if result is not None:
+            self.__result = result
+            self.__has_update = True
@@ -4,6 +4,7 @@
 # 06/21/2025
 # Hamza Kurdi
 
+import os
 import pygame
 import pygwidgets
 import sys
@@ -12,37 +13,55 @@ import sys
 from .config.config import GUIConfiguration
 from .handlers.form_handler import PatientFormHandler
 from .handlers.display_handler import PatientDisplayHandler
+from .handlers.background_handler import BackgroundLayerHandler
+from .handlers.event_dispatcher import EventDispatcher
+from .handlers.patient_list_handler import PatientListHandler
+from .handlers.search_handler import PatientSearchHandler
 from classes.person.person import Person
 from classes.person.vaccine_manager import VaccineManager
 from systems.report.report_system import ReportManager
 from systems.dialog.dialog_system import DialogManager
 from systems.animation.animation_system import AnimationManager
+from systems.render.dirty_regions import DirtyRegionTracker
+from systems.render.frame_pacer import FramePacer
+from systems.render.resource_cache import DEFAULT_RESOURCE_CACHE
 
 
 class VaccineTrackerGUI:
     """
     Main GUI class that handles the whole application.
     I split things up into different classes to make it easier to work with.
+    headless=True uses SDL's dummy drivers so it runs with no display (CI, benchmarks),
+    and auto_run=False skips the main loop so a script can call run_frame() itself.
     """
     
-    def __init__(self):
+    def __init__(self, manager: VaccineManager = None, headless: bool = False, auto_run: bool = True):
         # using seperate classes for different parts - makes debugging easier
         self.__config = GUIConfiguration()
-        self.__manager = VaccineManager()
+        self.__manager = manager if manager is not None else VaccineManager()
         self.__report_manager = ReportManager(self.__manager)
+        self.__pending_reports = {}  # background request name -> dialog title
         
         # track current patient index
         self.__current_index = -1
         self.__running = True
         
-        # setup pygame
+        # setup pygame - the dummy drivers have to be picked before init
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
         pygame.init()
         
         # create the main window
         window_size = self.__config.get_window_size()
         self.__window = pygame.display.set_mode(window_size)
         pygame.display.set_caption(self.__config.get_window_title())
-        self.__clock = pygame.time.Clock()
+        # full speed while something moves, sleeps in event.wait when idle
+        self.__pacer = FramePacer(active_fps=60, max_idle_wait_ms=1000)
+        
+        # only the parts of the window that changed get redrawn (see __draw)
+        self.__dirty = DirtyRegionTracker(window_size)
+        self.__last_status_info = None
         
         # load colors from config
         self.__colors = self.__config.get_colors()
@@ -50,17 +69,30 @@ class VaccineTrackerGUI:
         # initialize all the handlers
         self.__form_handler = PatientFormHandler(self.__window, self.__config)
         self.__display_handler = PatientDisplayHandler(self.__window, self.__config)
+        self.__list_handler = PatientListHandler(self.__window, self.__config, self.__manager)
+        self.__search_handler = PatientSearchHandler(self.__window, self.__config, self.__manager)
+        self.__background_handler = BackgroundLayerHandler(self.__window, self.__config)
+        self.__last_config_version = self.__config.get_version()
+        DEFAULT_RESOURCE_CACHE.sync_version(self.__last_config_version)  # cached surfaces follow this config
         self.__dialog_manager = DialogManager(self.__window, self.__colors)
         self.__animation_manager = AnimationManager(self.__window, self.__colors)
+        self.__last_dialog_version = self.__dialog_manager.get_version()
+        self.__last_dialog_widget_version = self.__dialog_manager.get_widget_version()
         
         # setup widgets
         self.__setup_main_widgets()
+        self.__setup_event_dispatcher()
+        
+        # recurring reports keep the cache and history warm in the background
+        for job_name, (report_type, interval) in self.__config.get_report_schedule().items():
+            self.__report_manager.schedule_report(job_name, report_type, interval)
         
         # update display
         self.__update_patient_display()
         
         # start main loop
-        self.__run()
+        if auto_run:
+            self.__run()
     
     def __setup_main_widgets(self):
         """
@@ -69,22 +101,7 @@ class VaccineTrackerGUI:
         """
         self.__main_widgets = []
         
-        card_left = self.__config.get_card_margin()
-        card_width = 760
-        
-        # title text at top
-        header = pygwidgets.DisplayText(
-            self.__window, (card_left, 25), "Vaccine Tracker",
-            fontSize=28, textColor=self.__colors['primary'], justified='center', width=card_width
-        )
-        self.__main_widgets.append(header)
-        
-        # subtitle w/ course info
-        subtitle = pygwidgets.DisplayText(
-            self.__window, (card_left, 55), "COP5230 Hamza Kurdi - M5 Assignment",
-            fontSize=14, textColor=self.__colors['text_light'], justified='center', width=card_width
-        )
-        self.__main_widgets.append(subtitle)
+        # the title and subtitle are drawn once into the background layer (BackgroundLayerHandler)
         
         # add patient button
         self.__add_button = pygwidgets.TextButton(
@@ -139,41 +156,42 @@ class VaccineTrackerGUI:
             self.__action_buttons[button] = callback
             self.__main_widgets.append(button)
     
-    def __handle_events(self, event):
+    def __setup_event_dispatcher(self):
         """
-        Handles pygame events - mouse clicks, keyboard, etc.
-        Prioritizes dialogs first, then forms, then main buttons.
+        Registers the interactive widgets with the dispatcher, in the same priority
+        order the old event loop checked them: form, then prev/next, then main buttons.
         """
-        # dialog events first - most important
-        if self.__dialog_manager.handle_dialog_events(event):
-            return
+        self.__event_dispatcher = EventDispatcher()
         
-        # check form widgets
         for widget in self.__form_handler.get_form_widgets():
-            if hasattr(widget, 'handleEvent') and widget.handleEvent(event):
-                return
+            self.__event_dispatcher.register(widget, layer=0)
+        self.__event_dispatcher.register(self.__search_handler.get_input(),
+                                         lambda widget: self.__search_handler.search_now(), layer=0)
         
-        # navigation buttons (prev/next)
         nav_buttons = self.__display_handler.get_nav_buttons()
-        if nav_buttons['prev'].handleEvent(event):
-            self.__navigate_previous()
-            return
-        elif nav_buttons['next'].handleEvent(event):
-            self.__navigate_next()
+        self.__event_dispatcher.register(nav_buttons['prev'], lambda widget: self.__navigate_previous(), layer=1)
+        self.__event_dispatcher.register(nav_buttons['next'], lambda widget: self.__navigate_next(), layer=1)
+        self.__event_dispatcher.register(nav_buttons['list'], lambda widget: self.__toggle_list_view(), layer=1)
+        self.__event_dispatcher.register(nav_buttons['filter'], lambda widget: self.__cycle_list_filter(), layer=1)
+        self.__event_dispatcher.register(
+            self.__list_handler, lambda widget: self.__select_patient(widget.get_selected_id()), layer=1
+        )
+        
+        self.__event_dispatcher.register(self.__add_button, lambda widget: self.__handle_add_patient(), layer=2)
+        for button, callback in self.__action_buttons.items():
+            self.__event_dispatcher.register(button, lambda widget, callback=callback: callback(), layer=2)
+    
+    def __handle_events(self, event):
+        """
+        Handles pygame events - mouse clicks, keyboard, etc.
+        Prioritizes dialogs first, then the dispatcher routes the event to just the
+        widgets under the pointer or with keyboard focus.
+        """
+        # dialog events first - most important
+        if self.__dialog_manager.handle_dialog_events(event):
             return
         
-        # main widgets
-        for widget in self.__main_widgets:
-            if hasattr(widget, 'handleEvent') and widget.handleEvent(event):
-                if widget == self.__add_button:
-                    self.__handle_add_patient()
-                    return
-                
-                # check action buttons
-                if widget in self.__action_buttons:
-                    callback = self.__action_buttons[widget]
-                    callback()  # run the function
-                    return
+        self.__event_dispatcher.dispatch(event)
     
     def __handle_add_patient(self):
         """
@@ -191,8 +209,8 @@ class VaccineTrackerGUI:
             # get form data
             form_data = self.__form_handler.get_form_data()
             
-            # check for duplicate IDs
-            if self.__manager.get_person_by_id(form_data['id']):
+            # check for duplicate IDs (has_person doesn't need to load the record)
+            if self.__manager.has_person(form_data['id']):
                 self.__animation_manager.show_notification("Duplicate ID detected", "error")
                 self.__dialog_manager.show_error_dialog(
                     "Duplicate ID", "A patient with this ID already exists in the system."
@@ -262,6 +280,34 @@ class VaccineTrackerGUI:
             current_person = self.__manager.get_person_by_index(self.__current_index)
             self.__animation_manager.show_notification(f"{current_person.get_first_name()} →", "info")
     
+    def __toggle_list_view(self):
+        """Switches the display card between the single patient and the scrolling list"""
+        list_mode = not self.__list_handler.is_visible()
+        self.__list_handler.set_visible(list_mode)
+        self.__display_handler.set_list_mode(list_mode)
+        self.__update_patient_display()
+    
+    def __cycle_list_filter(self):
+        """Next status filter for the list (all, cleared, not cleared, symptomatic)"""
+        status = self.__list_handler.cycle_status_filter()
+        self.__animation_manager.show_notification(f"Showing: {status.replace('_', ' ')}", "info")
+    
+    def __update_search(self):
+        """Shows new search box results in the list (switching to list view if needed)"""
+        if not self.__search_handler.update():
+            return
+        result = self.__search_handler.get_result()
+        self.__list_handler.set_search(result)
+        if result is not None and not self.__list_handler.is_visible():
+            self.__toggle_list_view()
+    
+    def __select_patient(self, person_id: int):
+        """A row got clicked in the list - that patient becomes the current one"""
+        index = self.__manager.get_index_of(person_id)
+        if index >= 0:
+            self.__current_index = index
+            self.__update_patient_display()
+    
     def __update_patient_display(self):
         """
         Updates patient display area.
@@ -281,6 +327,14 @@ class VaccineTrackerGUI:
         
         # update display
         self.__display_handler.update_patient_display(current_person, self.__current_index, total_count)
+        self.__list_handler.set_selected_id(current_person.id if current_person else None)
+        
+        # patient text, counter label (in the header) and nav buttons all changed
+        # (the buttons hang below the display card, so they're added to its rect)
+        nav_rects = [button.getRect() for button in self.__display_handler.get_nav_buttons().values()]
+        self.__dirty.mark(self.__background_handler.get_card_rect(BackgroundLayerHandler.HEADER_CARD))
+        self.__dirty.mark(self.__background_handler.get_card_rect(BackgroundLayerHandler.DISPLAY_CARD)
+                          .unionall(nav_rects))
     
     # Report button handlers
     def __handle_individual_report(self):
@@ -291,15 +345,20 @@ class VaccineTrackerGUI:
             )
             return
         
-        # show available IDs to user
-        available_ids = [str(p.id) for p in self.__manager.get_people()]
-        ids_text = ", ".join(available_ids)
-        prompt = f"Enter the patient ID to generate report:\n\nAvailable Patient IDs: {ids_text}"
+        # matching IDs show up under the field as you type - never lists everyone
+        prompt = "Enter the patient ID to generate report.\nMatching IDs show up below as you type."
         
-        self.__dialog_manager.show_input_dialog(
-            "Individual Patient Report", prompt, self.__process_individual_report
+        self.__dialog_manager.show_autocomplete_dialog(
+            "Individual Patient Report", prompt, self.__suggest_patient_ids, self.__process_individual_report
         )
     
+    def __suggest_patient_ids(self, text: str, limit: int) -> tuple:
+        """Suggestions for the report dialog - (first few IDs starting with text, how many there are)"""
+        if text and not text.isdigit():
+            return [], 0
+        ids = self.__manager.find_ids_by_prefix(text, limit)
+        return [str(person_id) for person_id in ids], self.__manager.count_ids_with_prefix(text)
+    
     def __process_individual_report(self, id_input: str):
         """
         Process patient ID input and generate report.
@@ -315,19 +374,20 @@ class VaccineTrackerGUI:
             
             patient_id = int(id_input.strip())
             
-            # generate report
-            report_content = self.__report_manager.generate_individual_report(
-                patient_id, include_header=True, include_stats=True
-            )
-            
-            if "Error" in report_content:
-                # show available IDs
-                available_ids = [str(p.id) for p in self.__manager.get_people()]
-                ids_text = ", ".join(available_ids)
-                error_msg = f"No patient with ID {patient_id} found.\n\nAvailable IDs: {ids_text}"
+            # the ID lookup says whether the patient exists, no need to guess from the
+            # report text (a name with "Error" in it used to count as a failure)
+            if not self.__manager.has_person(patient_id):
+                error_msg = f"No patient with ID {patient_id} found."
+                similar = self.__similar_patient_ids(str(patient_id))
+                if similar:
+                    error_msg += f"\n\nClosest IDs: {', '.join(similar)}"
                 self.__dialog_manager.show_error_dialog("Patient Not Found", error_msg)
             else:
-                self.__dialog_manager.show_info_dialog("Patient Report Generated", report_content)
+                # the dialog pulls chunks as it scrolls, so only what's on screen gets built
+                report_chunks = self.__report_manager.iter_report_chunks(
+                    "individual", include_stats=True, patient_id=patient_id
+                )
+                self.__dialog_manager.show_report_dialog("Patient Report Generated", report_chunks)
                 
         except ValueError:
             self.__dialog_manager.show_error_dialog(
@@ -336,19 +396,44 @@ class VaccineTrackerGUI:
         except Exception as e:
             self.__dialog_manager.show_error_dialog("Report Error", f"Unable to generate report: {str(e)}")
     
+    def __similar_patient_ids(self, id_text: str, limit: int = 8) -> list:
+        """
+        A few IDs sharing the longest possible start with a mistyped one (120 -> 12x -> 1xx).
+        At most one prefix lookup per digit, so it doesn't grow with the number of patients.
+        """
+        for length in range(len(id_text), 0, -1):
+            ids = self.__manager.find_ids_by_prefix(id_text[:length], limit)
+            if ids:
+                return [str(person_id) for person_id in ids]
+        return []
+    
     def __handle_vaccine_stats(self):
         """Show vaccination stats for all patients"""
-        report_content = self.__report_manager.generate_vaccination_stats(
-            include_header=True, include_stats=False
+        # runs on a worker thread, the dialog shows up once it's done (see __show_finished_reports)
+        request = self.__report_manager.generate_in_background(
+            "vaccination", include_header=True, include_stats=False
         )
-        self.__dialog_manager.show_info_dialog("Vaccination Statistics", report_content)
+        self.__pending_reports[request] = "Vaccination Statistics"
     
     def __handle_symptom_analysis(self):
         """Show symptom analysis for all patients"""
-        report_content = self.__report_manager.generate_symptom_analysis(
-            include_header=True, include_stats=False
+        request = self.__report_manager.generate_in_background(
+            "symptom", include_header=True, include_stats=False
         )
-        self.__dialog_manager.show_info_dialog("Symptom Analysis", report_content)
+        self.__pending_reports[request] = "Symptom Analysis"
+    
+    def __show_finished_reports(self):
+        """Checks for background reports that finished - called once per frame, never waits"""
+        for result in self.__report_manager.poll_background_reports():
+            title = self.__pending_reports.pop(result['name'], None)
+            if title is None:
+                continue  # a scheduled run, it already went to the cache and history
+            if result['error'] is not None:
+                self.__dialog_manager.show_error_dialog("Report Error", f"Unable to generate report: {result['error']}")
+            else:
+                # population reports are a fixed few dozen lines and the worker already
+                # built them - the view still only splits and wraps what it shows
+                self.__dialog_manager.show_report_dialog(title, result['content'])
         
     def __handle_reset_data(self):
         """Reset all medical data w/ confirmation"""
@@ -453,7 +538,7 @@ class VaccineTrackerGUI:
             # cleanup before exit
             self.__animation_manager.cleanup_all()
             self.__running = False
-            pygame.quit()
+            self.close()
             sys.exit()
     
     def __get_current_status_info(self) -> tuple:
@@ -465,7 +550,8 @@ class VaccineTrackerGUI:
             return (self.__colors['text_light'], "?")
         
         if self.__current_index >= 0:
-            current_person = self.__manager.get_people()[self.__current_index]
+            # runs every frame so use a proxy - it only reads the packed flags
+            current_person = self.__manager.get_proxy_by_index(self.__current_index)
             if current_person.is_cleared_for_entry():
                 return (self.__colors['success'], "+")
             else:
@@ -473,77 +559,210 @@ class VaccineTrackerGUI:
         
         return (self.__colors['text_light'], "?")
 
-    def __draw_modern_card(self, x: int, y: int, width: int, height: int, color: tuple = None):
+    def __get_all_widgets(self) -> list:
+        """Every widget on screen, dialog widgets last"""
+        return (self.__main_widgets + self.__form_handler.get_form_widgets() +
+                self.__display_handler.get_display_widgets() + self.__search_handler.get_widgets() +
+                self.__dialog_manager.get_widgets())
+    
+    def __get_input_widgets(self) -> list:
+        """Widgets that can take typing right now - only the dialog's while one is open"""
+        if self.__dialog_manager.get_is_active():
+            return self.__dialog_manager.get_widgets()
+        return self.__get_all_widgets()
+    
+    def __mark_event_dirty(self, event):
         """
-        Draw card with shadow effects.
-        Custom color optional - uses default if not specified.
+        Works out which parts of the window an event can change.
+        Mouse movement only changes the buttons under the pointer (hover state) and
+        typing only changes the text fields. Anything else (clicks, window events)
+        redraws everything - those are rare and could change nearly anything.
         """
-        if color is None:
-            color = self.__colors['card']
-        
-        # shadow first
-        shadow_rect = pygame.Rect(x + 3, y + 3, width, height)
-        pygame.draw.rect(self.__window, (0, 0, 0, 30), shadow_rect, border_radius=12)
-        
-        # main card
-        card_rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(self.__window, color, card_rect, border_radius=12)
-        pygame.draw.rect(self.__window, self.__colors['border'], card_rect, 2, border_radius=12)
+        if event.type == pygame.MOUSEMOTION:
+            previous = (event.pos[0] - event.rel[0], event.pos[1] - event.rel[1])
+            hovered = (self.__event_dispatcher.get_widgets_at(event.pos) +
+                       self.__event_dispatcher.get_widgets_at(previous))
+            for widget in hovered:
+                self.__dirty.mark(widget.getRect().inflate(6, 6))
+            for widget in self.__dialog_manager.get_widgets():
+                rect = widget.getRect()
+                if rect.collidepoint(event.pos) or rect.collidepoint(previous):
+                    self.__dirty.mark(rect.inflate(6, 6))
+        elif event.type == pygame.MOUSEWHEEL:
+            pass  # only the list scrolls, and it reports that itself (__mark_state_dirty)
+        elif event.type in (pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT):
+            for widget in self.__get_input_widgets():
+                if isinstance(widget, pygwidgets.InputText):
+                    self.__dirty.mark(widget.getRect().inflate(6, 6))
+        else:
+            self.__dirty.mark_all()
+    
+    def __mark_state_dirty(self):
+        """Marks whatever changed since last frame that isn't tied to an event"""
+        # colors or window size changed - the background layer gets rebuilt
+        config_version = self.__config.get_version()
+        if config_version != self.__last_config_version:
+            self.__last_config_version = config_version
+            DEFAULT_RESOURCE_CACHE.sync_version(config_version)
+            self.__dirty.mark_all()
+        
+        # a dialog opened or closed - overlay covers everything
+        dialog_version = self.__dialog_manager.get_version()
+        if dialog_version != self.__last_dialog_version:
+            self.__last_dialog_version = dialog_version
+            self.__dirty.mark_all()
+        
+        # the open dialog scrolled or changed its suggestions - just the dialog box
+        widget_version = self.__dialog_manager.get_widget_version()
+        if widget_version != self.__last_dialog_widget_version:
+            self.__last_dialog_widget_version = widget_version
+            self.__dirty.mark(self.__dialog_manager.get_dialog_rect())
+        
+        # status indicator switched between +, - and ?
+        status_info = self.__get_current_status_info()
+        if status_info != self.__last_status_info:
+            self.__last_status_info = status_info
+            self.__dirty.mark(self.__animation_manager.get_status_bounds())
+        
+        # the focused text field blinks its cursor
+        for widget in self.__get_input_widgets():
+            if isinstance(widget, pygwidgets.InputText) and widget.focus:
+                self.__dirty.mark(widget.getRect().inflate(6, 6))
+        
+        # list scrolled, re-sorted, changed selection or the data under it changed
+        if self.__list_handler.consume_changed():
+            self.__dirty.mark(self.__list_handler.getRect())
+        
+        self.__dirty.mark_many(self.__animation_manager.get_dirty_rects())
     
     def __draw(self):
         """
-        Draw everything each frame.
-        Calls handler classes for their parts.
+        Draws the parts of the window that changed since the last frame.
+        Each dirty rect is drawn on its own, clipped to that rect, with everything
+        that overlaps it drawn in the usual order - so overlapping things (dialog overlay,
+        notifications) still come out right and two small changes far apart don't
+        turn into one big redraw. Skips the frame entirely when nothing changed.
         """
-        # clear screen
-        self.__window.fill(self.__colors['bg'])
+        dirty_rects = self.__dirty.consume()
+        if not dirty_rects:
+            return
+        for rect in dirty_rects:
+            self.__window.set_clip(rect)
+            self.__draw_region(rect)
         
-        # draw card backgrounds
-        margin = self.__config.get_card_margin()
-        self.__draw_modern_card(margin, 10, 760, 85)  # header
-        self.__draw_modern_card(margin, 105, 760, 320, self.__colors['form_bg'])  # form
-        self.__draw_modern_card(margin, 435, 680, 170)  # display
-        self.__draw_modern_card(710, 490, 70, 70)  # status indicator
+        # only send the changed parts to the screen
+        self.__window.set_clip(None)
+        pygame.display.update(dirty_rects)
+    
+    def __draw_region(self, rect: pygame.Rect):
+        """Private helper - draws everything that touches rect (the clip is already set to it)"""
+        # background, cards and title in one blit
+        self.__background_handler.draw()
         
         # draw widgets
-        for widget in self.__main_widgets:
-            widget.draw()
-        
-        for widget in self.__form_handler.get_form_widgets():
-            widget.draw()
-        
-        for widget in self.__display_handler.get_display_widgets():
-            widget.draw()
+        widgets = (self.__main_widgets + self.__form_handler.get_form_widgets() +
+                   self.__display_handler.get_display_widgets())
+        for widget in widgets:
+            if widget.getRect().colliderect(rect):
+                widget.draw()
+        if self.__list_handler.getRect().colliderect(rect):
+            self.__list_handler.draw()  # nothing unless list view is on
+        
+        for widget in self.__search_handler.get_widgets():
+            if widget.getRect().colliderect(rect):
+                widget.draw()
         
         # draw animations and status
-        status_color, status_text = self.__get_current_status_info()
+        status_color, status_text = self.__last_status_info
         self.__animation_manager.draw_all_animations(status_color, status_text)
         
         # draw dialogs
         self.__dialog_manager.draw_dialog()
+    
+    def __is_busy(self) -> bool:
+        """True when the loop should run at full frame rate"""
+        return (self.__dirty.has_dirty() or self.__animation_manager.is_animating()
+                or self.__dialog_manager.get_is_active())
+    
+    def __get_wake_in_ms(self):
+        """
+        How long an idle loop can sleep before it has something to do - the next
+        animation timer, the text cursor blink, or checking on background reports.
+        None means only input (or the pacer's idle timeout) wakes it.
+        """
+        wake_times = []
+        next_timer = self.__animation_manager.get_ms_until_next_timer()
+        if next_timer is not None:
+            wake_times.append(next_timer)
+        if self.__pending_reports:
+            wake_times.append(100)
+        search_due = self.__search_handler.get_ms_until_due()
+        if search_due is not None:
+            wake_times.append(search_due)
+        for widget in self.__get_all_widgets():
+            if isinstance(widget, pygwidgets.InputText) and widget.focus:
+                wake_times.append(widget.cursorSwitchMs)
+                break
+        return min(wake_times) if wake_times else None
+    
+    def run_frame(self, events: list = None) -> bool:
+        """
+        One pass of the main loop - handles the events (None = take them from pygame's
+        queue), picks up background work, then redraws whatever changed.
+        Returns False once the app wants to quit.
+        """
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.__running = False
+            else:
+                self.__mark_event_dirty(event)
+                self.__handle_events(event)
         
-        # update display
-        pygame.display.flip()
+        # pick up any reports the background workers finished
+        self.__show_finished_reports()
+        self.__update_search()
+        
+        # update animations first
+        self.__animation_manager.update_all_animations()
+        
+        self.__mark_state_dirty()
+        self.__draw()
+        return self.__running
+    
+    def has_background_work(self) -> bool:
+        """True while a search or report is still running somewhere else"""
+        return self.__search_handler.is_searching() or bool(self.__pending_reports)
+    
+    def get_window(self) -> pygame.Surface:
+        return self.__window
+    
+    def get_manager(self) -> VaccineManager:
+        return self.__manager
+    
+    def close(self, quit_pygame: bool = True):
+        """
+        Stops the background workers and shuts pygame down (doesn't exit the process).
+        quit_pygame=False leaves pygame running for another GUI in the same process -
+        pygwidgets caches its fonts for the whole process and they die with pygame.quit().
+        """
+        self.__report_manager.shutdown(wait=False)
+        self.__search_handler.shutdown()
+        if quit_pygame:
+            # cached fonts belong to this pygame session, they're no good after quit()
+            DEFAULT_RESOURCE_CACHE.clear()
+            pygame.quit()
     
     def __run(self):
         """
         Main app loop - keeps everything running.
-        Handles events and redraws.
+        The pacer decides how long to wait for events, run_frame() does the rest.
         """
         while self.__running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.__running = False
-                else:
-                    self.__handle_events(event)
-            
-            # update animations first
-            self.__animation_manager.update_all_animations()
-            
-            self.__draw()
-            self.__clock.tick(60)
+            self.run_frame(self.__pacer.next_events(self.__is_busy(), self.__get_wake_in_ms()))
         
-        pygame.quit()
+        self.close()
         sys.exit()
         
 # create and run GUI
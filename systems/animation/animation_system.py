@@ -7,6 +7,7 @@
 import pygame
 from typing import Callable
 from classes.base_classes import DataEntity
+from systems.render.resource_cache import RenderResourceCache, DEFAULT_RESOURCE_CACHE
 
 # ===== INHERITANCE DEMONSTRATED HERE =====
 # AnimatedElement inherits from DataEntity to show we can extend our base classes
@@ -105,6 +106,16 @@ class SimpleTimer:
         
         return False
     
+    def is_running(self) -> bool:
+        """True between start() and the timer firing (or stop())"""
+        return self.__is_running
+    
+    def get_ms_left(self) -> int:
+        """Milliseconds until the timer fires, 0 if it's not running"""
+        if not self.__is_running:
+            return 0
+        return max(0, self.__duration_ms - (pygame.time.get_ticks() - self.__start_time))
+    
     def get_time_left(self) -> float:
         """Get remaining time in seconds"""
         if not self.__is_running:
@@ -154,7 +165,20 @@ class StatusAnimation(AnimatedElement):
             self.__pulse_direction = 1
             self.__pulse_amount = 0.0
     
-    def draw_animated_circle(self, window, color: tuple, status_text: str = ""):
+    def stop_animation(self):
+        """Stops the pulse and puts the circle back to its normal size"""
+        super().stop_animation()
+        self.__pulse_amount = 0.0
+        self.__pulse_direction = 1
+    
+    def get_bounds(self) -> pygame.Rect:
+        """Screen area the circle can cover at its biggest pulse (plus the outline)"""
+        max_radius = int(self.__base_radius * 1.3) + 3
+        return pygame.Rect(self.__center_pos[0] - max_radius, self.__center_pos[1] - max_radius,
+                           max_radius * 2, max_radius * 2)
+    
+    def draw_animated_circle(self, window, color: tuple, status_text: str = "",
+                             resources: RenderResourceCache = DEFAULT_RESOURCE_CACHE):
         """Draw the animated status circle"""
         # calculate current radius with pulse effect
         current_radius = int(self.__base_radius * (1.0 + self.__pulse_amount))
@@ -165,8 +189,8 @@ class StatusAnimation(AnimatedElement):
         
         # draw status text if provided
         if status_text:
-            font = pygame.font.Font(None, 24)
-            text_surface = font.render(status_text, True, (255, 255, 255))
+            # font and text come from the cache - this runs every frame
+            text_surface = resources.render_text(status_text, (255, 255, 255), 24)
             text_rect = text_surface.get_rect(center=self.__center_pos)
             window.blit(text_surface, text_rect)
     
@@ -194,6 +218,7 @@ class MessageNotification:
         self.__is_active = False
         self.__position = position_options.get('position', (550, 80))
         self.__background_color = position_options.get('bg_color', (59, 130, 246))
+        self.__panel = None  # our own copy of the cached panel, so fading it doesn't touch anyone else's
     
     def show(self):
         """Show the notification"""
@@ -223,7 +248,7 @@ class MessageNotification:
         if time_left < 0.5:
             self.__alpha = int(255 * (time_left / 0.5))
     
-    def draw(self, window):
+    def draw(self, window, resources: RenderResourceCache = DEFAULT_RESOURCE_CACHE):
         """Draw the notification if active"""
         if not self.__is_active:
             return
@@ -232,23 +257,31 @@ class MessageNotification:
         final_x = self.__position[0] - self.__slide_offset
         final_pos = (final_x, self.__position[1])
         
-        # create notification surface
-        notification_rect = pygame.Rect(final_pos[0], final_pos[1], 160, 40)
+        # the panel only changes alpha while showing - the cached one is shared with any
+        # other notification saying the same thing, so copy it once and fade the copy
+        if self.__panel is None:
+            self.__panel = resources.get_surface(('notification', self.__message, self.__background_color),
+                                                 lambda: self.__build_panel(resources)).copy()
+        self.__panel.set_alpha(self.__alpha)
         
-        # draw background with current alpha
-        temp_surface = pygame.Surface((160, 40))
-        temp_surface.set_alpha(self.__alpha)
-        temp_surface.fill(self.__background_color)
-        pygame.draw.rect(temp_surface, self.__background_color, (0, 0, 160, 40), border_radius=8)
+        # blit to main window
+        window.blit(self.__panel, final_pos)
+    
+    def __build_panel(self, resources: RenderResourceCache) -> pygame.Surface:
+        """Private helper - background and text for the notification"""
+        panel = pygame.Surface((160, 40))
+        panel.fill(self.__background_color)
+        pygame.draw.rect(panel, self.__background_color, (0, 0, 160, 40), border_radius=8)
         
         # draw text
-        font = pygame.font.Font(None, 20)
-        text_surface = font.render(self.__message, True, (255, 255, 255))
+        text_surface = resources.render_text(self.__message, (255, 255, 255), 20)
         text_rect = text_surface.get_rect(center=(80, 20))
-        temp_surface.blit(text_surface, text_rect)
-        
-        # blit to main window
-        window.blit(temp_surface, final_pos)
+        panel.blit(text_surface, text_rect)
+        return panel
+    
+    def get_rect(self) -> pygame.Rect:
+        """Where the notification is on screen right now (moves while it slides in)"""
+        return pygame.Rect(self.__position[0] - self.__slide_offset, self.__position[1], 160, 40)
     
     def is_active(self) -> bool:
         """Check if notification is currently active"""
@@ -261,15 +294,18 @@ class AnimationManager:
     Keeps everything organized in one place so the main GUI doesn't get cluttered.
     """
     
-    def __init__(self, window, colors: dict):
+    def __init__(self, window, colors: dict, resources: RenderResourceCache = None):
         self.__window = window
         self.__colors = colors
+        self.__resources = resources if resources is not None else DEFAULT_RESOURCE_CACHE
         
         # ===== ENCAPSULATION DEMONSTRATED HERE =====
         # Private collections to manage animation components
         self.__status_animation = StatusAnimation((720, 530))
         self.__active_notifications = []
         self.__auto_pulse_timer = SimpleTimer(30.0, self.__trigger_auto_pulse)
+        self.__pulse_stop_timer = SimpleTimer(2.0, self.__status_animation.stop_animation)
+        self.__last_drawn_rects = []  # what the animations covered last frame
         
         # start the auto-pulse timer to occasionally animate the status indicator
         self.__auto_pulse_timer.start()
@@ -291,9 +327,9 @@ class AnimationManager:
         """Private implementation of status pulsing"""
         self.__status_animation.start_animation()
         
-        # set a timer to stop the animation after 2 seconds
-        stop_timer = SimpleTimer(2.0, self.__status_animation.stop_animation)
-        stop_timer.start()
+        # stop the animation after 2 seconds - the timer has to be kept and updated,
+        # a local one never fired and the circle kept pulsing forever
+        self.__pulse_stop_timer.start()
     
     def show_notification(self, message: str, notification_type: str = "info"):
         """
@@ -323,8 +359,9 @@ class AnimationManager:
         # update status animation
         self.__status_animation.update_animation()
         
-        # update auto-pulse timer
+        # update the timers
         self.__auto_pulse_timer.update()
+        self.__pulse_stop_timer.update()
         
         # update notifications and remove expired ones
         self.__active_notifications = [
@@ -337,19 +374,55 @@ class AnimationManager:
         notification.update()
         return notification.is_active()
     
+    def is_animating(self) -> bool:
+        """True while something is moving (pulse running or a notification showing)"""
+        return self.__status_animation.is_animating() or bool(self.__active_notifications)
+    
+    def get_ms_until_next_timer(self):
+        """
+        Milliseconds until the next timer here fires (auto pulse, pulse stop),
+        None if none are running. The main loop sleeps until then when idle.
+        """
+        timers = [timer for timer in (self.__auto_pulse_timer, self.__pulse_stop_timer) if timer.is_running()]
+        if not timers:
+            return None
+        return min(timer.get_ms_left() for timer in timers)
+    
+    def get_dirty_rects(self) -> list:
+        """
+        Areas that need redrawing for the animations this frame - where they are now
+        plus where they were last frame, so a notification that slid or expired
+        gets cleaned up too. Call once per frame after update_all_animations().
+        """
+        current = []
+        if self.__status_animation.is_animating():
+            current.append(self.__status_animation.get_bounds())
+        for notification in self.__active_notifications:
+            current.append(notification.get_rect())
+        
+        dirty = current + self.__last_drawn_rects
+        self.__last_drawn_rects = current
+        return dirty
+    
+    def get_status_bounds(self) -> pygame.Rect:
+        """Area of the status indicator circle"""
+        return self.__status_animation.get_bounds()
+    
     def draw_all_animations(self, status_color: tuple, status_text: str = ""):
         """
         Draw all active animations.
         """
         # draw animated status indicator
-        self.__status_animation.draw_animated_circle(self.__window, status_color, status_text)
+        self.__status_animation.draw_animated_circle(self.__window, status_color, status_text,
+                                                     self.__resources)
         
         # draw all active notifications
         for notification in self.__active_notifications:
-            notification.draw(self.__window)
+            notification.draw(self.__window, self.__resources)
     
     def cleanup_all(self):
         """Clean up all animations and timers"""
         self.__status_animation.stop_animation()
         self.__auto_pulse_timer.stop()
+        self.__pulse_stop_timer.stop()
         self.__active_notifications.clear()
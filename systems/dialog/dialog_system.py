@@ -6,8 +6,20 @@
 
 import pygame
 import pygwidgets
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, List, Tuple, Union
 from classes.base_classes import DialogHandler
+from systems.render.resource_cache import RenderResourceCache, DEFAULT_RESOURCE_CACHE
+from systems.dialog.text_view import ScrollingTextView
+
+# reports get a bigger dialog than the 500x280 message boxes
+REPORT_DIALOG_SIZE = (640, 520)
+
+# keyboard and mouse events - while a dialog is up they stop at the dialog even if
+# none of its widgets wanted them, so nothing behind the overlay reacts
+DIALOG_INPUT_EVENTS = frozenset((
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL
+))
 
 # ===== INHERITANCE DEMONSTRATED HERE =====
 # InfoDialog inherits from DialogHandler abstract base class
@@ -299,18 +311,243 @@ class InputDialog(DialogHandler):
         return self.__input_field.getValue() if self.__input_field else ""
 
 
+# ===== INHERITANCE DEMONSTRATED HERE =====
+# AutocompleteInputDialog is another DialogHandler - same interface, but its
+# suggestion buttons change as you type (refresh_widgets)
+class AutocompleteInputDialog(DialogHandler):
+    """
+    Text input that shows a few matching suggestions under the field as you type.
+    suggestion_source(text, limit) returns (up to limit suggestions, total matches) -
+    only the suggestions that fit get buttons, so the dialog costs the same no matter
+    how many values there are. Clicking a suggestion picks it.
+    """
+
+    def __init__(self, title: str, message: str, suggestion_source: Callable[[str, int], Tuple[List[str], int]],
+                 default_value: str = "", max_suggestions: int = 5):
+        super().__init__(title, message)
+        self.__widgets = []
+        self.__suggestion_source = suggestion_source
+        self.__max_suggestions = max_suggestions
+        self.__default_value = default_value
+        self.__window = None
+        self.__suggestion_origin = (0, 0)
+        self.__suggestion_right = 0  # buttons that would go past this don't get made
+        self.__input_field = None
+        self.__hint = None
+        self.__ok_button = None
+        self.__cancel_button = None
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private suggestion state - the buttons only get rebuilt when the text changes
+        self.__suggestion_buttons = {}  # button -> suggested value
+        self.__suggested_for = None  # text the current buttons were made for
+
+    def create_widgets(self, window, dialog_rect):
+        """
+        Implementation of abstract method for autocomplete dialog widgets.
+        Input field, a row of suggestion buttons, a hint line and OK/Cancel.
+        """
+        self.__widgets.clear()
+        self.__window = window
+
+        title_widget = pygwidgets.DisplayText(
+            window, (dialog_rect.x + 25, dialog_rect.y + 25), self._title,
+            fontSize=18, textColor=(17, 24, 39)
+        )
+        self.__widgets.append(title_widget)
+
+        message_widget = pygwidgets.DisplayText(
+            window, (dialog_rect.x + 25, dialog_rect.y + 60), self._message,
+            fontSize=12, textColor=(17, 24, 39), width=450
+        )
+        self.__widgets.append(message_widget)
+
+        # focused right away so you can just start typing
+        self.__input_field = pygwidgets.InputText(
+            window, (dialog_rect.x + 25, dialog_rect.y + 105), width=300, initialFocus=True
+        )
+        if self.__default_value:
+            self.__input_field.setValue(self.__default_value)
+        self.__widgets.append(self.__input_field)
+
+        self.__hint = pygwidgets.DisplayText(
+            window, (dialog_rect.x + 25, dialog_rect.y + 190), "",
+            fontSize=12, textColor=(107, 114, 128), width=450
+        )
+        self.__widgets.append(self.__hint)
+
+        self.__ok_button = pygwidgets.TextButton(
+            window, (dialog_rect.x + dialog_rect.width - 180,
+                    dialog_rect.y + dialog_rect.height - 50), "OK"
+        )
+        self.__cancel_button = pygwidgets.TextButton(
+            window, (dialog_rect.x + dialog_rect.width - 90,
+                    dialog_rect.y + dialog_rect.height - 50), "Cancel"
+        )
+        self.__widgets.append(self.__ok_button)
+        self.__widgets.append(self.__cancel_button)
+
+        self.__suggestion_origin = (dialog_rect.x + 25, dialog_rect.y + 148)
+        self.__suggestion_right = dialog_rect.right - 25
+        self.__suggested_for = None
+        self.refresh_widgets()
+        return self.__widgets
+
+    def handle_response(self, clicked_widget):
+        """
+        Implementation of abstract method - OK or Enter submits what's typed,
+        a suggestion button submits that suggestion, Cancel gives None.
+        """
+        if clicked_widget in self.__suggestion_buttons:
+            self._result = self.__suggestion_buttons[clicked_widget]
+            return True
+        if clicked_widget == self.__ok_button or clicked_widget == self.__input_field:
+            self._result = self.__input_field.getValue()
+            return True
+        if clicked_widget == self.__cancel_button:
+            self._result = None
+            return True
+        return False
+
+    def refresh_widgets(self) -> bool:
+        """Rebuilds the suggestion buttons if the text changed since last time"""
+        text = self.__input_field.getValue().strip() if self.__input_field else ""
+        if text == self.__suggested_for:
+            return False
+        self.__suggested_for = text
+
+        for button in self.__suggestion_buttons:
+            self.__widgets.remove(button)
+        self.__suggestion_buttons.clear()
+
+        suggestions, total = self.__suggestion_source(text, self.__max_suggestions)
+        x, y = self.__suggestion_origin
+        for value in suggestions[:self.__max_suggestions]:
+            button = pygwidgets.TextButton(self.__window, (x, y), value, width=80, height=30, fontSize=16)
+            if x + button.getRect().width > self.__suggestion_right:
+                break  # long values - only what fits on the row
+            self.__suggestion_buttons[button] = value
+            self.__widgets.insert(-2, button)  # before OK/Cancel
+            x += button.getRect().width + 6
+
+        shown = len(self.__suggestion_buttons)
+        if total == 0:
+            self.__hint.setValue("No matches." if text else "")
+        elif total > shown:
+            self.__hint.setValue(f"{total - shown:,} more - keep typing to narrow it down.")
+        else:
+            self.__hint.setValue("")
+        return True
+
+    def get_widgets(self):
+        """Getter for dialog widgets"""
+        return self.__widgets
+
+    def get_input_value(self) -> str:
+        """Get current input field value"""
+        return self.__input_field.getValue() if self.__input_field else ""
+
+    def get_suggestions(self) -> List[str]:
+        """Suggestions currently showing"""
+        return list(self.__suggestion_buttons.values())
+
+
+# ===== INHERITANCE DEMONSTRATED HERE =====
+# ReportDialog is one more DialogHandler - the dialog manager doesn't need to know it scrolls
+class ReportDialog(DialogHandler):
+    """
+    Dialog for report text that can be any length. The text goes in a ScrollingTextView,
+    which wraps and renders only the rows on screen and reads a chunk stream (like
+    ReportManager.iter_report_chunks) only as far as you scroll. A line under the text
+    says where you are.
+    """
+
+    def __init__(self, title: str, content: Union[str, Iterable[str]]):
+        # the text lives in the view, not in _message - it might be a stream we haven't read yet
+        super().__init__(title, "")
+        self.__content = content
+        self.__widgets = []
+        self.__text_view = None
+        self.__position_label = None
+        self.__ok_button = None
+
+    def create_widgets(self, window, dialog_rect):
+        """
+        Implementation of abstract method for report dialog widgets.
+        Title, the scrolling text, a position line and OK.
+        """
+        self.__widgets.clear()
+
+        title_widget = pygwidgets.DisplayText(
+            window, (dialog_rect.x + 25, dialog_rect.y + 25), self._title,
+            fontSize=18, textColor=(17, 24, 39)
+        )
+        self.__widgets.append(title_widget)
+
+        self.__text_view = ScrollingTextView(
+            window, (dialog_rect.x + 25, dialog_rect.y + 60, dialog_rect.width - 50, dialog_rect.height - 125),
+            self.__content
+        )
+        self.__widgets.append(self.__text_view)
+
+        self.__position_label = pygwidgets.DisplayText(
+            window, (dialog_rect.x + 25, dialog_rect.y + dialog_rect.height - 38), "",
+            fontSize=12, textColor=(107, 114, 128), width=300
+        )
+        self.__widgets.append(self.__position_label)
+
+        self.__ok_button = pygwidgets.TextButton(
+            window, (dialog_rect.x + dialog_rect.width - 100,
+                    dialog_rect.y + dialog_rect.height - 50), "OK"
+        )
+        self.__widgets.append(self.__ok_button)
+
+        self.refresh_widgets()
+        return self.__widgets
+
+    def handle_response(self, clicked_widget):
+        """Only OK closes it - the text view says True when it scrolled, that's not an answer"""
+        if clicked_widget == self.__ok_button:
+            self._result = True
+            return True
+        return False
+
+    def refresh_widgets(self) -> bool:
+        """Updates the position line after the text scrolled (True means redraw)"""
+        if self.__text_view is None or not self.__text_view.consume_changed():
+            return False
+        first, last = self.__text_view.get_visible_range()
+        rows, complete = self.__text_view.get_row_count()
+        if complete and first == 0 and last >= rows:
+            self.__position_label.setValue("")  # it all fits, nothing to say
+        else:
+            total = f"{rows:,}" if complete else f"{rows:,}+"
+            self.__position_label.setValue(f"Lines {first + 1:,}-{last:,} of {total} - scroll for more")
+        return True
+
+    def get_widgets(self):
+        """Getter for dialog widgets"""
+        return self.__widgets
+
+    def get_text_view(self) -> ScrollingTextView:
+        return self.__text_view
+
+
 class DialogManager:
     """
     Manager class for handling dialog lifecycle and polymorphic behavior.
     Demonstrates composition and encapsulation.
     """
     
-    def __init__(self, window, colors: dict):
+    def __init__(self, window, colors: dict, resources: RenderResourceCache = None):
         self.__window = window
         self.__colors = colors
+        self.__resources = resources if resources is not None else DEFAULT_RESOURCE_CACHE
         self.__current_dialog = None  # private current dialog
         self.__dialog_rect = None
         self.__is_dialog_active = False
+        self.__version = 0  # bumped whenever a dialog opens or closes
+        self.__widget_version = 0  # bumped when the open dialog changes its widgets (scrolled, new suggestions)
         
         # dialog dimensions
         self.__dialog_width = 500
@@ -320,6 +557,18 @@ class DialogManager:
         """Getter for dialog active status"""
         return self.__is_dialog_active
     
+    def get_version(self) -> int:
+        """Changes every time a dialog opens or closes - the GUI redraws everything when it does"""
+        return self.__version
+    
+    def get_widget_version(self) -> int:
+        """Changes when the open dialog updates its widgets - only the dialog needs redrawing"""
+        return self.__widget_version
+    
+    def get_dialog_rect(self):
+        """Screen area of the open dialog (None when there isn't one)"""
+        return self.__dialog_rect
+    
     def set_dialog_dimensions(self, width: int, height: int):
         """Setter for dialog dimensions"""
         self.__dialog_width = width
@@ -349,7 +598,21 @@ class DialogManager:
         dialog = InputDialog(title, message, default_value)
         self.__show_dialog(dialog, callback)
     
-    def __show_dialog(self, dialog: DialogHandler, callback: Callable = None):
+    def show_autocomplete_dialog(self, title: str, message: str,
+                                 suggestion_source: Callable[[str, int], Tuple[List[str], int]],
+                                 callback: Callable = None, default_value: str = "", max_suggestions: int = 5):
+        """Show an input dialog with live suggestions (see AutocompleteInputDialog)"""
+        dialog = AutocompleteInputDialog(title, message, suggestion_source, default_value, max_suggestions)
+        self.__show_dialog(dialog, callback)
+    
+    def show_report_dialog(self, title: str, content: Union[str, Iterable[str]], callback: Callable = None):
+        """
+        Show report text in a bigger, scrollable dialog (see ReportDialog).
+        content can be a string or a stream of chunks - a stream is only read as you scroll.
+        """
+        self.__show_dialog(ReportDialog(title, content), callback, REPORT_DIALOG_SIZE)
+    
+    def __show_dialog(self, dialog: DialogHandler, callback: Callable = None, size: Tuple[int, int] = None):
         """
         Private method to show any dialog type (polymorphic behavior).
         ===== POLYMORPHISM DEMONSTRATED HERE =====
@@ -363,15 +626,16 @@ class DialogManager:
         
         self.__current_dialog = dialog
         self.__is_dialog_active = True
+        self.__version += 1
         
         # calculate dialog position (centered)
         window_width = 800  # hardcoded for this app
         window_height = 750
-        dialog_x = (window_width - self.__dialog_width) // 2
-        dialog_y = (window_height - self.__dialog_height) // 2
+        dialog_width, dialog_height = size if size is not None else (self.__dialog_width, self.__dialog_height)
+        dialog_x = (window_width - dialog_width) // 2
+        dialog_y = (window_height - dialog_height) // 2
         
-        self.__dialog_rect = pygame.Rect(dialog_x, dialog_y, 
-                                       self.__dialog_width, self.__dialog_height)
+        self.__dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
         
         # ===== POLYMORPHISM IN ACTION HERE =====
         # This call to create_widgets() will execute different code depending on
@@ -383,7 +647,8 @@ class DialogManager:
     def handle_dialog_events(self, event) -> bool:
         """
         Handle events for active dialog using polymorphic response handling.
-        Returns True if event was handled by dialog.
+        Returns True if event was handled by dialog. The dialog is modal, so every
+        keyboard/mouse event counts as handled while it's open (see DIALOG_INPUT_EVENTS).
         """
         if not self.__is_dialog_active or not self.__current_dialog:
             return False
@@ -406,10 +671,13 @@ class DialogManager:
                     # then call callback with result
                     if callback:
                         callback(result)
+                    return True
                 
+                self.__refresh_dialog()
                 return True
         
-        return False
+        self.__refresh_dialog()
+        return event.type in DIALOG_INPUT_EVENTS
     
     def draw_dialog(self):
         """
@@ -419,10 +687,8 @@ class DialogManager:
         if not self.__is_dialog_active or not self.__current_dialog:
             return
         
-        # draw semi-transparent overlay
-        overlay = pygame.Surface((800, 750))
-        overlay.set_alpha(150)
-        overlay.fill((0, 0, 0))
+        # draw semi-transparent overlay (same surface every frame)
+        overlay = self.__resources.get_overlay((800, 750), (0, 0, 0), 150)
         self.__window.blit(overlay, (0, 0))
         
         # draw dialog shadow
@@ -439,16 +705,28 @@ class DialogManager:
         for widget in widgets:
             widget.draw()
     
+    def __refresh_dialog(self):
+        """Private helper - lets the dialog update widgets that follow the input (redraws if it did)"""
+        if self.__current_dialog is not None and self.__current_dialog.refresh_widgets():
+            self.__widget_version += 1
+    
     def __close_dialog(self):
         """Private method to close current dialog"""
         self.__current_dialog = None
         self.__is_dialog_active = False
         self.__dialog_rect = None
+        self.__version += 1
     
     def force_close_dialog(self):
         """Public method to force close dialog (for cleanup)"""
         self.__close_dialog()
     
+    def get_widgets(self) -> list:
+        """Widgets of the open dialog (empty list when there isn't one)"""
+        if not self.__is_dialog_active or not self.__current_dialog:
+            return []
+        return self.__current_dialog.get_widgets()
+    
     def get_current_dialog_type(self) -> str:
         """Get type of current dialog for debugging"""
         if not self.__current_dialog:
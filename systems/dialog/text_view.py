@@ -0,0 +1,416 @@
+# text_view.py
+# Vax Project Scrolling Text View
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Reports used to go into one DisplayText inside the 500x280 dialog - anything longer
+# than about 15 lines just ran off the bottom, and the whole thing got rendered up front.
+# ScrollingTextView shows text in a fixed box with a scrollbar instead:
+# - the text comes from a chunk stream (a string works too) and only gets read as far
+#   as the view has actually scrolled, so opening a big report doesn't read all of it
+# - each line is word-wrapped to the box width the first time it shows up, and the
+#   wrapped rows are kept in an LRU keyed by (font, width, line) so scrolling back or
+#   reopening the same report doesn't measure text again
+# - only the rows on screen have surfaces, scrolling renders just the rows that came in
+
+import pygame
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from systems.render.resource_cache import LRUStore, RenderResourceCache, DEFAULT_RESOURCE_CACHE
+
+# wrapped lines kept around, shared by every view
+WRAP_CACHE_SIZE = 4096
+
+# how many rows past the bottom of the view get read in ahead of time
+READ_AHEAD_ROWS = 20
+
+
+class ChunkedTextSource:
+    """
+    Lines of a text that arrives in chunks (a report generator, or just a string).
+    Chunks are only pulled when someone asks for a line that hasn't been read yet.
+    """
+
+    def __init__(self, chunks: Union[str, Iterable[str]]):
+        if isinstance(chunks, str):
+            chunks = (chunks,)
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private read position - callers only see whole lines
+        self.__chunks: Optional[Iterator[str]] = iter(chunks)
+        self.__pending = ""  # chunk text that hasn't been split into lines yet
+        self.__position = 0  # how far into __pending we've split
+        self.__lines: List[str] = []
+
+    def ensure_lines(self, count: int) -> int:
+        """Reads until there are at least count lines (or the text ran out), returns how many there are"""
+        while len(self.__lines) < count and not self.is_finished():
+            end = self.__pending.find("\n", self.__position)
+            if end >= 0:
+                self.__lines.append(self.__pending[self.__position:end])
+                self.__position = end + 1
+            else:
+                self.__read_chunk()
+        return len(self.__lines)
+
+    def read_all(self) -> int:
+        """Reads everything that's left (End key), returns the line count"""
+        while not self.is_finished():
+            self.ensure_lines(len(self.__lines) + 1024)
+        return len(self.__lines)
+
+    def get_line(self, index: int) -> str:
+        return self.__lines[index]
+
+    def get_loaded_count(self) -> int:
+        return len(self.__lines)
+
+    def is_finished(self) -> bool:
+        """True once the stream ran out and every line is in"""
+        return self.__chunks is None and self.__position >= len(self.__pending)
+
+    def __read_chunk(self):
+        """Private helper - pulls the next chunk, the leftover without a newline is the last line"""
+        leftover = self.__pending[self.__position:]
+        self.__position = 0
+        if self.__chunks is None:
+            self.__pending = ""
+            return
+        try:
+            chunk = next(self.__chunks)
+        except StopIteration:
+            chunk = None
+        except Exception as e:
+            # a broken report shouldn't take the dialog down with it
+            chunk = None
+            leftover += ("\n" if leftover else "") + f"[report stopped: {e}]"
+
+        if chunk is None:
+            self.__chunks = None
+            if leftover:
+                self.__lines.extend(leftover.split("\n"))
+            self.__pending = ""
+        else:
+            self.__pending = leftover + chunk
+
+
+def wrap_line(font: pygame.font.Font, line: str, width: int) -> Tuple[str, ...]:
+    """
+    Word-wraps one line to width pixels. Wrapped rows keep the line's indent so the
+    report sections still line up, and a word too long for a row gets cut.
+    """
+    line = line.rstrip().expandtabs(4)
+    if font.size(line)[0] <= width:
+        return (line,)
+
+    indent = line[:len(line) - len(line.lstrip())]
+    if font.size(indent + "M" * 8)[0] > width:
+        indent = ""  # huge indent in a narrow box - not worth keeping
+    rows = []
+    current = indent  # the row being built - just the indent until a word goes on it
+    for word in line.split():
+        candidate = current + word if current == indent else current + " " + word
+        if font.size(candidate)[0] <= width:
+            current = candidate
+            continue
+        if current != indent:
+            rows.append(current)
+            current = indent + word
+            if font.size(current)[0] <= width:
+                continue
+        else:
+            current = candidate
+        # one word too long for a row by itself - cut it (the indent check above
+        # means at least one character past the indent always fits)
+        while font.size(current)[0] > width:
+            cut = _fitting_length(font, current, width)
+            rows.append(current[:cut])
+            current = indent + current[cut:]
+    if current.strip():
+        rows.append(current)
+    return tuple(rows) if rows else ("",)
+
+
+def _fitting_length(font: pygame.font.Font, text: str, width: int) -> int:
+    """How many characters of text fit in width (at least one, so cutting always moves forward)"""
+    low, high = 1, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if font.size(text[:middle])[0] <= width:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class WrappedTextLayout:
+    """
+    Where the rows of a ChunkedTextSource fall at one width.
+    Lines get wrapped as the view reaches them - row_starts[i] is the first row of line i,
+    so finding the line for a row is a binary search and nothing after it is touched.
+    """
+
+    def __init__(self, source: ChunkedTextSource, font: pygame.font.Font, font_key: tuple,
+                 width: int, wrap_cache: LRUStore):
+        self.__source = source
+        self.__font = font
+        self.__font_key = font_key
+        self.__width = width
+        self.__wrap_cache = wrap_cache
+        self.__row_starts = array('q')  # first row of each laid out line
+        self.__row_count = 0
+
+    def get_width(self) -> int:
+        return self.__width
+
+    def ensure_rows(self, count: int) -> int:
+        """Lays out lines until there are count rows (or the text ran out), returns the row count"""
+        while self.__row_count < count:
+            line_index = len(self.__row_starts)
+            if self.__source.ensure_lines(line_index + 1) <= line_index:
+                break
+            self.__row_starts.append(self.__row_count)
+            self.__row_count += len(self.__wrap(self.__source.get_line(line_index)))
+        return self.__row_count
+
+    def lay_out_all(self) -> int:
+        self.__source.read_all()
+        return self.ensure_rows(1 << 62)
+
+    def get_row_count(self) -> int:
+        """Rows laid out so far (all of them once is_complete())"""
+        return self.__row_count
+
+    def is_complete(self) -> bool:
+        return self.__source.is_finished() and len(self.__row_starts) == self.__source.get_loaded_count()
+
+    def get_rows(self, first: int, count: int) -> List[str]:
+        """The text of rows first .. first+count (fewer at the end)"""
+        self.ensure_rows(first + count)
+        line_index = self.line_of_row(first)
+        if line_index is None:
+            return []
+        skip = first - self.__row_starts[line_index]  # rows of the first line above the view
+        rows = []
+        while line_index < len(self.__row_starts) and len(rows) < count:
+            wrapped = self.__wrap(self.__source.get_line(line_index))
+            rows.extend(wrapped[skip:skip + count - len(rows)])
+            skip = 0
+            line_index += 1
+        return rows
+
+    def line_of_row(self, row: int) -> Optional[int]:
+        """Which line a row belongs to (None past the end of what's laid out)"""
+        if row < 0 or row >= self.__row_count:
+            return None
+        low, high = 0, len(self.__row_starts) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.__row_starts[middle] <= row:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def row_of_line(self, line_index: int) -> int:
+        """First row of a line, laying out up to it if needed"""
+        while len(self.__row_starts) <= line_index and not self.is_complete():
+            self.ensure_rows(self.__row_count + READ_AHEAD_ROWS)
+        if line_index < len(self.__row_starts):
+            return self.__row_starts[line_index]
+        return self.__row_count
+
+    def __wrap(self, line: str) -> Tuple[str, ...]:
+        """Private helper - wrapped rows for one line, measured once per font and width"""
+        return self.__wrap_cache.get_or_create(
+            (self.__font_key, self.__width, line), lambda: wrap_line(self.__font, line, self.__width)
+        )
+
+
+# ===== ENCAPSULATION DEMONSTRATED HERE =====
+# One wrap cache for every view - the same report lines at the same width are only measured once
+DEFAULT_WRAP_CACHE = LRUStore(WRAP_CACHE_SIZE)
+
+
+class ScrollingTextView:
+    """
+    A box of scrollable, word-wrapped text for dialogs. It acts like a widget (getRect,
+    handleEvent, draw) so the dialog code can treat it like any other one.
+    Mouse wheel, the arrow keys, Page Up/Down, Home/End and clicking the scrollbar scroll it.
+    """
+
+    SCROLLBAR_WIDTH = 10
+    LINE_SPACING = 2
+
+    def __init__(self, window, rect, chunks: Union[str, Iterable[str]], font_size: int = 16,
+                 text_color: tuple = (17, 24, 39), track_color: tuple = (229, 231, 235),
+                 thumb_color: tuple = (156, 163, 175), resources: RenderResourceCache = None,
+                 wrap_cache: LRUStore = None):
+        self.__window = window
+        self.__rect = pygame.Rect(rect)
+        self.__text_color = text_color
+        self.__track_color = track_color
+        self.__thumb_color = thumb_color
+        self.__resources = resources if resources is not None else DEFAULT_RESOURCE_CACHE
+        self.__wrap_cache = wrap_cache if wrap_cache is not None else DEFAULT_WRAP_CACHE
+        self.__font_key = (None, font_size)
+        self.__font = self.__resources.get_font(font_size)
+        self.__row_height = self.__font.get_linesize() + self.LINE_SPACING
+        self.__visible_rows = max(1, self.__rect.height // self.__row_height)
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private scroll state - one layout per width we've shown, surfaces only for rows on screen
+        self.__source = ChunkedTextSource(chunks)
+        self.__layouts: Dict[int, WrappedTextLayout] = {}
+        self.__layout = self.__layout_for(self.__text_width())
+        self.__top_row = 0
+        self.__row_surfaces: Dict[str, pygame.Surface] = {}
+        self.__changed = True
+        self.__rendered = 0
+
+        self.__layout.ensure_rows(self.__visible_rows + READ_AHEAD_ROWS)
+
+    # the dialog treats the view as one widget
+    def getRect(self) -> pygame.Rect:
+        return self.__rect
+
+    def handleEvent(self, event) -> bool:
+        """
+        Scrolls on wheel/keys/scrollbar clicks. Returns True when the event was one of
+        those, so it stops here instead of reaching whatever is behind the dialog.
+        """
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll_by(-event.y * 3)
+            return True
+        if event.type == pygame.KEYDOWN:
+            page = max(1, self.__visible_rows - 1)
+            steps = {pygame.K_UP: -1, pygame.K_DOWN: 1, pygame.K_PAGEUP: -page, pygame.K_PAGEDOWN: page}
+            if event.key in steps:
+                self.scroll_by(steps[event.key])
+                return True
+            if event.key == pygame.K_HOME:
+                self.scroll_to(0)
+                return True
+            if event.key == pygame.K_END:
+                self.scroll_to(self.__layout.lay_out_all())
+                return True
+            return False
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.__track_rect().collidepoint(event.pos):
+            # a click on the track pages toward it, like most scrollbars
+            thumb = self.__thumb_rect()
+            if thumb is not None and event.pos[1] < thumb.top:
+                self.scroll_by(-self.__visible_rows)
+            elif thumb is not None and event.pos[1] >= thumb.bottom:
+                self.scroll_by(self.__visible_rows)
+            return True
+        return False
+
+    def scroll_by(self, rows: int):
+        self.scroll_to(self.__top_row + rows)
+
+    def scroll_to(self, row: int):
+        # lay out just far enough to know where the bottom is
+        available = self.__layout.ensure_rows(max(row, 0) + self.__visible_rows + READ_AHEAD_ROWS)
+        row = max(0, min(row, available - self.__visible_rows))
+        if row != self.__top_row:
+            self.__top_row = row
+            self.__changed = True
+
+    def set_width(self, width: int):
+        """Changes the box width - keeps the same line at the top, wrapped for the new width"""
+        if width == self.__rect.width:
+            return
+        top_line = self.__layout.line_of_row(self.__top_row) or 0
+        self.__rect.width = width
+        self.__layout = self.__layout_for(self.__text_width())
+        self.__top_row = 0
+        self.scroll_to(self.__layout.row_of_line(top_line))
+        self.__changed = True
+
+    def get_visible_range(self) -> Tuple[int, int]:
+        """(first row, one past the last row) on screen"""
+        end = min(self.__top_row + self.__visible_rows, self.__layout.get_row_count())
+        return self.__top_row, end
+
+    def get_row_count(self) -> Tuple[int, bool]:
+        """Rows laid out so far, and whether that's all of them"""
+        return self.__layout.get_row_count(), self.__layout.is_complete()
+
+    def consume_changed(self) -> bool:
+        """True (once) after the view scrolled or changed width"""
+        changed = self.__changed
+        self.__changed = False
+        return changed
+
+    def get_stats(self) -> dict:
+        """How much of the text has been read and how many row surfaces got rendered"""
+        return {
+            'lines_read': self.__source.get_loaded_count(),
+            'rows_laid_out': self.__layout.get_row_count(),
+            'complete': self.__layout.is_complete(),
+            'row_surfaces': len(self.__row_surfaces),
+            'rendered': self.__rendered,
+            'layouts': len(self.__layouts),
+        }
+
+    def draw(self):
+        rows = self.__layout.get_rows(self.__top_row, self.__visible_rows)
+
+        # keep the surfaces of rows that are still on screen, render only the new ones
+        surfaces = {}
+        for text in rows:
+            if text in surfaces:
+                continue
+            surface = self.__row_surfaces.get(text)
+            if surface is None and text:
+                surface = self.__font.render(text, True, self.__text_color)
+                self.__rendered += 1
+            surfaces[text] = surface
+        self.__row_surfaces = surfaces
+
+        y = self.__rect.y
+        for text in rows:
+            surface = surfaces[text]
+            if surface is not None:
+                self.__window.blit(surface, (self.__rect.x, y))
+            y += self.__row_height
+
+        self.__draw_scrollbar()
+
+    def __layout_for(self, width: int) -> WrappedTextLayout:
+        """Private helper - the layout for a width, made the first time that width is used"""
+        layout = self.__layouts.get(width)
+        if layout is None:
+            layout = WrappedTextLayout(self.__source, self.__font, self.__font_key, width, self.__wrap_cache)
+            self.__layouts[width] = layout
+        return layout
+
+    def __text_width(self) -> int:
+        return max(1, self.__rect.width - self.SCROLLBAR_WIDTH - 8)
+
+    def __track_rect(self) -> pygame.Rect:
+        return pygame.Rect(self.__rect.right - self.SCROLLBAR_WIDTH, self.__rect.y,
+                           self.SCROLLBAR_WIDTH, self.__rect.height)
+
+    def __thumb_rect(self) -> Optional[pygame.Rect]:
+        """
+        Private helper - thumb for the rows laid out so far. Until the end of the text has
+        been read we count a page more than we have, so the thumb never claims the bottom early.
+        """
+        total = self.__layout.get_row_count()
+        if not self.__layout.is_complete():
+            total += self.__visible_rows
+        if total <= self.__visible_rows:
+            return None
+        track = self.__track_rect()
+        height = max(16, track.height * self.__visible_rows // total)
+        y = track.y + (track.height - height) * self.__top_row // max(1, total - self.__visible_rows)
+        return pygame.Rect(track.x + 2, min(y, track.bottom - height), track.width - 4, height)
+
+    def __draw_scrollbar(self):
+        thumb = self.__thumb_rect()
+        if thumb is None:
+            return  # everything fits
+        pygame.draw.rect(self.__window, self.__track_color, self.__track_rect(), border_radius=4)
+        pygame.draw.rect(self.__window, self.__thumb_color, thumb, border_radius=3)
@@ -0,0 +1,105 @@
+# dirty_regions.py
+# Vax Project Dirty Region Tracking
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The GUI used to clear the window and redraw every card, widget and dialog 60 times
+# a second, even when nothing on screen had changed. Now anything that changes marks
+# the rectangle it covers as dirty. A frame with nothing dirty draws nothing, and
+# otherwise only the dirty parts get redrawn and sent to the screen with
+# pygame.display.update(rects) instead of flip().
+
+import pygame
+from typing import Iterable, List, Optional
+
+
+class DirtyRegionTracker:
+    """
+    Collects the screen rectangles that need redrawing before the next frame.
+    Overlapping rectangles get merged. If the dirty area covers most of the window
+    it's cheaper to just redraw the whole thing, so consume() returns the full window.
+    """
+
+    def __init__(self, window_size: tuple, full_redraw_ratio: float = 0.5):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private rect list - callers only mark and consume, never edit it directly
+        self.__window_rect = pygame.Rect((0, 0), window_size)
+        self.__full_redraw_area = int(self.__window_rect.width * self.__window_rect.height * full_redraw_ratio)
+        self.__rects: List[pygame.Rect] = []
+        self.__full = True  # the first frame always draws everything
+
+        # counters for checking how much we're actually skipping
+        self.__frames_drawn = 0
+        self.__frames_skipped = 0
+        self.__full_redraws = 0
+
+    def mark(self, rect) -> None:
+        """Marks one rectangle (pygame.Rect or (x, y, w, h)) as needing a redraw"""
+        if self.__full or rect is None:
+            return
+        rect = pygame.Rect(rect).clip(self.__window_rect)
+        if rect.width > 0 and rect.height > 0:
+            self.__rects.append(rect)
+
+    def mark_many(self, rects: Iterable) -> None:
+        for rect in rects:
+            self.mark(rect)
+
+    def mark_all(self) -> None:
+        """Next frame redraws the whole window (dialog opened, window exposed...)"""
+        self.__full = True
+        self.__rects.clear()
+
+    def has_dirty(self) -> bool:
+        return self.__full or bool(self.__rects)
+
+    def consume(self) -> List[pygame.Rect]:
+        """
+        Returns the merged dirty rectangles and resets the tracker.
+        Empty list means nothing needs drawing this frame.
+        """
+        if not self.has_dirty():
+            self.__frames_skipped += 1
+            return []
+
+        self.__frames_drawn += 1
+        rects = [self.__window_rect.copy()] if self.__full else self.__merge(self.__rects)
+        if not self.__full and sum(rect.width * rect.height for rect in rects) >= self.__full_redraw_area:
+            rects = [self.__window_rect.copy()]
+        if rects[0] == self.__window_rect:
+            self.__full_redraws += 1
+
+        self.__full = False
+        self.__rects = []
+        return rects
+
+    def get_window_rect(self) -> pygame.Rect:
+        return self.__window_rect.copy()
+
+    def get_stats(self) -> dict:
+        return {
+            'frames_drawn': self.__frames_drawn,
+            'frames_skipped': self.__frames_skipped,
+            'full_redraws': self.__full_redraws
+        }
+
+    @staticmethod
+    def bounding_rect(rects: List[pygame.Rect]) -> Optional[pygame.Rect]:
+        """One rect around all of them (used as the clip area while drawing)"""
+        if not rects:
+            return None
+        return rects[0].unionall(rects[1:])
+
+    @staticmethod
+    def __merge(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Private helper - keeps merging overlapping rects until none overlap"""
+        merged = []
+        for rect in rects:
+            rect = rect.copy()
+            overlapping = rect.collidelist(merged)
+            while overlapping != -1:
+                rect.union_ip(merged.pop(overlapping))
+                overlapping = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
@@ -0,0 +1,66 @@
+# frame_pacer.py
+# Vax Project Frame Pacing
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The main loop used to spin at 60 fps forever, which on the kiosks means a core
+# stays busy all day with nobody touching the screen. Now while something is moving
+# (an animation, a notification sliding, a dialog open) we still run at full speed,
+# but when nothing is going on the loop blocks in pygame.event.wait until there's
+# input, or until the next timer is due, or until the idle timeout. Roughly 1 frame
+# a second with nothing happening instead of 60.
+
+import pygame
+from typing import List, Optional
+
+
+class FramePacer:
+    """
+    Decides how long the main loop waits before each frame.
+    next_events(active, wake_in_ms) returns the events for the next frame:
+    active - tick at active_fps and poll, like the old loop
+    idle - block until an event, wake_in_ms, or max_idle_wait_ms (whichever is first)
+    clock and events default to pygame.time.Clock() and the pygame.event module,
+    tests can hand in fakes with the same tick/get_fps and wait/get methods.
+    """
+
+    def __init__(self, active_fps: int = 60, max_idle_wait_ms: int = 1000, clock=None, events=None):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private clock and counters - the loop only asks for the next events
+        self.__active_fps = active_fps
+        self.__max_idle_wait_ms = max_idle_wait_ms
+        self.__clock = clock if clock is not None else pygame.time.Clock()
+        self.__events = events if events is not None else pygame.event
+
+        self.__active_frames = 0
+        self.__idle_frames = 0
+        self.__idle_timeouts = 0  # idle waits that ended without any input
+
+    def next_events(self, active: bool, wake_in_ms: Optional[int] = None) -> List[pygame.event.Event]:
+        if active:
+            self.__active_frames += 1
+            self.__clock.tick(self.__active_fps)
+            return self.__events.get()
+
+        self.__idle_frames += 1
+        timeout = self.__max_idle_wait_ms
+        if wake_in_ms is not None:
+            timeout = max(1, min(timeout, int(wake_in_ms)))
+
+        event = self.__events.wait(timeout)
+        self.__clock.tick()  # so the next active frame doesn't count the sleep
+        if event.type == pygame.NOEVENT:
+            self.__idle_timeouts += 1
+            return []
+        return [event] + self.__events.get()
+
+    def get_fps(self) -> float:
+        return self.__clock.get_fps()
+
+    def get_stats(self) -> dict:
+        return {
+            'active_frames': self.__active_frames,
+            'idle_frames': self.__idle_frames,
+            'idle_timeouts': self.__idle_timeouts
+        }
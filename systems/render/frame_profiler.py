@@ -0,0 +1,147 @@
+# frame_profiler.py
+# Vax Project Frame Profiler
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# To catch drawing getting slower (or leaking) we need numbers, not "it feels laggy".
+# FrameProfiler times each frame and groups the frames into named phases (idle,
+# typing, scrolling...), then reports p50/p95/p99 per phase. It can also count the
+# surfaces made during a frame and, with tracemalloc, how much Python memory a frame
+# allocates and how much of it sticks around. tracemalloc slows everything down, so
+# the benchmark times one pass without it and measures memory on a second pass.
+
+import math
+import sys
+import time
+import tracemalloc
+import pygame
+from typing import Callable, Dict, List, Optional
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0 for an empty one)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class SurfaceCounter:
+    """
+    Counts surfaces created through pygame.Surface(...) and Font.render while installed.
+    pygame's classes can't be patched, so install() swaps in counting subclasses of
+    pygame.Surface and pygame.font.Font - only fonts made after that get counted, so
+    install it before building the GUI. Surfaces made by copy()/convert()/transform
+    happen inside pygame and aren't seen.
+    """
+
+    def __init__(self):
+        self.__count = 0
+        self.__originals = None
+
+    def install(self):
+        if self.__originals is not None:
+            return
+        counter = self
+        original_surface, original_font = pygame.Surface, pygame.font.Font
+
+        class CountingSurface(original_surface):
+            def __init__(self, *args, **kwargs):
+                counter.record()
+                super().__init__(*args, **kwargs)
+
+        class CountingFont(original_font):
+            def render(self, *args, **kwargs):
+                counter.record()
+                return super().render(*args, **kwargs)
+
+        self.__originals = (original_surface, original_font)
+        pygame.Surface, pygame.font.Font = CountingSurface, CountingFont
+
+    def uninstall(self):
+        if self.__originals is not None:
+            pygame.Surface, pygame.font.Font = self.__originals
+            self.__originals = None
+
+    def record(self):
+        """one more surface"""
+        self.__count += 1
+
+    def get_count(self) -> int:
+        return self.__count
+
+
+class FrameProfiler:
+    """
+    Measures frames. Call begin_phase(name) and then measure(run_frame) for each frame.
+    track_allocations=True turns on tracemalloc and records, per frame, the peak Python
+    memory allocated and the memory blocks still alive afterwards.
+    """
+
+    def __init__(self, track_allocations: bool = False, surface_counter: Optional[SurfaceCounter] = None):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private per-phase samples - callers only see the summary from get_report()
+        self.__track_allocations = track_allocations
+        self.__surface_counter = surface_counter
+        self.__phases: Dict[str, dict] = {}
+        self.__phase: Optional[dict] = None
+
+    def start(self):
+        if self.__track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self):
+        if self.__track_allocations and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def begin_phase(self, name: str):
+        """Frames measured from now on count toward this phase"""
+        self.__phase = self.__phases.setdefault(name, {
+            'times': [], 'surfaces': 0, 'peak_bytes': [], 'retained_blocks': 0
+        })
+
+    def measure(self, run_frame: Callable[[], object]):
+        """Runs and measures one frame, returns whatever run_frame returned"""
+        if self.__phase is None:
+            self.begin_phase("default")
+        phase = self.__phase
+        surfaces_before = self.__surface_counter.get_count() if self.__surface_counter else 0
+        tracing = self.__track_allocations and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+        blocks_before = sys.getallocatedblocks()
+
+        start = time.perf_counter()
+        result = run_frame()
+        phase['times'].append(time.perf_counter() - start)
+
+        if tracing:
+            phase['peak_bytes'].append(tracemalloc.get_traced_memory()[1] - traced_before)
+            phase['retained_blocks'] += sys.getallocatedblocks() - blocks_before
+        if self.__surface_counter:
+            phase['surfaces'] += self.__surface_counter.get_count() - surfaces_before
+        return result
+
+    def get_report(self) -> Dict[str, dict]:
+        """
+        Per phase: frames, p50/p95/p99/max frame time in ms, surfaces created, and with
+        allocation tracking the worst per-frame peak (KB) and the net blocks retained.
+        """
+        report = {}
+        for name, phase in self.__phases.items():
+            times = sorted(phase['times'])
+            summary = {
+                'frames': len(times),
+                'p50_ms': round(percentile(times, 0.50) * 1000, 3),
+                'p95_ms': round(percentile(times, 0.95) * 1000, 3),
+                'p99_ms': round(percentile(times, 0.99) * 1000, 3),
+                'max_ms': round(times[-1] * 1000, 3) if times else 0.0,
+                'surfaces': phase['surfaces'],
+            }
+            if phase['peak_bytes']:
+                summary['peak_kb'] = round(max(phase['peak_bytes']) / 1024, 1)
+                summary['retained_blocks'] = phase['retained_blocks']
+            report[name] = summary
+        return report
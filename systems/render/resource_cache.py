@@ -0,0 +1,136 @@
+# resource_cache.py
+# Vax Project Render Resource Cache
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# A few draw methods were making new pygame objects every single frame - a Font for the
+# status circle, a Font and a Surface for every notification, and an 800x750 overlay
+# Surface whenever a dialog was up. All that allocating was where our frame time jitter
+# came from. Now fonts, rendered text and plain surfaces like the overlay are made once
+# and handed back from here. Each kind is a small LRU so the cache can't grow forever,
+# and the hit/miss counters show how well it's working.
+
+import pygame
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class LRUStore:
+    """
+    Small least-recently-used dict with hit/miss counters.
+    get_or_create() builds missing entries with the factory you pass in.
+    """
+
+    def __init__(self, max_entries: int):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private entries and counters - only get_or_create touches them
+        self.__max_entries = max_entries
+        self.__entries = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        entry = self.__entries.get(key)
+        if entry is not None:
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry
+
+        self.__misses += 1
+        entry = factory()
+        self.__entries[key] = entry
+        if len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+            self.__evictions += 1
+        return entry
+
+    def clear(self):
+        self.__entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.__hits + self.__misses
+        return {
+            'entries': len(self.__entries),
+            'max_entries': self.__max_entries,
+            'hits': self.__hits,
+            'misses': self.__misses,
+            'evictions': self.__evictions,
+            'hit_rate': self.__hits / lookups if lookups else 0.0
+        }
+
+
+class RenderResourceCache:
+    """
+    Shared fonts, rendered text and reusable surfaces for the draw code.
+    Everything handed out is shared - draw it, don't draw ON it or change its alpha.
+    Copy it once if you need your own version (see MessageNotification).
+    Surfaces can depend on the GUI config (colors, window size), so sync_version()
+    drops them when the config version moves on.
+    """
+
+    def __init__(self, max_fonts: int = 16, max_text: int = 256, max_surfaces: int = 32):
+        self.__fonts = LRUStore(max_fonts)
+        self.__text = LRUStore(max_text)
+        self.__surfaces = LRUStore(max_surfaces)
+        self.__config_version = None  # last config version sync_version() saw
+
+    def get_font(self, size: int, face: Optional[str] = None) -> pygame.font.Font:
+        """pygame Font for (face, size) - face None is pygame's default font"""
+        return self.__fonts.get_or_create((face, size), lambda: pygame.font.Font(face, size))
+
+    def render_text(self, text: str, color: tuple, size: int, face: Optional[str] = None,
+                    antialias: bool = True) -> pygame.Surface:
+        """Rendered text surface, only rendered the first time this exact text/color/font shows up"""
+        key = (text, tuple(color), size, face, antialias)
+        return self.__text.get_or_create(
+            key, lambda: self.get_font(size, face).render(text, antialias, color)
+        )
+
+    def get_overlay(self, size: tuple, color: tuple = (0, 0, 0), alpha: int = 150) -> pygame.Surface:
+        """Plain filled see-through surface (dialog backdrop and the like)"""
+        def make_overlay():
+            overlay = pygame.Surface(size)
+            overlay.set_alpha(alpha)
+            overlay.fill(color)
+            return overlay
+        return self.__surfaces.get_or_create(('overlay', tuple(size), tuple(color), alpha), make_overlay)
+
+    def get_surface(self, key: Hashable, factory: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Any other surface that's expensive to build - the factory runs on a miss"""
+        return self.__surfaces.get_or_create(('custom', key), factory)
+
+    def sync_version(self, config_version: int) -> bool:
+        """
+        Call with GUIConfiguration.get_version() - if it changed, the surfaces get dropped
+        since they were built with the old look. Fonts and text are keyed on everything
+        they depend on, so they stay. Returns True if anything got dropped.
+        """
+        if config_version == self.__config_version:
+            return False
+        changed = self.__config_version is not None
+        self.__config_version = config_version
+        if changed:
+            self.__surfaces.clear()
+        return changed
+
+    def clear(self):
+        self.__fonts.clear()
+        self.__text.clear()
+        self.__surfaces.clear()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss counters for each kind of resource"""
+        return {
+            'fonts': self.__fonts.get_stats(),
+            'text': self.__text.get_stats(),
+            'surfaces': self.__surfaces.get_stats()
+        }
+
+
+# shared by the animation, dialog and display code - fonts only get made after pygame.init()
+DEFAULT_RESOURCE_CACHE = RenderResourceCache()
@@ -0,0 +1,170 @@
+# analytics.py
+# Vax Project Cross-tab Analytics
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Every new breakdown somebody asked for ("fever rate among people with only the flu
+# shot"...) used to mean another hand written loop over everybody. The packed flag code
+# is the three vaccine bits in the low half and the three symptom bits in the high half,
+# so the 64 bucket histogram the stats engine already builds IS the full 8x8 table of
+# vaccine combination x symptom combination. Any conditional rate is just sums over it.
+
+from typing import Callable, List, Optional, Tuple, Union
+from classes.person.person import (COVID19_BIT, INFLUENZA_BIT, EBOLA_BIT, FEVER_BIT,
+                                   FATIGUE_BIT, HEADACHE_BIT, ALL_VACCINES_MASK, ALL_SYMPTOMS_MASK)
+from classes.person.cohort import Cohort
+from .stats_engine import StatsEngine, PopulationStats, FLAG_CODE_COUNT
+
+COMBINATION_COUNT = 8  # three flags on each side -> 2^3 combinations
+SYMPTOM_SHIFT = 3  # symptom bits sit right above the vaccine bits
+
+# names by bit inside a 3 bit combination (vaccines: code & 0x07, symptoms: code >> 3)
+VACCINE_NAMES = ((COVID19_BIT, "COVID-19"), (INFLUENZA_BIT, "Influenza"), (EBOLA_BIT, "Ebola"))
+SYMPTOM_NAMES = ((FEVER_BIT >> SYMPTOM_SHIFT, "Fever"), (FATIGUE_BIT >> SYMPTOM_SHIFT, "Fatigue"),
+                 (HEADACHE_BIT >> SYMPTOM_SHIFT, "Headache"))
+
+
+class FlagCondition:
+    """
+    Describes a group of people by their flags.
+    required - every one of these bits must be set
+    excluded - none of these bits can be set
+    any_of - at least one of these bits must be set (0 means no such rule)
+    e.g. FlagCondition(any_of=ALL_SYMPTOMS_MASK) is "has any symptom"
+    """
+
+    def __init__(self, required: int = 0, excluded: int = 0, any_of: int = 0):
+        if required & excluded:
+            raise ValueError("A flag can't be both required and excluded")
+        self.__required = required
+        self.__excluded = excluded
+        self.__any_of = any_of
+
+    def matches(self, code: int) -> bool:
+        if code & self.__required != self.__required:
+            return False
+        if code & self.__excluded:
+            return False
+        if self.__any_of and not code & self.__any_of:
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        return (f"FlagCondition(required={self.__required:#04x}, excluded={self.__excluded:#04x}, "
+                f"any_of={self.__any_of:#04x})")
+
+
+Condition = Union[FlagCondition, Callable[[int], bool]]
+
+
+def combination_label(combination: int, names: Tuple[Tuple[int, str], ...]) -> str:
+    """'COVID-19+Ebola' style label for a 3 bit combination, 'None' when nothing is set"""
+    parts = [name for bit, name in names if combination & bit]
+    return "+".join(parts) if parts else "None"
+
+
+class ContingencyTable:
+    """
+    Read-only 8x8 table - rows are vaccine combinations (code & 0x07),
+    columns are symptom combinations (code >> 3). Built from the flag code histogram.
+    """
+
+    def __init__(self, code_counts: Tuple[int, ...]):
+        if len(code_counts) != FLAG_CODE_COUNT:
+            raise ValueError(f"Expected {FLAG_CODE_COUNT} flag code counts, got {len(code_counts)}")
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private histogram - every public number is worked out from it on request
+        self.__code_counts = tuple(code_counts)
+
+    @staticmethod
+    def from_stats(stats: PopulationStats) -> 'ContingencyTable':
+        return ContingencyTable(stats.get_code_counts())
+
+    @staticmethod
+    def to_code(vaccine_combination: int, symptom_combination: int) -> int:
+        """Packs a (row, column) pair back into the six bit flag code"""
+        return (vaccine_combination & ALL_VACCINES_MASK) | ((symptom_combination & 0x07) << SYMPTOM_SHIFT)
+
+    def get_total(self) -> int:
+        return sum(self.__code_counts)
+
+    def get_cell(self, vaccine_combination: int, symptom_combination: int) -> int:
+        return self.__code_counts[self.to_code(vaccine_combination, symptom_combination)]
+
+    def get_rows(self) -> Tuple[Tuple[int, ...], ...]:
+        """The whole table as 8 rows of 8 counts"""
+        return tuple(tuple(self.get_cell(row, column) for column in range(COMBINATION_COUNT))
+                     for row in range(COMBINATION_COUNT))
+
+    def get_row_total(self, vaccine_combination: int) -> int:
+        return sum(self.get_cell(vaccine_combination, column) for column in range(COMBINATION_COUNT))
+
+    def get_column_total(self, symptom_combination: int) -> int:
+        return sum(self.get_cell(row, symptom_combination) for row in range(COMBINATION_COUNT))
+
+    def count(self, condition: Condition) -> int:
+        """How many people match a FlagCondition (or any function of the flag code)"""
+        matches = condition.matches if isinstance(condition, FlagCondition) else condition
+        return sum(count for code, count in enumerate(self.__code_counts) if count and matches(code))
+
+    def conditional_rate(self, outcome: Condition, given: Optional[Condition] = None) -> Optional[float]:
+        """
+        P(outcome | given) as a fraction, None when nobody matches given.
+        e.g. fever rate among the fully vaccinated:
+            conditional_rate(FlagCondition(required=FEVER_BIT),
+                             FlagCondition(required=ALL_VACCINES_MASK))
+        """
+        given_match = (given.matches if isinstance(given, FlagCondition) else given) if given else None
+        outcome_match = outcome.matches if isinstance(outcome, FlagCondition) else outcome
+
+        denominator = 0
+        numerator = 0
+        for code, count in enumerate(self.__code_counts):
+            if not count or (given_match and not given_match(code)):
+                continue
+            denominator += count
+            if outcome_match(code):
+                numerator += count
+        return numerator / denominator if denominator else None
+
+    def symptom_rates_by_vaccine_combination(self) -> List[Tuple[str, int, Optional[float]]]:
+        """(vaccine combination label, people, share with any symptom) for each row"""
+        any_symptom = FlagCondition(any_of=ALL_SYMPTOMS_MASK)
+        results = []
+        for row in range(COMBINATION_COUNT):
+            in_row = FlagCondition(required=row, excluded=ALL_VACCINES_MASK & ~row)
+            results.append((combination_label(row, VACCINE_NAMES), self.get_row_total(row),
+                            self.conditional_rate(any_symptom, in_row)))
+        return results
+
+    def format_table(self) -> str:
+        """Plain text grid with row/column totals for showing in a dialog or a log"""
+        column_labels = [combination_label(column, SYMPTOM_NAMES) for column in range(COMBINATION_COUNT)]
+        row_labels = [combination_label(row, VACCINE_NAMES) for row in range(COMBINATION_COUNT)]
+        first_width = max(len(label) for label in row_labels + ["Vaccines \\ Symptoms"])
+        widths = [max(len(label), 6) for label in column_labels]
+
+        lines = ["Vaccines \\ Symptoms".ljust(first_width) + " | " +
+                 " ".join(label.rjust(width) for label, width in zip(column_labels, widths)) + " |  Total"]
+        lines.append("-" * len(lines[0]))
+        for row, label in enumerate(row_labels):
+            cells = " ".join(str(self.get_cell(row, column)).rjust(width)
+                             for column, width in enumerate(widths))
+            lines.append(f"{label.ljust(first_width)} | {cells} | {self.get_row_total(row):6d}")
+        lines.append("-" * len(lines[0]))
+        totals = " ".join(str(self.get_column_total(column)).rjust(width)
+                          for column, width in enumerate(widths))
+        lines.append(f"{'Total'.ljust(first_width)} | {totals} | {self.get_total():6d}")
+        return "\n".join(lines)
+
+
+class AnalyticsEngine:
+    """Builds contingency tables off the shared StatsEngine pass"""
+
+    def __init__(self, stats_engine: StatsEngine = None):
+        self.__stats_engine = stats_engine if stats_engine is not None else StatsEngine()
+
+    def build_table(self, manager, cohort: Union[str, Cohort] = None) -> ContingencyTable:
+        """One pass over the packed flags (reused if the stats engine already has it)"""
+        return ContingencyTable.from_stats(self.__stats_engine.compute(manager, cohort))
@@ -0,0 +1,202 @@
+# batch_runner.py
+# Vax Project Batch Report Runner
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# batch_generate_all_reports builds every individual report one after another on the
+# calling thread and keeps them all in a dict. For the whole registry that's way too
+# slow and way too much memory. The runner splits the patient IDs into shards, renders
+# each shard in a separate process and writes the reports straight to files.
+# When the records are in a storage file the workers read them from it themselves,
+# so the parent process only ever handles IDs and file offsets.
+
+import copy
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+from classes.person.person import Person
+from classes.person.person_store import read_record
+
+SHARD_FILE_PATTERN = "reports_shard_{:05d}.txt"
+REPORT_SEPARATOR = "----- patient {} -----\n"
+
+
+class SegmentShard:
+    """
+    A shard sent as record locations instead of Person objects - the worker opens
+    the segment file and reads the records itself (see VaccineManager.get_record_locations).
+    """
+
+    def __init__(self, segment_path: str, locations: List[tuple]):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private file position list - only load() reads it
+        self.__segment_path = segment_path
+        self.__locations = locations  # (person id, offset, length)
+
+    def load(self) -> tuple:
+        """Reads the records - returns (people, ids whose record couldn't be read)"""
+        people = []
+        failed = []
+        with open(self.__segment_path, 'rb') as segment:
+            for person_id, offset, length in self.__locations:
+                try:
+                    people.append(read_record(segment, offset, length))
+                except Exception:
+                    failed.append(person_id)  # the file got compacted under us, or a bad record
+        return people, failed
+
+
+def _render_shard(shard_index: int, shard: Union[SegmentShard, List[Person]],
+                  format_options: Dict[str, Any], output_path: str) -> tuple:
+    """
+    Worker side - renders one shard of individual reports into output_path.
+    Runs in a child process so it only gets a SegmentShard or plain Person objects,
+    not the manager. Person objects handed over in this process are the manager's
+    own, so it works on copies - add_person would otherwise point their change listener
+    at the throwaway shard manager and later edits would never reach the real one.
+    Returns (shard index, patients written, bytes written, failed patient ids).
+    """
+    # imported here so the child process doesn't pull in the report module until it needs it
+    from classes.person.vaccine_manager import VaccineManager
+    from systems.report.report_system import IndividualReport
+    from systems.report.report_renderer import DEFAULT_RENDERER
+
+    if isinstance(shard, SegmentShard):
+        people, failed = shard.load()
+    else:
+        people = [copy.copy(person) for person in shard]  # copies come without the listener
+        failed = []
+
+    # a small manager holding just this shard so IndividualReport can look people up
+    shard_manager = VaccineManager(max_capacity=max(len(people), 1))
+    for person in people:
+        shard_manager.add_person(person)
+
+    bytes_written = 0
+    # reports go straight from the templates into the file, no per-report string
+    with open(output_path, 'wb') as output:
+        for person in people:
+            bytes_written += DEFAULT_RENDERER.write_chunks(output, (REPORT_SEPARATOR.format(person.id),))
+            try:
+                report = IndividualReport(shard_manager, person.id)
+                bytes_written += DEFAULT_RENDERER.render_to(output, report, **format_options)
+            except Exception:
+                bytes_written += DEFAULT_RENDERER.write_chunks(output, ("Error generating individual report",))
+                failed.append(person.id)
+            bytes_written += DEFAULT_RENDERER.write_chunks(output, ("\n\n",))
+    return shard_index, len(people), bytes_written, failed
+
+
+class BatchReportRunner:
+    """
+    Renders individual reports for lots of patients in parallel.
+    Patient IDs are handed out in shards of shard_size, and load_shard turns each one
+    into what the worker gets (a SegmentShard or a list of Person) right before it's
+    queued. At most max_in_flight shards are queued at once so memory stays bounded
+    no matter how big the registry is.
+    Output is one file per shard, or a single archive with the shards in order.
+    """
+
+    def __init__(self, workers: Optional[int] = None, shard_size: int = 2000,
+                 max_in_flight: Optional[int] = None):
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private run settings - fixed once the runner is made
+        self.__workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.__shard_size = shard_size
+        self.__max_in_flight = max_in_flight if max_in_flight is not None else self.__workers * 2
+
+    def get_workers(self) -> int:
+        return self.__workers
+
+    def get_shard_size(self) -> int:
+        return self.__shard_size
+
+    def run(self, person_ids: Iterable[int], total: int, output_dir: str,
+            load_shard: Callable[[List[int]], Union[SegmentShard, List[Person]]],
+            format_options: Dict[str, Any] = None, archive_name: str = None,
+            progress_callback: Callable[[int, int], None] = None) -> Dict[str, Any]:
+        """
+        Renders a report for everyone in person_ids (total is just for progress).
+        progress_callback(done, total) gets called in this process after each shard.
+        Returns a summary: patients, shards, files, bytes, failed ids and seconds taken.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        format_options = format_options or {}
+        start = time.perf_counter()
+
+        summary = {'patients': 0, 'shards': 0, 'files': [], 'bytes': 0, 'failed': []}
+        shard_paths = {}
+
+        def finished(result: tuple):
+            shard_index, count, bytes_written, failed = result
+            summary['patients'] += count
+            summary['shards'] += 1
+            summary['bytes'] += bytes_written
+            summary['failed'].extend(failed)
+            if progress_callback:
+                progress_callback(summary['patients'], total)
+
+        shards = ((index, load_shard(ids)) for index, ids in self.__iter_shards(person_ids))
+        if self.__workers <= 1:
+            # no point starting processes for a single worker
+            for shard_index, shard in shards:
+                shard_paths[shard_index] = self.__shard_path(output_dir, shard_index)
+                finished(_render_shard(shard_index, shard, format_options, shard_paths[shard_index]))
+        else:
+            with ProcessPoolExecutor(max_workers=self.__workers) as pool:
+                in_flight = set()
+                for shard_index, shard in shards:
+                    if len(in_flight) >= self.__max_in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            finished(future.result())
+                    shard_paths[shard_index] = self.__shard_path(output_dir, shard_index)
+                    in_flight.add(pool.submit(_render_shard, shard_index, shard,
+                                              format_options, shard_paths[shard_index]))
+                for future in wait(in_flight).done:
+                    finished(future.result())
+
+        ordered_paths = [shard_paths[index] for index in sorted(shard_paths)]
+        if archive_name:
+            summary['files'] = [self.__concatenate(ordered_paths, os.path.join(output_dir, archive_name))]
+        else:
+            summary['files'] = ordered_paths
+        summary['failed'].sort()
+        summary['seconds'] = time.perf_counter() - start
+        return summary
+
+    def __iter_shards(self, person_ids: Iterable[int]) -> Iterator[tuple]:
+        """Private helper - groups IDs into (index, list) shards without reading ahead"""
+        shard = []
+        shard_index = 0
+        for person_id in person_ids:
+            shard.append(person_id)
+            if len(shard) >= self.__shard_size:
+                yield shard_index, shard
+                shard = []
+                shard_index += 1
+        if shard:
+            yield shard_index, shard
+
+    @staticmethod
+    def __shard_path(output_dir: str, shard_index: int) -> str:
+        return os.path.join(output_dir, SHARD_FILE_PATTERN.format(shard_index))
+
+    @staticmethod
+    def __concatenate(shard_paths: List[str], archive_path: str) -> str:
+        """Private helper - joins the shard files into one archive in shard order, then deletes them"""
+        with open(archive_path, 'wb') as archive:
+            for path in shard_paths:
+                with open(path, 'rb') as shard_file:
+                    while True:
+                        block = shard_file.read(1024 * 1024)
+                        if not block:
+                            break
+                        archive.write(block)
+                os.remove(path)
+        return archive_path
@@ -0,0 +1,103 @@
+# report_cache.py
+# Vax Project Report Cache
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Clicking "Vaccine Statistics" twice in a row used to build the whole report twice
+# even though nothing changed. The cache keys every report on its type, its options
+# and the VaccineManager data version, so a repeat request is just a dictionary hit
+# and any change to the patients automatically makes the old entries unreachable.
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class ReportCache:
+    """
+    LRU cache for generated reports with an entry limit and a byte limit.
+    Keys are (report type, parameters, data version) tuples built by ReportManager.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 8 * 1024 * 1024):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private cache storage and counters - only reachable through the methods below
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__entries = OrderedDict()  # key -> (content, size in bytes), most recent at the end
+        self.__total_bytes = 0
+        self.__current_version = None
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__invalidations = 0
+
+    @staticmethod
+    def make_key(report_type: str, params: tuple, data_version: int) -> tuple:
+        """Builds a cache key - params has to be hashable (tuples, strings, numbers)"""
+        return (report_type, params, data_version)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Returns the cached report or None on a miss"""
+        self.__check_version(key[2])
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.__misses += 1
+            return None
+        self.__entries.move_to_end(key)
+        self.__hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, content: str):
+        """Stores a report, evicting the least recently used ones if we're over a limit"""
+        self.__check_version(key[2])
+        if key[2] != self.__current_version:
+            return  # built from data that's already been changed, nobody can hit it
+        size = len(content.encode('utf-8')) if isinstance(content, str) else len(content)
+        if size > self.__max_bytes:
+            return  # one giant report would just flush everything else out
+
+        old = self.__entries.pop(key, None)
+        if old is not None:
+            self.__total_bytes -= old[1]
+        self.__entries[key] = (content, size)
+        self.__total_bytes += size
+
+        while (len(self.__entries) > self.__max_entries or
+               self.__total_bytes > self.__max_bytes):
+            _, (_, evicted_size) = self.__entries.popitem(last=False)
+            self.__total_bytes -= evicted_size
+            self.__evictions += 1
+
+    def clear(self):
+        self.__entries.clear()
+        self.__total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters plus current size"""
+        lookups = self.__hits + self.__misses
+        return {
+            'entries': len(self.__entries),
+            'bytes': self.__total_bytes,
+            'hits': self.__hits,
+            'misses': self.__misses,
+            'hit_rate': self.__hits / lookups if lookups else 0.0,
+            'evictions': self.__evictions,
+            'invalidations': self.__invalidations
+        }
+
+    def __check_version(self, data_version: int):
+        """
+        Private helper - the first time we see a newer data version everything cached
+        for older versions can never be hit again, so drop it right away to free memory.
+        """
+        if data_version == self.__current_version:
+            return
+        if self.__current_version is not None and data_version < self.__current_version:
+            return  # a slow request for old data, leave the current entries alone
+        self.__current_version = data_version
+        stale = [key for key in self.__entries if key[2] != data_version]
+        for key in stale:
+            self.__total_bytes -= self.__entries.pop(key)[1]
+        self.__invalidations += len(stale)
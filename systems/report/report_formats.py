@@ -0,0 +1,249 @@
+# report_formats.py
+# Vax Project Structured Report Output
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The text reports are meant for people. Anything downstream that wanted the numbers
+# had to regex them back out of the text. Reports can now hand back a plain dict with
+# the same numbers (the TypedDicts below describe them). The writers stream those
+# dicts out as JSON, CSV or an HTML table one record at a time, so exporting the
+# whole registry never holds everything in memory.
+
+import csv
+import html
+import io
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, TypedDict
+from .report_renderer import ReportRenderer
+
+
+class IndividualReportData(TypedDict):
+    report_type: str
+    patient_id: int
+    found: bool
+    first_name: Optional[str]
+    last_name: Optional[str]
+    phone: Optional[str]
+    address: Optional[str]
+    covid19: Optional[bool]
+    influenza: Optional[bool]
+    ebola: Optional[bool]
+    fever: Optional[bool]
+    fatigue: Optional[bool]
+    headache: Optional[bool]
+    vaccine_count: Optional[int]
+    symptom_count: Optional[int]
+    cleared_for_entry: Optional[bool]
+
+
+class ApproximateFields(TypedDict, total=False):
+    # only filled in when the report was estimated from the sample
+    sample_size: int
+    confidence: float
+    intervals: Dict[str, Dict[str, float]]  # key -> {'low': %, 'high': %}
+
+
+class VaccinationReportData(ApproximateFields):
+    report_type: str
+    cohort: Optional[str]
+    total_patients: int
+    covid19: int
+    influenza: int
+    ebola: int
+    fully_vaccinated: int
+    covid19_percent: float
+    influenza_percent: float
+    ebola_percent: float
+    fully_vaccinated_percent: float
+    approximate: bool
+
+
+class SymptomReportData(ApproximateFields):
+    report_type: str
+    cohort: Optional[str]
+    total_patients: int
+    covid19_with_symptoms: int
+    influenza_with_symptoms: int
+    ebola_with_symptoms: int
+    fever: int
+    fatigue: int
+    headache: int
+    any_symptoms: int
+    cleared_for_entry: int
+    symptom_rate: float
+    entry_clearance_rate: float
+    approximate: bool
+
+
+def flatten_record(record: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Nested dicts become dotted column names (coverage.covid19) for CSV and HTML"""
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, name + "."))
+        else:
+            flat[name] = value
+    return flat
+
+
+# ===== INHERITANCE DEMONSTRATED HERE =====
+# Every output format inherits the stream handling from StructuredReportWriter
+# and only fills in how the start, each record and the end get written
+class StructuredReportWriter(ABC):
+    """
+    Base class for the streaming writers.
+    Use as a context manager, or call write_all(records) which does begin/end for you.
+    Binary streams get wrapped so the writers can always write text.
+    """
+
+    def __init__(self, stream, encoding: str = 'utf-8'):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Protected stream - subclasses write through self._stream only
+        self.__wrapper = None
+        if ReportRenderer.is_binary_stream(stream):
+            self.__wrapper = io.TextIOWrapper(stream, encoding=encoding, newline='')
+            self._stream = self.__wrapper
+        else:
+            self._stream = stream
+        self._record_count = 0
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end()
+        return False
+
+    def get_record_count(self) -> int:
+        return self._record_count
+
+    def write_record(self, record: Dict[str, Any]):
+        self._write_record(record)
+        self._record_count += 1
+
+    def write_all(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Writes every record from an iterable (can be a generator), returns how many"""
+        with self:
+            for record in records:
+                self.write_record(record)
+        return self._record_count
+
+    def end(self):
+        self._write_end()
+        self._stream.flush()
+        if self.__wrapper is not None:
+            # hand the binary stream back to the caller instead of closing it
+            self.__wrapper.detach()
+            self.__wrapper = None
+
+    # ===== POLYMORPHISM DEMONSTRATED HERE =====
+    # Each format implements these three differently
+    @abstractmethod
+    def begin(self):
+        pass
+
+    @abstractmethod
+    def _write_record(self, record: Dict[str, Any]):
+        pass
+
+    @abstractmethod
+    def _write_end(self):
+        pass
+
+
+class JsonReportWriter(StructuredReportWriter):
+    """Writes a JSON array, one record at a time"""
+
+    def begin(self):
+        self._stream.write("[")
+
+    def _write_record(self, record: Dict[str, Any]):
+        if self._record_count:
+            self._stream.write(",")
+        self._stream.write("\n  ")
+        self._stream.write(json.dumps(record))
+
+    def _write_end(self):
+        self._stream.write("\n]\n" if self._record_count else "]\n")
+
+
+class CsvReportWriter(StructuredReportWriter):
+    """Writes CSV - the columns come from the first record (nested keys get flattened)"""
+
+    def __init__(self, stream, encoding: str = 'utf-8'):
+        super().__init__(stream, encoding)
+        self.__writer = None
+
+    def begin(self):
+        self.__writer = None
+
+    def _write_record(self, record: Dict[str, Any]):
+        flat = flatten_record(record)
+        if self.__writer is None:
+            self.__writer = csv.DictWriter(self._stream, fieldnames=list(flat),
+                                           restval='', extrasaction='ignore')
+            self.__writer.writeheader()
+        self.__writer.writerow(flat)
+
+    def _write_end(self):
+        pass
+
+
+class HtmlReportWriter(StructuredReportWriter):
+    """Writes a standalone HTML page with one table row per record"""
+
+    def __init__(self, stream, encoding: str = 'utf-8', title: str = "Vax Report"):
+        super().__init__(stream, encoding)
+        self.__title = title
+        self.__columns: List[str] = []
+
+    def begin(self):
+        self.__columns = []
+        self._stream.write("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n")
+        self._stream.write(f"<title>{html.escape(self.__title)}</title>\n</head>\n<body>\n")
+        self._stream.write(f"<h1>{html.escape(self.__title)}</h1>\n<table>\n")
+
+    def _write_record(self, record: Dict[str, Any]):
+        flat = flatten_record(record)
+        if not self.__columns:
+            self.__columns = list(flat)
+            header = "".join(f"<th>{html.escape(column)}</th>" for column in self.__columns)
+            self._stream.write(f"<tr>{header}</tr>\n")
+        cells = "".join(f"<td>{html.escape(self.__cell_text(flat.get(column)))}</td>"
+                        for column in self.__columns)
+        self._stream.write(f"<tr>{cells}</tr>\n")
+
+    def _write_end(self):
+        self._stream.write("</table>\n</body>\n</html>\n")
+
+    @staticmethod
+    def __cell_text(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, float):
+            return f"{value:.1f}"
+        return str(value)
+
+
+class ReportFormatFactory:
+    """Factory for the structured writers, same idea as ReportFactory"""
+
+    @staticmethod
+    def get_available_formats() -> List[str]:
+        return ["json", "csv", "html"]
+
+    @staticmethod
+    def create_writer(output_format: str, stream, **kwargs) -> StructuredReportWriter:
+        output_format = output_format.lower()
+        if output_format == "json":
+            return JsonReportWriter(stream, **kwargs)
+        elif output_format == "csv":
+            return CsvReportWriter(stream, **kwargs)
+        elif output_format == "html":
+            return HtmlReportWriter(stream, **kwargs)
+        else:
+            raise ValueError(f"Unknown report format: {output_format}")
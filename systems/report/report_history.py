@@ -0,0 +1,148 @@
+# report_history.py
+# Vax Project Report History
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# ReportManager used to keep the full text of every report it ever made in a list,
+# which in a long running process just keeps growing (batch runs add one per patient).
+# Now the newest entries stay in a fixed size ring buffer, compressed with zlib, and
+# older ones get appended to a segment file on disk where they can still be queried.
+
+import os
+import pickle
+import struct
+import tempfile
+import zlib
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+
+# every spilled entry: payload length, crc32 of the payload
+HISTORY_RECORD_HEADER = struct.Struct('<II')
+HISTORY_FILE_NAME = "report_history.dat"
+
+
+class ReportHistory:
+    """
+    Bounded history of generated reports.
+    Keeps max_in_memory entries in memory, spills older ones to disk.
+    Query by type, patient ID and time range with query().
+    """
+
+    def __init__(self, max_in_memory: int = 200, history_dir: str = None):
+        if max_in_memory < 1:
+            raise ValueError("max_in_memory must be at least 1")
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private ring buffer and spill file - callers only record and query
+        self.__max_in_memory = max_in_memory
+        self.__recent = deque()  # newest entries, oldest on the left
+        self.__spilled_count = 0
+
+        # no directory means a temp file that goes away when we close
+        if history_dir:
+            os.makedirs(history_dir, exist_ok=True)
+            self.__segment = open(os.path.join(history_dir, HISTORY_FILE_NAME), 'a+b')
+            self.__spilled_count = sum(1 for _ in self.__iter_spilled())
+        else:
+            self.__segment = tempfile.TemporaryFile()
+
+    def record(self, report_type: str, content: str, **fields) -> Dict[str, Any]:
+        """
+        Adds an entry. Extra fields (patient_id, cohort...) are stored as they are.
+        Returns the stored entry (without the content).
+        """
+        now = datetime.now()
+        entry = {'type': report_type}
+        entry.update(fields)
+        entry['timestamp'] = now.isoformat(timespec='microseconds')
+        entry['epoch'] = now.timestamp()
+        entry['content_z'] = zlib.compress(content.encode('utf-8'))
+
+        if len(self.__recent) >= self.__max_in_memory:
+            self.__spill(self.__recent.popleft())
+        self.__recent.append(entry)
+        return {key: value for key, value in entry.items() if key != 'content_z'}
+
+    def get_count(self) -> int:
+        """returns total number of entries (memory + disk)"""
+        return len(self.__recent) + self.__spilled_count
+
+    def get_memory_count(self) -> int:
+        """returns how many entries are in the ring buffer right now"""
+        return len(self.__recent)
+
+    def clear(self):
+        self.__recent.clear()
+        self.__segment.seek(0)
+        self.__segment.truncate()
+        self.__spilled_count = 0
+
+    def query(self, report_type: str = None, patient_id: int = None,
+              since: datetime = None, until: datetime = None,
+              limit: int = None, include_content: bool = True) -> List[Dict[str, Any]]:
+        """
+        Returns matching entries oldest first. Every filter is optional.
+        limit keeps only the newest matches.
+        Disk entries are only read if the memory ones don't already cover the time range.
+        """
+        since_epoch = since.timestamp() if since else None
+        until_epoch = until.timestamp() if until else None
+
+        def matches(entry) -> bool:
+            if report_type is not None and entry['type'] != report_type:
+                return False
+            if patient_id is not None and entry.get('patient_id') != patient_id:
+                return False
+            if since_epoch is not None and entry['epoch'] < since_epoch:
+                return False
+            if until_epoch is not None and entry['epoch'] > until_epoch:
+                return False
+            return True
+
+        results = []
+        # everything on disk is older than the ring buffer, so skip the file if the
+        # oldest entry in memory is already before the start of the range
+        need_disk = self.__spilled_count and not (
+            since_epoch is not None and self.__recent and self.__recent[0]['epoch'] < since_epoch)
+        if need_disk:
+            results.extend(entry for entry in self.__iter_spilled() if matches(entry))
+        results.extend(entry for entry in self.__recent if matches(entry))
+
+        if limit is not None:
+            results = results[-limit:] if limit > 0 else []
+        return [self.__to_public(entry, include_content) for entry in results]
+
+    def close(self):
+        self.__segment.close()
+
+    @staticmethod
+    def __to_public(entry: Dict[str, Any], include_content: bool) -> Dict[str, Any]:
+        """Private helper - drops the compressed blob and optionally decompresses the text"""
+        public = {key: value for key, value in entry.items() if key != 'content_z'}
+        if include_content:
+            public['content'] = zlib.decompress(entry['content_z']).decode('utf-8')
+        return public
+
+    def __spill(self, entry: Dict[str, Any]):
+        """Private helper - appends one entry to the segment file"""
+        payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        self.__segment.seek(0, os.SEEK_END)
+        self.__segment.write(HISTORY_RECORD_HEADER.pack(len(payload), zlib.crc32(payload)))
+        self.__segment.write(payload)
+        self.__spilled_count += 1
+
+    def __iter_spilled(self) -> Iterator[Dict[str, Any]]:
+        """Private helper - reads the spilled entries back in order, stops at a torn write"""
+        self.__segment.flush()
+        self.__segment.seek(0)
+        while True:
+            header = self.__segment.read(HISTORY_RECORD_HEADER.size)
+            if len(header) < HISTORY_RECORD_HEADER.size:
+                return
+            length, crc = HISTORY_RECORD_HEADER.unpack(header)
+            payload = self.__segment.read(length)
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                return
+            yield pickle.loads(payload)
@@ -0,0 +1,302 @@
+# report_registry.py
+# Vax Project Report Registry
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# ReportFactory used to know every report type through an if/elif chain, so adding a
+# report meant editing the factory and importing the new code at startup even if
+# nobody ever asked for it. Now report types are registered by name with an
+# "module.path:ClassName" string and only get imported the first time someone asks
+# for them. Besides the built-ins they can come from JSON config files or from
+# installed packages through the "vax.reports" entry point group.
+
+import importlib
+import inspect
+import json
+import os
+import threading
+from collections import OrderedDict
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+ENTRY_POINT_GROUP = "vax.reports"
+CONFIG_ENV_VAR = "VAX_REPORT_TYPES"  # extra config files, separated like PATH
+
+# services ReportManager hands every report type - dropped quietly for types that don't use them
+SHARED_ARGUMENTS = ('stats_engine',)
+
+# the three reports that ship with the project - still only imported when used
+BUILTIN_REPORT_TYPES = OrderedDict([
+    ("individual", ("systems.report.report_system:IndividualReport", "Single patient report")),
+    ("vaccination", ("systems.report.report_system:VaccinationStatsReport", "Vaccination coverage")),
+    ("symptom", ("systems.report.report_system:SymptomAnalysisReport", "Symptom analysis")),
+])
+
+
+class ReportTypeSpec:
+    """
+    One registered report type. The target is either something callable that makes
+    the report, or a "module:attribute" string that gets imported on first use.
+    """
+
+    def __init__(self, name: str, target: Union[str, Callable], description: str = "",
+                 source: str = "code"):
+        if isinstance(target, str) and ":" not in target:
+            raise ValueError(f"Report target for {name} should look like 'module.path:ClassName'")
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private spec state - the import happens inside load(), callers never see the string
+        self.__name = name
+        self.__target = target
+        self.__description = description
+        self.__source = source
+        self.__factory: Optional[Callable] = None if isinstance(target, str) else target
+        self.__parameters = None  # names the factory takes, None means it takes **kwargs
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def get_description(self) -> str:
+        return self.__description
+
+    def get_source(self) -> str:
+        """returns where the type came from - code, a config file path or entry point"""
+        return self.__source
+
+    def is_loaded(self) -> bool:
+        return self.__factory is not None
+
+    def load(self) -> Callable:
+        """Imports the target the first time, then just hands back the cached factory"""
+        if self.__factory is None:
+            module_name, _, attribute_path = self.__target.partition(":")
+            target = importlib.import_module(module_name)
+            for attribute in attribute_path.split("."):
+                target = getattr(target, attribute)
+            self.__factory = target
+        return self.__factory
+
+    def filter_arguments(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Picks out the keyword arguments the factory takes. Options left as None count as
+        not passed, so callers can send the same option names (cohort, patient_id...) to
+        every report type. Raises ValueError for a required one that's missing, or for
+        one the report doesn't take at all (a typo or the wrong report type).
+        """
+        factory = self.load()
+        if self.__parameters is None:
+            signature = inspect.signature(factory)
+            parameters = list(signature.parameters.values())[1:]  # first one is the manager
+            if any(parameter.kind == parameter.VAR_KEYWORD for parameter in parameters):
+                self.__parameters = ()
+            else:
+                self.__parameters = tuple(
+                    (parameter.name, parameter.default is parameter.empty) for parameter in parameters
+                    if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)
+                )
+        if not self.__parameters:
+            return dict(kwargs)
+
+        arguments = {}
+        for parameter_name, required in self.__parameters:
+            value = kwargs.get(parameter_name)
+            if value is not None:
+                arguments[parameter_name] = value
+            elif required:
+                raise ValueError(f"{parameter_name} required for {self.__name} reports")
+
+        unknown = sorted(name for name, value in kwargs.items()
+                         if value is not None and name not in arguments and name not in SHARED_ARGUMENTS)
+        if unknown:
+            raise ValueError(f"{self.__name} reports don't take {', '.join(unknown)}")
+        return arguments
+
+
+class ReportInstanceCache:
+    """
+    Recently made report objects, keyed on the report type, the manager, its data
+    version and the arguments - asking for the same report again before anything
+    changed reuses the object (and whatever stats it already worked out).
+    Each ReportManager keeps its own, since the reports hold on to their manager and a
+    shared cache would keep old managers alive.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private LRU storage and counters - the registry fills it through create()
+        self.__max_entries = max_entries
+        self.__entries = OrderedDict()  # key -> report, most recently used at the end
+        self.__lock = threading.Lock()  # background report threads create reports too
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(self, key: tuple):
+        with self.__lock:
+            report = self.__entries.get(key)
+            if report is None:
+                self.__misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return report
+
+    def put(self, key: tuple, report):
+        with self.__lock:
+            self.__entries[key] = report
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.__lock:
+            return {'entries': len(self.__entries), 'hits': self.__hits, 'misses': self.__misses}
+
+    @staticmethod
+    def make_key(spec: ReportTypeSpec, manager, arguments: Dict[str, Any]) -> Optional[tuple]:
+        """
+        (spec, manager id, data version, arguments) or None if the arguments can't be
+        hashed. The spec object is in there so re-registering a type never hands back
+        reports from the old one. The manager id can't get reused while a cached report
+        still holds the manager. Cohorts go in by fingerprint since editing a cohort
+        doesn't change the data version.
+        """
+        items = []
+        for argument_name, value in sorted(arguments.items()):
+            if argument_name == 'cohort':
+                value = manager.get_cohorts().resolve(value).get_fingerprint()
+            items.append((argument_name, value))
+        key = (spec, id(manager), manager.get_data_version(), tuple(items))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+
+class ReportRegistry:
+    """
+    Name -> report type lookup with lazy imports.
+    create() can reuse recently made report objects if it's given a ReportInstanceCache.
+    """
+
+    def __init__(self, config_paths: Iterable[str] = None, use_entry_points: bool = True,
+                 include_builtins: bool = True):
+        self.__specs: Dict[str, ReportTypeSpec] = OrderedDict()
+        self.__lock = threading.RLock()  # background report threads use the registry too
+
+        if include_builtins:
+            for name, (target, description) in BUILTIN_REPORT_TYPES.items():
+                self.register(name, target, description)
+
+        # later sources win, so a site config can replace a built-in
+        paths = list(config_paths or [])
+        env_paths = os.environ.get(CONFIG_ENV_VAR)
+        if env_paths:
+            paths.extend(path for path in env_paths.split(os.pathsep) if path)
+        for path in paths:
+            self.load_config(path)
+
+        if use_entry_points:
+            self.load_entry_points()
+
+    def register(self, name: str, target: Union[str, Callable], description: str = "",
+                 source: str = "code") -> ReportTypeSpec:
+        """Adds (or replaces) a report type - target can be a class/function or 'module:Class'"""
+        spec = ReportTypeSpec(name.lower(), target, description, source)
+        with self.__lock:
+            self.__specs[spec.get_name()] = spec
+        return spec
+
+    def unregister(self, name: str) -> bool:
+        with self.__lock:
+            return self.__specs.pop(name.lower(), None) is not None
+
+    def load_config(self, path: str) -> int:
+        """
+        Registers report types from a JSON file, returns how many. Either form works:
+            {"report_types": {"site_daily": "site_reports.daily:DailyReport"}}
+            {"report_types": {"site_daily": {"target": "...", "description": "..."}}}
+        """
+        with open(path, 'r', encoding='utf-8') as config_file:
+            config = json.load(config_file)
+        report_types = config.get("report_types", {})
+        for name, entry in report_types.items():
+            if isinstance(entry, str):
+                self.register(name, entry, source=path)
+            else:
+                self.register(name, entry["target"], entry.get("description", ""), source=path)
+        return len(report_types)
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> int:
+        """Registers report types installed packages advertise - nothing gets imported yet"""
+        try:
+            found = entry_points(group=group)
+        except TypeError:  # older importlib.metadata returns a dict of groups
+            found = entry_points().get(group, [])
+        count = 0
+        for entry_point in found:
+            self.register(entry_point.name, entry_point.value, source=f"entry point {entry_point.value}")
+            count += 1
+        return count
+
+    def get_available_report_types(self) -> List[str]:
+        """Names in registration order - doesn't import anything"""
+        with self.__lock:
+            return list(self.__specs)
+
+    def get_spec(self, name: str) -> ReportTypeSpec:
+        spec = self.__specs.get(name.lower())
+        if spec is None:
+            raise ValueError(f"Unknown report type: {name}")
+        return spec
+
+    def is_loaded(self, name: str) -> bool:
+        """True once the report type's module has been imported"""
+        return self.get_spec(name).is_loaded()
+
+    def create(self, name: str, manager, instance_cache: ReportInstanceCache = None, **kwargs):
+        """
+        Builds a report of the given type (importing it first if needed).
+        See ReportTypeSpec.filter_arguments for which arguments get through. With an
+        instance_cache the same arguments at the same data version give back the same
+        report object.
+        """
+        spec = self.get_spec(name)
+        arguments = spec.filter_arguments(kwargs)
+        key = ReportInstanceCache.make_key(spec, manager, arguments) if instance_cache is not None else None
+
+        if key is not None:
+            report = instance_cache.get(key)
+            if report is not None:
+                return report
+
+        report = spec.load()(manager, **arguments)
+        if key is not None:
+            instance_cache.put(key, report)
+        return report
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.__lock:
+            return {
+                'registered': len(self.__specs),
+                'loaded': sum(1 for spec in self.__specs.values() if spec.is_loaded())
+            }
+
+
+# shared registry, made on first use so nothing is scanned at import time
+_default_registry: Optional[ReportRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_default_registry() -> ReportRegistry:
+    """The registry ReportFactory uses (built-ins + config files + entry points)"""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = ReportRegistry()
+        return _default_registry
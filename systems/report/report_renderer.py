@@ -0,0 +1,207 @@
+# report_renderer.py
+# Vax Project Report Renderer
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Reports used to build their text with a long chain of content += f"..." and then
+# format_report joined everything again, so one report made a pile of throwaway
+# strings. The templates below get parsed once at import into literal pieces and
+# fields. Rendering just walks those pieces and yields them, and the renderer writes
+# the chunks straight to whatever stream you give it (file, socket, buffer).
+
+import io
+from string import Formatter
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+# one template per report type (plus the "nothing to show" variants)
+# cohort_line is either "" or the pre-built "Cohort: ..." line
+REPORT_TEMPLATE_SOURCES = {
+    'individual': (
+        "DETAILED PATIENT REPORT\n\n"
+        "Patient ID: {patient_id}\n"
+        "Name: {first_name} {last_name}\n"
+        "Phone: {phone}\n"
+        "Address: {address}\n\n"
+        "VACCINATION RECORD:\n"
+        "   COVID-19: {covid19}\n"
+        "   Influenza: {influenza}\n"
+        "   Ebola: {ebola}\n\n"
+        "SYMPTOM CHECK:\n"
+        "   Fever: {fever}\n"
+        "   Fatigue: {fatigue}\n"
+        "   Headache: {headache}\n\n"
+        "{final_status}"
+    ),
+    'individual_missing': "ERROR: No patient found with ID {patient_id}",
+    'vaccination': (
+        "VACCINATION STATISTICS\n\n"
+        "{cohort_line}"
+        "Total Patients: {total}\n\n"
+        "Vaccination Coverage:\n"
+        "   COVID-19: {covid19} patients ({covid19_pct:.1f}%)\n"
+        "   Influenza: {influenza} patients ({influenza_pct:.1f}%)\n"
+        "   Ebola: {ebola} patients ({ebola_pct:.1f}%)\n\n"
+        "Fully Vaccinated: {fully_vaccinated} patients ({fully_vaccinated_pct:.1f}%)"
+    ),
+    'vaccination_approximate': (
+        "VACCINATION STATISTICS (APPROXIMATE)\n\n"
+        "{cohort_line}"
+        "Total Patients: {total}\n"
+        "Estimated from a random sample of {sample_size} patients ({confidence:.0f}% confidence)\n\n"
+        "Vaccination Coverage:\n"
+        "   COVID-19: ~{covid19} patients ({covid19_pct:.1f}%, {covid19_low:.1f}-{covid19_high:.1f}%)\n"
+        "   Influenza: ~{influenza} patients ({influenza_pct:.1f}%, {influenza_low:.1f}-{influenza_high:.1f}%)\n"
+        "   Ebola: ~{ebola} patients ({ebola_pct:.1f}%, {ebola_low:.1f}-{ebola_high:.1f}%)\n\n"
+        "Fully Vaccinated: ~{fully_vaccinated} patients "
+        "({fully_vaccinated_pct:.1f}%, {fully_vaccinated_low:.1f}-{fully_vaccinated_high:.1f}%)"
+    ),
+    'vaccination_empty': "No patients in the system.\n\nAdd patients to view vaccination statistics.",
+    'symptom': (
+        "SYMPTOM ANALYSIS REPORT\n\n"
+        "{cohort_line}"
+        "Vaccinated patients currently experiencing symptoms:\n\n"
+        "COVID-19 vaccinated with symptoms: {covid19_with_symptoms}\n"
+        "Influenza vaccinated with symptoms: {influenza_with_symptoms}\n"
+        "Ebola vaccinated with symptoms: {ebola_with_symptoms}\n\n"
+        "Total patients with any symptoms: {any_symptoms}\n"
+        "Patients cleared for entry: {cleared_for_entry}"
+    ),
+    'symptom_approximate': (
+        "SYMPTOM ANALYSIS REPORT (APPROXIMATE)\n\n"
+        "{cohort_line}"
+        "Estimated from a random sample of {sample_size} patients ({confidence:.0f}% confidence)\n\n"
+        "Vaccinated patients currently experiencing symptoms:\n\n"
+        "COVID-19 vaccinated with symptoms: ~{covid19_with_symptoms} "
+        "({covid19_with_symptoms_low:.1f}-{covid19_with_symptoms_high:.1f}%)\n"
+        "Influenza vaccinated with symptoms: ~{influenza_with_symptoms} "
+        "({influenza_with_symptoms_low:.1f}-{influenza_with_symptoms_high:.1f}%)\n"
+        "Ebola vaccinated with symptoms: ~{ebola_with_symptoms} "
+        "({ebola_with_symptoms_low:.1f}-{ebola_with_symptoms_high:.1f}%)\n\n"
+        "Total patients with any symptoms: ~{any_symptoms} ({any_symptoms_low:.1f}-{any_symptoms_high:.1f}%)\n"
+        "Patients cleared for entry: ~{cleared_for_entry} "
+        "({cleared_for_entry_low:.1f}-{cleared_for_entry_high:.1f}%)"
+    ),
+    'symptom_empty': "No patients in the system.\n\nAdd patients to view symptom analysis.",
+    'cohort_empty': "No patients in cohort {cohort}."
+}
+
+
+class ReportTemplate:
+    """
+    A template parsed once into literal text and {field:spec} slots.
+    iter_chunks(values) yields the pieces in order without joining them.
+    """
+
+    def __init__(self, name: str, source: str):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private compiled pieces - a str is literal text, a tuple is (field, spec, conversion)
+        self.__name = name
+        self.__source = source
+        self.__pieces: List[Union[str, tuple]] = []
+        self.__fields = []
+
+        for literal, field, spec, conversion in Formatter().parse(source):
+            if literal:
+                self.__pieces.append(literal)
+            if field is not None:
+                if not field or not field.isidentifier():
+                    raise ValueError(f"Template {name} needs named fields, got {{{field}}}")
+                self.__pieces.append((field, spec or '', conversion))
+                self.__fields.append(field)
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def get_fields(self) -> List[str]:
+        """returns the field names this template needs, in order"""
+        return list(self.__fields)
+
+    def iter_chunks(self, values: Dict[str, Any]) -> Iterator[str]:
+        for piece in self.__pieces:
+            if piece.__class__ is str:
+                yield piece
+                continue
+            field, spec, conversion = piece
+            value = values[field]
+            if conversion == 'r':
+                value = repr(value)
+            elif conversion == 's':
+                value = str(value)
+            elif conversion == 'a':
+                value = ascii(value)
+            # most fields are already strings with no spec, skip format() for those
+            yield value if (not spec and value.__class__ is str) else format(value, spec)
+
+    def render(self, values: Dict[str, Any]) -> str:
+        """Whole thing as one string - format_map does it in one C call"""
+        return self.__source.format_map(values)
+
+
+class ReportRenderer:
+    """
+    Holds the compiled templates and writes reports to streams.
+    Text streams get str chunks, binary streams (files opened with 'b', sockets
+    from makefile('wb'), BytesIO) get them encoded.
+    """
+
+    def __init__(self, template_sources: Dict[str, str] = None):
+        sources = template_sources if template_sources is not None else REPORT_TEMPLATE_SOURCES
+        self.__templates = {name: ReportTemplate(name, source) for name, source in sources.items()}
+
+    def get_template(self, name: str) -> ReportTemplate:
+        template = self.__templates.get(name)
+        if template is None:
+            raise ValueError(f"Unknown report template: {name}")
+        return template
+
+    def get_template_names(self) -> List[str]:
+        return list(self.__templates)
+
+    def iter_content(self, template_name: str, values: Dict[str, Any]) -> Iterator[str]:
+        """Content chunks for one template - what the report classes yield"""
+        return self.get_template(template_name).iter_chunks(values)
+
+    def render_content(self, template_name: str, values: Dict[str, Any]) -> str:
+        """Content for one template as a single string"""
+        return self.get_template(template_name).render(values)
+
+    @staticmethod
+    def iter_bytes(chunks: Iterable[str], encoding: str = 'utf-8') -> Iterator[bytes]:
+        """Encodes a chunk stream as it goes"""
+        for chunk in chunks:
+            yield chunk.encode(encoding)
+
+    @staticmethod
+    def is_binary_stream(stream) -> bool:
+        """True if the stream wants bytes instead of str"""
+        if isinstance(stream, io.TextIOBase):
+            return False
+        if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+            return True
+        return 'b' in getattr(stream, 'mode', '')
+
+    def render_to(self, stream, report, title: str = None, include_stats: bool = True,
+                  encoding: str = 'utf-8') -> int:
+        """
+        Writes a formatted report to stream chunk by chunk.
+        Returns how much got written (characters for text streams, bytes for binary ones).
+        """
+        return self.write_chunks(stream, report.iter_chunks(title, include_stats), encoding)
+
+    def write_chunks(self, stream, chunks: Iterable[str], encoding: str = 'utf-8') -> int:
+        """Writes any chunk stream, encoding it first if the stream is binary"""
+        written = 0
+        if self.is_binary_stream(stream):
+            for data in self.iter_bytes(chunks, encoding):
+                stream.write(data)
+                written += len(data)
+        else:
+            for chunk in chunks:
+                stream.write(chunk)
+                written += len(chunk)
+        return written
+
+
+# compiled once when the module loads, shared by every report
+DEFAULT_RENDERER = ReportRenderer()
@@ -0,0 +1,240 @@
+# report_scheduler.py
+# Vax Project Report Scheduler
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Every report used to run inside a button handler, so the GUI loop just froze until
+# it was done. The scheduler runs reports on a small thread pool instead - either
+# recurring ones (hourly vaccination stats, daily symptom analysis) or one-off ones a
+# button asks for. Finished results wait in a queue for the GUI to pick up each frame.
+# If a recurring job is still running when it's due again the runs get coalesced, and
+# if we fell way behind (laptop asleep...) the missed runs are skipped, not replayed.
+
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+
+class ScheduledJob:
+    """One recurring report - what to run, how often, and how it's been going"""
+
+    def __init__(self, name: str, report_type: str, interval: float,
+                 next_run: float, options: Dict[str, Any]):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private schedule state - only the scheduler changes it, under its lock
+        self.__name = name
+        self.__report_type = report_type
+        self.__interval = interval
+        self.__options = dict(options)
+        self.__next_run = next_run
+        self.__running = False
+        self.__pending = False  # due again while running - run once more when done
+
+        self.__runs = 0
+        self.__coalesced = 0
+        self.__skipped = 0
+        self.__errors = 0
+        self.__last_duration = None
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def get_report_type(self) -> str:
+        return self.__report_type
+
+    def get_options(self) -> Dict[str, Any]:
+        return dict(self.__options)
+
+    def get_interval(self) -> float:
+        return self.__interval
+
+    def get_next_run(self) -> float:
+        return self.__next_run
+
+    def is_running(self) -> bool:
+        return self.__running
+
+    def is_due(self, now: float) -> bool:
+        return now >= self.__next_run
+
+    def claim(self, now: float) -> bool:
+        """
+        Called when the job is due. Moves next_run forward, counting any whole intervals
+        we slept through as skipped. Returns True if it should start running now,
+        False if it's already running (then it just gets marked as pending).
+        """
+        late_by = now - self.__next_run
+        missed = int(late_by // self.__interval)
+        self.__skipped += missed
+        self.__next_run += (missed + 1) * self.__interval
+
+        if self.__running:
+            if self.__pending:
+                self.__coalesced += 1
+            self.__pending = True
+            return False
+        self.__running = True
+        return True
+
+    def finish(self, duration: float, failed: bool) -> bool:
+        """Marks the run done. Returns True if a coalesced run is waiting to start"""
+        self.__runs += 1
+        self.__last_duration = duration
+        if failed:
+            self.__errors += 1
+        if self.__pending:
+            self.__pending = False
+            return True
+        self.__running = False
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'name': self.__name, 'report_type': self.__report_type,
+            'interval': self.__interval, 'runs': self.__runs,
+            'coalesced': self.__coalesced, 'skipped': self.__skipped,
+            'errors': self.__errors, 'running': self.__running,
+            'last_duration': self.__last_duration
+        }
+
+
+class ReportScheduler:
+    """
+    Runs reports in the background with a thread pool.
+    run_report(report_type, options) does the actual work - ReportManager passes its
+    own generate_report so results land in the report cache and history as usual.
+    """
+
+    def __init__(self, run_report: Callable[[str, Dict[str, Any]], str], workers: int = 2,
+                 max_completed: int = 100, clock: Callable[[], float] = time.monotonic):
+        self.__run_report = run_report
+        self.__workers = workers
+        self.__clock = clock
+
+        self.__jobs: Dict[str, ScheduledJob] = {}
+        self.__lock = threading.Lock()
+        self.__wakeup = threading.Condition(self.__lock)
+        # nobody polling shouldn't mean recurring results pile up forever - oldest get dropped
+        self.__completed = deque(maxlen=max_completed)
+        self.__request_ids = itertools.count(1)
+
+        self.__pool: Optional[ThreadPoolExecutor] = None
+        self.__timer_thread: Optional[threading.Thread] = None
+        self.__stopping = False
+
+    def add_job(self, name: str, report_type: str, interval: float,
+                start_delay: float = None, **options) -> ScheduledJob:
+        """
+        Adds (or replaces) a recurring job. First run happens after start_delay
+        seconds, by default one full interval from now.
+        """
+        first_run = self.__clock() + (interval if start_delay is None else start_delay)
+        job = ScheduledJob(name, report_type, interval, first_run, options)
+        with self.__wakeup:
+            self.__jobs[name] = job
+            self.__wakeup.notify()
+        self.__ensure_started()
+        return job
+
+    def remove_job(self, name: str) -> bool:
+        with self.__lock:
+            return self.__jobs.pop(name, None) is not None
+
+    def get_job_names(self) -> List[str]:
+        with self.__lock:
+            return list(self.__jobs)
+
+    def get_job_stats(self, name: str) -> Dict[str, Any]:
+        with self.__lock:
+            job = self.__jobs.get(name)
+            if job is None:
+                raise ValueError(f"No scheduled job named {name}")
+            return job.get_stats()
+
+    def submit(self, report_type: str, **options) -> str:
+        """
+        Runs one report as soon as a worker is free.
+        Returns a request name - the result comes back from poll_completed() with it.
+        """
+        self.__ensure_started()
+        request_name = f"request-{next(self.__request_ids)}"
+        self.__pool.submit(self.__execute, request_name, report_type, options, None)
+        return request_name
+
+    def poll_completed(self) -> List[Dict[str, Any]]:
+        """
+        Everything that finished since the last call, never blocks (fine to call each frame).
+        Each entry: name, report_type, content (None on failure), error, duration, scheduled.
+        """
+        results = []
+        while True:
+            try:
+                results.append(self.__completed.popleft())
+            except IndexError:
+                return results
+
+    def stop(self, wait: bool = True):
+        """Stops the timer thread and the workers (running reports finish if wait is True)"""
+        with self.__wakeup:
+            self.__stopping = True
+            self.__wakeup.notify()
+        if self.__timer_thread is not None and wait:
+            self.__timer_thread.join()
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=wait)
+        self.__pool = None
+        self.__timer_thread = None
+
+    def __ensure_started(self):
+        """Private helper - threads only get created once something is actually scheduled"""
+        with self.__lock:
+            if self.__stopping:
+                raise RuntimeError("Scheduler has been stopped")
+            if self.__pool is None:
+                self.__pool = ThreadPoolExecutor(max_workers=self.__workers,
+                                                 thread_name_prefix="report-worker")
+            if self.__timer_thread is None:
+                self.__timer_thread = threading.Thread(target=self.__timer_loop,
+                                                       name="report-scheduler", daemon=True)
+                self.__timer_thread.start()
+
+    def __timer_loop(self):
+        """Private helper - sleeps until the next job is due, hands due jobs to the pool"""
+        with self.__wakeup:
+            while not self.__stopping:
+                now = self.__clock()
+                for job in self.__jobs.values():
+                    if job.is_due(now) and job.claim(now):
+                        self.__pool.submit(self.__execute, job.get_name(), job.get_report_type(),
+                                           job.get_options(), job)
+                next_due = min((job.get_next_run() for job in self.__jobs.values()), default=None)
+                timeout = None if next_due is None else max(next_due - self.__clock(), 0)
+                self.__wakeup.wait(timeout)
+
+    def __execute(self, name: str, report_type: str, options: Dict[str, Any],
+                  job: Optional[ScheduledJob]):
+        """Private helper - runs on a worker thread"""
+        while True:
+            start = self.__clock()
+            content, error = None, None
+            try:
+                content = self.__run_report(report_type, options)
+            except Exception as e:
+                error = str(e) or e.__class__.__name__
+            duration = self.__clock() - start
+
+            self.__completed.append({'name': name, 'report_type': report_type, 'content': content,
+                                  'error': error, 'duration': duration, 'scheduled': job is not None})
+            if job is None:
+                return
+            with self.__lock:
+                run_again = job.finish(duration, error is not None) and not self.__stopping
+            if not run_again:
+                return
@@ -4,10 +4,28 @@
 # 06/21/2025
 # Hamza Kurdi
 
-from typing import Dict, Any, List
+from abc import abstractmethod
+from typing import Dict, Any, List, Union, Callable, Iterator, Tuple
+import threading
 from datetime import datetime
 from classes.base_classes import ReportGenerator
 from classes.person.vaccine_manager import VaccineManager
+from classes.person.cohort import Cohort
+from .report_cache import ReportCache
+from .report_history import ReportHistory
+from .stats_engine import StatsEngine, PopulationStats, PopulationEstimate
+from .batch_runner import BatchReportRunner, SegmentShard
+from .report_renderer import DEFAULT_RENDERER
+from .analytics import AnalyticsEngine, ContingencyTable
+from .report_scheduler import ReportScheduler
+from .report_registry import ReportRegistry, ReportInstanceCache, get_default_registry
+from .report_formats import (ReportFormatFactory, IndividualReportData,
+                             VaccinationReportData, SymptomReportData)
+
+# aggregates the population reports show (names from PopulationStats)
+VACCINATION_KEYS = ('covid19', 'influenza', 'ebola', 'fully_vaccinated')
+SYMPTOM_REPORT_KEYS = ('covid19_with_symptoms', 'influenza_with_symptoms', 'ebola_with_symptoms',
+                       'any_symptoms', 'cleared_for_entry')
 
 # ===== INHERITANCE DEMONSTRATED HERE =====
 # IndividualReport inherits from ReportGenerator abstract base class
@@ -39,33 +57,61 @@ class IndividualReport(ReportGenerator):
         This method implements the abstract method from ReportGenerator
         Each report type implements this method differently (polymorphism)
         """
+        return DEFAULT_RENDERER.render_content(*self._get_template_values())
+    
+    def iter_content_chunks(self) -> Iterator[str]:
+        """Content straight from the compiled template, one piece at a time"""
+        return DEFAULT_RENDERER.iter_content(*self._get_template_values())
+    
+    def _get_template_values(self) -> Tuple[str, Dict[str, Any]]:
+        """Picks the template and fills in the values it needs"""
         if not self._target_person:
-            return f"ERROR: No patient found with ID {self._patient_id}"
+            return 'individual_missing', {'patient_id': self._patient_id}
         
         person = self._target_person
+        return 'individual', {
+            'patient_id': person.id,
+            'first_name': person.get_first_name(),
+            'last_name': person.get_last_name(),
+            'phone': person.get_phone() or 'Not provided',
+            'address': person.get_address() or 'Not provided',
+            'covid19': 'Vaccinated' if person.get_covid19_vaccine() else 'Not Vaccinated',
+            'influenza': 'Vaccinated' if person.get_influenza_vaccine() else 'Not Vaccinated',
+            'ebola': 'Vaccinated' if person.get_ebola_vaccine() else 'Not Vaccinated',
+            'fever': 'Present' if person.get_fever() else 'None',
+            'fatigue': 'Present' if person.get_fatigue() else 'None',
+            'headache': 'Present' if person.get_headache() else 'None',
+            'final_status': ("FINAL STATUS: CLEARED FOR ENTRY\nPatient meets all requirements."
+                             if person.is_cleared_for_entry() else
+                             "FINAL STATUS: NOT CLEARED\nPatient does not meet entry requirements.")
+        }
+    
+    def get_structured_data(self) -> IndividualReportData:
+        """Same facts as the text report, as typed fields (found is False for a bad ID)"""
+        person = self._target_person
+        if not person:
+            data = dict.fromkeys(IndividualReportData.__annotations__)
+            data.update(report_type='individual', patient_id=self._patient_id, found=False)
+            return data
         
-        content = f"DETAILED PATIENT REPORT\n\n"
-        content += f"Patient ID: {person.id}\n"
-        content += f"Name: {person.get_first_name()} {person.get_last_name()}\n"
-        content += f"Phone: {person.get_phone() or 'Not provided'}\n"
-        content += f"Address: {person.get_address() or 'Not provided'}\n\n"
-        
-        content += f"VACCINATION RECORD:\n"
-        content += f"   COVID-19: {'Vaccinated' if person.get_covid19_vaccine() else 'Not Vaccinated'}\n"
-        content += f"   Influenza: {'Vaccinated' if person.get_influenza_vaccine() else 'Not Vaccinated'}\n"
-        content += f"   Ebola: {'Vaccinated' if person.get_ebola_vaccine() else 'Not Vaccinated'}\n\n"
-        
-        content += f"SYMPTOM CHECK:\n"
-        content += f"   Fever: {'Present' if person.get_fever() else 'None'}\n"
-        content += f"   Fatigue: {'Present' if person.get_fatigue() else 'None'}\n"
-        content += f"   Headache: {'Present' if person.get_headache() else 'None'}\n\n"
-        
-        if person.is_cleared_for_entry():
-            content += "FINAL STATUS: CLEARED FOR ENTRY\nPatient meets all requirements."
-        else:
-            content += "FINAL STATUS: NOT CLEARED\nPatient does not meet entry requirements."
-        
-        return content
+        return {
+            'report_type': 'individual',
+            'patient_id': person.id,
+            'found': True,
+            'first_name': person.get_first_name(),
+            'last_name': person.get_last_name(),
+            'phone': person.get_phone(),
+            'address': person.get_address(),
+            'covid19': person.get_covid19_vaccine(),
+            'influenza': person.get_influenza_vaccine(),
+            'ebola': person.get_ebola_vaccine(),
+            'fever': person.get_fever(),
+            'fatigue': person.get_fatigue(),
+            'headache': person.get_headache(),
+            'vaccine_count': person.get_vaccine_count(),
+            'symptom_count': person.get_symptom_count(),
+            'cleared_for_entry': person.is_cleared_for_entry()
+        }
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -86,18 +132,82 @@ class IndividualReport(ReportGenerator):
 
 
 # ===== INHERITANCE DEMONSTRATED HERE =====
-# VaccinationStatsReport also inherits from ReportGenerator
+# PopulationReport sits between ReportGenerator and the whole-population reports
+# so they all share one stats pass instead of each asking the manager again
+class PopulationReport(ReportGenerator):
+    """
+    Base for reports that summarize everyone (or a cohort).
+    Stats come from the StatsEngine once per report and get reused by
+    generate_content and get_statistics.
+    approximate=True uses the manager's random sample instead of a full pass and
+    shows confidence intervals - for quick looks, official reports stay exact.
+    """
+    
+    def __init__(self, manager: VaccineManager, cohort: Union[str, Cohort] = None,
+                 stats_engine: StatsEngine = None, approximate: bool = False):
+        super().__init__(manager)
+        self._cohort = cohort  # None means the whole population
+        self._stats_engine = stats_engine if stats_engine is not None else StatsEngine()
+        self._approximate = approximate
+        self._population_stats = None
+    
+    def _get_population_stats(self) -> Union[PopulationStats, PopulationEstimate]:
+        """
+        Runs the stats pass (or the sample estimate) the first time it's needed,
+        then reuses the result. Both kinds answer get/get_total/get_rate/percent.
+        """
+        if self._population_stats is None:
+            if self._approximate:
+                self._population_stats = self._stats_engine.estimate(self._data_source, self._cohort)
+            else:
+                self._population_stats = self._stats_engine.compute(self._data_source, self._cohort)
+        return self._population_stats
+    
+    def _add_interval_values(self, values: Dict[str, Any], keys: Tuple[str, ...]):
+        """Adds sample size, confidence and key_low/key_high for the approximate templates"""
+        estimate = self._get_population_stats()
+        values['sample_size'] = estimate.get_sample_size()
+        values['confidence'] = estimate.get_confidence() * 100
+        for key in keys:
+            values[key + '_low'], values[key + '_high'] = estimate.get_interval(key)
+    
+    def _add_interval_data(self, data: Dict[str, Any], keys: Tuple[str, ...]):
+        """Structured version - marks the data approximate and nests the intervals"""
+        data['approximate'] = self._approximate
+        if not self._approximate:
+            return
+        estimate = self._get_population_stats()
+        data['sample_size'] = estimate.get_sample_size()
+        data['confidence'] = estimate.get_confidence()
+        data['intervals'] = {}
+        for key in keys:
+            low, high = estimate.get_interval(key)
+            data['intervals'][key] = {'low': low, 'high': high}
+    
+    def iter_content_chunks(self) -> Iterator[str]:
+        """Content straight from the compiled template, one piece at a time"""
+        return DEFAULT_RENDERER.iter_content(*self._get_template_values())
+    
+    @abstractmethod
+    def _get_template_values(self) -> Tuple[str, Dict[str, Any]]:
+        """Each population report picks its own template and values"""
+        pass
+
+
+# ===== INHERITANCE DEMONSTRATED HERE =====
+# VaccinationStatsReport also inherits from ReportGenerator (through PopulationReport)
 # Multiple classes inherit from the same base class showing inheritance hierarchy
-class VaccinationStatsReport(ReportGenerator):
+class VaccinationStatsReport(PopulationReport):
     """
     Concrete implementation for vaccination statistics report.
     Shows polymorphism with different content generation logic.
     """
     
-    def __init__(self, manager: VaccineManager):
+    def __init__(self, manager: VaccineManager, cohort: Union[str, Cohort] = None,
+                 stats_engine: StatsEngine = None, approximate: bool = False):
         # ===== INHERITANCE DEMONSTRATED HERE =====
         # Another example of calling parent constructor
-        super().__init__(manager)
+        super().__init__(manager, cohort, stats_engine, approximate)
         # ===== ENCAPSULATION DEMONSTRATED HERE =====
         # Protected attribute encapsulates report configuration
         self._report_title = "Vaccination Statistics Report"
@@ -109,21 +219,43 @@ class VaccinationStatsReport(ReportGenerator):
         Same method name as IndividualReport but completely different implementation
         This is polymorphism - same interface, different behavior
         """
-        if self._data_source.get_person_count() == 0:
-            return "No patients in the system.\n\nAdd patients to view vaccination statistics."
-        
-        stats = self._data_source.get_vaccination_stats()
-        total = stats['total_people']
+        return DEFAULT_RENDERER.render_content(*self._get_template_values())
+    
+    def _get_template_values(self) -> Tuple[str, Dict[str, Any]]:
+        stats = self._get_population_stats()
+        total = stats.get_total()
         
-        content = f"VACCINATION STATISTICS\n\n"
-        content += f"Total Patients: {total}\n\n"
-        content += f"Vaccination Coverage:\n"
-        content += f"   COVID-19: {stats['covid19']} patients ({stats['covid19']/total*100:.1f}%)\n"
-        content += f"   Influenza: {stats['influenza']} patients ({stats['influenza']/total*100:.1f}%)\n"
-        content += f"   Ebola: {stats['ebola']} patients ({stats['ebola']/total*100:.1f}%)\n\n"
-        content += f"Fully Vaccinated: {stats['fully_vaccinated']} patients ({stats['fully_vaccinated']/total*100:.1f}%)"
+        if total == 0:
+            if self._cohort is not None:
+                return 'cohort_empty', {'cohort': _cohort_name(self._cohort)}
+            return 'vaccination_empty', {}
         
-        return content
+        values = {
+            'cohort_line': f"Cohort: {_cohort_name(self._cohort)}\n" if self._cohort is not None else "",
+            'total': total
+        }
+        for key in VACCINATION_KEYS:
+            values[key] = stats.get(key)
+            values[key + '_pct'] = stats.get_rate(key)
+        if self._approximate:
+            self._add_interval_values(values, VACCINATION_KEYS)
+            return 'vaccination_approximate', values
+        return 'vaccination', values
+    
+    def get_structured_data(self) -> VaccinationReportData:
+        """Counts and coverage percentages from the same stats pass as the text"""
+        stats = self._get_population_stats()
+        data = {
+            'report_type': 'vaccination',
+            'cohort': _cohort_name(self._cohort) if self._cohort is not None else None,
+            'total_patients': stats.get_total()
+        }
+        for key in VACCINATION_KEYS:
+            data[key] = stats.get(key)
+        for key in VACCINATION_KEYS:
+            data[key + '_percent'] = stats.get_rate(key)
+        self._add_interval_data(data, VACCINATION_KEYS)
+        return data
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -131,27 +263,28 @@ class VaccinationStatsReport(ReportGenerator):
         ===== POLYMORPHISM DEMONSTRATED HERE =====
         Different statistical calculations than IndividualReport - polymorphic behavior
         """
-        stats = self._data_source.get_vaccination_stats()
+        stats = self._get_population_stats()
         
         return {
-            "Total Patients": stats['total_people'],
-            "COVID-19 Coverage": f"{stats['covid19']/stats['total_people']*100:.1f}%" if stats['total_people'] > 0 else "0%",
-            "Influenza Coverage": f"{stats['influenza']/stats['total_people']*100:.1f}%" if stats['total_people'] > 0 else "0%",
-            "Ebola Coverage": f"{stats['ebola']/stats['total_people']*100:.1f}%" if stats['total_people'] > 0 else "0%",
-            "Fully Vaccinated": f"{stats['fully_vaccinated']/stats['total_people']*100:.1f}%" if stats['total_people'] > 0 else "0%"
+            "Total Patients": stats.get_total(),
+            "COVID-19 Coverage": stats.percent('covid19'),
+            "Influenza Coverage": stats.percent('influenza'),
+            "Ebola Coverage": stats.percent('ebola'),
+            "Fully Vaccinated": stats.percent('fully_vaccinated')
         }
 
 
 # ===== INHERITANCE DEMONSTRATED HERE =====
 # Third class inheriting from ReportGenerator - shows inheritance hierarchy
-class SymptomAnalysisReport(ReportGenerator):
+class SymptomAnalysisReport(PopulationReport):
     """
     Concrete implementation for symptom analysis report.
     Another example of polymorphism in report generation.
     """
     
-    def __init__(self, manager: VaccineManager):
-        super().__init__(manager)
+    def __init__(self, manager: VaccineManager, cohort: Union[str, Cohort] = None,
+                 stats_engine: StatsEngine = None, approximate: bool = False):
+        super().__init__(manager, cohort, stats_engine, approximate)
         self._report_title = "Symptom Analysis Report"
     
     def generate_content(self) -> str:
@@ -160,35 +293,41 @@ class SymptomAnalysisReport(ReportGenerator):
         ===== POLYMORPHISM DEMONSTRATED HERE =====
         Third different implementation of generate_content - pure polymorphism
         """
-        if self._data_source.get_person_count() == 0:
-            return "No patients in the system.\n\nAdd patients to view symptom analysis."
-        
-        # get vaccinated people with symptoms
-        covid_with_symptoms = 0
-        flu_with_symptoms = 0
-        ebola_with_symptoms = 0
-        
-        for person in self._data_source.get_people():
-            has_symptoms = (person.get_fever() or person.get_fatigue() or person.get_headache())
-            
-            if person.get_covid19_vaccine() and has_symptoms:
-                covid_with_symptoms += 1
-            if person.get_influenza_vaccine() and has_symptoms:
-                flu_with_symptoms += 1
-            if person.get_ebola_vaccine() and has_symptoms:
-                ebola_with_symptoms += 1
-        
-        symptom_stats = self._data_source.get_symptom_stats()
-        
-        content = f"SYMPTOM ANALYSIS REPORT\n\n"
-        content += f"Vaccinated patients currently experiencing symptoms:\n\n"
-        content += f"COVID-19 vaccinated with symptoms: {covid_with_symptoms}\n"
-        content += f"Influenza vaccinated with symptoms: {flu_with_symptoms}\n"
-        content += f"Ebola vaccinated with symptoms: {ebola_with_symptoms}\n\n"
-        content += f"Total patients with any symptoms: {symptom_stats['any_symptoms']}\n"
-        content += f"Patients cleared for entry: {symptom_stats['cleared_for_entry']}"
+        return DEFAULT_RENDERER.render_content(*self._get_template_values())
+    
+    def _get_template_values(self) -> Tuple[str, Dict[str, Any]]:
+        stats = self._get_population_stats()
+        if stats.get_total() == 0:
+            if self._cohort is not None:
+                return 'cohort_empty', {'cohort': _cohort_name(self._cohort)}
+            return 'symptom_empty', {}
         
-        return content
+        # vaccinated people with symptoms - already counted in the same stats pass
+        values = {
+            'cohort_line': f"Cohort: {_cohort_name(self._cohort)}\n\n" if self._cohort is not None else ""
+        }
+        for key in SYMPTOM_REPORT_KEYS:
+            values[key] = stats.get(key)
+        if self._approximate:
+            self._add_interval_values(values, SYMPTOM_REPORT_KEYS)
+            return 'symptom_approximate', values
+        return 'symptom', values
+    
+    def get_structured_data(self) -> SymptomReportData:
+        """Symptom counts and rates from the same stats pass as the text"""
+        stats = self._get_population_stats()
+        data = {
+            'report_type': 'symptom',
+            'cohort': _cohort_name(self._cohort) if self._cohort is not None else None,
+            'total_patients': stats.get_total()
+        }
+        for key in ('covid19_with_symptoms', 'influenza_with_symptoms', 'ebola_with_symptoms',
+                    'fever', 'fatigue', 'headache', 'any_symptoms', 'cleared_for_entry'):
+            data[key] = stats.get(key)
+        data['symptom_rate'] = stats.get_rate('any_symptoms')
+        data['entry_clearance_rate'] = stats.get_rate('cleared_for_entry')
+        self._add_interval_data(data, SYMPTOM_REPORT_KEYS + ('fever', 'fatigue', 'headache'))
+        return data
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -196,77 +335,119 @@ class SymptomAnalysisReport(ReportGenerator):
         ===== POLYMORPHISM DEMONSTRATED HERE =====
         Third different implementation of get_statistics - polymorphic method behavior
         """
-        symptom_stats = self._data_source.get_symptom_stats()
-        total = self._data_source.get_person_count()
+        stats = self._get_population_stats()
         
         return {
-            "Patients with Fever": symptom_stats['fever'],
-            "Patients with Fatigue": symptom_stats['fatigue'], 
-            "Patients with Headache": symptom_stats['headache'],
-            "Patients with Any Symptoms": symptom_stats['any_symptoms'],
-            "Symptom Rate": f"{symptom_stats['any_symptoms']/total*100:.1f}%" if total > 0 else "0%",
-            "Entry Clearance Rate": f"{symptom_stats['cleared_for_entry']/total*100:.1f}%" if total > 0 else "0%"
+            "Patients with Fever": stats.get('fever'),
+            "Patients with Fatigue": stats.get('fatigue'), 
+            "Patients with Headache": stats.get('headache'),
+            "Patients with Any Symptoms": stats.get('any_symptoms'),
+            "Symptom Rate": stats.percent('any_symptoms'),
+            "Entry Clearance Rate": stats.percent('cleared_for_entry')
         }
 
 
+def _cohort_name(cohort: Union[str, Cohort]) -> str:
+    """Helper so reports can take either a cohort name or a Cohort object"""
+    return cohort.get_name() if isinstance(cohort, Cohort) else str(cohort)
+
+
 class ReportFactory:
     """
     Factory class for creating different types of reports.
     Supports scalability by centralizing report creation logic.
+    Each factory keeps its own cache of recently made reports for create_report.
     """
     
+    def __init__(self, max_cached_instances: int = 64):
+        self.__instances = ReportInstanceCache(max_cached_instances)
+    
     @staticmethod
     def create_individual_report(manager: VaccineManager, patient_id: int) -> IndividualReport:
         """Factory method for individual reports"""
         return IndividualReport(manager, patient_id)
     
     @staticmethod
-    def create_vaccination_report(manager: VaccineManager) -> VaccinationStatsReport:
+    def create_vaccination_report(manager: VaccineManager, cohort: Union[str, Cohort] = None,
+                                  stats_engine: StatsEngine = None,
+                                  approximate: bool = False) -> VaccinationStatsReport:
         """Factory method for vaccination statistics reports"""
-        return VaccinationStatsReport(manager)
+        return VaccinationStatsReport(manager, cohort, stats_engine, approximate)
     
     @staticmethod
-    def create_symptom_report(manager: VaccineManager) -> SymptomAnalysisReport:
+    def create_symptom_report(manager: VaccineManager, cohort: Union[str, Cohort] = None,
+                              stats_engine: StatsEngine = None,
+                              approximate: bool = False) -> SymptomAnalysisReport:
         """Factory method for symptom analysis reports"""
-        return SymptomAnalysisReport(manager)
+        return SymptomAnalysisReport(manager, cohort, stats_engine, approximate)
+    
+    @staticmethod
+    def get_registry() -> ReportRegistry:
+        """The registry the type-name methods below look report types up in"""
+        return get_default_registry()
     
     @staticmethod
     def get_available_report_types() -> List[str]:
-        """Get list of available report types for UI"""
-        return ["individual", "vaccination", "symptom"]
+        """Get list of available report types for UI (built-ins plus anything registered)"""
+        return get_default_registry().get_available_report_types()
     
     @staticmethod
     def create_report_by_type(report_type: str, manager: VaccineManager, **kwargs) -> ReportGenerator:
         """
         Create report by type string with keyword arguments.
-        Demonstrates keyword argument usage.
+        The type is looked up in the report registry (imported the first time it's asked
+        for), and each report type only gets the keyword arguments it takes.
+        Makes a new report every time - create_report() reuses them.
         """
-        if report_type.lower() == "individual":
-            patient_id = kwargs.get('patient_id')
-            if patient_id is None:
-                raise ValueError("patient_id required for individual reports")
-            return ReportFactory.create_individual_report(manager, patient_id)
-        
-        elif report_type.lower() == "vaccination":
-            return ReportFactory.create_vaccination_report(manager)
-        
-        elif report_type.lower() == "symptom":
-            return ReportFactory.create_symptom_report(manager)
-        
-        else:
-            raise ValueError(f"Unknown report type: {report_type}")
+        return get_default_registry().create(report_type, manager, **kwargs)
+    
+    def create_report(self, report_type: str, manager: VaccineManager, **kwargs) -> ReportGenerator:
+        """Same as create_report_by_type, but hands back this factory's cached report when nothing changed"""
+        return get_default_registry().create(report_type, manager, self.__instances, **kwargs)
+    
+    def get_instance_stats(self) -> Dict[str, int]:
+        """Hit/miss counters for the reused report objects"""
+        return self.__instances.get_stats()
 
 
 class ReportManager:
     """
     Manager class for handling multiple reports and batch operations.
     Demonstrates composition and better encapsulation.
+    Generated reports are cached on (type, options, data version) so asking for
+    the same report again before anything changes doesn't rebuild it.
+    The history is bounded - see ReportHistory for how older entries get spilled to disk.
+    Population reports share one StatsEngine, so the vaccination and symptom
+    reports for the same data come from a single pass.
+    Reports can also run in the background (see ReportScheduler) - the cache and
+    history are guarded by a lock since worker threads use them too.
+    What a worker thread reads from the VaccineManager: population reports only use
+    the packed flag counts, the sample and the data version (no Person records),
+    an individual report loads one record through the store. MemoryPersonStore is
+    a plain dict lookup and TieredPersonStore locks its cache and file, so that's
+    safe next to the GUI thread. Anything else (a new report type walking every
+    Person, say) should run on the GUI thread or take a snapshot first.
     """
     
-    def __init__(self, vaccine_manager: VaccineManager):
+    def __init__(self, vaccine_manager: VaccineManager, cache: ReportCache = None,
+                 history: ReportHistory = None):
         self.__vaccine_manager = vaccine_manager
-        self.__report_history = []  # private list to store generated reports
+        self.__report_history = history if history is not None else ReportHistory()
         self.__factory = ReportFactory()
+        self.__cache = cache if cache is not None else ReportCache()
+        self.__stats_engine = StatsEngine()
+        self.__renderer = DEFAULT_RENDERER
+        self.__analytics = AnalyticsEngine(self.__stats_engine)
+        self.__lock = threading.RLock()
+        self.__scheduler = None  # made the first time something gets scheduled
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for the report cache"""
+        return self.__cache.get_stats()
+    
+    def clear_cache(self):
+        """Drops every cached report"""
+        self.__cache.clear()
     
     def generate_individual_report(self, patient_id: int, **format_options) -> str:
         """
@@ -274,106 +455,295 @@ class ReportManager:
         Uses keyword arguments for flexible formatting.
         """
         try:
-            report = self.__factory.create_individual_report(self.__vaccine_manager, patient_id)
-            
-            valid_options = {}
-            if 'title' in format_options:
-                valid_options['title'] = format_options['title']
-            if 'include_stats' in format_options:
-                valid_options['include_stats'] = format_options['include_stats']
-            
-            formatted_report = report.format_report(**valid_options)
-            
-            self.__report_history.append({
-                'type': 'individual',
-                'patient_id': patient_id,
-                'content': formatted_report,
-                'timestamp': datetime.now().strftime("%m-%d-%Y")
-            })
-            
-            return formatted_report
+            return self.__generate_individual(patient_id, format_options)
             
         except Exception as e:
             # print(f"Error generating individual report: {str(e)}")
             return f"Error generating individual report"
     
-    def generate_vaccination_stats(self, **format_options) -> str:
-        """Generate vaccination statistics report"""
+    def generate_vaccination_stats(self, cohort: Union[str, Cohort] = None, approximate: bool = False,
+                                   **format_options) -> str:
+        """
+        Generate vaccination statistics report (whole population or one cohort).
+        approximate=True estimates from the random sample with confidence intervals.
+        """
         try:
-            report = self.__factory.create_vaccination_report(self.__vaccine_manager)
-            
-            valid_options = {}
-            if 'title' in format_options:
-                valid_options['title'] = format_options['title']
-            if 'include_stats' in format_options:
-                valid_options['include_stats'] = format_options['include_stats']
-            
-            formatted_report = report.format_report(**valid_options)
-            
-            self.__report_history.append({
-                'type': 'vaccination',
-                'content': formatted_report,
-                'timestamp': datetime.now().strftime("%m-%d-%Y")
-            })
-            
-            return formatted_report
+            return self.__generate_vaccination(cohort, approximate, format_options)
             
         except Exception as e:
             # print(f"Error generating vaccination report: {str(e)}")
             return f"Error generating vaccination report"
     
-    def generate_symptom_analysis(self, **format_options) -> str:
-        """Generate symptom analysis report"""
+    def generate_symptom_analysis(self, cohort: Union[str, Cohort] = None, approximate: bool = False,
+                                  **format_options) -> str:
+        """
+        Generate symptom analysis report (whole population or one cohort).
+        approximate=True estimates from the random sample with confidence intervals.
+        """
         try:
-            report = self.__factory.create_symptom_report(self.__vaccine_manager)
-            
-            valid_options = {}
-            if 'title' in format_options:
-                valid_options['title'] = format_options['title']
-            if 'include_stats' in format_options:
-                valid_options['include_stats'] = format_options['include_stats']
-            
-            formatted_report = report.format_report(**valid_options)
-            
-            self.__report_history.append({
-                'type': 'symptom',
-                'content': formatted_report,
-                'timestamp': datetime.now().strftime("%m-%d-%Y")
-            })
-            
-            return formatted_report
+            return self.__generate_symptom(cohort, approximate, format_options)
             
         except Exception as e:
             # print(f"Error generating symptom analysis: {str(e)}")
             return f"Error generating symptom report"
     
+    # the generate_* methods above turn errors into a message for the report dialog,
+    # these raise them instead (generate_report and the background jobs use these)
+    def __generate_individual(self, patient_id: int, format_options: dict) -> str:
+        return self.__generate(
+            'individual', (patient_id,), format_options,
+            lambda: self.__factory.create_individual_report(self.__vaccine_manager, patient_id),
+            {'patient_id': patient_id}
+        )
+    
+    def __generate_vaccination(self, cohort: Union[str, Cohort], approximate: bool,
+                               format_options: dict) -> str:
+        return self.__generate(
+            'vaccination', self.__cohort_params(cohort) + (approximate,), format_options,
+            lambda: self.__factory.create_vaccination_report(self.__vaccine_manager, cohort,
+                                                            self.__stats_engine, approximate),
+            {'cohort': _cohort_name(cohort) if cohort is not None else None,
+             'approximate': approximate}
+        )
+    
+    def __generate_symptom(self, cohort: Union[str, Cohort], approximate: bool,
+                           format_options: dict) -> str:
+        return self.__generate(
+            'symptom', self.__cohort_params(cohort) + (approximate,), format_options,
+            lambda: self.__factory.create_symptom_report(self.__vaccine_manager, cohort,
+                                                        self.__stats_engine, approximate),
+            {'cohort': _cohort_name(cohort) if cohort is not None else None,
+             'approximate': approximate}
+        )
+    
+    def __generate(self, report_type: str, params: tuple, format_options: dict,
+                   create_report, history_fields: dict) -> str:
+        """
+        Private helper shared by the generate_* methods.
+        Checks the cache first, otherwise builds the report with the factory callable,
+        then records it in the history either way.
+        """
+        valid_options = {}
+        if 'title' in format_options:
+            valid_options['title'] = format_options['title']
+        if 'include_stats' in format_options:
+            valid_options['include_stats'] = format_options['include_stats']
+        
+        cache_key = ReportCache.make_key(
+            report_type, params + tuple(sorted(valid_options.items())),
+            self.__vaccine_manager.get_data_version()
+        )
+        with self.__lock:
+            formatted_report = self.__cache.get(cache_key)
+        if formatted_report is None:
+            # built outside the lock so a slow report doesn't block the others
+            report = create_report()
+            formatted_report = report.format_report(**valid_options)
+            with self.__lock:
+                self.__cache.put(cache_key, formatted_report)
+        
+        with self.__lock:
+            self.__report_history.record(report_type, formatted_report, **history_fields)
+        
+        return formatted_report
+    
+    def iter_report_chunks(self, report_type: str, title: str = None, include_stats: bool = True,
+                           **kwargs) -> Iterator[str]:
+        """
+        Streams a report as chunks instead of one string (kwargs go to the factory,
+        e.g. patient_id or cohort). Nothing is cached or recorded - for big outputs
+        that should never be held in memory all at once.
+        """
+        report = self.__create_report(report_type, kwargs)
+        return report.iter_chunks(title, include_stats)
+    
+    def render_report_to(self, stream, report_type: str, title: str = None,
+                         include_stats: bool = True, **kwargs) -> int:
+        """
+        Writes a report straight to a text or binary stream (file, socket, buffer).
+        Returns characters written for text streams, bytes for binary ones.
+        """
+        report = self.__create_report(report_type, kwargs)
+        return self.__renderer.render_to(stream, report, title, include_stats)
+    
+    def get_contingency_table(self, cohort: Union[str, Cohort] = None) -> ContingencyTable:
+        """
+        Vaccine combination x symptom combination counts (8x8) for everyone or a cohort.
+        Shares the stats pass with the population reports, use conditional_rate() on it
+        for any breakdown instead of writing another loop.
+        """
+        return self.__analytics.build_table(self.__vaccine_manager, cohort)
+    
+    def generate_structured_report(self, report_type: str, **kwargs) -> Dict[str, Any]:
+        """
+        Report as a plain dict instead of text (kwargs go to the factory, e.g. patient_id).
+        Unlike the generate_* text methods errors are raised, not turned into a message.
+        """
+        return self.__create_report(report_type, kwargs).get_structured_data()
+    
+    def export_report(self, stream, report_type: str, output_format: str = "json", **kwargs) -> int:
+        """Writes one report as json, csv or html to a text or binary stream"""
+        writer = ReportFormatFactory.create_writer(output_format, stream)
+        return writer.write_all([self.generate_structured_report(report_type, **kwargs)])
+    
+    def export_individual_reports(self, stream, output_format: str = "json",
+                                  cohort: Union[str, Cohort] = None) -> int:
+        """
+        Streams the individual report for every patient (or a cohort) to stream.
+        Records are written as they're built so this works for the whole registry.
+        Returns how many records were written.
+        """
+        writer = ReportFormatFactory.create_writer(output_format, stream)
+        records = (self.__factory.create_individual_report(self.__vaccine_manager, person_id)
+                   .get_structured_data()
+                   for person_id in self.__vaccine_manager.iter_ids(cohort))
+        return writer.write_all(records)
+    
+    def __create_report(self, report_type: str, kwargs: dict) -> ReportGenerator:
+        """Private helper - factory call with the shared stats engine filled in"""
+        kwargs.setdefault('stats_engine', self.__stats_engine)
+        return self.__factory.create_report(report_type, self.__vaccine_manager, **kwargs)
+    
+    def __cohort_params(self, cohort: Union[str, Cohort]) -> tuple:
+        """Private helper - cache params for a cohort, based on who's in it (not just the name)"""
+        if cohort is None:
+            return (None,)
+        resolved = self.__vaccine_manager.get_cohorts().resolve(cohort)
+        return (resolved.get_name(), resolved.get_fingerprint())
+    
+    def generate_report(self, report_type: str, **kwargs) -> str:
+        """
+        Text report by type name - patient_id for individual reports, cohort for the
+        others, plus the usual format options. This is what background jobs call.
+        Unlike the generate_* methods errors are raised, so a failed background
+        report comes back with its error set instead of an error message as content.
+        """
+        report_type = report_type.lower()
+        if report_type == "individual":
+            if kwargs.get('patient_id') is None:
+                raise ValueError("patient_id required for individual reports")
+            return self.__generate_individual(kwargs.pop('patient_id'), kwargs)
+        elif report_type == "vaccination":
+            cohort = kwargs.pop('cohort', None)
+            return self.__generate_vaccination(cohort, kwargs.pop('approximate', False), kwargs)
+        elif report_type == "symptom":
+            cohort = kwargs.pop('cohort', None)
+            return self.__generate_symptom(cohort, kwargs.pop('approximate', False), kwargs)
+        else:
+            # anything else registered (config file / entry point) - unknown names raise here
+            self.__factory.get_registry().get_spec(report_type)
+            format_options = {key: kwargs.pop(key) for key in ('title', 'include_stats') if key in kwargs}
+            cohort = kwargs.pop('cohort', None)
+            return self.__generate(
+                report_type, self.__cohort_params(cohort) + tuple(sorted(kwargs.items())), format_options,
+                lambda: self.__create_report(report_type, dict(kwargs, cohort=cohort)),
+                dict(kwargs, cohort=_cohort_name(cohort) if cohort is not None else None)
+            )
+    
+    def get_scheduler(self) -> ReportScheduler:
+        """The background scheduler (created on first use, threads start on first job)"""
+        if self.__scheduler is None:
+            self.__scheduler = ReportScheduler(
+                lambda report_type, options: self.generate_report(report_type, **options)
+            )
+        return self.__scheduler
+    
+    def schedule_report(self, name: str, report_type: str, interval_seconds: float,
+                        start_delay: float = None, **kwargs):
+        """
+        Runs a report every interval_seconds in the background. The results go to the
+        cache and history like any other report (and show up in poll_background_reports).
+        """
+        return self.get_scheduler().add_job(name, report_type, interval_seconds, start_delay, **kwargs)
+    
+    def generate_in_background(self, report_type: str, **kwargs) -> str:
+        """Starts one report on a worker thread, returns the name its result comes back under"""
+        return self.get_scheduler().submit(report_type, **kwargs)
+    
+    def poll_background_reports(self) -> List[Dict[str, Any]]:
+        """Finished background reports since the last call - never blocks"""
+        if self.__scheduler is None:
+            return []
+        return self.__scheduler.poll_completed()
+    
+    def shutdown(self, wait: bool = True):
+        """Stops the background scheduler if one was started"""
+        if self.__scheduler is not None:
+            self.__scheduler.stop(wait)
+            self.__scheduler = None
+    
     def get_report_history_count(self) -> int:
         """Get number of reports generated"""
-        return len(self.__report_history)
+        return self.__report_history.get_count()
+    
+    def query_report_history(self, report_type: str = None, patient_id: int = None,
+                             since: datetime = None, until: datetime = None,
+                             limit: int = None, include_content: bool = True) -> List[Dict[str, Any]]:
+        """
+        Look up past reports by type, patient ID and time range (all optional).
+        Returns entries oldest first with full precision ISO timestamps.
+        """
+        return self.__report_history.query(report_type, patient_id, since, until,
+                                           limit, include_content)
     
     def clear_report_history(self):
         """Clear report history"""
         self.__report_history.clear()
     
-    def batch_generate_all_reports(self, **format_options) -> Dict[str, str]:
+    def batch_generate_all_reports(self, cohort: Union[str, Cohort] = None, **format_options) -> Dict[str, str]:
         """
         Generate all available reports in batch operation.
         Returns dict with report type as key and content as value.
+        Pass a cohort to only cover those patients.
         """
         results = {}
         
         # vaccination stats report
-        results['vaccination'] = self.generate_vaccination_stats(**format_options)
+        results['vaccination'] = self.generate_vaccination_stats(cohort, **format_options)
         
         # symptom analysis report  
-        results['symptom'] = self.generate_symptom_analysis(**format_options)
+        results['symptom'] = self.generate_symptom_analysis(cohort, **format_options)
         
         # individual reports for all patients
         individual_reports = {}
-        for person in self.__vaccine_manager.get_people():
+        for person in self.__vaccine_manager.iter_people(cohort):
             report_content = self.generate_individual_report(person.id, **format_options)
             individual_reports[f"patient_{person.id}"] = report_content
         
         results['individual_reports'] = individual_reports
         
-        return results
\ No newline at end of file
+        return results
+    
+    def batch_generate_to_files(self, output_dir: str, cohort: Union[str, Cohort] = None,
+                                workers: int = None, shard_size: int = 2000,
+                                max_in_flight: int = None, archive_name: str = None,
+                                progress_callback: Callable[[int, int], None] = None,
+                                **format_options) -> Dict[str, Any]:
+        """
+        Renders an individual report for every patient (or everyone in a cohort) in
+        parallel worker processes and writes them to output_dir instead of memory.
+        One file per shard by default, or one archive file if archive_name is given.
+        Unlike batch_generate_all_reports this skips the cache and history (a run over
+        the whole registry would just flush both) and failed patients are reported
+        in the returned summary instead of being hidden in the text.
+        """
+        valid_options = {key: format_options[key] for key in ('title', 'include_stats')
+                         if key in format_options}
+        # the total comes from the same list the shards do, so progress ends at 100%
+        person_ids = list(self.__vaccine_manager.iter_ids(cohort))
+        
+        runner = BatchReportRunner(workers, shard_size, max_in_flight)
+        return runner.run(person_ids, len(person_ids), output_dir, self.__load_batch_shard,
+                          valid_options, archive_name, progress_callback)
+    
+    def __load_batch_shard(self, person_ids: List[int]):
+        """
+        Private helper - what a batch worker gets for one shard of IDs. Records in a
+        storage file go as locations and the worker reads them; otherwise they only
+        exist in this process (memory store, temp file) and get sent over as they are.
+        """
+        locations = self.__vaccine_manager.get_record_locations(person_ids)
+        if locations is not None:
+            return SegmentShard(*locations)
+        people = (self.__vaccine_manager.get_person_by_id(person_id) for person_id in person_ids)
+        return [person for person in people if person is not None]  # removed since the ID list was made
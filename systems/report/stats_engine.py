@@ -0,0 +1,233 @@
+# stats_engine.py
+# Vax Project Statistics Engine
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Each report used to ask the VaccineManager for stats on its own - a vaccination
+# report scanned everyone twice and the symptom report three times. The engine does
+# one pass to count how many people have each of the 64 possible packed flag codes,
+# and every number any report needs gets worked out from those 64 counts.
+# For quick looks at huge registries estimate() does the same thing over the manager's
+# random sample instead of everybody, and adds confidence intervals.
+
+import math
+import threading
+from statistics import NormalDist
+from typing import Dict, Tuple, Union
+from classes.person.person import (COVID19_BIT, INFLUENZA_BIT, EBOLA_BIT, FEVER_BIT,
+                                   FATIGUE_BIT, HEADACHE_BIT, ALL_VACCINES_MASK, ALL_SYMPTOMS_MASK)
+from classes.person.cohort import Cohort
+
+FLAG_CODE_COUNT = 64  # six flags -> 2^6 possible codes
+
+
+class PopulationStats:
+    """
+    Immutable result of one stats pass. Only getters, nothing can change it after it's built.
+    Every count comes from the histogram of packed flag codes.
+    """
+
+    __slots__ = ('_PopulationStats__code_counts', '_PopulationStats__totals')
+
+    def __init__(self, code_counts: Dict[int, int]):
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private histogram and derived totals - exposed read-only through getters
+        counts = tuple(code_counts.get(code, 0) for code in range(FLAG_CODE_COUNT))
+        object.__setattr__(self, '_PopulationStats__code_counts', counts)
+        object.__setattr__(self, '_PopulationStats__totals', self.__derive_totals(counts))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PopulationStats is immutable")
+
+    @staticmethod
+    def __derive_totals(counts: Tuple[int, ...]) -> Dict[str, int]:
+        """Private helper - every aggregate the reports use, from the 64 buckets"""
+        totals = {
+            'total_people': 0, 'covid19': 0, 'influenza': 0, 'ebola': 0,
+            'fever': 0, 'fatigue': 0, 'headache': 0, 'any_symptoms': 0,
+            'cleared_for_entry': 0, 'covid19_with_symptoms': 0,
+            'influenza_with_symptoms': 0, 'ebola_with_symptoms': 0
+        }
+        for code, count in enumerate(counts):
+            if not count:
+                continue
+            has_symptoms = bool(code & ALL_SYMPTOMS_MASK)
+            totals['total_people'] += count
+            if code & COVID19_BIT:
+                totals['covid19'] += count
+                if has_symptoms:
+                    totals['covid19_with_symptoms'] += count
+            if code & INFLUENZA_BIT:
+                totals['influenza'] += count
+                if has_symptoms:
+                    totals['influenza_with_symptoms'] += count
+            if code & EBOLA_BIT:
+                totals['ebola'] += count
+                if has_symptoms:
+                    totals['ebola_with_symptoms'] += count
+            if code & FEVER_BIT:
+                totals['fever'] += count
+            if code & FATIGUE_BIT:
+                totals['fatigue'] += count
+            if code & HEADACHE_BIT:
+                totals['headache'] += count
+            if has_symptoms:
+                totals['any_symptoms'] += count
+            if code == ALL_VACCINES_MASK:
+                totals['cleared_for_entry'] += count
+        # the vaccination report has always called cleared people "fully vaccinated"
+        totals['fully_vaccinated'] = totals['cleared_for_entry']
+        return totals
+
+    def get(self, name: str) -> int:
+        """Any aggregate by name (total_people, covid19, fever, ebola_with_symptoms...)"""
+        return self.__totals[name]
+
+    def get_total(self) -> int:
+        return self.__totals['total_people']
+
+    def get_code_counts(self) -> Tuple[int, ...]:
+        """The raw histogram - index is the packed flag code"""
+        return self.__code_counts
+
+    def get_vaccination_stats(self) -> Dict[str, int]:
+        """Same keys as VaccineManager.get_vaccination_stats()"""
+        return {key: self.__totals[key] for key in
+                ('total_people', 'covid19', 'influenza', 'ebola', 'fully_vaccinated')}
+
+    def get_symptom_stats(self) -> Dict[str, int]:
+        """Same keys as VaccineManager.get_symptom_stats()"""
+        return {key: self.__totals[key] for key in
+                ('fever', 'fatigue', 'headache', 'any_symptoms', 'cleared_for_entry')}
+
+    def get_rate(self, name: str) -> float:
+        """An aggregate as a percentage of everyone (0.0 for an empty population)"""
+        total = self.__totals['total_people']
+        return self.__totals[name] / total * 100 if total else 0.0
+
+    def percent(self, name: str) -> str:
+        """Formats an aggregate as a percentage of everyone, '0%' for an empty population"""
+        total = self.__totals['total_people']
+        if total == 0:
+            return "0%"
+        return f"{self.__totals[name] / total * 100:.1f}%"
+
+
+class StatsEngine:
+    """
+    Computes PopulationStats in a single pass and remembers the last few results,
+    so a vaccination and a symptom report built back to back share the same pass.
+    Background reports call compute() from worker threads, so the cache has a lock.
+    The pass itself runs outside it, and a result only gets cached if the data
+    version was the same before and after counting (otherwise an edit that landed
+    mid-pass would be filed under the new version).
+    """
+
+    def __init__(self, max_cached: int = 8):
+        self.__max_cached = max_cached
+        self.__results = {}  # (data version, cohort key) -> PopulationStats
+        self.__passes = 0
+        self.__lock = threading.Lock()
+
+    def compute(self, manager, cohort: Union[str, Cohort] = None) -> PopulationStats:
+        """Stats for everyone (or one cohort) at the manager's current data version"""
+        cohort_key = None
+        if cohort is not None:
+            resolved = manager.get_cohorts().resolve(cohort)
+            cohort_key = (resolved.get_name(), resolved.get_fingerprint())
+        version = manager.get_data_version()
+        key = (version, cohort_key)
+
+        with self.__lock:
+            stats = self.__results.get(key)
+        if stats is not None:
+            return stats
+
+        stats = PopulationStats(manager.get_flag_code_counts(cohort))
+        with self.__lock:
+            self.__passes += 1
+            if manager.get_data_version() != version:
+                return stats  # something changed while we counted - good enough to show, not to keep
+            if key not in self.__results and len(self.__results) >= self.__max_cached:
+                self.__results.pop(next(iter(self.__results)))  # oldest first
+            self.__results[key] = stats
+        return stats
+
+    def estimate(self, manager, cohort: Union[str, Cohort] = None,
+                 confidence: float = 0.95) -> 'PopulationEstimate':
+        """Approximate stats from the sample - only a few thousand lookups, however big the registry"""
+        return PopulationEstimate(manager.get_sample_flag_code_counts(cohort),
+                                  manager.get_population_size(cohort), confidence)
+
+    def get_pass_count(self) -> int:
+        """returns how many population passes have actually run"""
+        return self.__passes
+
+
+class PopulationEstimate:
+    """
+    Approximate stats from the manager's random sample, with Wilson score intervals.
+    Rates are percentages of the population, counts are the rate scaled up to it.
+    If the sample is everybody (small populations) the numbers are exact and the
+    intervals collapse to a single point.
+    """
+
+    def __init__(self, sample_counts: Dict[int, int], population: int, confidence: float = 0.95):
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+
+        # ===== ENCAPSULATION DEMONSTRATED HERE =====
+        # Private sample stats - reuse PopulationStats for the counting part
+        self.__sample_stats = PopulationStats(sample_counts)
+        self.__population = population
+        self.__confidence = confidence
+        self.__z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+
+    def get_total(self) -> int:
+        """The real population size (this part isn't estimated)"""
+        return self.__population
+
+    def get_sample_size(self) -> int:
+        return self.__sample_stats.get_total()
+
+    def get_confidence(self) -> float:
+        return self.__confidence
+
+    def is_exact(self) -> bool:
+        """True when the sample covers everybody"""
+        return self.get_sample_size() >= self.__population
+
+    def get_rate(self, name: str) -> float:
+        """Estimated percentage for an aggregate (same names as PopulationStats)"""
+        return self.__sample_stats.get_rate(name)
+
+    def get_estimated_count(self, name: str) -> int:
+        return round(self.get_rate(name) / 100 * self.__population)
+
+    def get(self, name: str) -> int:
+        """Estimated count - same call as PopulationStats.get so reports can use either"""
+        return self.get_estimated_count(name)
+
+    def get_interval(self, name: str) -> Tuple[float, float]:
+        """(low, high) percentage - Wilson score interval at the chosen confidence"""
+        sample_size = self.get_sample_size()
+        if sample_size == 0:
+            return (0.0, 100.0) if self.__population else (0.0, 0.0)
+        rate = self.__sample_stats.get(name) / sample_size
+        if self.is_exact():
+            return rate * 100, rate * 100
+
+        z_squared = self.__z * self.__z
+        denominator = 1 + z_squared / sample_size
+        center = (rate + z_squared / (2 * sample_size)) / denominator
+        half_width = (self.__z * math.sqrt(rate * (1 - rate) / sample_size +
+                                           z_squared / (4 * sample_size * sample_size)) / denominator)
+        return max(0.0, center - half_width) * 100, min(1.0, center + half_width) * 100
+
+    def percent(self, name: str) -> str:
+        """'61.2% (58.1-64.3%)' style text for report summaries"""
+        if self.__population == 0:
+            return "0%"
+        low, high = self.get_interval(name)
+        return f"{self.get_rate(name):.1f}% ({low:.1f}-{high:.1f}%)"
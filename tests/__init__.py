@@ -0,0 +1 @@
+# tests package - run with python -m pytest -q (or python -m unittest discover tests)
@@ -0,0 +1,110 @@
+# test_analytics.py
+# Vax Project - tests for the 8x8 contingency table
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The table is read straight off the flag code histogram, so these count the same
+# small random population by hand (one person at a time, through the getters) and
+# check every cell, the row and column totals and a few conditional rates against it.
+
+import random
+import unittest
+
+from classes.person.person import Person, ALL_VACCINES_MASK, FEVER_BIT, INFLUENZA_BIT
+from classes.person.vaccine_manager import VaccineManager
+from systems.report.analytics import ContingencyTable, FlagCondition, COMBINATION_COUNT
+from systems.report.report_system import ReportManager
+
+
+def vaccine_combination(person: Person) -> int:
+    return (int(person.get_covid19_vaccine()) | int(person.get_influenza_vaccine()) << 1 |
+            int(person.get_ebola_vaccine()) << 2)
+
+
+def symptom_combination(person: Person) -> int:
+    return int(person.get_fever()) | int(person.get_fatigue()) << 1 | int(person.get_headache()) << 2
+
+
+def build_manager(count: int, seed: int = 37) -> VaccineManager:
+    rng = random.Random(seed)
+    manager = VaccineManager(max_capacity=count)
+    for person_id in range(1, count + 1):
+        person = Person(person_id, "Test", "Patient")
+        person.update_medical_data(
+            vaccines={'covid19': rng.random() < 0.7, 'influenza': rng.random() < 0.5, 'ebola': rng.random() < 0.2},
+            symptoms={'fever': rng.random() < 0.3, 'fatigue': rng.random() < 0.3, 'headache': rng.random() < 0.3}
+        )
+        manager.add_person(person)
+    return manager
+
+
+def brute_force(people) -> list:
+    cells = [[0] * COMBINATION_COUNT for _ in range(COMBINATION_COUNT)]
+    for person in people:
+        cells[vaccine_combination(person)][symptom_combination(person)] += 1
+    return cells
+
+
+class TestContingencyTable(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = build_manager(250)
+        self.reports = ReportManager(self.manager)
+
+    def test_cells_and_totals_match_a_hand_count(self):
+        table = self.reports.get_contingency_table()
+        cells = brute_force(self.manager.iter_people())
+
+        self.assertEqual(table.get_rows(), tuple(tuple(row) for row in cells))
+        for index in range(COMBINATION_COUNT):
+            self.assertEqual(table.get_row_total(index), sum(cells[index]))
+            self.assertEqual(table.get_column_total(index), sum(row[index] for row in cells))
+        self.assertEqual(table.get_total(), 250)
+        self.assertEqual(sum(table.get_row_total(row) for row in range(COMBINATION_COUNT)), 250)
+
+    def test_cohort_table(self):
+        rng = random.Random(7)
+        members = rng.sample(range(1, 251), 40)
+        self.manager.save_cohort("sample", members)
+        table = self.reports.get_contingency_table("sample")
+        cells = brute_force(self.manager.get_person_by_id(person_id) for person_id in members)
+        self.assertEqual(table.get_rows(), tuple(tuple(row) for row in cells))
+        self.assertEqual(table.get_total(), 40)
+
+    def test_conditional_rates(self):
+        table = self.reports.get_contingency_table()
+        people = list(self.manager.iter_people())
+
+        # fever among people with exactly the flu shot and nothing else
+        flu_only = [person for person in people if vaccine_combination(person) == INFLUENZA_BIT]
+        expected = sum(1 for person in flu_only if person.get_fever()) / len(flu_only)
+        rate = table.conditional_rate(FlagCondition(required=FEVER_BIT),
+                                      FlagCondition(required=INFLUENZA_BIT, excluded=ALL_VACCINES_MASK & ~INFLUENZA_BIT))
+        self.assertAlmostEqual(rate, expected)
+
+        cleared = sum(1 for person in people if person.is_cleared_for_entry())
+        self.assertEqual(table.count(lambda code: code == ALL_VACCINES_MASK), cleared)
+        self.assertEqual(table.count(FlagCondition()), 250)
+
+        cells = brute_force(people)
+        for row, (label, people_in_row, share) in enumerate(table.symptom_rates_by_vaccine_combination()):
+            self.assertEqual(people_in_row, sum(cells[row]))
+            if people_in_row:
+                self.assertAlmostEqual(share, (people_in_row - cells[row][0]) / people_in_row)
+            else:
+                self.assertIsNone(share)
+
+    def test_empty_and_bad_input(self):
+        table = ContingencyTable((0,) * 64)
+        self.assertEqual(table.get_total(), 0)
+        self.assertIsNone(table.conditional_rate(FlagCondition(required=FEVER_BIT)))
+        self.assertIn("Total", table.format_table())
+        with self.assertRaises(ValueError):
+            ContingencyTable((0,) * 8)
+        with self.assertRaises(ValueError):
+            FlagCondition(required=FEVER_BIT, excluded=FEVER_BIT)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+# test_background_handler.py
+# Vax Project - tests for the cached background layer
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+import os
+import unittest
+
+# no window or sound needed for these
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from gui.config.config import GUIConfiguration
+from gui.handlers.background_handler import BackgroundLayerHandler
+
+
+class TestBackgroundLayerHandler(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.window = pygame.display.set_mode((800, 700))
+        self.config = GUIConfiguration()
+        self.handler = BackgroundLayerHandler(self.window, self.config)
+
+    def test_card_rects_follow_the_layout(self):
+        margin = self.config.get_card_margin()
+        self.assertEqual(self.handler.get_card_rect(BackgroundLayerHandler.HEADER_CARD),
+                         pygame.Rect(margin, 10, 760, 85))
+        x, y, width, height, _ = BackgroundLayerHandler.CARD_LAYOUT[BackgroundLayerHandler.DISPLAY_CARD]
+        self.assertEqual(self.handler.get_card_rect(BackgroundLayerHandler.DISPLAY_CARD),
+                         pygame.Rect(margin, y, width, height))
+        # cards with their own x don't use the margin
+        self.assertEqual(self.handler.get_card_rect(3).x, BackgroundLayerHandler.CARD_LAYOUT[3][0])
+
+    def test_layer_is_cached(self):
+        first = self.handler.get_layer()
+        self.assertIs(self.handler.get_layer(), first)
+        self.assertEqual(first.get_size(), self.window.get_size())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# test_batch_runner.py
+# Vax Project - tests for the batch report runner
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Mostly runs with workers=1 so everything happens in this process (that's also the
+# path that hands the runner the manager's own Person objects). The storage file
+# tests use real worker processes too, since those read the records themselves.
+
+import os
+import tempfile
+import unittest
+
+from classes.person.person import Person
+from classes.person.vaccine_manager import VaccineManager
+from systems.report.batch_runner import BatchReportRunner
+from systems.report.report_system import ReportManager
+
+
+class TestBatchReportRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.manager = VaccineManager(max_capacity=10)
+        for person_id in range(1, 6):
+            self.manager.add_person(Person(person_id, "Test", f"Patient{person_id}"))
+
+    def test_shards_and_archive(self):
+        runner = BatchReportRunner(workers=1, shard_size=2)
+        summary = runner.run(self.manager.iter_ids(), 5, self.directory.name,
+                             lambda ids: [self.manager.get_person_by_id(person_id) for person_id in ids],
+                             archive_name="all.txt")
+        self.assertEqual((summary['patients'], summary['shards'], summary['failed']), (5, 3, []))
+        with open(os.path.join(self.directory.name, "all.txt"), encoding='utf-8') as archive:
+            text = archive.read()
+        positions = [text.index(f"----- patient {person_id} -----") for person_id in range(1, 6)]
+        self.assertEqual(positions, sorted(positions))
+
+    def test_inline_run_leaves_listeners_alone(self):
+        # regression: rendering used to re-point each person's change listener at the
+        # shard's own manager, so edits after a batch run never reached this one
+        # (the GUI holds on to the Person it's showing, so grab it before the run)
+        person = self.manager.get_person_by_id(3)
+        reports = ReportManager(self.manager)
+        self.addCleanup(reports.shutdown)
+        reports.batch_generate_to_files(self.directory.name, workers=1)
+
+        version = self.manager.get_data_version()
+        person.set_covid19_vaccine(True)
+        self.assertGreater(self.manager.get_data_version(), version)
+        self.assertTrue(self.manager.get_proxy_by_id(3).get_covid19_vaccine())
+        self.assertEqual(self.manager.get_vaccination_stats()['covid19'], 1)
+
+
+    def test_progress_total_matches_the_ids(self):
+        # the cohort has a member who isn't in the system (any more)
+        self.manager.save_cohort("group", [2, 4, 9])
+        reports = ReportManager(self.manager)
+        self.addCleanup(reports.shutdown)
+        progress = []
+        summary = reports.batch_generate_to_files(self.directory.name, cohort="group", workers=1,
+                                                  progress_callback=lambda done, total: progress.append((done, total)))
+        self.assertEqual(summary['patients'], 2)
+        self.assertEqual(progress[-1], (2, 2))
+
+
+class TestBatchFromStorageFile(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.manager = VaccineManager(max_capacity=50, max_hot_records=2,
+                                      storage_dir=os.path.join(self.directory.name, "registry"))
+        self.addCleanup(self.manager.close)
+        for person_id in range(1, 31):
+            self.manager.add_person(Person(person_id, "Test", f"Patient{person_id}"))
+        self.reports = ReportManager(self.manager)
+        self.addCleanup(self.reports.shutdown)
+
+    def run_batch(self, workers: int):
+        output_dir = os.path.join(self.directory.name, f"out{workers}")
+        faults = self.manager.get_storage_stats()['faults']
+        summary = self.reports.batch_generate_to_files(output_dir, workers=workers, shard_size=7,
+                                                       archive_name="all.txt")
+        # the workers read the records from the file - none got loaded in this process
+        self.assertEqual(self.manager.get_storage_stats()['faults'], faults)
+        self.assertEqual((summary['patients'], summary['failed']), (30, []))
+        with open(os.path.join(output_dir, "all.txt"), encoding='utf-8') as archive:
+            text = archive.read()
+        self.assertIn("Patient30", text)
+        return text
+
+    def test_inline(self):
+        # the hot (unsaved) records get written out before the workers read the file
+        self.manager.get_person_by_id(30).set_covid19_vaccine(True)
+        self.assertIn("----- patient 1 -----", self.run_batch(1))
+
+    def test_worker_processes(self):
+        self.assertEqual(self.run_batch(2), self.run_batch(1))
+
+if __name__ == '__main__':
+    unittest.main()
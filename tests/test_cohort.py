@@ -0,0 +1,92 @@
+# test_cohort.py
+# Vax Project - tests for the cohort bitmaps
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Checks the bitmap against plain Python sets, including IDs on chunk boundaries
+# and IDs far apart so more than one chunk gets used.
+
+import tempfile
+import unittest
+
+from classes.person.cohort import Cohort, CohortRegistry, CHUNK_BITS
+
+CHUNK = 1 << CHUNK_BITS
+FIRST_IDS = [0, 7, CHUNK - 1, CHUNK, 5 * CHUNK + 3, 123456789]
+SECOND_IDS = [7, CHUNK, 42, 123456789, 987654321]
+
+
+class TestCohort(unittest.TestCase):
+
+    def setUp(self):
+        self.first = Cohort.from_ids("first", FIRST_IDS)
+        self.second = Cohort.from_ids("second", SECOND_IDS)
+
+    def test_membership_and_order(self):
+        self.assertEqual(self.first.get_ids(), sorted(FIRST_IDS))
+        self.assertEqual(self.first.get_size(), len(FIRST_IDS))
+        self.assertTrue(self.first.contains(CHUNK - 1))
+        self.assertFalse(self.first.contains(CHUNK + 1))
+        self.assertFalse(self.first.contains(-1))
+
+    def test_negative_ids_rejected(self):
+        with self.assertRaises(ValueError):
+            Cohort.from_ids("bad", [-5])
+
+    def test_set_algebra_matches_sets(self):
+        first, second = set(FIRST_IDS), set(SECOND_IDS)
+        self.assertEqual(self.first.union(self.second).get_ids(), sorted(first | second))
+        self.assertEqual(self.first.intersection(self.second).get_ids(), sorted(first & second))
+        self.assertEqual(self.first.difference(self.second).get_ids(), sorted(first - second))
+
+    def test_operations_dont_change_inputs(self):
+        self.first.union(self.second)
+        self.first.without_id(7)
+        self.assertEqual(self.first.get_ids(), sorted(FIRST_IDS))
+
+    def test_empty_chunks_dropped(self):
+        emptied = self.first.difference(self.first)
+        self.assertEqual(emptied.get_chunks(), {})
+        self.assertEqual(emptied.get_fingerprint(), ())
+
+    def test_fingerprint_ignores_name(self):
+        same = Cohort.from_ids("other name", reversed(FIRST_IDS))
+        self.assertEqual(same.get_fingerprint(), self.first.get_fingerprint())
+        self.assertNotEqual(self.second.get_fingerprint(), self.first.get_fingerprint())
+
+    def test_fingerprint_built_once(self):
+        self.assertIs(self.first.get_fingerprint(), self.first.get_fingerprint())
+
+    def test_compressed_round_trip(self):
+        copy = Cohort.from_compressed("first", self.first.to_compressed())
+        self.assertEqual(copy.get_ids(), self.first.get_ids())
+
+
+class TestCohortRegistry(unittest.TestCase):
+
+    def test_named_operations_and_save(self):
+        registry = CohortRegistry()
+        registry.save_cohort(Cohort.from_ids("a", [1, 2, 3]))
+        registry.save_cohort(Cohort.from_ids("b", [3, 4]))
+        registry.union("a", "b", save_as="a or b")
+        self.assertEqual(registry.get_cohort("a or b").get_ids(), [1, 2, 3, 4])
+        self.assertEqual(registry.intersection("a", "b").get_ids(), [3])
+
+        registry.discard_id(3)
+        self.assertEqual(registry.get_cohort("a").get_ids(), [1, 2])
+
+        with tempfile.TemporaryDirectory() as directory:
+            registry.save_to(directory)
+            loaded = CohortRegistry()
+            loaded.load_from(directory)
+        self.assertEqual(loaded.get_cohort_names(), ["a", "a or b", "b"])
+        self.assertEqual(loaded.get_cohort("b").get_ids(), [4])
+
+    def test_unknown_name(self):
+        with self.assertRaises(ValueError):
+            CohortRegistry().resolve("missing")
+
+
+if __name__ == '__main__':
+    unittest.main()
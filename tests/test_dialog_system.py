@@ -0,0 +1,134 @@
+# test_dialog_system.py
+# Vax Project - tests for the autocomplete patient ID dialog
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The report prompt only ever asks the suggestion source for a handful of IDs, so
+# these check what it asks for as you type, what it shows, and that clicking a
+# suggestion (or OK, or Cancel) hands the right value to the callback.
+
+import os
+import unittest
+
+# no window or sound needed for these
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from gui.frame_benchmark import click_events, key_events
+from systems.dialog.dialog_system import DialogManager, AutocompleteInputDialog
+
+PATIENT_IDS = [str(person_id) for person_id in range(100, 400)]
+
+
+class RecordingSource:
+    """Prefix search over PATIENT_IDS that remembers every call"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text: str, limit: int) -> tuple:
+        self.calls.append((text, limit))
+        matches = [value for value in PATIENT_IDS if value.startswith(text)]
+        return matches[:limit], len(matches)
+
+
+class TestAutocompleteInputDialog(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.window = pygame.display.set_mode((800, 750))
+        self.source = RecordingSource()
+        self.dialogs = DialogManager(self.window, {'form_bg': (255, 255, 255), 'border': (0, 0, 0)})
+        self.results = []
+
+    def open(self, **kwargs):
+        self.dialogs.show_autocomplete_dialog("Report", "Patient ID?", self.source, self.results.append, **kwargs)
+
+    def type(self, text: str):
+        for char in text:
+            for event in key_events(char):
+                self.dialogs.handle_dialog_events(event)
+
+    def click(self, pos: tuple):
+        for event in click_events(pos):
+            self.dialogs.handle_dialog_events(event)
+
+    def suggestion_pos(self, index: int) -> tuple:
+        """Middle of the index-th suggestion button (they're 80 wide with a 6 pixel gap)"""
+        rect = self.dialogs.get_dialog_rect()
+        return rect.x + 25 + index * 86 + 40, rect.y + 148 + 15
+
+    def test_suggestions_follow_the_text(self):
+        dialog = AutocompleteInputDialog("Report", "Patient ID?", self.source, max_suggestions=3)
+        dialog.create_widgets(self.window, pygame.Rect(150, 200, 500, 300))
+        self.assertEqual(dialog.get_suggestions(), ["100", "101", "102"])
+        self.assertEqual(self.source.calls, [("", 3)])
+
+        # nothing changed, nothing asked
+        self.assertFalse(dialog.refresh_widgets())
+        self.assertEqual(len(self.source.calls), 1)
+
+        dialog.get_widgets()[2].setValue(" 25")  # the input field, whitespace is ignored
+        self.assertTrue(dialog.refresh_widgets())
+        self.assertEqual(dialog.get_suggestions(), ["250", "251", "252"])
+        self.assertEqual(self.source.calls[-1], ("25", 3))
+
+        dialog.get_widgets()[2].setValue("9")
+        dialog.refresh_widgets()
+        self.assertEqual(dialog.get_suggestions(), [])
+
+    def test_hint_says_how_many_more(self):
+        dialog = AutocompleteInputDialog("Report", "Patient ID?", self.source, default_value="2")
+        widgets = dialog.create_widgets(self.window, pygame.Rect(150, 200, 500, 300))
+        hint = next(widget for widget in widgets if widget.getValue() == "95 more - keep typing to narrow it down.")
+        dialog.get_widgets()[2].setValue("9")
+        dialog.refresh_widgets()
+        self.assertEqual(hint.getValue(), "No matches.")
+        dialog.get_widgets()[2].setValue("123")
+        dialog.refresh_widgets()
+        self.assertEqual(hint.getValue(), "")
+
+    def test_suggestion_buttons_stay_on_the_row(self):
+        # ten asked for, but only five buttons fit across a 500 wide dialog
+        dialog = AutocompleteInputDialog("Report", "?", self.source, max_suggestions=10)
+        widgets = dialog.create_widgets(self.window, pygame.Rect(150, 200, 500, 300))
+        self.assertEqual(dialog.get_suggestions(), ["100", "101", "102", "103", "104"])
+        self.assertTrue(any(widget.getValue() == "295 more - keep typing to narrow it down."
+                            for widget in widgets if hasattr(widget, 'getValue')))
+
+    def test_typing_then_clicking_a_suggestion(self):
+        self.open()
+        self.type("3")
+        self.assertEqual(self.source.calls[-1], ("3", 5))
+        self.type("1")
+        self.assertEqual(self.source.calls[-1], ("31", 5))
+        self.click(self.suggestion_pos(2))  # 310, 311, [312]
+        self.assertEqual(self.results, ["312"])
+        self.assertFalse(self.dialogs.get_is_active())
+
+    def test_enter_submits_what_was_typed(self):
+        self.open()
+        self.type("12")
+        self.type("\r")
+        self.assertEqual(self.results, ["12"])
+
+    def test_cancel_gives_none(self):
+        self.open(default_value="150")
+        rect = self.dialogs.get_dialog_rect()
+        self.click((rect.right - 70, rect.bottom - 40))
+        self.assertEqual(self.results, [None])
+
+    def test_suggestion_change_only_bumps_the_widget_version(self):
+        self.open()
+        version = self.dialogs.get_version()
+        widget_version = self.dialogs.get_widget_version()
+        self.type("2")
+        self.assertEqual(self.dialogs.get_version(), version)
+        self.assertGreater(self.dialogs.get_widget_version(), widget_version)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+# test_event_dispatcher.py
+# Vax Project - tests for the grid based event dispatcher
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Fake widgets just record what they were sent, so no window is needed.
+
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from gui.handlers.event_dispatcher import EventDispatcher
+
+
+class FakeWidget:
+    def __init__(self, rect, handles=False):
+        self.rect = pygame.Rect(rect)
+        self.handles = handles
+        self.received = []
+
+    def getRect(self):
+        return self.rect
+
+    def handleEvent(self, event):
+        self.received.append(event.type)
+        return self.handles
+
+
+class FakeField(FakeWidget):
+    def __init__(self, rect, focus=False):
+        super().__init__(rect)
+        self.focus = focus
+
+
+def mouse(event_type, pos, **extra):
+    return pygame.event.Event(event_type, pos=pos, **extra)
+
+
+class TestEventDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.dispatcher = EventDispatcher(cell_size=64)
+
+    def test_mouse_only_reaches_widgets_under_pointer(self):
+        left = FakeWidget((0, 0, 50, 50))
+        right = FakeWidget((300, 300, 50, 50))
+        self.dispatcher.register(left)
+        self.dispatcher.register(right)
+        self.dispatcher.dispatch(mouse(pygame.MOUSEBUTTONDOWN, (10, 10), button=1))
+        self.assertEqual(left.received, [pygame.MOUSEBUTTONDOWN])
+        self.assertEqual(right.received, [])
+
+    def test_widget_spanning_cells_found_from_any_cell(self):
+        wide = FakeWidget((10, 10, 200, 20))
+        self.dispatcher.register(wide)
+        self.assertEqual(self.dispatcher.get_widgets_at((190, 15)), [wide])
+        self.assertEqual(self.dispatcher.get_widgets_at((190, 40)), [])
+
+    def test_hover_target_hears_pointer_leave(self):
+        button = FakeWidget((0, 0, 50, 50))
+        self.dispatcher.register(button)
+        self.dispatcher.dispatch(mouse(pygame.MOUSEMOTION, (10, 10), rel=(0, 0), buttons=(0, 0, 0)))
+        self.dispatcher.dispatch(mouse(pygame.MOUSEMOTION, (400, 400), rel=(0, 0), buttons=(0, 0, 0)))
+        self.assertEqual(len(button.received), 2)
+        self.dispatcher.dispatch(mouse(pygame.MOUSEMOTION, (410, 400), rel=(0, 0), buttons=(0, 0, 0)))
+        self.assertEqual(len(button.received), 2)
+
+    def test_pressed_widget_gets_mouse_up_elsewhere(self):
+        button = FakeWidget((0, 0, 50, 50))
+        self.dispatcher.register(button)
+        self.dispatcher.dispatch(mouse(pygame.MOUSEBUTTONDOWN, (10, 10), button=1))
+        self.dispatcher.dispatch(mouse(pygame.MOUSEMOTION, (400, 400), rel=(0, 0), buttons=(1, 0, 0)))
+        self.dispatcher.dispatch(mouse(pygame.MOUSEBUTTONUP, (400, 400), button=1))
+        self.assertEqual(button.received[-1], pygame.MOUSEBUTTONUP)
+
+    def test_lower_layer_first_and_first_handler_wins(self):
+        calls = []
+        top = FakeWidget((0, 0, 50, 50), handles=True)
+        bottom = FakeWidget((0, 0, 50, 50), handles=True)
+        self.dispatcher.register(bottom, lambda widget: calls.append('bottom'), layer=1)
+        self.dispatcher.register(top, lambda widget: calls.append('top'), layer=0)
+        self.assertTrue(self.dispatcher.dispatch(mouse(pygame.MOUSEBUTTONUP, (10, 10), button=1)))
+        self.assertEqual(calls, ['top'])
+        self.assertEqual(bottom.received, [])
+
+    def test_keys_go_to_focused_field_only(self):
+        focused = FakeField((0, 0, 100, 20), focus=True)
+        other = FakeField((0, 100, 100, 20))
+        self.dispatcher.register(focused)
+        self.dispatcher.register(other)
+        self.dispatcher.dispatch(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode='a'))
+        self.assertEqual((len(focused.received), len(other.received)), (1, 0))
+        # key up goes to every field so key repeat stops even after focus moved
+        self.dispatcher.dispatch(pygame.event.Event(pygame.KEYUP, key=pygame.K_a, mod=0))
+        self.assertEqual(len(other.received), 1)
+
+    def test_click_reaches_focused_field_elsewhere(self):
+        field = FakeField((0, 0, 100, 20), focus=True)
+        self.dispatcher.register(field)
+        self.dispatcher.dispatch(mouse(pygame.MOUSEBUTTONDOWN, (400, 400), button=1))
+        self.assertEqual(field.received, [pygame.MOUSEBUTTONDOWN])
+
+    def test_wheel_uses_last_pointer_position(self):
+        area = FakeWidget((0, 0, 50, 50))
+        self.dispatcher.register(area)
+        self.dispatcher.dispatch(mouse(pygame.MOUSEMOTION, (10, 10), rel=(0, 0), buttons=(0, 0, 0)))
+        self.dispatcher.dispatch(pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1))
+        self.assertEqual(area.received[-1], pygame.MOUSEWHEEL)
+
+    def test_unregister_and_move(self):
+        widget = FakeWidget((0, 0, 50, 50))
+        self.dispatcher.register(widget)
+        widget.rect = pygame.Rect(200, 200, 50, 50)
+        self.dispatcher.move(widget)
+        self.assertEqual(self.dispatcher.get_widgets_at((10, 10)), [])
+        self.assertEqual(self.dispatcher.get_widgets_at((210, 210)), [widget])
+        self.dispatcher.unregister(widget)
+        self.assertEqual(self.dispatcher.get_widgets_at((210, 210)), [])
+        self.assertEqual(self.dispatcher.get_stats()['widgets'], 0)
+
+    def test_labels_are_ignored(self):
+        class Label:
+            def getRect(self):
+                return pygame.Rect(0, 0, 10, 10)
+        self.dispatcher.register(Label())
+        self.assertEqual(self.dispatcher.get_stats()['widgets'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# test_frame_benchmark.py
+# Vax Project - smoke test for the headless frame benchmark
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The benchmark is only useful if the whole script still plays through, so this
+# runs it end to end against a tiny population and checks the report it writes.
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# no window or sound needed for these
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from gui import frame_benchmark
+
+PHASES = ["idle", "hover", "form_typing", "add_patient", "list_scroll", "list_sort_filter",
+          "search", "individual_report", "background_report", "navigate"]
+
+
+class TestFrameBenchmark(unittest.TestCase):
+
+    def run_main(self, *args) -> tuple:
+        """Runs main() with args, returns (exit code, what it printed)"""
+        output = io.StringIO()
+        # main() shuts pygame down when it's done - the other tests still need it
+        with mock.patch('pygame.quit'), contextlib.redirect_stdout(output):
+            code = frame_benchmark.main(["--populations", "20", "--no-allocations", *args])
+        return code, output.getvalue()
+
+    def test_script_plays_through(self):
+        with tempfile.TemporaryDirectory() as folder:
+            json_path = os.path.join(folder, "frames.json")
+            code, output = self.run_main("--json", json_path, "--budget-ms", "100000")
+            with open(json_path) as f:
+                results = json.load(f)
+
+        self.assertEqual(code, 0)
+        self.assertIn("20 patients", output)
+        self.assertEqual(list(results), ["20"])
+        report = results["20"]
+        self.assertEqual(list(report), PHASES)
+        for name, summary in report.items():
+            self.assertGreater(summary['frames'], 0, name)
+            self.assertLessEqual(summary['p50_ms'], summary['max_ms'])
+            self.assertNotIn('peak_kb', summary)  # --no-allocations skips that pass
+
+    def test_over_budget_fails(self):
+        code, output = self.run_main("--budget-ms", "0")
+        self.assertEqual(code, 1)
+        self.assertIn("OVER BUDGET", output)
+
+    def test_population_is_left_as_it_was(self):
+        manager = frame_benchmark.build_population(20)
+        counter = frame_benchmark.SurfaceCounter()
+        frame_benchmark.FrameBenchmark(manager, frame_benchmark.FrameProfiler(surface_counter=counter)).run()
+        self.assertEqual(manager.get_person_count(), 20)
+        self.assertTrue(pygame.get_init())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+# test_frame_pacer.py
+# Vax Project - tests for the frame pacer
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Real sleeps would make these slow and flaky, so the pacer gets a fake clock and a
+# fake event queue that share one made up millisecond counter. Waiting just moves
+# the counter forward, which lets us check exactly how long each kind of frame waits.
+
+import unittest
+
+import pygame
+
+from systems.render.frame_pacer import FramePacer
+
+
+class FakeTime:
+    """Made up milliseconds shared by the fake clock and the fake events"""
+
+    def __init__(self):
+        self.now = 0
+
+
+class FakeClock:
+    """Same tick/get_fps as pygame.time.Clock, but sleeping just moves FakeTime along"""
+
+    def __init__(self, time: FakeTime, work_ms: int = 0):
+        self.__time = time
+        self.__work_ms = work_ms  # pretend every frame takes this long to draw
+        self.__last = 0
+        self.ticks = []  # the fps each tick was asked for
+
+    def tick(self, framerate: int = 0) -> int:
+        self.ticks.append(framerate)
+        self.__time.now += self.__work_ms
+        if framerate:
+            # pygame sleeps off whatever is left of the frame budget
+            self.__time.now = max(self.__time.now, self.__last + 1000 // framerate)
+        elapsed = self.__time.now - self.__last
+        self.__last = self.__time.now
+        return elapsed
+
+    def get_fps(self) -> float:
+        return 0.0
+
+
+class FakeEvents:
+    """Same wait/get as pygame.event, fed from a list of (due at ms, event)"""
+
+    def __init__(self, time: FakeTime):
+        self.__time = time
+        self.__queue = []
+        self.waits = []  # the timeout of every wait call
+
+    def post_at(self, due_ms: int, event: pygame.event.Event):
+        self.__queue.append((due_ms, event))
+        self.__queue.sort(key=lambda item: item[0])
+
+    def wait(self, timeout: int) -> pygame.event.Event:
+        self.waits.append(timeout)
+        if self.__queue and self.__queue[0][0] <= self.__time.now + timeout:
+            due, event = self.__queue.pop(0)
+            self.__time.now = max(self.__time.now, due)
+            return event
+        self.__time.now += timeout
+        return pygame.event.Event(pygame.NOEVENT)
+
+    def get(self) -> list:
+        ready = [event for due, event in self.__queue if due <= self.__time.now]
+        self.__queue = self.__queue[len(ready):]
+        return ready
+
+
+def key(letter: str) -> pygame.event.Event:
+    return pygame.event.Event(pygame.KEYDOWN, key=ord(letter), unicode=letter)
+
+
+class TestFramePacer(unittest.TestCase):
+
+    def setUp(self):
+        self.time = FakeTime()
+        self.clock = FakeClock(self.time, work_ms=4)
+        self.events = FakeEvents(self.time)
+        self.pacer = FramePacer(active_fps=60, max_idle_wait_ms=1000, clock=self.clock, events=self.events)
+
+    def test_active_frames_use_the_fps_budget(self):
+        for _ in range(60):
+            self.assertEqual(self.pacer.next_events(active=True), [])
+        # 16ms a frame no matter how little drawing there was, and no waiting on input
+        self.assertEqual(self.time.now, 60 * 16)
+        self.assertEqual(set(self.clock.ticks), {60})
+        self.assertEqual(self.events.waits, [])
+        self.assertEqual(self.pacer.get_stats()['active_frames'], 60)
+
+    def test_active_frame_returns_queued_input(self):
+        self.events.post_at(10, key('a'))
+        self.events.post_at(12, key('b'))
+        events = self.pacer.next_events(active=True)
+        self.assertEqual([event.unicode for event in events], ['a', 'b'])
+
+    def test_idle_frame_waits_out_the_idle_budget(self):
+        for _ in range(5):
+            self.assertEqual(self.pacer.next_events(active=False), [])
+        self.assertEqual(self.events.waits, [1000] * 5)
+        self.assertEqual(self.time.now, 5 * (1000 + 4))  # each wait plus drawing the frame
+        self.assertEqual(self.pacer.get_stats(), {'active_frames': 0, 'idle_frames': 5, 'idle_timeouts': 5})
+        # the catch-up tick after a wait never asks for a frame rate
+        self.assertEqual(set(self.clock.ticks), {0})
+
+    def test_idle_frame_wakes_for_a_timer(self):
+        self.pacer.next_events(active=False, wake_in_ms=250)
+        self.pacer.next_events(active=False, wake_in_ms=5000)  # never later than the idle budget
+        self.pacer.next_events(active=False, wake_in_ms=0)  # a timer that's already due still waits 1ms
+        self.pacer.next_events(active=False, wake_in_ms=12.7)
+        self.assertEqual(self.events.waits, [250, 1000, 1, 12])
+
+    def test_idle_frame_wakes_on_input(self):
+        self.events.post_at(300, key('x'))
+        self.events.post_at(300, key('y'))
+        self.events.post_at(900, key('z'))
+        events = self.pacer.next_events(active=False)
+        self.assertEqual([event.unicode for event in events], ['x', 'y'])
+        self.assertEqual(self.time.now, 300 + 4)  # woke at 300, then drew the frame
+        self.assertEqual(self.pacer.get_stats()['idle_timeouts'], 0)
+
+    def test_idle_then_active_does_not_count_the_sleep(self):
+        self.pacer.next_events(active=False)
+        start = self.time.now
+        self.pacer.next_events(active=True)
+        # the tick after the wait reset the budget, so this frame is a normal 16ms
+        self.assertEqual(self.time.now - start, 16)
+
+    def test_a_quiet_minute(self):
+        # sixty seconds with nobody at the kiosk
+        while self.time.now < 60000:
+            self.pacer.next_events(active=False)
+        self.assertLessEqual(self.pacer.get_stats()['idle_frames'], 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# test_main_gui.py
+# Vax Project - tests for the main window's redraw tracking
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Runs the real GUI headless and watches what gets sent to the screen, so we
+# notice if an ordinary frame goes back to redrawing the whole window.
+
+import os
+import unittest
+from unittest import mock
+
+# no window or sound needed for these
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from gui.frame_benchmark import (build_population, click_events, key_events,
+                                 INDIVIDUAL_REPORT_BUTTON, ID_FIELD, FIRST_SUGGESTION)
+from gui.main_gui import VaccineTrackerGUI
+from systems.report.report_system import ReportManager, IndividualReport
+
+WINDOW = pygame.Rect(0, 0, 800, 750)
+
+
+class TestDirtyRedraw(unittest.TestCase):
+
+    def setUp(self):
+        self.app = VaccineTrackerGUI(build_population(30), headless=True, auto_run=False)
+        self.addCleanup(self.app.close, quit_pygame=False)  # pygwidgets' fonts have to outlive the test
+        self.app.run_frame([])  # first frame paints everything
+
+    def frame_rects(self, events: list = ()) -> list:
+        """Runs one frame, returns the rects it sent to the screen (empty if it drew nothing)"""
+        with mock.patch('pygame.display.update') as update:
+            self.app.run_frame(list(events))
+        return update.call_args[0][0] if update.called else []
+
+    def test_typing_in_the_form(self):
+        self.frame_rects(click_events(ID_FIELD))
+        rects = self.frame_rects(key_events('5'))
+        self.assertTrue(rects)
+        self.assertNotIn(WINDOW, rects)
+
+    def test_dialog_refresh_only_redraws_the_dialog(self):
+        # opening the dialog covers everything with the overlay
+        self.assertEqual(self.frame_rects(click_events(INDIVIDUAL_REPORT_BUTTON)), [WINDOW])
+        # typing changes the suggestions - the form behind the overlay stays as it is
+        rects = self.frame_rects(key_events('1'))
+        self.assertTrue(rects)
+        dialog_area = rects[0].unionall(rects[1:])
+        self.assertLess(dialog_area.width * dialog_area.height, WINDOW.width * WINDOW.height // 4)
+
+
+class TestIndividualReport(unittest.TestCase):
+
+    def setUp(self):
+        self.app = VaccineTrackerGUI(build_population(30), headless=True, auto_run=False)
+        self.addCleanup(self.app.close, quit_pygame=False)
+        self.app.run_frame([])
+
+    def test_report_is_built_once(self):
+        self.app.run_frame(click_events(INDIVIDUAL_REPORT_BUTTON))
+        self.app.run_frame(key_events('1'))
+        with mock.patch.object(ReportManager, 'generate_structured_report') as structured, \
+                mock.patch.object(IndividualReport, 'get_statistics', autospec=True,
+                                  side_effect=IndividualReport.get_statistics) as statistics:
+            self.app.run_frame(click_events(FIRST_SUGGESTION))
+            self.app.run_frame([])
+        structured.assert_not_called()
+        self.assertEqual(statistics.call_count, 1)
+
+    def test_report_dialog_gets_the_chunk_stream(self):
+        self.app.run_frame(click_events(INDIVIDUAL_REPORT_BUTTON))
+        self.app.run_frame(key_events('1'))
+        with mock.patch.object(ReportManager, 'iter_report_chunks', autospec=True,
+                               side_effect=ReportManager.iter_report_chunks) as chunks, \
+                mock.patch.object(ReportManager, 'generate_individual_report') as whole:
+            self.app.run_frame(click_events(FIRST_SUGGESTION))
+        whole.assert_not_called()
+        self.assertEqual(chunks.call_args[0][1], "individual")
+
+
+if __name__ == '__main__':
+    unittest.main()
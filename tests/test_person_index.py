@@ -0,0 +1,137 @@
+# test_person_index.py
+# Vax Project - tests for the secondary indexes and the index file
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The index file is only worth having if a damaged or stale one gets thrown away,
+# so most of these check that load() says no when it should.
+
+import os
+import tempfile
+import unittest
+
+from classes.person.person import Person
+from classes.person.person_index import PrefixIndex, SortedIdIndex, IndexFile, INDEX_HEADER
+from classes.person.vaccine_manager import VaccineManager
+
+
+class TestPrefixIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = PrefixIndex()
+        for key, person_id in (("maria", 1), ("mark", 2), ("maria", 3), ("bob", 4)):
+            self.index.add(key, person_id)
+
+    def test_exact_and_prefix(self):
+        self.assertEqual(self.index.find_exact("maria"), [1, 3])
+        self.assertEqual(self.index.find_prefix("mar"), [1, 3, 2])
+        self.assertEqual(self.index.find_prefix("mar", limit=2), [1, 3])
+        self.assertEqual(self.index.find_prefix("z"), [])
+
+    def test_remove_drops_empty_keys(self):
+        self.index.remove("bob", 4)
+        self.assertEqual(self.index.get_key_count(), 2)
+        self.assertEqual(self.index.find_exact("bob"), [])
+
+    def test_payload_round_trip(self):
+        copy = PrefixIndex.from_payload(self.index.to_payload())
+        self.assertEqual(copy.find_prefix("mar"), [1, 3, 2])
+        copy.add("alice", 5)
+        self.assertEqual(copy.find_prefix(""), [5, 4, 1, 3, 2])
+
+
+
+class TestSortedIdIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = SortedIdIndex([0, 5, 12, 1, 120, 129, 130, 1200, 13, 1299, 12000])
+
+    def test_prefix_covers_every_decade(self):
+        # "12" is 12, then 120-129, then 1200-1299, then 12000-12999
+        self.assertEqual(self.index.find_prefix("12"), [12, 120, 129, 1200, 1299, 12000])
+        self.assertEqual(self.index.count_prefix("12"), 6)
+        self.assertEqual(list(self.index.iter_prefix("13")), [13, 130])
+
+    def test_limit_stops_across_spans(self):
+        self.assertEqual(self.index.find_prefix("12", limit=3), [12, 120, 129])
+        self.assertEqual(self.index.find_prefix("12", limit=1), [12])
+
+    def test_odd_prefixes(self):
+        self.assertEqual(self.index.count_prefix(""), 11)
+        self.assertEqual(self.index.find_prefix("0"), [0])
+        self.assertEqual(self.index.find_prefix("01"), [])
+        self.assertEqual(self.index.find_prefix("1a"), [])
+        self.assertEqual(self.index.find_prefix("9"), [])
+        # bigger than anything in there - no ranges at all
+        self.assertEqual(self.index.find_prefix("99999"), [])
+
+    def test_add_and_remove_keep_order(self):
+        self.index.add(125)
+        self.index.add(125)  # already there
+        self.index.remove(1200)
+        self.index.remove(7)  # never was
+        self.assertEqual(self.index.find_prefix("12"), [12, 120, 125, 129, 1299, 12000])
+        self.index.clear()
+        self.assertEqual(self.index.find_prefix(""), [])
+        self.assertEqual(self.index.find_prefix("0"), [])
+
+class TestIndexFile(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.index_file = IndexFile(self.directory.name)
+        self.payload = {'ids': [1, 2, 3]}
+
+    def test_round_trip(self):
+        self.index_file.save(self.payload, 7, 100)
+        self.assertEqual(self.index_file.load(100), (7, self.payload))
+        self.assertFalse(os.path.exists(self.index_file.get_path() + ".tmp"))
+
+    def test_missing_file(self):
+        self.assertIsNone(self.index_file.load(0))
+
+    def test_stale_when_segment_size_changed(self):
+        self.index_file.save(self.payload, 7, 100)
+        self.assertIsNone(self.index_file.load(101))
+
+    def test_corrupted_body_fails_crc(self):
+        self.index_file.save(self.payload, 7, 100)
+        with open(self.index_file.get_path(), 'r+b') as raw:
+            raw.seek(INDEX_HEADER.size + 5)
+            byte = raw.read(1)
+            raw.seek(INDEX_HEADER.size + 5)
+            raw.write(bytes([byte[0] ^ 0xFF]))
+        self.assertIsNone(self.index_file.load(100))
+
+    def test_truncated_file(self):
+        self.index_file.save(self.payload, 7, 100)
+        with open(self.index_file.get_path(), 'r+b') as raw:
+            raw.truncate(INDEX_HEADER.size - 1)
+        self.assertIsNone(self.index_file.load(100))
+
+    def test_remove(self):
+        self.index_file.save(self.payload, 7, 100)
+        self.index_file.remove()
+        self.assertIsNone(self.index_file.load(100))
+
+
+class TestManagerIndexRecovery(unittest.TestCase):
+
+    def test_rescan_when_index_is_damaged(self):
+        with tempfile.TemporaryDirectory() as directory:
+            manager = VaccineManager(max_capacity=10, storage_dir=directory)
+            manager.add_person(Person(4, "Maria", "Lopez", "555-0104"))
+            manager.add_person(Person(2, "Mark", "Hill", "555-0102"))
+            manager.close()
+
+            IndexFile(directory).remove()
+            reopened = VaccineManager(max_capacity=10, storage_dir=directory)
+            self.assertEqual([reopened.get_person_by_index(slot).id for slot in range(2)], [4, 2])
+            self.assertEqual(sorted(reopened.search_patients("mar").get_ids()), [2, 4])
+            reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# test_person_proxy.py
+# Vax Project - tests for PersonProxy
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# A proxy is only worth having if the flag getters really don't touch the record
+# store, so these run against a tiered manager that only keeps one record in memory
+# and watch its fault counter. The rest checks what a proxy does once its patient
+# (or the patient in the last slot) has been removed.
+
+import unittest
+
+from classes.person.person import Person
+from classes.person.person_proxy import PersonProxy
+from classes.person.vaccine_manager import VaccineManager
+
+
+def build_manager() -> VaccineManager:
+    # one hot record, so every other record lives in the segment file
+    manager = VaccineManager(max_capacity=10, max_hot_records=1)
+    for person_id in range(1, 6):
+        person = Person(person_id, f"First{person_id}", "Patient", f"555-010{person_id}")
+        person.update_medical_data(vaccines={'covid19': person_id % 2 == 1}, symptoms={'fever': person_id == 3})
+        manager.add_person(person)
+    return manager
+
+
+class TestPersonProxy(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = build_manager()
+
+    def faults(self) -> int:
+        return self.manager.get_storage_stats()['faults']
+
+    def test_flags_do_not_load_the_record(self):
+        before = self.faults()
+        proxies = list(self.manager.iter_proxies())
+        self.assertEqual([proxy.id for proxy in proxies], [1, 2, 3, 4, 5])
+        self.assertEqual([proxy.get_covid19_vaccine() for proxy in proxies], [True, False, True, False, True])
+        self.assertEqual([proxy.get_fever() for proxy in proxies], [False, False, True, False, False])
+        self.assertEqual(sum(proxy.get_vaccine_count() for proxy in proxies), 3)
+        self.assertFalse(any(proxy.is_cleared_for_entry() for proxy in proxies))
+        self.assertEqual(self.faults(), before)
+        self.assertFalse(any(proxy.is_materialized() for proxy in proxies))
+
+    def test_name_loads_the_record_once(self):
+        proxy = self.manager.get_proxy_by_id(2)
+        before = self.faults()
+        self.assertEqual(proxy.get_first_name(), "First2")
+        self.assertTrue(proxy.is_materialized())
+        self.assertEqual(self.faults(), before + 1)
+        # the loaded record sticks to the proxy
+        self.assertEqual(proxy.get_phone(), "555-0102")
+        self.assertEqual(self.faults(), before + 1)
+
+    def test_setter_goes_through_to_the_manager(self):
+        proxy = self.manager.get_proxy_by_index(1)
+        version = self.manager.get_data_version()
+        proxy.set_headache(True)
+        self.assertTrue(self.manager.get_person_by_id(2).get_headache())
+        self.assertTrue(self.manager.get_proxy_by_id(2).get_headache())
+        self.assertGreater(self.manager.get_data_version(), version)
+
+    def test_removed_patient_fails_cleanly(self):
+        fresh = self.manager.get_proxy_by_id(2)
+        loaded = self.manager.get_proxy_by_id(4)
+        loaded.get_first_name()
+        self.assertTrue(self.manager.remove_person(2))
+        self.assertTrue(self.manager.remove_person(4))
+
+        with self.assertRaises(LookupError):
+            fresh.get_fever()
+        with self.assertRaises(LookupError):
+            fresh.get_first_name()
+        # an already loaded record doesn't keep the flags alive either
+        with self.assertRaises(LookupError):
+            loaded.get_covid19_vaccine()
+        self.assertIsNone(self.manager.get_proxy_by_id(2))
+
+    def test_moved_patient_stays_valid(self):
+        # removing 2 moves 5 (the last slot) into slot 1 - the old proxy's slot is out of date
+        last = self.manager.get_proxy_by_id(5)
+        self.assertEqual(last.get_slot(), 4)
+        self.manager.remove_person(2)
+        self.assertTrue(last.get_covid19_vaccine())
+        self.assertEqual(last.get_first_name(), "First5")
+        self.assertEqual(self.manager.get_proxy_by_id(5).get_slot(), 1)
+
+        # a new patient takes over slot 4 - the old proxy must not read their flags
+        newcomer = Person(6, "First6", "Patient")
+        newcomer.set_covid19_vaccine(False)
+        self.manager.add_person(newcomer)
+        self.assertEqual(self.manager.get_proxy_by_id(6).get_slot(), 4)
+        self.assertTrue(last.get_covid19_vaccine())
+
+    def test_same_interface_as_person(self):
+        proxy = self.manager.get_proxy_by_id(3)
+        person = self.manager.get_person_by_id(3)
+        self.assertIsInstance(proxy, PersonProxy)
+        self.assertTrue(proxy.validate_data())
+        self.assertEqual(proxy.get_display_info(), person.get_display_info())
+        self.assertEqual(proxy.get_flag_code(), person.get_flag_code())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+# test_person_store.py
+# Vax Project - tests for the person storage backends
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Mostly the tiered store since that's the one with an LRU cache and a file behind it.
+
+import os
+import tempfile
+import unittest
+
+from classes.person.person import Person
+from classes.person.person_store import TieredPersonStore, MemoryPersonStore
+from classes.person.vaccine_manager import VaccineManager
+
+
+def make_person(person_id: int, first_name: str = "Test") -> Person:
+    return Person(person_id, first_name, "Patient", "555-0100")
+
+
+class TestMemoryPersonStore(unittest.TestCase):
+
+    def test_put_get_remove(self):
+        store = MemoryPersonStore()
+        store.put(make_person(1))
+        self.assertEqual(store.get(1).get_first_name(), "Test")
+        store.remove(1)
+        self.assertIsNone(store.get(1))
+
+
+class TestTieredPersonStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_evicts_least_recently_used_and_faults_back(self):
+        store = TieredPersonStore(2)
+        self.addCleanup(store.close)
+        for person_id in (1, 2, 3):
+            store.put(make_person(person_id))
+
+        self.assertFalse(store.is_hot(1))
+        self.assertEqual(store.get(1).id, 1)
+        self.assertTrue(store.is_hot(1))
+        self.assertFalse(store.is_hot(2))
+        stats = store.get_stats()
+        self.assertEqual(stats['hot'], 2)
+        self.assertEqual(stats['faults'], 1)
+
+    def test_rejects_empty_cache(self):
+        with self.assertRaises(ValueError):
+            TieredPersonStore(0)
+
+    def test_scan_restores_insertion_order_after_reopen(self):
+        store = TieredPersonStore(2, self.directory.name)
+        for person_id in (30, 10, 20):
+            store.put(make_person(person_id))
+        store.remove(10)
+        store.flush()
+        store.close()
+
+        reopened = TieredPersonStore(2, self.directory.name)
+        self.addCleanup(reopened.close)
+        self.assertEqual([person.id for person in reopened.scan()], [30, 20])
+
+    def test_flush_compacts_mostly_dead_file(self):
+        store = TieredPersonStore(1, self.directory.name, compact_ratio=0.5, compact_min_bytes=0)
+        self.addCleanup(store.close)
+        people = [make_person(person_id) for person_id in range(1, 6)]
+        for person in people:
+            store.put(person)
+        # rewrite everybody a few times so most of the file is old copies
+        for round_number in range(4):
+            for person in people:
+                person.set_fever(round_number % 2 == 1)
+                store.put(person)
+        store.remove(5)
+        store.flush()
+
+        self.assertEqual(store.get_stats()['compactions'], 1)
+        self.assertEqual(store.get_dead_bytes(), 0)
+        for person_id in range(1, 5):
+            self.assertTrue(store.get(person_id).get_fever())
+        self.assertIsNone(store.get(5))
+
+        # the compacted file is still a valid segment file for the next run
+        store.close()
+        reopened = TieredPersonStore(1, self.directory.name)
+        self.addCleanup(reopened.close)
+        self.assertEqual([person.id for person in reopened.scan()], [1, 2, 3, 4])
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "records.dat.compact")))
+
+    def test_flush_leaves_mostly_live_file_alone(self):
+        store = TieredPersonStore(1, compact_min_bytes=0)
+        self.addCleanup(store.close)
+        for person_id in range(1, 6):
+            store.put(make_person(person_id))
+        store.flush()
+        self.assertEqual(store.get_stats()['compactions'], 0)
+        self.assertEqual(store.get_dead_bytes(), 0)
+
+    def test_compact_without_storage_dir(self):
+        store = TieredPersonStore(1)
+        self.addCleanup(store.close)
+        for person_id in range(1, 4):
+            store.put(make_person(person_id))
+        store.remove(2)
+        before = store.get_segment_size()
+        store.compact()
+        self.assertLess(store.get_segment_size(), before)
+        self.assertEqual(store.get(1).id, 1)
+        self.assertEqual(store.get(3).id, 3)
+
+
+class TestManagerStorage(unittest.TestCase):
+
+    def test_max_hot_records_uses_tiered_store(self):
+        manager = VaccineManager(max_capacity=10, max_hot_records=2)
+        self.addCleanup(manager.close)
+        for person_id in range(1, 6):
+            manager.add_person(make_person(person_id))
+        self.assertEqual(manager.get_storage_stats()['hot'], 2)
+        self.assertEqual(manager.get_person_by_id(1).id, 1)
+
+    def test_reopen_after_save(self):
+        with tempfile.TemporaryDirectory() as directory:
+            manager = VaccineManager(max_capacity=10, storage_dir=directory)
+            for person_id in (7, 3, 5):
+                manager.add_person(make_person(person_id))
+            manager.close()
+
+            reopened = VaccineManager(max_capacity=10, storage_dir=directory)
+            self.assertEqual(reopened.get_person_count(), 3)
+            self.assertEqual(reopened.get_person_by_index(0).id, 7)
+            reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# test_report_cache.py
+# Vax Project - tests for the report cache
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The cache is only safe if a change to the patients makes the old reports
+# unreachable, so invalidation gets the most attention here.
+
+import unittest
+
+from classes.person.person import Person
+from classes.person.vaccine_manager import VaccineManager
+from systems.report.report_cache import ReportCache
+from systems.report.report_system import ReportManager
+
+
+class TestReportCache(unittest.TestCase):
+
+    def test_hit_and_miss(self):
+        cache = ReportCache()
+        key = ReportCache.make_key('vaccination', (None,), 1)
+        self.assertIsNone(cache.get(key))
+        cache.put(key, "report")
+        self.assertEqual(cache.get(key), "report")
+        stats = cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_newer_version_drops_older_entries(self):
+        cache = ReportCache()
+        cache.put(ReportCache.make_key('vaccination', (None,), 1), "old")
+        cache.put(ReportCache.make_key('symptom', (None,), 1), "old")
+        self.assertIsNone(cache.get(ReportCache.make_key('vaccination', (None,), 2)))
+        stats = cache.get_stats()
+        self.assertEqual(stats['entries'], 0)
+        self.assertEqual(stats['invalidations'], 2)
+        self.assertEqual(stats['bytes'], 0)
+
+    def test_put_for_stale_version_is_ignored(self):
+        cache = ReportCache()
+        cache.put(ReportCache.make_key('vaccination', (None,), 5), "current")
+        stale_key = ReportCache.make_key('symptom', (None,), 4)
+        cache.put(stale_key, "built before the last change")
+        self.assertIsNone(cache.get(stale_key))
+        # and the current entry survived the slow request
+        self.assertEqual(cache.get(ReportCache.make_key('vaccination', (None,), 5)), "current")
+
+    def test_entry_and_byte_limits(self):
+        cache = ReportCache(max_entries=2, max_bytes=10)
+        first, second, third = (ReportCache.make_key('individual', (n,), 1) for n in range(3))
+        cache.put(first, "aaaa")
+        cache.put(second, "bbbb")
+        cache.get(first)  # first is now the most recently used
+        cache.put(third, "cccc")
+        self.assertIsNone(cache.get(second))
+        self.assertEqual(cache.get(first), "aaaa")
+
+        cache.put(ReportCache.make_key('individual', (9,), 1), "x" * 11)
+        self.assertEqual(cache.get_stats()['entries'], 2)  # too big to cache at all
+
+        cache.put(ReportCache.make_key('individual', (8,), 1), "dddddddd")
+        self.assertLessEqual(cache.get_stats()['bytes'], 10)
+
+
+class TestReportManagerCaching(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = VaccineManager(max_capacity=10)
+        self.person = Person(1, "Maria", "Lopez")
+        self.manager.add_person(self.person)
+        self.reports = ReportManager(self.manager)
+        self.addCleanup(self.reports.shutdown)
+
+    def test_repeat_request_is_a_hit(self):
+        first = self.reports.generate_vaccination_stats()
+        second = self.reports.generate_vaccination_stats()
+        self.assertEqual(first, second)
+        self.assertEqual(self.reports.get_cache_stats()['hits'], 1)
+
+    def test_patient_edit_invalidates(self):
+        before = self.reports.generate_individual_report(1)
+        self.person.set_covid19_vaccine(True)
+        after = self.reports.generate_individual_report(1)
+        self.assertNotEqual(before, after)
+        self.assertEqual(self.reports.get_cache_stats()['hits'], 0)
+
+    def test_format_options_are_part_of_the_key(self):
+        self.reports.generate_vaccination_stats(title="One")
+        self.reports.generate_vaccination_stats(title="Two")
+        self.assertEqual(self.reports.get_cache_stats()['hits'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+# test_report_formats.py
+# Vax Project - tests for the JSON/CSV/HTML report writers
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Whatever the writers put out has to read back as the same records, so these
+# parse the output with json/csv/html.parser and compare it to the dicts that went
+# in - including names with the characters each format has to escape.
+
+import csv
+import io
+import json
+import unittest
+from html.parser import HTMLParser
+
+from classes.person.person import Person
+from classes.person.vaccine_manager import VaccineManager
+from systems.report.report_formats import ReportFormatFactory, flatten_record
+from systems.report.report_system import ReportManager
+
+# a comma, quotes, a newline and some markup - something in here breaks every format
+AWKWARD_NAME = 'O\'Brien, "Jr"\n<script>alert(1)</script> & co'
+
+
+class TableParser(HTMLParser):
+    """Reads the cells of every <tr> back out of the HTML writer's page"""
+
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+        self.title = ""
+        self.__cell = None
+        self.__in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'tr':
+            self.rows.append([])
+        elif tag in ('td', 'th'):
+            self.__cell = ""
+        elif tag == 'title':
+            self.__in_title = True
+
+    def handle_endtag(self, tag):
+        if tag in ('td', 'th'):
+            self.rows[-1].append(self.__cell)
+            self.__cell = None
+        elif tag == 'title':
+            self.__in_title = False
+
+    def handle_data(self, data):
+        if self.__cell is not None:
+            self.__cell += data
+        elif self.__in_title:
+            self.title += data
+
+
+def build_manager() -> VaccineManager:
+    manager = VaccineManager(max_capacity=10)
+    awkward = Person(1, AWKWARD_NAME, "Smith", "555-0100", "1 Main St,\nApt \"B\"")
+    awkward.update_medical_data(vaccines={'covid19': True}, symptoms={'fever': True})
+    manager.add_person(awkward)
+    manager.add_person(Person(2, "Plain", "Patient"))
+    manager.add_person(Person(3, "Another", "Patient", "555-0101"))
+    return manager
+
+
+class TestStructuredWriters(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = build_manager()
+        self.reports = ReportManager(self.manager)
+        self.records = [self.reports.generate_structured_report("individual", patient_id=person_id)
+                        for person_id in (1, 2, 3)]
+
+    def export(self, output_format: str) -> str:
+        stream = io.StringIO(newline='')
+        self.assertEqual(self.reports.export_individual_reports(stream, output_format), 3)
+        return stream.getvalue()
+
+    def test_json_round_trip(self):
+        self.assertEqual(json.loads(self.export("json")), self.records)
+        self.assertEqual(self.records[0]['first_name'], AWKWARD_NAME)
+
+    def test_csv_round_trip(self):
+        rows = list(csv.DictReader(io.StringIO(self.export("csv"), newline='')))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(list(rows[0]), list(self.records[0]))
+        for row, record in zip(rows, self.records):
+            # csv only has text, so compare against the text of each value
+            self.assertEqual(row, {key: '' if value is None else str(value) for key, value in record.items()})
+        self.assertEqual(rows[0]['first_name'], AWKWARD_NAME)
+        self.assertEqual(rows[0]['address'], "1 Main St,\nApt \"B\"")
+
+    def test_html_escapes_and_round_trips(self):
+        page = self.export("html")
+        self.assertNotIn("<script>", page)
+        self.assertTrue(page.startswith("<!DOCTYPE html>"))
+        self.assertTrue(page.rstrip().endswith("</html>"))
+
+        parser = TableParser()
+        parser.feed(page)
+        header, rows = parser.rows[0], parser.rows[1:]
+        self.assertEqual(header, list(self.records[0]))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(dict(zip(header, rows[0]))['first_name'], AWKWARD_NAME)
+        self.assertEqual(dict(zip(header, rows[1]))['phone'], "")
+
+    def test_html_title_is_escaped(self):
+        stream = io.StringIO()
+        ReportFormatFactory.create_writer("html", stream, title="A & <B>").write_all([])
+        self.assertIn("<title>A &amp; &lt;B&gt;</title>", stream.getvalue())
+        parser = TableParser()
+        parser.feed(stream.getvalue())
+        self.assertEqual(parser.title, "A & <B>")
+        self.assertEqual(parser.rows, [])
+
+    def test_aggregate_report_shape(self):
+        stream = io.StringIO()
+        self.assertEqual(self.reports.export_report(stream, "vaccination", "json"), 1)
+        (record,) = json.loads(stream.getvalue())
+        self.assertEqual(record['report_type'], "vaccination")
+        self.assertEqual(record['total_patients'], 3)
+        self.assertEqual(record['covid19'], 1)
+        self.assertFalse(record['approximate'])
+
+    def test_nested_values_become_dotted_columns(self):
+        record = {'id': 1, 'coverage': {'covid19': 2.5, 'limits': {'low': 1}}}
+        self.assertEqual(flatten_record(record), {'id': 1, 'coverage.covid19': 2.5, 'coverage.limits.low': 1})
+        stream = io.StringIO(newline='')
+        ReportFormatFactory.create_writer("csv", stream).write_all([record])
+        self.assertEqual(list(csv.reader(io.StringIO(stream.getvalue()))),
+                         [['id', 'coverage.covid19', 'coverage.limits.low'], ['1', '2.5', '1']])
+
+    def test_empty_and_binary_streams(self):
+        stream = io.StringIO()
+        self.assertEqual(ReportFormatFactory.create_writer("json", stream).write_all(iter([])), 0)
+        self.assertEqual(json.loads(stream.getvalue()), [])
+        self.assertEqual(ReportFormatFactory.create_writer("csv", io.StringIO()).write_all([]), 0)
+
+        binary = io.BytesIO()
+        self.reports.export_report(binary, "individual", "json", patient_id=1)
+        self.assertFalse(binary.closed)  # the writer hands the stream back
+        self.assertEqual(json.loads(binary.getvalue().decode('utf-8')), [self.records[0]])
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            ReportFormatFactory.create_writer("xml", io.StringIO())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# test_report_history.py
+# Vax Project - tests for the bounded report history
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The ring buffer only holds the newest entries, so these check the older ones
+# really end up in the spill file and still come back from query().
+
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from systems.report.report_history import ReportHistory, HISTORY_FILE_NAME
+
+
+class TestReportHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.history = ReportHistory(max_in_memory=3)
+        self.addCleanup(self.history.close)
+
+    def test_ring_buffer_spills_oldest(self):
+        for number in range(5):
+            self.history.record('individual', f"report {number}", patient_id=number)
+        self.assertEqual(self.history.get_memory_count(), 3)
+        self.assertEqual(self.history.get_count(), 5)
+        entries = self.history.query()
+        self.assertEqual([entry['content'] for entry in entries], [f"report {n}" for n in range(5)])
+
+    def test_filters_and_limit(self):
+        for number in range(5):
+            self.history.record('individual' if number % 2 else 'vaccination', f"report {number}",
+                                patient_id=number)
+        self.assertEqual([entry['patient_id'] for entry in self.history.query('individual')], [1, 3])
+        self.assertEqual([entry['patient_id'] for entry in self.history.query(patient_id=0)], [0])
+        newest = self.history.query(limit=2, include_content=False)
+        self.assertEqual([entry['patient_id'] for entry in newest], [3, 4])
+        self.assertNotIn('content', newest[0])
+        self.assertEqual(self.history.query(limit=0), [])
+
+    def test_time_range(self):
+        self.history.record('vaccination', "old")
+        time.sleep(0.01)  # so the timestamps can't land on the same microsecond
+        middle = datetime.now()
+        time.sleep(0.01)
+        self.history.record('vaccination', "new")
+        self.assertEqual([entry['content'] for entry in self.history.query(since=middle)], ["new"])
+        self.assertEqual([entry['content'] for entry in self.history.query(until=middle)], ["old"])
+        later = datetime.now() + timedelta(hours=1)
+        self.assertEqual(self.history.query(since=later), [])
+
+    def test_clear(self):
+        for number in range(5):
+            self.history.record('vaccination', f"report {number}")
+        self.history.clear()
+        self.assertEqual(self.history.get_count(), 0)
+        self.assertEqual(self.history.query(), [])
+
+    def test_rejects_empty_buffer(self):
+        with self.assertRaises(ValueError):
+            ReportHistory(max_in_memory=0)
+
+
+class TestPersistentHistory(unittest.TestCase):
+
+    def test_spilled_entries_survive_reopen_and_torn_write(self):
+        with tempfile.TemporaryDirectory() as directory:
+            history = ReportHistory(max_in_memory=1, history_dir=directory)
+            for number in range(3):
+                history.record('symptom', f"report {number}")
+            history.close()
+
+            # half written record at the end of the file gets ignored
+            with open(os.path.join(directory, HISTORY_FILE_NAME), 'ab') as segment:
+                segment.write(b"\x40\x00\x00\x00junk")
+
+            reopened = ReportHistory(max_in_memory=1, history_dir=directory)
+            self.assertEqual(reopened.get_count(), 2)
+            self.assertEqual([entry['content'] for entry in reopened.query()], ["report 0", "report 1"])
+            reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# test_report_registry.py
+# Vax Project - tests for the report registry
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+import gc
+import json
+import os
+import tempfile
+import unittest
+import weakref
+
+from classes.person.person import Person
+from classes.person.vaccine_manager import VaccineManager
+from systems.report.report_registry import ReportRegistry, ReportInstanceCache
+from systems.report.report_system import ReportManager, ReportFactory, IndividualReport, VaccinationStatsReport
+
+
+class EchoReport:
+    """Tiny report type for registering from code"""
+
+    def __init__(self, manager, label: str, repeat: int = 1):
+        self.label = label * repeat
+
+
+class TestReportRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = ReportRegistry(use_entry_points=False)
+        self.manager = VaccineManager(max_capacity=10)
+        self.manager.add_person(Person(1, "Maria", "Lopez"))
+
+    def test_builtins_are_lazy(self):
+        self.assertEqual(self.registry.get_available_report_types()[:3], ['individual', 'vaccination', 'symptom'])
+        self.assertIsInstance(self.registry.create('individual', self.manager, patient_id=1), IndividualReport)
+        self.assertTrue(self.registry.is_loaded('individual'))
+
+    def test_arguments(self):
+        self.registry.register('echo', EchoReport)
+        self.assertEqual(self.registry.create('echo', self.manager, label="ab", repeat=2).label, "abab")
+        # None counts as not passed, shared services get dropped
+        self.registry.create('echo', self.manager, label="a", cohort=None, stats_engine=object())
+        with self.assertRaises(ValueError):
+            self.registry.create('echo', self.manager)  # label is required
+        with self.assertRaises(ValueError):
+            self.registry.create('echo', self.manager, label="a", lable="typo")
+        with self.assertRaises(ValueError):
+            self.registry.create('individual', self.manager, patient_id=1, cohort="everyone")
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            self.registry.get_spec('nope')
+
+    def test_config_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "reports.json")
+            with open(path, 'w', encoding='utf-8') as config_file:
+                json.dump({"report_types": {"echo": f"{__name__}:EchoReport"}}, config_file)
+            registry = ReportRegistry([path], use_entry_points=False)
+        self.assertFalse(registry.is_loaded('echo'))
+        self.assertEqual(registry.create('echo', self.manager, label="x").label, "x")
+        self.assertEqual(registry.get_spec('echo').get_source(), path)
+
+    def test_instance_cache(self):
+        cache = ReportInstanceCache()
+        first = self.registry.create('individual', self.manager, cache, patient_id=1)
+        self.assertIs(self.registry.create('individual', self.manager, cache, patient_id=1), first)
+        self.manager.get_person_by_id(1).set_fever(True)  # new data version
+        self.assertIsNot(self.registry.create('individual', self.manager, cache, patient_id=1), first)
+        # re-registering a type never hands back reports from the old one
+        self.registry.register('individual', IndividualReport)
+        self.assertIsNot(self.registry.create('individual', self.manager, cache, patient_id=1), first)
+        self.assertEqual(cache.get_stats()['hits'], 1)
+
+    def test_reports_dont_keep_managers_alive(self):
+        manager = VaccineManager(max_capacity=10)
+        manager.add_person(Person(1, "Maria", "Lopez"))
+        reports = ReportManager(manager)
+        reports.generate_structured_report('individual', patient_id=1)
+        reports.shutdown()
+        watcher = weakref.ref(manager)
+        del manager, reports
+        gc.collect()
+        self.assertIsNone(watcher())
+
+
+
+class TestReportFactory(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = VaccineManager(max_capacity=10)
+        self.manager.add_person(Person(1, "Maria", "Lopez"))
+
+    def test_static_create_report_by_type(self):
+        # the old call style still works without a factory object
+        first = ReportFactory.create_report_by_type("vaccination", self.manager)
+        self.assertIsInstance(first, VaccinationStatsReport)
+        self.assertIsNot(ReportFactory.create_report_by_type("vaccination", self.manager), first)
+        self.assertIsInstance(ReportFactory.create_report_by_type("individual", self.manager, patient_id=1),
+                              IndividualReport)
+        with self.assertRaises(ValueError):
+            ReportFactory.create_report_by_type("vaccination", self.manager, patient_id=1)
+
+    def test_factory_reuses_its_own_reports(self):
+        factory = ReportFactory()
+        report = factory.create_report("vaccination", self.manager)
+        self.assertIs(factory.create_report("vaccination", self.manager), report)
+        self.assertIsNot(ReportFactory().create_report("vaccination", self.manager), report)
+        self.assertEqual(factory.get_instance_stats()['hits'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# test_report_scheduler.py
+# Vax Project - tests for background reports
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Uses a fake clock for the recurring job logic and the real thread pool for
+# the one-off reports (those finish in milliseconds, we just poll until they do).
+
+import threading
+import time
+import unittest
+
+from classes.person.person import Person
+from classes.person.vaccine_manager import VaccineManager
+from systems.report.report_scheduler import ScheduledJob
+from systems.report.report_system import ReportManager
+
+
+def wait_for_results(reports: ReportManager, count: int, timeout: float = 5.0) -> list:
+    results = []
+    deadline = time.monotonic() + timeout
+    while len(results) < count and time.monotonic() < deadline:
+        results.extend(reports.poll_background_reports())
+        time.sleep(0.01)
+    return results
+
+
+class TestScheduledJob(unittest.TestCase):
+
+    def test_missed_runs_are_skipped_and_busy_runs_coalesced(self):
+        job = ScheduledJob("hourly", "vaccination", 10, 10, {})
+        self.assertTrue(job.claim(35))  # 10 was due, 20 and 30 got slept through
+        self.assertEqual(job.get_stats()['skipped'], 2)
+        self.assertEqual(job.get_next_run(), 40)
+
+        self.assertFalse(job.claim(40))  # still running - marked pending
+        self.assertFalse(job.claim(50))
+        self.assertEqual(job.get_stats()['coalesced'], 1)
+        self.assertTrue(job.finish(1.0, failed=False))  # pending run goes next
+        self.assertFalse(job.finish(1.0, failed=True))
+        self.assertEqual(job.get_stats()['errors'], 1)
+
+
+class TestBackgroundReports(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = VaccineManager(max_capacity=10)
+        self.manager.add_person(Person(1, "Maria", "Lopez"))
+        self.reports = ReportManager(self.manager)
+        self.addCleanup(self.reports.shutdown)
+
+    def test_success(self):
+        name = self.reports.generate_in_background('vaccination')
+        (result,) = wait_for_results(self.reports, 1)
+        self.assertEqual(result['name'], name)
+        self.assertIsNone(result['error'])
+        self.assertIn("VACCINATION", result['content'].upper())
+
+    def test_failure_sets_error_instead_of_content(self):
+        self.reports.generate_in_background('vaccination', cohort="no such cohort")
+        (result,) = wait_for_results(self.reports, 1)
+        self.assertIsNone(result['content'])
+        self.assertIn("no such cohort", result['error'])
+
+    def test_foreground_call_still_returns_message(self):
+        self.assertEqual(self.reports.generate_vaccination_stats("no such cohort"),
+                         "Error generating vaccination report")
+
+
+class TestStoreFromWorkerThreads(unittest.TestCase):
+
+    def test_individual_reports_next_to_edits(self):
+        # tiered store with a tiny cache so nearly every lookup seeks in the file
+        manager = VaccineManager(max_capacity=300, max_hot_records=4)
+        self.addCleanup(manager.close)
+        for person_id in range(1, 201):
+            manager.add_person(Person(person_id, "Test", f"Patient{person_id}"))
+        reports = ReportManager(manager)
+        self.addCleanup(reports.shutdown)
+
+        # fewer requests than the scheduler keeps results for, so none get dropped
+        for person_id in range(1, 61):
+            reports.generate_in_background('individual', patient_id=person_id)
+        stop = threading.Event()
+
+        def edit_people():
+            person_id = 1
+            while not stop.is_set():
+                manager.get_person_by_id(person_id).set_fever(True)
+                person_id = person_id % 200 + 1
+
+        editor = threading.Thread(target=edit_people)
+        editor.start()
+        try:
+            results = wait_for_results(reports, 60, timeout=20)
+        finally:
+            stop.set()
+            editor.join()
+        self.assertEqual(len(results), 60)
+        self.assertEqual([result['error'] for result in results if result['error']], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+# test_report_system.py
+# Vax Project - tests for the report classes and ReportManager
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+import unittest
+
+from classes.person.person import Person
+from classes.person.vaccine_manager import VaccineManager
+from systems.report.report_system import (PopulationReport, VaccinationStatsReport,
+                                          SymptomAnalysisReport)
+
+
+class TestPopulationReport(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = VaccineManager(max_capacity=10)
+        person = Person(1, "Maria", "Lopez")
+        person.set_covid19_vaccine(True)
+        self.manager.add_person(person)
+
+    def test_subclass_without_template_values_cant_be_made(self):
+        class ForgetfulReport(PopulationReport):
+            def generate_content(self):
+                return ""
+
+            def get_statistics(self):
+                return {}
+
+        with self.assertRaises(TypeError):
+            ForgetfulReport(self.manager)
+
+    def test_concrete_reports_render(self):
+        for report_class in (VaccinationStatsReport, SymptomAnalysisReport):
+            text = "".join(report_class(self.manager).iter_content_chunks())
+            self.assertTrue(text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# test_resource_cache.py
+# Vax Project - tests for the shared render resources
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+import os
+import unittest
+
+# no window or sound needed for these
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from systems.animation.animation_system import MessageNotification
+from systems.render.resource_cache import LRUStore, RenderResourceCache
+
+
+class TestLRUStore(unittest.TestCase):
+
+    def test_hits_and_eviction(self):
+        store = LRUStore(2)
+        made = []
+
+        def factory(value):
+            return lambda: made.append(value) or value
+
+        self.assertEqual(store.get_or_create('a', factory(1)), 1)
+        self.assertEqual(store.get_or_create('b', factory(2)), 2)
+        self.assertEqual(store.get_or_create('a', factory(99)), 1)  # hit, 'a' is now newest
+        store.get_or_create('c', factory(3))  # pushes out 'b', the least recently used
+        self.assertEqual(store.get_or_create('a', factory(99)), 1)
+        self.assertEqual(store.get_or_create('b', factory(4)), 4)
+        self.assertEqual(made, [1, 2, 3, 4])
+
+        stats = store.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions'], stats['entries']), (2, 4, 2, 2))
+        self.assertAlmostEqual(stats['hit_rate'], 2 / 6)
+
+    def test_bad_size(self):
+        with self.assertRaises(ValueError):
+            LRUStore(0)
+
+
+class TestRenderResourceCache(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.resources = RenderResourceCache(max_surfaces=4)
+
+    def test_text_and_fonts_are_reused(self):
+        first = self.resources.render_text("hello", (0, 0, 0), 20)
+        self.assertIs(self.resources.render_text("hello", [0, 0, 0], 20), first)
+        self.assertIsNot(self.resources.render_text("hello", (255, 0, 0), 20), first)
+        self.assertIs(self.resources.get_font(20), self.resources.get_font(20))
+        stats = self.resources.get_stats()
+        self.assertEqual(stats['text']['hits'], 1)
+        self.assertEqual(stats['fonts']['entries'], 1)
+
+    def test_surfaces_dropped_when_config_version_moves(self):
+        overlay = self.resources.get_overlay((10, 10))
+        panel = self.resources.get_surface('panel', lambda: pygame.Surface((5, 5)))
+        font = self.resources.get_font(12)
+
+        self.assertFalse(self.resources.sync_version(0))  # first sync just remembers it
+        self.assertFalse(self.resources.sync_version(0))
+        self.assertIs(self.resources.get_overlay((10, 10)), overlay)
+
+        self.assertTrue(self.resources.sync_version(1))
+        self.assertIsNot(self.resources.get_overlay((10, 10)), overlay)
+        self.assertIsNot(self.resources.get_surface('panel', lambda: pygame.Surface((5, 5))), panel)
+        self.assertIs(self.resources.get_font(12), font)
+
+
+class TestNotificationAlpha(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.window = pygame.display.set_mode((800, 750))
+        self.resources = RenderResourceCache()
+
+    def test_fading_one_leaves_the_shared_panel_alone(self):
+        # same message and color - same cached panel
+        fading = MessageNotification("Saved", duration_seconds=0.2)  # already in its last half second
+        steady = MessageNotification("Saved", duration_seconds=10)
+        for notification in (steady, fading):  # the fading one draws last
+            notification.show()
+            notification.update()
+            notification.draw(self.window, self.resources)
+
+        cached = self.resources.get_surface(('notification', "Saved", (59, 130, 246)),
+                                            lambda: self.fail("panel should be cached"))
+        self.assertIn(cached.get_alpha(), (None, 255))
+        self.assertEqual(self.resources.get_stats()['surfaces']['misses'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# test_sampling.py
+# Vax Project - tests for the reservoir sample and the approximate stats
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The sample has to stay uniform after removals too, and the Wilson intervals
+# are checked against numbers worked out by hand.
+
+import unittest
+from collections import Counter
+
+from classes.person.person import COVID19_BIT
+from classes.person.reservoir import ReservoirSample
+from systems.report.stats_engine import PopulationEstimate
+
+
+class TestReservoirSample(unittest.TestCase):
+
+    def test_fills_up_then_stays_at_capacity(self):
+        sample = ReservoirSample(5, seed=1)
+        for item in range(3):
+            sample.add(item)
+        self.assertEqual(sorted(sample.get_ids()), [0, 1, 2])
+        for item in range(3, 100):
+            sample.add(item)
+        self.assertEqual(sample.get_size(), 5)
+        self.assertEqual(sample.get_population(), 100)
+        self.assertEqual(len(set(sample.get_ids())), 5)
+
+    def test_uniform_inclusion(self):
+        hits = Counter()
+        trials = 2000
+        for seed in range(trials):
+            sample = ReservoirSample(5, seed=seed)
+            for item in range(20):
+                sample.add(item)
+            hits.update(sample.get_ids())
+        # each item should be in about 5/20 of the samples (500 of 2000)
+        for item in range(20):
+            self.assertAlmostEqual(hits[item] / trials, 0.25, delta=0.05)
+
+    def test_uniform_after_removals(self):
+        hits = Counter()
+        trials = 2000
+        for seed in range(trials):
+            sample = ReservoirSample(5, seed=seed)
+            for item in range(20):
+                sample.add(item)
+            for item in range(10):
+                sample.remove(item)
+            for item in range(20, 30):
+                sample.add(item)
+            self.assertFalse(any(sample.contains(item) for item in range(10)))
+            hits.update(sample.get_ids())
+        for item in range(10, 30):
+            self.assertAlmostEqual(hits[item] / trials, 0.25, delta=0.05)
+
+    def test_rebuild(self):
+        sample = ReservoirSample(3, seed=2)
+        sample.rebuild(range(10))
+        self.assertEqual(sample.get_size(), 3)
+        self.assertEqual(sample.get_population(), 10)
+        self.assertTrue(all(0 <= item < 10 for item in sample.get_ids()))
+
+
+class TestPopulationEstimate(unittest.TestCase):
+
+    def test_wilson_interval_half(self):
+        estimate = PopulationEstimate({COVID19_BIT: 50, 0: 50}, 10000)
+        self.assertAlmostEqual(estimate.get_rate('covid19'), 50.0)
+        low, high = estimate.get_interval('covid19')
+        self.assertAlmostEqual(low, 40.38, places=2)
+        self.assertAlmostEqual(high, 59.62, places=2)
+        self.assertEqual(estimate.get_estimated_count('covid19'), 5000)
+
+    def test_wilson_interval_zero_successes(self):
+        estimate = PopulationEstimate({0: 10}, 1000)
+        low, high = estimate.get_interval('covid19')
+        self.assertAlmostEqual(low, 0.0)
+        # z^2 / n / (1 + z^2 / n) with z = 1.96, n = 10
+        self.assertAlmostEqual(high, 27.75, places=2)
+
+    def test_exact_when_sample_is_everybody(self):
+        estimate = PopulationEstimate({COVID19_BIT: 3, 0: 1}, 4)
+        self.assertTrue(estimate.is_exact())
+        self.assertEqual(estimate.get_interval('covid19'), (75.0, 75.0))
+
+    def test_empty_sample(self):
+        self.assertEqual(PopulationEstimate({}, 50).get_interval('covid19'), (0.0, 100.0))
+        self.assertEqual(PopulationEstimate({}, 0).percent('covid19'), "0%")
+
+    def test_bad_confidence(self):
+        with self.assertRaises(ValueError):
+            PopulationEstimate({}, 0, confidence=1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
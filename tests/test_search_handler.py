@@ -0,0 +1,74 @@
+# test_search_handler.py
+# Vax Project - tests for the patient search box
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The background search runs on a worker thread, so these check that whatever
+# comes back from it (a result, nothing, or an exception) doesn't hurt the frame loop.
+
+import os
+import time
+import unittest
+
+# no window or sound needed for these
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from classes.person.person import Person
+from classes.person.vaccine_manager import VaccineManager
+from gui.config.config import GUIConfiguration
+from gui.handlers.search_handler import PatientSearchHandler
+
+
+class BrokenSearchManager(VaccineManager):
+    """Manager whose search blows up, like it would if something went wrong mid-walk"""
+
+    def search_patients(self, text, previous=None, is_cancelled=None):
+        raise ValueError("search broke")
+
+
+class TestPatientSearchHandler(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.window = pygame.display.set_mode((800, 700))
+        self.config = GUIConfiguration()
+
+    def make_handler(self, manager):
+        # inline_limit=0 so every search goes to the worker thread
+        handler = PatientSearchHandler(self.window, self.config, manager, debounce_ms=0, inline_limit=0)
+        self.addCleanup(handler.shutdown)
+        for person_id in (1, 12, 20):
+            manager.add_person(Person(person_id, "Test", "Patient", "555-0100"))
+        return handler
+
+    def wait_for(self, handler):
+        for _ in range(200):
+            handler.update()
+            if not handler.is_searching():
+                return
+            time.sleep(0.01)
+        self.fail("search never finished")
+
+    def test_background_search(self):
+        handler = self.make_handler(VaccineManager(max_capacity=10))
+        handler.get_input().setValue("1")
+        handler.search_now()
+        self.wait_for(handler)
+        self.assertEqual(handler.get_result().get_ids(), [1, 12])
+        self.assertEqual(handler.get_stats()['background'], 1)
+
+    def test_worker_exception_is_counted_not_raised(self):
+        handler = self.make_handler(BrokenSearchManager(max_capacity=10))
+        handler.get_input().setValue("1")
+        handler.search_now()
+        self.wait_for(handler)
+        self.assertIsNone(handler.get_result())
+        self.assertEqual(handler.get_stats()['errors'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+# test_stats_engine.py
+# Vax Project - tests for the shared stats pass
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# Every report reads its numbers from one counting pass, so these check the counts
+# against the people themselves and that a cached pass is only reused while the
+# data (and the cohort) hasn't changed.
+
+import random
+import threading
+import unittest
+
+from classes.person.person import Person
+from classes.person.vaccine_manager import VaccineManager
+from systems.report.stats_engine import StatsEngine, PopulationStats
+
+
+def make_person(person_id: int, covid19: bool = False, fever: bool = False) -> Person:
+    person = Person(person_id, "Test", "Patient")
+    person.update_medical_data(vaccines={'covid19': covid19}, symptoms={'fever': fever})
+    return person
+
+
+class EditingManager(VaccineManager):
+    """Adds a person the first time the flags get counted, like the GUI would mid-pass"""
+
+    def get_flag_code_counts(self, cohort=None):
+        counts = super().get_flag_code_counts(cohort)
+        if not self.has_person(99):
+            self.add_person(make_person(99))
+        return counts
+
+
+def build_population(count: int, seed: int = 33) -> VaccineManager:
+    rng = random.Random(seed)
+    manager = VaccineManager(max_capacity=count)
+    for person_id in range(1, count + 1):
+        person = Person(person_id, "Test", "Patient")
+        bits = rng.getrandbits(6)
+        person.update_medical_data(
+            vaccines={'covid19': bool(bits & 1), 'influenza': bool(bits & 2), 'ebola': bool(bits & 4)},
+            symptoms={'fever': bool(bits & 8), 'fatigue': bool(bits & 16), 'headache': bool(bits & 32)}
+        )
+        manager.add_person(person)
+    return manager
+
+
+class TestPopulationStats(unittest.TestCase):
+
+    def test_counts_match_the_people(self):
+        manager = build_population(300)
+        stats = StatsEngine().compute(manager)
+        people = list(manager.iter_people())
+
+        def count(predicate):
+            return sum(1 for person in people if predicate(person))
+
+        def has_symptoms(person):
+            return person.get_fever() or person.get_fatigue() or person.get_headache()
+
+        def all_vaccines(person):
+            return person.get_covid19_vaccine() and person.get_influenza_vaccine() and person.get_ebola_vaccine()
+
+        self.assertEqual(stats.get_total(), 300)
+        self.assertEqual(stats.get('covid19'), count(Person.get_covid19_vaccine))
+        self.assertEqual(stats.get('ebola'), count(Person.get_ebola_vaccine))
+        self.assertEqual(stats.get('headache'), count(Person.get_headache))
+        self.assertEqual(stats.get('any_symptoms'), count(has_symptoms))
+        self.assertEqual(stats.get('influenza_with_symptoms'),
+                         count(lambda person: person.get_influenza_vaccine() and has_symptoms(person)))
+        # cleared means all three vaccines and no symptoms, and fully_vaccinated
+        # has always been reported as the same number
+        cleared = count(lambda person: all_vaccines(person) and not has_symptoms(person))
+        self.assertEqual(stats.get('cleared_for_entry'), cleared)
+        self.assertEqual(stats.get('fully_vaccinated'), cleared)
+        self.assertEqual(stats.get_vaccination_stats(), manager.get_vaccination_stats())
+        self.assertEqual(stats.get_symptom_stats(), manager.get_symptom_stats())
+        self.assertEqual(sum(stats.get_code_counts()), 300)
+
+    def test_empty_and_immutable(self):
+        stats = PopulationStats({})
+        self.assertEqual(stats.get_total(), 0)
+        self.assertEqual(stats.percent('covid19'), "0%")
+        self.assertEqual(stats.get_rate('covid19'), 0.0)
+        with self.assertRaises(AttributeError):
+            stats.extra = 1
+
+    def test_percent(self):
+        stats = PopulationStats({1: 1, 0: 2})  # one of three has COVID-19
+        self.assertEqual(stats.percent('covid19'), "33.3%")
+
+
+class TestStatsEngineCache(unittest.TestCase):
+
+    def test_cache_hit_until_the_data_changes(self):
+        manager = build_population(50)
+        engine = StatsEngine()
+        first = engine.compute(manager)
+        self.assertIs(engine.compute(manager), first)
+        self.assertEqual(engine.get_pass_count(), 1)
+
+        person = manager.get_person_by_id(1)
+        person.set_covid19_vaccine(not person.get_covid19_vaccine())
+        second = engine.compute(manager)
+        self.assertIsNot(second, first)
+        self.assertEqual(engine.get_pass_count(), 2)
+        self.assertEqual(abs(second.get('covid19') - first.get('covid19')), 1)
+
+    def test_cohort_results_follow_the_members(self):
+        manager = build_population(50)
+        engine = StatsEngine()
+        manager.save_cohort("group", range(1, 11))
+        self.assertEqual(engine.compute(manager, "group").get_total(), 10)
+        self.assertEqual(engine.compute(manager).get_total(), 50)
+        # new members, same data version - the cohort fingerprint tells them apart
+        manager.save_cohort("group", range(1, 6))
+        self.assertEqual(engine.compute(manager, "group").get_total(), 5)
+        self.assertEqual(engine.get_pass_count(), 3)
+
+    def test_oldest_result_goes_first(self):
+        manager = build_population(20)
+        engine = StatsEngine(max_cached=1)
+        manager.save_cohort("a", [1, 2])
+        engine.compute(manager, "a")
+        engine.compute(manager)
+        engine.compute(manager, "a")
+        self.assertEqual(engine.get_pass_count(), 3)
+
+    def test_result_counted_during_an_edit_isnt_kept(self):
+        manager = EditingManager(max_capacity=10)
+        manager.add_person(make_person(1, covid19=True))
+        engine = StatsEngine()
+
+        stale = engine.compute(manager)
+        self.assertEqual(stale.get_total(), 1)
+        # the edit moved the version on - the next call has to count again
+        fresh = engine.compute(manager)
+        self.assertEqual(fresh.get_total(), 2)
+        self.assertEqual(engine.get_pass_count(), 2)
+        self.assertIs(engine.compute(manager), fresh)
+
+    def test_compute_from_threads(self):
+        manager = VaccineManager(max_capacity=500)
+        for person_id in range(1, 201):
+            manager.add_person(make_person(person_id, covid19=person_id % 2 == 0))
+        engine = StatsEngine(max_cached=2)
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(200):
+                    stats = engine.compute(manager)
+                    self.assertLessEqual(stats.get('covid19'), stats.get_total())
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for person_id in range(201, 401):
+            manager.add_person(make_person(person_id))
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(engine.compute(manager).get_total(), 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
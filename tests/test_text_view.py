@@ -0,0 +1,145 @@
+# test_text_view.py
+# Vax Project - tests for the scrolling report text
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The report dialog only reads and wraps as far as you scroll, so these check the
+# pieces that make that work - the chunk reader, word wrapping, and that scroll
+# input stays inside the dialog.
+
+import os
+import unittest
+
+# no window or sound needed for these
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from systems.dialog.dialog_system import DialogManager
+from systems.dialog.text_view import ChunkedTextSource, ScrollingTextView, wrap_line
+
+
+class TestChunkedTextSource(unittest.TestCase):
+
+    def test_lines_split_across_chunks(self):
+        source = ChunkedTextSource(["first li", "ne\nsecond\n", "third"])
+        self.assertEqual(source.ensure_lines(1), 1)
+        self.assertEqual(source.get_line(0), "first line")
+        self.assertFalse(source.is_finished())
+        self.assertEqual(source.read_all(), 3)
+        self.assertEqual([source.get_line(index) for index in range(3)], ["first line", "second", "third"])
+        self.assertTrue(source.is_finished())
+
+    def test_only_reads_what_was_asked_for(self):
+        pulled = []
+
+        def chunks():
+            for number in range(100):
+                pulled.append(number)
+                yield f"line {number}\n"
+
+        source = ChunkedTextSource(chunks())
+        source.ensure_lines(5)
+        self.assertEqual(source.get_loaded_count(), 5)
+        self.assertLess(len(pulled), 10)
+
+    def test_plain_string_and_empty(self):
+        source = ChunkedTextSource("a\nb")
+        self.assertEqual(source.ensure_lines(10), 2)
+        self.assertEqual(ChunkedTextSource("").read_all(), 0)
+
+    def test_broken_generator_becomes_a_line(self):
+        def chunks():
+            yield "half a li"
+            raise ValueError("no data")
+
+        source = ChunkedTextSource(chunks())
+        self.assertEqual(source.read_all(), 2)
+        self.assertEqual(source.get_line(0), "half a li")
+        self.assertEqual(source.get_line(1), "[report stopped: no data]")
+        self.assertTrue(source.is_finished())
+
+
+class TestWrapLine(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.font = pygame.font.Font(None, 16)
+
+    def test_short_line_untouched(self):
+        self.assertEqual(wrap_line(self.font, "short\t ", 500), ("short",))
+        self.assertEqual(wrap_line(self.font, "", 500), ("",))
+
+    def test_wrapped_rows_keep_indent(self):
+        line = "    " + " ".join(["word"] * 40)
+        width = self.font.size("    " + " ".join(["word"] * 8))[0]
+        rows = wrap_line(self.font, line, width)
+        self.assertGreater(len(rows), 1)
+        for row in rows:
+            self.assertTrue(row.startswith("    word"))
+            self.assertLessEqual(self.font.size(row)[0], width)
+        self.assertEqual(" ".join(row.strip() for row in rows), line.strip())
+
+    def test_long_word_gets_cut(self):
+        word = "x" * 200
+        width = self.font.size("x" * 30)[0]
+        rows = wrap_line(self.font, word, width)
+        self.assertGreater(len(rows), 1)
+        self.assertEqual("".join(rows), word)
+        for row in rows:
+            self.assertLessEqual(self.font.size(row)[0], width)
+
+
+class TestScrollInputStaysInDialog(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.window = pygame.display.set_mode((800, 750))
+        self.report = "\n".join(f"line {number}" for number in range(500))
+
+    def test_view_says_when_it_used_an_event(self):
+        view = ScrollingTextView(self.window, (0, 0, 300, 200), self.report)
+        self.assertTrue(view.handleEvent(pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1)))
+        self.assertEqual(view.get_visible_range()[0], 3)
+        self.assertTrue(view.handleEvent(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_PAGEDOWN)))
+        self.assertTrue(view.handleEvent(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_HOME)))
+        self.assertEqual(view.get_visible_range()[0], 0)
+        self.assertFalse(view.handleEvent(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)))
+        # a click on the text, not the scrollbar
+        self.assertFalse(view.handleEvent(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(10, 10))))
+
+    def test_dialog_swallows_input_while_open(self):
+        dialogs = DialogManager(self.window, {'form_bg': (255, 255, 255), 'border': (0, 0, 0)})
+        dialogs.show_report_dialog("Report", self.report)
+        wheel = pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1)
+        self.assertTrue(dialogs.handle_dialog_events(wheel))
+        # nobody in the dialog wants these, but they still mustn't get behind it
+        self.assertTrue(dialogs.handle_dialog_events(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)))
+        self.assertTrue(dialogs.handle_dialog_events(pygame.event.Event(pygame.MOUSEMOTION, pos=(5, 5), rel=(1, 1), buttons=(0, 0, 0))))
+        self.assertFalse(dialogs.handle_dialog_events(pygame.event.Event(pygame.USEREVENT)))
+
+        dialogs.force_close_dialog()
+        self.assertFalse(dialogs.handle_dialog_events(wheel))
+
+    def test_report_dialog_reads_a_stream_as_it_scrolls(self):
+        pulled = []
+
+        def chunks():
+            for number in range(10000):
+                pulled.append(number)
+                yield f"line {number}\n"
+
+        dialogs = DialogManager(self.window, {'form_bg': (255, 255, 255), 'border': (0, 0, 0)})
+        dialogs.show_report_dialog("Report", chunks())
+        self.assertLess(len(pulled), 100)
+        dialogs.handle_dialog_events(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_PAGEDOWN))
+        self.assertLess(len(pulled), 200)
+        dialogs.handle_dialog_events(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_END))
+        self.assertEqual(len(pulled), 10000)
+        dialogs.force_close_dialog()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# test_vaccine_manager.py
+# Vax Project - tests for VaccineManager
+# COP5230 Assignment M5
+# 06/21/2025
+# Hamza Kurdi
+
+# The manager keeps a handful of structures in sync (ID list, packed flags, lookup
+# dict, indexes), so these mostly check they still agree after adds and removes.
+
+import tempfile
+import threading
+import unittest
+
+from classes.person.person import Person
+from classes.person.patient_query import PatientQuery
+from classes.person.vaccine_manager import VaccineManager
+
+
+def make_person(person_id: int, first_name: str = "Test", fever: bool = False) -> Person:
+    person = Person(person_id, first_name, "Patient", "555-0100")
+    person.set_fever(fever)
+    return person
+
+
+class TestVaccineManager(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = VaccineManager(max_capacity=20)
+        for person_id in (10, 20, 30, 40):
+            self.manager.add_person(make_person(person_id, fever=person_id == 40))
+
+    def test_has_person(self):
+        self.assertTrue(self.manager.has_person(20))
+        self.assertFalse(self.manager.has_person(25))
+        self.assertFalse(self.manager.add_person(make_person(20)))
+
+    def test_remove_moves_last_person_into_slot(self):
+        self.assertTrue(self.manager.remove_person(20))
+        self.assertFalse(self.manager.remove_person(20))
+
+        self.assertEqual(self.manager.get_person_count(), 3)
+        self.assertEqual(self.manager.get_index_of(40), 1)
+        self.assertEqual(self.manager.get_index_of(20), -1)
+        for slot in range(3):
+            person = self.manager.get_person_by_index(slot)
+            self.assertEqual(self.manager.get_index_of(person.id), slot)
+        # the packed flags moved along with the ID
+        self.assertTrue(self.manager.get_proxy_by_id(40).get_fever())
+        self.assertFalse(self.manager.has_person(20))
+        self.assertEqual(self.manager.find_ids_by_prefix("2"), [])
+
+    def test_remove_last_person(self):
+        self.assertTrue(self.manager.remove_person(40))
+        self.assertEqual([self.manager.get_person_by_index(slot).id for slot in range(3)], [10, 20, 30])
+
+    def test_cohort_query_follows_cohort_changes(self):
+        self.manager.save_cohort("group", [10, 30])
+        query = PatientQuery(cohort="group", sort_by="id", descending=True)
+        self.assertEqual(self.manager.run_query(query), (30, 10))
+        self.assertIs(self.manager.run_query(query), self.manager.run_query(query))
+        # same name, different members - the data version doesn't move but the result must
+        self.manager.save_cohort("group", [20])
+        self.assertEqual(self.manager.run_query(query), (20,))
+
+    def test_unknown_id_never_reaches_the_store(self):
+        with tempfile.TemporaryDirectory() as storage_dir:
+            first = VaccineManager(max_capacity=20, max_hot_records=1, storage_dir=storage_dir)
+            for person_id in (1, 2, 3):
+                first.add_person(make_person(person_id))
+            first.close()
+
+            # reopened from the index, so every record is cold on disk
+            manager = VaccineManager(max_capacity=20, max_hot_records=1, storage_dir=storage_dir)
+            before = manager.get_storage_stats()
+            self.assertFalse(manager.has_person(99))
+            self.assertIsNone(manager.get_person_by_id(99))
+            self.assertFalse(manager.add_person(make_person(2)))
+            after = manager.get_storage_stats()
+            self.assertEqual((after['hits'], after['faults']), (before['hits'], before['faults']))
+            # a known cold ID does go to disk
+            self.assertEqual(manager.get_person_by_id(3).id, 3)
+            self.assertEqual(manager.get_storage_stats()['faults'], before['faults'] + 1)
+            manager.close()
+
+class TestSearchWhileAdding(unittest.TestCase):
+
+    def setUp(self):
+        # IDs starting with 1 - enough matches that the search stops to check in a few times
+        self.manager = VaccineManager(max_capacity=40000)
+        for person_id in range(1, 20000):
+            self.manager.add_person(make_person(person_id))
+
+    def test_search_gives_up_when_indexes_change(self):
+        def add_one():
+            # stands in for the UI thread getting in while the search let go of the lock
+            if self.manager.has_person(30000):
+                return False
+            self.manager.add_person(make_person(30000))
+            return False
+        self.assertIsNone(self.manager.search_patients("1", is_cancelled=add_one))
+        # nothing changing - the same search finishes
+        result = self.manager.search_patients("1", is_cancelled=lambda: False)
+        self.assertEqual(result.get_ids()[:3], [1, 10, 11])
+
+    def test_search_on_worker_while_adding(self):
+        errors = []
+        results = []
+
+        def worker():
+            try:
+                for _ in range(20):
+                    results.append(self.manager.search_patients("1", is_cancelled=lambda: False))
+            except Exception as error:
+                errors.append(error)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        for person_id in range(20000, 26000):
+            self.manager.add_person(make_person(person_id))
+            if person_id % 3 == 0:
+                self.manager.remove_person(person_id - 1)
+        thread.join()
+
+        self.assertEqual(errors, [])
+        for result in results:
+            if result is not None:
+                self.assertTrue(all(str(person_id).startswith("1") for person_id in result.get_ids()))
+
+
+if __name__ == '__main__':
+    unittest.main()